@@ -0,0 +1,399 @@
+"""
+Columnar Transform - DataFrame 단위 열 기반 변환
+
+CSV/Excel/PDF 테이블처럼 이미 pandas DataFrame으로 들어오는 소스를
+레코드 dict 단위가 아닌 열 단위로 변환합니다.
+
+- 문자열 열의 정제/파싱은 고유값당 1회만 수행 (pd.factorize)
+- 길이, 요약, 공백→None, 품질 점수 등은 NumPy 배열 연산
+- dict 변환은 적재 직전 frame_to_records()에서 한 번만 수행
+
+결과는 DataTransformer.transform()과 레코드 단위로 동일합니다
+(레코드별 utcnow() 대신 배치 단일 시각을 쓰는 _crawled_at 제외).
+"""
+
+from datetime import datetime, date, timedelta
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+# 행 단위 변환에서 키가 생성되지 않는 경우를 표시 (dict 변환 시 키 제거)
+MISSING = type('_Missing', (), {'__repr__': lambda self: 'MISSING'})()
+
+SPARSE_COLUMNS_ATTR = 'sparse_columns'
+
+_NUMERIC_KINDS = {'floating', 'integer', 'mixed-integer-float', 'boolean'}
+
+_DATE_FIELDS = ['date', 'published_at', 'created_at', 'datetime']
+
+_FINANCIAL_NUMERIC_FIELDS = ['price', 'value', 'open', 'high', 'low', 'close', 'volume',
+                             'change', 'change_rate', 'market_cap', 'per', 'pbr', 'eps']
+
+_RATE_FIELDS = ['base_rate', 'buy_rate', 'sell_rate', 'send_rate', 'receive_rate']
+
+_INDEX_MAPPINGS = {
+    '코스피': 'KOSPI',
+    '코스닥': 'KOSDAQ',
+    '다우존스': 'DJI',
+    '나스닥': 'NASDAQ',
+    'S&P500': 'SPX',
+}
+
+
+def frame_to_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """변환된 DataFrame을 레코드 목록으로 변환 (생성되지 않은 키 제거)"""
+    # transform() 결과는 모두 파이썬 값을 담은 object 열이므로
+    # to_dict('records')의 셀 단위 박싱 없이 바로 묶음
+    columns = list(frame.columns)
+    arrays = [frame[column].to_numpy(dtype=object) for column in columns]
+    records = [dict(zip(columns, row)) for row in zip(*arrays)]
+    sparse = frame.attrs.get(SPARSE_COLUMNS_ATTR, ())
+    if sparse:
+        for record in records:
+            for column in sparse:
+                if record.get(column) is MISSING:
+                    del record[column]
+    return records
+
+
+class ColumnarTransformer:
+    """DataTransformer의 열 기반 실행기"""
+
+    def __init__(self, transformer):
+        # 요소 단위 함수(_clean_text, _parse_date 등)는 행 경로와 공유
+        self.transformer = transformer
+        self.config = transformer.config
+
+    def transform(self, frame: pd.DataFrame, start_index: int = 0) -> pd.DataFrame:
+        """DataFrame 변환 (품질 기준 통과 행만 반환, _order_index는 start_index부터)"""
+        from .etl_pipeline import DataCategory, QualityLevel
+
+        n = len(frame)
+        self._errors = np.zeros(n, dtype=bool)
+        self._sparse: List[str] = []
+
+        # 모든 열을 object로 변환 (to_dict('records')와 같은 파이썬 값)
+        frame = frame.reset_index(drop=True)
+        cols: Dict[str, pd.Series] = {}
+
+        # 1. 필드 매핑 (중복 매핑 시 dict와 동일하게 마지막 값, 첫 위치)
+        for column in frame.columns:
+            new_key = self.config.field_mappings.get(column, column)
+            cols[new_key] = frame[column].astype(object)
+
+        # 2. 카테고리별 변환
+        category = self.config.category
+        if category == DataCategory.NEWS_ARTICLE:
+            self._transform_news(cols, n)
+        elif category in [DataCategory.FINANCIAL_DATA, DataCategory.STOCK_PRICE]:
+            self._transform_financial(cols, n)
+        elif category == DataCategory.EXCHANGE_RATE:
+            self._transform_exchange_rate(cols, n)
+        elif category == DataCategory.MARKET_INDEX:
+            self._transform_market_index(cols, n)
+        elif category == DataCategory.ANNOUNCEMENT:
+            self._transform_announcement(cols, n)
+
+        # 3. 공통 변환
+        for key in list(cols):
+            cols[key] = self._blank_to_none(cols[key])
+        cols['_order_index'] = pd.Series(np.arange(start_index, start_index + n).astype(object), dtype=object)
+
+        # 4. 메타데이터
+        now = datetime.utcnow()
+        cols['_crawled_at'] = self._constant(now, n)
+        cols['_data_category'] = self._constant(category.value, n)
+        cols['_transform_version'] = self._constant('1.0', n)
+        data_dates = self._data_dates(cols, n)
+        cols['_data_date'] = self._data_date_column(cols, data_dates, now, n)
+
+        # 5. 품질 검증
+        scores = self._quality_scores(cols, data_dates, n)
+        levels = np.select(
+            [scores >= 0.8, scores >= 0.6, scores >= 0.4],
+            [QualityLevel.HIGH.value, QualityLevel.MEDIUM.value, QualityLevel.LOW.value],
+            default=QualityLevel.INVALID.value
+        ).astype(object)
+        cols['_quality_score'] = pd.Series(scores, dtype=float).astype(object)
+        cols['_quality_level'] = pd.Series(levels.tolist(), dtype=object)
+
+        keep = ~self._errors & (scores >= self.config.quality_threshold)
+        result = pd.DataFrame(cols, index=frame.index).loc[keep].reset_index(drop=True)
+        result.attrs[SPARSE_COLUMNS_ATTR] = list(self._sparse)
+        return result
+
+    # ------------------------------------------------------------------
+    # 카테고리별 변환
+    # ------------------------------------------------------------------
+
+    def _transform_news(self, cols: Dict[str, pd.Series], n: int):
+        t = self.transformer
+
+        if 'title' in cols:
+            cols['title'] = self._map(cols['title'], t._clean_text)
+            cols['title_length'] = self._lengths(cols['title'])
+
+        if 'content' in cols:
+            content = self._map(cols['content'], t._clean_text)
+            cols['content'] = content
+            lengths = self._lengths(content)
+            cols['content_length'] = lengths
+
+            if 'summary' not in cols:
+                long_mask = lengths.to_numpy(dtype=np.int64) > 200
+                summary = content.copy()
+                if long_mask.any():
+                    summary[long_mask] = content[long_mask].str.slice(0, 200) + '...'
+                cols['summary'] = summary
+
+        for date_field in _DATE_FIELDS:
+            if date_field in cols:
+                cols['published_at'] = self._map(cols[date_field], t._parse_date)
+                break
+
+        if 'link' in cols:
+            cols['url'] = self._map(cols['link'], t._normalize_url)
+        elif 'url' not in cols:
+            cols['url'] = self._constant(None, n)
+
+        title = cols['title'] if 'title' in cols else self._constant('', n)
+        url = cols['url'] if 'url' in cols else self._constant('', n)
+        cols['content_hash'] = pd.Series(
+            [t._generate_content_hash(a, b) for a, b in zip(title.to_numpy(), url.to_numpy())],
+            dtype=object
+        )
+
+    def _transform_financial(self, cols: Dict[str, pd.Series], n: int):
+        t = self.transformer
+
+        for field in _FINANCIAL_NUMERIC_FIELDS:
+            if field in cols:
+                cols[field] = self._numbers(cols[field])
+
+        # 변동률 계산 (price/change 모두 truthy이고 전일가가 0이 아닐 때만)
+        if 'change' in cols and 'price' in cols:
+            price, price_none = self._floats(cols['price'])
+            change, change_none = self._floats(cols['change'])
+            with np.errstate(invalid='ignore', divide='ignore'):
+                prev_price = price - change
+                applies = ~price_none & (price != 0) & ~change_none & (change != 0) & (prev_price != 0)
+                rates = change / prev_price * 100
+
+            existing = cols['change_rate'] if 'change_rate' in cols else self._constant(MISSING, n)
+            change_rate = existing.copy()
+            if applies.any():
+                change_rate[applies] = [round(float(rate), 2) for rate in rates[applies]]
+            cols['change_rate'] = change_rate
+            self._mark_sparse('change_rate', change_rate)
+
+        if 'date' in cols:
+            cols['trade_date'] = self._map(cols['date'], t._parse_date)
+
+        if 'code' in cols:
+            cols['stock_code'] = self._map(cols['code'], t._normalize_stock_code)
+
+    def _transform_exchange_rate(self, cols: Dict[str, pd.Series], n: int):
+        self._transform_financial(cols, n)
+
+        if 'currency' in cols:
+            cols['currency_code'] = self._map(cols['currency'], lambda value: value.upper()[:3])
+
+        for field in _RATE_FIELDS:
+            if field in cols:
+                cols[field] = self._numbers(cols[field])
+
+    def _transform_market_index(self, cols: Dict[str, pd.Series], n: int):
+        self._transform_financial(cols, n)
+
+        if 'name' in cols:
+            def index_code(name):
+                for ko, en in _INDEX_MAPPINGS.items():
+                    if ko in name:
+                        return en
+                return MISSING
+
+            codes = self._map(cols['name'], index_code)
+            if 'index_code' in cols:
+                codes = codes.where(codes.map(lambda v: v is not MISSING), cols['index_code'])
+            cols['index_code'] = codes
+            self._mark_sparse('index_code', codes)
+
+    def _transform_announcement(self, cols: Dict[str, pd.Series], n: int):
+        self._transform_news(cols, n)
+
+        if 'title' in cols:
+            def announcement_type(title):
+                if '실적' in title or '영업' in title:
+                    return 'earnings'
+                elif '배당' in title:
+                    return 'dividend'
+                elif '증자' in title or '감자' in title:
+                    return 'capital'
+                elif '합병' in title or '인수' in title:
+                    return 'ma'
+                return 'other'
+
+            cols['announcement_type'] = self._map(cols['title'], announcement_type)
+
+    # ------------------------------------------------------------------
+    # 메타데이터 / 품질
+    # ------------------------------------------------------------------
+
+    def _data_dates(self, cols: Dict[str, pd.Series], n: int) -> np.ndarray:
+        """record.get('published_at') or record.get('trade_date')"""
+        published = cols['published_at'].to_numpy() if 'published_at' in cols else np.full(n, None, dtype=object)
+        traded = cols['trade_date'].to_numpy() if 'trade_date' in cols else np.full(n, None, dtype=object)
+        result = np.empty(n, dtype=object)
+        result[:] = [a or b for a, b in zip(published, traded)]
+        return result
+
+    def _data_date_column(self, cols, data_dates: np.ndarray, now: datetime, n: int) -> pd.Series:
+        existing = cols['_data_date'].to_numpy() if '_data_date' in cols else np.full(n, MISSING, dtype=object)
+        today = now.date().isoformat()
+        values = np.empty(n, dtype=object)
+
+        for i, data_date in enumerate(data_dates):
+            if not data_date:
+                values[i] = today
+            elif isinstance(data_date, datetime):
+                values[i] = data_date.date().isoformat()
+            elif isinstance(data_date, date):
+                values[i] = data_date.isoformat()
+            else:
+                values[i] = existing[i]
+
+        column = pd.Series(values, dtype=object)
+        self._mark_sparse('_data_date', column)
+        return column
+
+    def _quality_scores(self, cols: Dict[str, pd.Series], data_dates: np.ndarray, n: int) -> np.ndarray:
+        from .etl_pipeline import DataCategory
+
+        # 행 경로와 같은 순서로 차감해야 부동소수 결과가 동일
+        score = np.ones(n, dtype=float)
+
+        for field in self.config.required_fields:
+            if field not in cols:
+                score -= 0.2
+            else:
+                score -= np.where(self._is_none(cols[field]), 0.2, 0.0)
+
+        category = self.config.category
+        if category == DataCategory.NEWS_ARTICLE:
+            score -= np.where(self._is_falsy(cols.get('title'), n), 0.3, 0.0)
+            score -= np.where(self._is_falsy(cols.get('published_at'), n), 0.2, 0.0)
+        elif category in [DataCategory.FINANCIAL_DATA, DataCategory.STOCK_PRICE]:
+            price = cols.get('price')
+            price_none = np.ones(n, dtype=bool) if price is None else self._is_none(price)
+            score -= np.where(price_none, 0.3, 0.0)
+
+        # 미래 날짜 체크 (aware/naive 비교 오류는 행 경로처럼 해당 행 제외)
+        limit = datetime.utcnow() + timedelta(days=1)
+        future = np.zeros(n, dtype=bool)
+        for i, data_date in enumerate(data_dates):
+            if data_date and isinstance(data_date, datetime):
+                try:
+                    future[i] = data_date > limit
+                except TypeError:
+                    self._errors[i] = True
+        score -= np.where(future, 0.3, 0.0)
+
+        return np.maximum(score, 0.0)
+
+    # ------------------------------------------------------------------
+    # 열 연산 헬퍼
+    # ------------------------------------------------------------------
+
+    def _map(self, series: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+        """
+        요소 함수를 열에 적용
+
+        문자열만 있는 열은 고유값당 1회 호출합니다. 예외가 발생한 행은
+        행 경로처럼 변환 실패로 표시됩니다.
+        """
+        if infer_dtype(series, skipna=True) == 'string':
+            codes, uniques = pd.factorize(series)
+            mapped, failed = self._call_each(uniques, func)
+            values = np.empty(len(series), dtype=object)
+            valid = codes >= 0
+            values[valid] = mapped[codes[valid]]
+            if failed:
+                self._errors |= np.isin(codes, failed)
+
+            # None/NaN은 factorize에서 같은 코드(-1)가 되므로 개별 처리
+            na_positions = np.flatnonzero(~valid)
+            if len(na_positions):
+                na_values, na_failed = self._call_each(series.to_numpy()[na_positions], func)
+                values[na_positions] = na_values
+                self._errors[na_positions[na_failed]] = True
+        else:
+            values, failed = self._call_each(series.to_numpy(), func)
+            if failed:
+                self._errors[failed] = True
+        return pd.Series(values, dtype=object)
+
+    @staticmethod
+    def _call_each(values, func):
+        results = np.empty(len(values), dtype=object)
+        failed = []
+        for i, value in enumerate(values):
+            try:
+                results[i] = func(value)
+            except Exception:
+                results[i] = None
+                failed.append(i)
+        return results, failed
+
+    def _numbers(self, series: pd.Series) -> pd.Series:
+        """숫자 파싱 (이미 숫자인 열은 float 변환만)"""
+        if infer_dtype(series, skipna=False) in _NUMERIC_KINDS:
+            return series.astype(float).astype(object)
+        return self._map(series, self.transformer._parse_number)
+
+    @staticmethod
+    def _floats(series: pd.Series):
+        """숫자 열 → (float 배열, None 마스크)"""
+        values = series.to_numpy()
+        none_mask = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+        floats = np.where(none_mask, np.nan, values).astype(float)
+        return floats, none_mask
+
+    @staticmethod
+    def _lengths(series: pd.Series) -> pd.Series:
+        # 변환 실패 행(None)은 결과에서 제외되므로 0으로 채움
+        return pd.Series([len(v) if isinstance(v, str) else 0 for v in series.to_numpy()], dtype=object)
+
+    @staticmethod
+    def _blank_to_none(series: pd.Series) -> pd.Series:
+        """공백 문자열 → None"""
+        values = series.to_numpy()
+        blank = np.fromiter(
+            (isinstance(v, str) and not v.strip() for v in values), dtype=bool, count=len(values)
+        )
+        if not blank.any():
+            return series
+        series = series.copy()
+        series[blank] = None
+        return series
+
+    @staticmethod
+    def _is_none(series: pd.Series) -> np.ndarray:
+        values = series.to_numpy()
+        return np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+
+    @staticmethod
+    def _is_falsy(series, n: int) -> np.ndarray:
+        if series is None:
+            return np.ones(n, dtype=bool)
+        values = series.to_numpy()
+        return np.fromiter((not v for v in values), dtype=bool, count=len(values))
+
+    @staticmethod
+    def _constant(value: Any, n: int) -> pd.Series:
+        return pd.Series(np.full(n, value, dtype=object), dtype=object)
+
+    def _mark_sparse(self, column: str, series: pd.Series):
+        if column not in self._sparse and any(v is MISSING for v in series.to_numpy()):
+            self._sparse.append(column)
@@ -11,15 +11,30 @@ ETL Pipeline - Extract, Transform, Load 완전 자동화
 import os
 import re
 import json
+import asyncio
 import hashlib
 import logging
 from datetime import datetime, date, timedelta
-from typing import Optional, Dict, Any, List, Union, Callable
+from typing import Optional, Dict, Any, List, Tuple, Union, Callable, Iterator, Iterable, AsyncIterable, AsyncIterator, Set
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from decimal import Decimal
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+import time
 import unicodedata
 
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    from crawlers.utils.parsers import parse_korean_date, parse_korean_number
+except ImportError:
+    # DAG 이미지에는 crawlers 패키지가 없을 수 있음 - ISO 날짜/단순 숫자 변환으로 대체
+    parse_korean_date = None
+    parse_korean_number = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,6 +70,9 @@ class TransformConfig:
     field_mappings: Dict[str, str] = field(default_factory=dict)
     custom_transforms: Dict[str, str] = field(default_factory=dict)
     quality_threshold: float = 0.7
+    parallel_workers: int = 0  # 1 이상이면 프로세스 풀에서 청크 단위 병렬 변환
+    parallel_threshold: int = 20000  # 이 건수 미만은 프로세스 내 변환
+    parallel_chunk_size: int = 5000
 
 
 @dataclass
@@ -67,6 +85,8 @@ class LoadConfig:
     partition_by: Optional[str] = None  # date, month, source
     upsert: bool = True
     upsert_key: List[str] = field(default_factory=list)
+    bulk_write: bool = False  # True면 bulk_write(ordered=False) 배치 적재
+    batch_size: int = 1000
 
 
 @dataclass
@@ -95,33 +115,35 @@ class ETLResult:
 class DataTransformer:
     """데이터 변환기"""
 
-    # 한국 날짜 패턴
-    KO_DATE_PATTERNS = [
-        (r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2}):(\d{2})', '%Y-%m-%d %H:%M'),
-        (r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', '%Y-%m-%d'),
-        (r'(\d{4})\.(\d{1,2})\.(\d{1,2})\s*(\d{1,2}):(\d{2})', '%Y-%m-%d %H:%M'),
-        (r'(\d{4})\.(\d{1,2})\.(\d{1,2})', '%Y-%m-%d'),
-        (r'(\d{4})-(\d{1,2})-(\d{1,2})\s*(\d{1,2}):(\d{2}):(\d{2})', '%Y-%m-%d %H:%M:%S'),
-        (r'(\d{4})-(\d{1,2})-(\d{1,2})\s*(\d{1,2}):(\d{2})', '%Y-%m-%d %H:%M'),
-        (r'(\d{4})-(\d{1,2})-(\d{1,2})', '%Y-%m-%d'),
-        (r'(\d{1,2})/(\d{1,2})/(\d{4})', '%m/%d/%Y'),
-        (r'(\d{2}):(\d{2})', '%H:%M'),  # 오늘 시간만
-    ]
-
-    # 숫자 정제 패턴
-    NUMBER_PATTERNS = {
-        'korean': {'억': 100000000, '만': 10000, '천': 1000},
-        'symbols': {',': '', '%': '', '원': '', '$': '', '₩': ''},
-    }
-
     def __init__(self, config: TransformConfig):
         self.config = config
 
     def transform(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """데이터 변환"""
+        transformed, _ = self.transform_chunk(raw_data)
+        return transformed
+
+    def transform_chunk(
+        self,
+        raw_data: List[Dict[str, Any]],
+        start_index: int = 0
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        청크 단위 변환 (병렬 변환 시 워커에서 호출)
+
+        Args:
+            raw_data: 원본 레코드 청크
+            start_index: 전체 배치 내 청크 시작 위치 (_order_index 기준)
+
+        Returns:
+            (변환된 레코드 목록, 청크 통계 dict)
+        """
+        started = time.perf_counter()
         transformed = []
+        error_count = 0
+        invalid_count = 0
 
-        for idx, record in enumerate(raw_data):
+        for idx, record in enumerate(raw_data, start_index):
             try:
                 # 1. 필드 매핑
                 record = self._apply_field_mappings(record)
@@ -143,13 +165,45 @@ class DataTransformer:
                 if quality >= self.config.quality_threshold:
                     transformed.append(record)
                 else:
+                    invalid_count += 1
                     logger.warning(f"Record {idx} failed quality check: {quality}")
 
             except Exception as e:
+                error_count += 1
                 logger.error(f"Transform error at record {idx}: {e}")
                 continue
 
-        return transformed
+        stats = {
+            'start': start_index,
+            'size': len(raw_data),
+            'transformed': len(transformed),
+            'errors': error_count,
+            'invalid': invalid_count,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+        }
+        return transformed, stats
+
+    def transform_frame(self, frame: 'pd.DataFrame', start_index: int = 0) -> 'pd.DataFrame':
+        """
+        열 기반 데이터 변환 (테이블 소스용)
+
+        transform()과 레코드 단위로 동일한 결과를 DataFrame으로 반환합니다.
+        dict 변환은 적재 직전 frame_to_records()로 수행합니다.
+
+        Args:
+            frame: 원본 DataFrame
+            start_index: 전체 배치 내 첫 행 위치 (_order_index 기준)
+        """
+        from .columnar_transform import ColumnarTransformer
+
+        return ColumnarTransformer(self).transform(frame, start_index)
+
+    @staticmethod
+    def frame_to_records(frame: 'pd.DataFrame') -> List[Dict[str, Any]]:
+        """transform_frame() 결과를 레코드 목록으로 변환"""
+        from .columnar_transform import frame_to_records
+
+        return frame_to_records(frame)
 
     def _apply_field_mappings(self, record: Dict) -> Dict:
         """필드 매핑 적용"""
@@ -392,107 +446,28 @@ class DataTransformer:
         return text.strip()
 
     def _parse_date(self, value: Any) -> Optional[datetime]:
-        """날짜 파싱"""
+        """날짜 파싱 (상대 시간, 한국어 날짜, ISO 형식)"""
+        if parse_korean_date is not None:
+            return parse_korean_date(value)
         if isinstance(value, datetime):
             return value
         if isinstance(value, date):
             return datetime.combine(value, datetime.min.time())
-        if not value:
-            return None
-
-        text = str(value).strip()
-
-        # 상대적 시간 처리
-        relative_patterns = {
-            r'(\d+)분\s*전': lambda m: datetime.now() - timedelta(minutes=int(m.group(1))),
-            r'(\d+)시간\s*전': lambda m: datetime.now() - timedelta(hours=int(m.group(1))),
-            r'(\d+)일\s*전': lambda m: datetime.now() - timedelta(days=int(m.group(1))),
-            r'방금': lambda m: datetime.now(),
-            r'오늘': lambda m: datetime.now().replace(hour=0, minute=0, second=0),
-            r'어제': lambda m: (datetime.now() - timedelta(days=1)).replace(hour=0, minute=0, second=0),
-        }
-
-        for pattern, handler in relative_patterns.items():
-            match = re.search(pattern, text)
-            if match:
-                return handler(match)
-
-        # 절대 날짜 패턴 매칭
-        for pattern, fmt in self.KO_DATE_PATTERNS:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    groups = match.groups()
-                    if len(groups) == 2:  # 시:분만
-                        today = datetime.now()
-                        return today.replace(hour=int(groups[0]), minute=int(groups[1]), second=0)
-                    elif len(groups) == 3:
-                        return datetime(int(groups[0]), int(groups[1]), int(groups[2]))
-                    elif len(groups) == 5:
-                        return datetime(int(groups[0]), int(groups[1]), int(groups[2]),
-                                      int(groups[3]), int(groups[4]))
-                    elif len(groups) == 6:
-                        return datetime(int(groups[0]), int(groups[1]), int(groups[2]),
-                                      int(groups[3]), int(groups[4]), int(groups[5]))
-                except Exception:
-                    continue
-
-        # ISO 형식 시도
         try:
-            return datetime.fromisoformat(text.replace('Z', '+00:00'))
-        except Exception:
-            pass
-
-        return None
+            return datetime.fromisoformat(str(value).strip().replace('Z', '+00:00')) if value else None
+        except ValueError:
+            return None
 
     def _parse_number(self, value: Any) -> Optional[float]:
-        """숫자 파싱"""
+        """숫자 파싱 (부호, 통화 기호, 한국어 단위)"""
+        if parse_korean_number is not None:
+            return parse_korean_number(value)
         if value is None:
             return None
-        if isinstance(value, (int, float, Decimal)):
-            return float(value)
-
-        text = str(value).strip()
-        if not text:
-            return None
-
-        # 부호 처리
-        negative = False
-        if text.startswith('-') or text.startswith('▼') or text.startswith('↓'):
-            negative = True
-            text = text[1:]
-        elif text.startswith('+') or text.startswith('▲') or text.startswith('↑'):
-            text = text[1:]
-
-        # 기호 제거
-        for symbol, replacement in self.NUMBER_PATTERNS['symbols'].items():
-            text = text.replace(symbol, replacement)
-
-        # 한국어 단위 처리
-        multiplier = 1
-        for unit, mult in self.NUMBER_PATTERNS['korean'].items():
-            if unit in text:
-                text = text.replace(unit, '')
-                multiplier = mult
-                break
-
-        # 숫자 추출
         try:
-            number = float(text.strip())
-            number *= multiplier
-            return -number if negative else number
+            return float(str(value).replace(',', '').strip())
         except ValueError:
-            # 숫자만 추출 시도
-            numbers = re.findall(r'[\d.]+', text)
-            if numbers:
-                try:
-                    number = float(numbers[0])
-                    number *= multiplier
-                    return -number if negative else number
-                except ValueError:
-                    pass
-
-        return None
+            return None
 
     def _normalize_url(self, url: str) -> str:
         """URL 정규화"""
@@ -529,6 +504,15 @@ class DataTransformer:
         return hashlib.md5(combined.encode()).hexdigest()
 
 
+def _transform_chunk_worker(
+    config: TransformConfig,
+    records: List[Dict[str, Any]],
+    start_index: int
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """프로세스 풀 워커 진입점 (pickle 가능한 모듈 수준 함수)"""
+    return DataTransformer(config).transform_chunk(records, start_index)
+
+
 class DataLoader:
     """데이터 적재기 - Staging 컬렉션에 저장"""
 
@@ -552,9 +536,15 @@ class DataLoader:
         self,
         data: List[Dict[str, Any]],
         source_id: str,
-        crawl_result_id: Optional[str] = None
+        crawl_result_id: Optional[str] = None,
+        start_index: int = 0
     ) -> Dict[str, Any]:
-        """데이터를 Staging 컬렉션에 적재"""
+        """
+        데이터를 Staging 컬렉션에 적재
+
+        start_index는 data[0]의 전체 배치 내 위치입니다 (_record_index 기준,
+        윈도우 단위 적재 시 윈도우 시작 위치).
+        """
         if not data:
             return {'loaded': 0, 'duplicates': 0, 'errors': [], 'staging_ids': []}
 
@@ -579,18 +569,56 @@ class DataLoader:
         if self.config.create_index:
             await self._ensure_indexes(collection)
 
-        # 배치 처리
-        for idx, record in enumerate(data):
-            try:
-                # 소스 ID 추가
-                record['_source_id'] = source_id
+        if self.config.bulk_write:
+            await self._load_bulk(collection, data, source_id, crawl_result_id, result, start_index)
+        else:
+            await self._load_per_record(collection, data, source_id, crawl_result_id, result, start_index)
 
-                # Staging 메타데이터 추가
-                if self.use_staging:
-                    record['_review_status'] = 'pending'
-                    record['_record_index'] = idx
-                    if crawl_result_id:
-                        record['_crawl_result_id'] = crawl_result_id
+        # Staging 컬렉션 정보 추가
+        result['collection'] = collection_name
+        result['is_staging'] = self.use_staging
+
+        return result
+
+    def _prepare_record(
+        self,
+        record: Dict[str, Any],
+        idx: int,
+        source_id: str,
+        crawl_result_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """적재 전 소스/Staging 메타데이터 추가"""
+        # 소스 ID 추가
+        record['_source_id'] = source_id
+
+        # Staging 메타데이터 추가
+        if self.use_staging:
+            record['_review_status'] = 'pending'
+            record['_record_index'] = idx
+            if crawl_result_id:
+                record['_crawl_result_id'] = crawl_result_id
+
+        return record
+
+    def _upsert_filter(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """upsert 키 기반 필터 (upsert 모드가 아니면 빈 dict)"""
+        if not (self.config.upsert and self.config.upsert_key):
+            return {}
+        return {k: record.get(k) for k in self.config.upsert_key if k in record}
+
+    async def _load_per_record(
+        self,
+        collection,
+        data: List[Dict[str, Any]],
+        source_id: str,
+        crawl_result_id: Optional[str],
+        result: Dict[str, Any],
+        start_index: int = 0
+    ):
+        """레코드 단위 적재 (레코드당 1회 왕복)"""
+        for idx, record in enumerate(data, start_index):
+            try:
+                record = self._prepare_record(record, idx, source_id, crawl_result_id)
 
                 if self.config.upsert and self.config.upsert_key:
                     # Upsert 모드
@@ -631,11 +659,117 @@ class DataLoader:
                     result['errors'].append(str(e)[:200])
                     logger.error(f"Load error: {e}")
 
-        # Staging 컬렉션 정보 추가
-        result['collection'] = collection_name
-        result['is_staging'] = self.use_staging
+    async def _load_bulk(
+        self,
+        collection,
+        data: List[Dict[str, Any]],
+        source_id: str,
+        crawl_result_id: Optional[str],
+        result: Dict[str, Any],
+        start_index: int = 0
+    ):
+        """
+        bulk_write 배치 적재 (배치당 1회 왕복)
 
-        return result
+        레코드 단위 적재와 동일한 의미로 결과를 집계합니다:
+        - upsert 생성 / insert → loaded (+ staging_ids)
+        - 기존 문서 변경 → loaded
+        - 기존 문서와 동일 / duplicate key → duplicates
+        """
+        from pymongo import InsertOne, UpdateOne
+
+        batch_size = max(1, self.config.batch_size)
+        result['batches'] = []
+
+        for start in range(0, len(data), batch_size):
+            batch = data[start:start + batch_size]
+            operations = []
+
+            for offset, record in enumerate(batch):
+                record = self._prepare_record(record, start_index + start + offset, source_id, crawl_result_id)
+                filter_query = self._upsert_filter(record)
+
+                if filter_query:
+                    operations.append(UpdateOne(
+                        filter_query,
+                        {'$set': record, '$setOnInsert': {'_first_seen': datetime.utcnow()}},
+                        upsert=True
+                    ))
+                else:
+                    operations.append(InsertOne(record))
+
+            batch_start = time.perf_counter()
+            self._apply_bulk_batch(collection, operations, batch, result)
+            result['batches'].append({
+                'start': start,
+                'size': len(batch),
+                'elapsed_ms': round((time.perf_counter() - batch_start) * 1000, 2)
+            })
+
+    def _apply_bulk_batch(
+        self,
+        collection,
+        operations: List[Any],
+        batch: List[Dict[str, Any]],
+        result: Dict[str, Any]
+    ):
+        """단일 bulk_write 배치 실행 후 결과를 load 결과에 매핑"""
+        from pymongo import InsertOne
+        from pymongo.errors import BulkWriteError
+
+        write_errors: List[Dict[str, Any]] = []
+
+        try:
+            bulk_result = collection.bulk_write(operations, ordered=False)
+            counts = {
+                'inserted': bulk_result.inserted_count,
+                'upserted': bulk_result.upserted_count,
+                'matched': bulk_result.matched_count,
+                'modified': bulk_result.modified_count,
+            }
+            upserted = dict(bulk_result.upserted_ids or {})
+        except BulkWriteError as e:
+            # ordered=False: 실패한 op 외에는 모두 실행됨
+            details = e.details or {}
+            write_errors = details.get('writeErrors', [])
+            counts = {
+                'inserted': details.get('nInserted', 0),
+                'upserted': details.get('nUpserted', 0),
+                'matched': details.get('nMatched', 0),
+                'modified': details.get('nModified', 0),
+            }
+            upserted = {u['index']: u['_id'] for u in details.get('upserted', [])}
+        except Exception as e:
+            result['errors'].append(str(e)[:200])
+            logger.error(f"Bulk load error ({len(operations)} ops): {e}")
+            return
+
+        # upsert로 매칭만 되고 변경되지 않은 문서는 기존 경로와 동일하게 중복 처리
+        result['loaded'] += counts['inserted'] + counts['upserted'] + counts['modified']
+        result['duplicates'] += counts['matched'] - counts['modified']
+
+        failed_indexes = set()
+        for error in write_errors:
+            failed_indexes.add(error.get('index'))
+            message = error.get('errmsg', '')
+            if error.get('code') == 11000 or 'duplicate key' in message.lower():
+                result['duplicates'] += 1
+            else:
+                result['errors'].append(message[:200])
+                logger.error(f"Load error: {message}")
+
+        # 레코드 순서대로 ID 수집 (InsertOne은 pymongo가 문서에 _id를 채워 넣음)
+        for index, operation in enumerate(operations):
+            if index in failed_indexes:
+                continue
+            if index in upserted:
+                inserted_id = str(upserted[index])
+            elif isinstance(operation, InsertOne) and '_id' in batch[index]:
+                inserted_id = str(batch[index]['_id'])
+            else:
+                continue
+            result['upserted_ids'].append(inserted_id)
+            result['staging_ids'].append(inserted_id)
 
     def _get_collection_name(self, sample_record: Dict) -> str:
         """컬렉션 이름 결정"""
@@ -775,7 +909,7 @@ class ETLPipeline:
 
     async def run(
         self,
-        raw_data: List[Dict[str, Any]],
+        raw_data: Union[List[Dict[str, Any]], 'pd.DataFrame'],
         source_id: str,
         category: Optional[DataCategory] = None,
         transform_config: Optional[TransformConfig] = None,
@@ -789,7 +923,7 @@ class ETLPipeline:
         ETL 파이프라인 실행 - 데이터를 Staging에 저장
 
         Args:
-            raw_data: 크롤링된 원본 데이터
+            raw_data: 크롤링된 원본 데이터 (테이블 소스는 DataFrame 그대로 전달 시 열 기반 변환)
             source_id: 소스 ID
             category: 데이터 카테고리
             transform_config: 변환 설정
@@ -805,10 +939,12 @@ class ETLPipeline:
         skipped_unchanged = 0
         new_count = 0
         modified_count = 0
+        columnar = self._is_frame(raw_data)
 
         # 1. 카테고리 자동 감지
         if not category:
-            category = self._detect_category(raw_data)
+            sample = raw_data.head(1).to_dict('records') if columnar else raw_data
+            category = self._detect_category(sample)
             warnings.append(f"Auto-detected category: {category.value}")
 
         # 2. 설정 로드
@@ -826,12 +962,14 @@ class ETLPipeline:
                 change_service = ChangeDetectionService(self.mongo)
                 change_result = await change_service.check_batch(
                     source_id=source_id,
-                    records=raw_data,
+                    records=raw_data.to_dict('records') if columnar else raw_data,
                     hash_fields=hash_fields
                 )
 
                 # 변경된 레코드만 처리
                 data_to_process = change_result.new_records + change_result.modified_records
+                if columnar:
+                    data_to_process = pd.DataFrame(data_to_process)
                 skipped_unchanged = change_result.unchanged_count
                 new_count = change_result.new_count
                 modified_count = change_result.modified_count
@@ -848,7 +986,7 @@ class ETLPipeline:
                 logger.warning(f"Change detection error: {e}")
 
         # 데이터가 없으면 조기 종료
-        if not data_to_process:
+        if len(data_to_process) == 0:
             execution_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
             return ETLResult(
                 success=True,
@@ -870,9 +1008,18 @@ class ETLPipeline:
                 modified_records=modified_count
             )
 
-        # 4. Transform
+        # 4. Transform (DataFrame 입력은 열 기반 변환 후 적재 직전에 dict로 변환)
         transformer = DataTransformer(t_config)
-        transformed_data = transformer.transform(data_to_process)
+        transform_chunks = []
+        if columnar:
+            transformed_data = transformer.frame_to_records(transformer.transform_frame(data_to_process))
+        elif t_config.parallel_workers > 0 and len(data_to_process) >= t_config.parallel_threshold:
+            transformed_data, transform_chunks = await self._transform_parallel(
+                t_config, data_to_process, warnings
+            )
+        else:
+            transformed_data, chunk_stats = transformer.transform_chunk(data_to_process)
+            transform_chunks = [chunk_stats]
 
         invalid_count = len(data_to_process) - len(transformed_data)
         if invalid_count > 0:
@@ -913,7 +1060,8 @@ class ETLPipeline:
                     source_id=source_id,
                     staging_ids=load_result['staging_ids'],
                     transformed_data=transformed_data,
-                    crawl_result_id=crawl_result_id
+                    crawl_result_id=crawl_result_id,
+                    chunk_size=l_config.batch_size
                 )
                 if review_count > 0:
                     warnings.append(f"Created {review_count} review records for staging data")
@@ -949,31 +1097,375 @@ class ETLPipeline:
                 'change_detection_enabled': skip_unchanged,
                 'is_staging': load_result.get('is_staging', use_staging),
                 'staging_ids': load_result.get('staging_ids', []),
-                'crawl_result_id': crawl_result_id
+                'crawl_result_id': crawl_result_id,
+                'transform_errors': sum(c['errors'] for c in transform_chunks),
+                'transform_chunks': transform_chunks,
+                'load_batches': load_result.get('batches', [])
+            },
+            skipped_unchanged=skipped_unchanged,
+            new_records=new_count,
+            modified_records=modified_count
+        )
+
+    async def run_stream(
+        self,
+        records: Union[Iterable[Any], AsyncIterable[Any]],
+        source_id: str,
+        category: Optional[DataCategory] = None,
+        transform_config: Optional[TransformConfig] = None,
+        load_config: Optional[LoadConfig] = None,
+        skip_unchanged: bool = True,
+        hash_fields: Optional[List[str]] = None,
+        use_staging: bool = True,
+        crawl_result_id: Optional[str] = None,
+        window_size: int = 5000
+    ) -> ETLResult:
+        """
+        스트리밍 ETL 실행 - 고정 크기 윈도우 단위로 변경 감지/변환/중복 제거/적재
+
+        전체 원본을 메모리에 올리지 않고 window_size 단위로 처리하며
+        ETLResult 카운터는 윈도우마다 누적합니다. 최대 메모리는 소스 크기가
+        아니라 윈도우 크기에 비례합니다 (배치 내 중복 제거용 키 집합만 전체 유지).
+
+        Args:
+            records: 레코드 iterator/async iterator (pandas DataFrame 청크도 가능,
+                     청크 하나가 하나의 윈도우로 열 기반 변환됨)
+            source_id: 소스 ID
+            category: 데이터 카테고리 (None이면 첫 윈도우로 자동 감지)
+            transform_config: 변환 설정
+            load_config: 적재 설정
+            skip_unchanged: 변경되지 않은 데이터 스킵
+            hash_fields: 변경 감지에 사용할 필드 목록
+            use_staging: staging 컬렉션 사용 여부
+            crawl_result_id: 크롤 결과 ID (리뷰 연동용)
+            window_size: 윈도우당 레코드 수
+        """
+        start_time = datetime.utcnow()
+        errors = []
+        warnings = []
+        t_config = l_config = None
+        change_service = None
+        change_detection = skip_unchanged and self.mongo is not None
+        seen_keys: Set[str] = set()
+        sample_data: List[Dict] = []
+        windows: List[Dict[str, Any]] = []
+        extracted = processed = transformed_count = invalid_count = loaded = duplicates = 0
+        transform_errors = skipped_unchanged = new_count = modified_count = review_count = 0
+        quality_sum = 0.0
+        is_staging = use_staging
+        collection = None
+
+        async for window in self._iter_windows(records, max(1, window_size)):
+            window_start = time.perf_counter()
+            columnar = self._is_frame(window)
+            offset = extracted
+            extracted += len(window)
+
+            # 1. 카테고리 감지 / 설정 로드 (첫 윈도우)
+            if t_config is None:
+                if not category:
+                    sample = window.head(1).to_dict('records') if columnar else window
+                    category = self._detect_category(sample)
+                    warnings.append(f"Auto-detected category: {category.value}")
+                default_config = self.DEFAULT_CONFIGS.get(category, self.DEFAULT_CONFIGS[DataCategory.NEWS_ARTICLE])
+                t_config = transform_config or default_config['transform']
+                l_config = load_config or default_config['load']
+
+            # 2. 변경 감지
+            data_to_process = window
+            if change_detection:
+                try:
+                    if change_service is None:
+                        from api.app.services.change_detection import ChangeDetectionService
+                        change_service = ChangeDetectionService(self.mongo)
+
+                    change_result = await change_service.check_batch(
+                        source_id=source_id,
+                        records=window.to_dict('records') if columnar else window,
+                        hash_fields=hash_fields
+                    )
+                    data_to_process = change_result.new_records + change_result.modified_records
+                    if columnar:
+                        data_to_process = pd.DataFrame(data_to_process)
+                    skipped_unchanged += change_result.unchanged_count
+                    new_count += change_result.new_count
+                    modified_count += change_result.modified_count
+
+                except ImportError:
+                    change_detection = False
+                    warnings.append("Change detection service not available, processing all records")
+                except Exception as e:
+                    warnings.append(f"Change detection failed for window at {offset}: {str(e)}, processing all records")
+                    logger.warning(f"Change detection error: {e}")
+
+            del window
+            window_stats = {'start': offset, 'processed': len(data_to_process), 'transformed': 0, 'loaded': 0}
+            windows.append(window_stats)
+            if len(data_to_process) == 0:
+                continue
+            # 인덱스는 run()과 같이 전체 스트림 기준:
+            # _order_index는 처리 대상 레코드 순번, _record_index / Review는 변환 결과 순번
+            order_offset = processed
+            processed += len(data_to_process)
+            window_processed = len(data_to_process)
+
+            # 3. Transform
+            transformer = DataTransformer(t_config)
+            if columnar:
+                transformed_data = transformer.frame_to_records(
+                    transformer.transform_frame(data_to_process, order_offset)
+                )
+            elif t_config.parallel_workers > 0 and len(data_to_process) >= t_config.parallel_threshold:
+                transformed_data, chunks = await self._transform_parallel(
+                    t_config, data_to_process, warnings, order_offset
+                )
+                transform_errors += sum(c['errors'] for c in chunks)
+            else:
+                transformed_data, chunk_stats = transformer.transform_chunk(data_to_process, order_offset)
+                transform_errors += chunk_stats['errors']
+            del data_to_process
+            invalid_count += window_processed - len(transformed_data)
+
+            # 4. Deduplicate (이전 윈도우 포함 배치 내 중복 제거)
+            if t_config.deduplicate and t_config.dedup_fields:
+                before_dedup = len(transformed_data)
+                transformed_data = self._deduplicate(transformed_data, t_config.dedup_fields, seen_keys)
+                duplicates += before_dedup - len(transformed_data)
+
+            # 5. Load
+            loader = DataLoader(self.mongo, l_config, use_staging=use_staging)
+            load_result = await loader.load(transformed_data, source_id, crawl_result_id, transformed_count)
+            errors.extend(load_result.get('errors', []))
+            loaded += load_result['loaded']
+            duplicates += load_result.get('duplicates', 0)
+            collection = load_result.get('collection', collection)
+            is_staging = load_result.get('is_staging', is_staging)
+
+            # 6. 해시 업데이트
+            if change_service is not None and load_result['loaded'] > 0:
+                try:
+                    await change_service.update_hashes(
+                        source_id=source_id,
+                        records=transformed_data,
+                        hash_fields=hash_fields
+                    )
+                except Exception as e:
+                    warnings.append(f"Hash update failed: {str(e)}")
+
+            # 7. Review 레코드
+            if use_staging and load_result['loaded'] > 0 and load_result.get('staging_ids'):
+                try:
+                    review_count += await self._create_review_records(
+                        source_id=source_id,
+                        staging_ids=load_result['staging_ids'],
+                        transformed_data=transformed_data,
+                        crawl_result_id=crawl_result_id,
+                        chunk_size=l_config.batch_size,
+                        start_index=transformed_count
+                    )
+                except Exception as e:
+                    warnings.append(f"Review record creation failed: {str(e)}")
+                    logger.error(f"Failed to create review records: {e}")
+
+            # 8. 누적
+            transformed_count += len(transformed_data)
+            quality_sum += sum(r.get('_quality_score', 0) for r in transformed_data)
+            if len(sample_data) < 3:
+                sample_data.extend(transformed_data[:3 - len(sample_data)])
+            window_stats.update(
+                transformed=len(transformed_data),
+                loaded=load_result['loaded'],
+                elapsed_ms=round((time.perf_counter() - window_start) * 1000, 1)
+            )
+            del transformed_data, load_result
+
+        # 빈 스트림
+        if l_config is None:
+            category = category or DataCategory.GENERIC
+            default_config = self.DEFAULT_CONFIGS.get(category, self.DEFAULT_CONFIGS[DataCategory.NEWS_ARTICLE])
+            l_config = load_config or default_config['load']
+
+        if skipped_unchanged > 0:
+            skip_ratio = round(skipped_unchanged / extracted * 100, 1)
+            warnings.append(f"Skipped {skipped_unchanged} unchanged records ({skip_ratio}%)")
+        if processed == 0:
+            warnings.append("No changed data to process")
+
+        if invalid_count > 0:
+            warnings.append(f"{invalid_count} records failed quality check")
+        if review_count > 0:
+            warnings.append(f"Created {review_count} review records for staging data")
+
+        execution_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        if processed == 0:
+            quality_score = 1.0
+        else:
+            quality_score = round(quality_sum / transformed_count, 3) if transformed_count else 0
+
+        return ETLResult(
+            success=len(errors) == 0 and (loaded > 0 or skipped_unchanged > 0 or processed == 0),
+            source_id=source_id,
+            category=category,
+            extracted_count=extracted,
+            transformed_count=transformed_count,
+            loaded_count=loaded,
+            duplicate_count=duplicates,
+            invalid_count=invalid_count,
+            quality_score=quality_score,
+            errors=errors,
+            warnings=warnings,
+            sample_data=sample_data,
+            execution_time_ms=execution_time,
+            metadata={
+                'collection': collection or l_config.collection_name,
+                'category': category.value,
+                'transform_version': '1.0',
+                'change_detection_enabled': skip_unchanged,
+                'is_staging': is_staging,
+                'crawl_result_id': crawl_result_id,
+                'transform_errors': transform_errors,
+                'window_size': window_size,
+                'windows': windows
             },
             skipped_unchanged=skipped_unchanged,
             new_records=new_count,
             modified_records=modified_count
         )
 
+    @staticmethod
+    async def _iter_windows(
+        records: Union[Iterable[Any], AsyncIterable[Any]],
+        window_size: int
+    ) -> AsyncIterator[Any]:
+        """레코드 스트림을 window_size 단위 리스트로 묶음 (DataFrame 청크는 그대로 전달)"""
+        if not hasattr(records, '__aiter__'):
+            records = ETLPipeline._as_async_iter(records)
+
+        window = []
+        async for item in records:
+            if ETLPipeline._is_frame(item):
+                if window:
+                    yield window
+                    window = []
+                yield item
+                continue
+            window.append(item)
+            if len(window) >= window_size:
+                yield window
+                window = []
+
+        if window:
+            yield window
+
+    @staticmethod
+    async def _as_async_iter(records: Iterable[Any]) -> AsyncIterator[Any]:
+        for item in records:
+            yield item
+
+    async def _transform_parallel(
+        self,
+        t_config: TransformConfig,
+        records: List[Dict[str, Any]],
+        warnings: List[str],
+        start_index: int = 0
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        프로세스 풀 병렬 변환 (이벤트 루프 밖에서 실행)
+
+        청크 순서대로 결과를 합치므로 레코드 순서와 _order_index는
+        단일 프로세스 변환과 동일합니다 (start_index부터 시작). 풀
+        생성/실행에 실패하면 프로세스 내 변환으로 대체합니다.
+
+        Returns:
+            (변환된 레코드 목록, 청크별 통계 목록)
+        """
+        chunk_size = max(1, t_config.parallel_chunk_size)
+        loop = asyncio.get_running_loop()
+
+        try:
+            with ProcessPoolExecutor(max_workers=t_config.parallel_workers) as pool:
+                futures = [
+                    loop.run_in_executor(
+                        pool, _transform_chunk_worker, t_config, records[start:start + chunk_size],
+                        start_index + start
+                    )
+                    for start in range(0, len(records), chunk_size)
+                ]
+                results = await asyncio.gather(*futures)
+        except Exception as e:
+            warnings.append(f"Parallel transform failed: {str(e)}, transforming in-process")
+            logger.warning(f"Parallel transform error: {e}")
+            transformed, chunk_stats = DataTransformer(t_config).transform_chunk(records, start_index)
+            return transformed, [chunk_stats]
+
+        transformed = []
+        chunk_stats = []
+        for chunk_records, stats in results:
+            transformed.extend(chunk_records)
+            chunk_stats.append(stats)
+        return transformed, chunk_stats
+
     async def _create_review_records(
         self,
         source_id: str,
         staging_ids: List[str],
         transformed_data: List[Dict],
-        crawl_result_id: Optional[str] = None
+        crawl_result_id: Optional[str] = None,
+        chunk_size: int = 1000,
+        start_index: int = 0
     ) -> int:
         """
         Staging 데이터에 대한 Review 레코드 생성
 
-        검토 대기열에 자동으로 등록하여 사람이 검토할 수 있게 함
+        검토 대기열에 자동으로 등록하여 사람이 검토할 수 있게 함.
+        Review 문서는 제너레이터로 생성하고 chunk_size 단위로
+        insert_many(ordered=False) 하여 청크당 1회 왕복으로 적재합니다.
         """
-        from bson import ObjectId
+        from pymongo.errors import BulkWriteError
 
         created_count = 0
         reviews_collection = self.mongo.db['data_reviews']
+        review_docs = self._iter_review_docs(
+            source_id, staging_ids, transformed_data, crawl_result_id, start_index
+        )
+        chunk_size = max(1, chunk_size)
+
+        while True:
+            chunk = list(islice(review_docs, chunk_size))
+            if not chunk:
+                break
+
+            try:
+                insert_result = reviews_collection.insert_many(chunk, ordered=False)
+                created_count += len(insert_result.inserted_ids)
+            except BulkWriteError as e:
+                # ordered=False: 실패한 문서 외에는 모두 적재됨
+                details = e.details or {}
+                inserted = details.get('nInserted', 0)
+                created_count += inserted
+                write_errors = details.get('writeErrors', [])
+                first_error = write_errors[0].get('errmsg', '') if write_errors else str(e)
+                logger.warning(
+                    f"Review chunk partially failed: {inserted}/{len(chunk)} inserted, "
+                    f"{len(write_errors)} errors (first: {first_error[:200]})"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to create review chunk of {len(chunk)} records: {e}")
 
-        for idx, (staging_id, record) in enumerate(zip(staging_ids, transformed_data)):
+        return created_count
+
+    def _iter_review_docs(
+        self,
+        source_id: str,
+        staging_ids: List[str],
+        transformed_data: List[Dict],
+        crawl_result_id: Optional[str] = None,
+        start_index: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """Staging 레코드별 Review 문서 생성 (변환 실패 레코드는 건너뜀)"""
+        from bson import ObjectId
+
+        for idx, (staging_id, record) in enumerate(zip(staging_ids, transformed_data), start_index):
             try:
                 # 신뢰도 정보 추출
                 confidence = record.get('confidence', record.get('_confidence'))
@@ -1001,14 +1493,16 @@ class ETLPipeline:
                 if crawl_result_id:
                     review_doc['crawl_result_id'] = ObjectId(crawl_result_id) if not isinstance(crawl_result_id, ObjectId) else crawl_result_id
 
-                reviews_collection.insert_one(review_doc)
-                created_count += 1
-
             except Exception as e:
                 logger.warning(f"Failed to create review for staging_id {staging_id}: {e}")
                 continue
 
-        return created_count
+            yield review_doc
+
+    @staticmethod
+    def _is_frame(data: Any) -> bool:
+        """pandas DataFrame 입력 여부"""
+        return pd is not None and isinstance(data, pd.DataFrame)
 
     def _detect_category(self, data: List[Dict]) -> DataCategory:
         """데이터 카테고리 자동 감지"""
@@ -1038,9 +1532,15 @@ class ETLPipeline:
 
         return DataCategory.GENERIC
 
-    def _deduplicate(self, data: List[Dict], dedup_fields: List[str]) -> List[Dict]:
-        """중복 제거"""
-        seen = set()
+    def _deduplicate(
+        self,
+        data: List[Dict],
+        dedup_fields: List[str],
+        seen: Optional[Set[str]] = None
+    ) -> List[Dict]:
+        """중복 제거 (seen을 넘기면 이전 윈도우의 키까지 포함해 판단)"""
+        if seen is None:
+            seen = set()
         unique = []
 
         for record in data:
@@ -19,7 +19,8 @@ from fastapi.responses import JSONResponse
 from slowapi.middleware import SlowAPIMiddleware
 
 from app.routers import sources, crawlers, errors, dashboard, quick_add, monitoring, auth, auth_config, reviews, data_quality, metrics, lineage, export, backup, contracts, schemas, catalog, versions, e2e_pipeline, production_data
-from app.services.mongo_service import MongoService
+from app.services.mongo_service import MongoService, init_client_pool, close_client_pool
+from app.services.async_mongo_service import shutdown_executor as shutdown_mongo_executor
 from app.auth import APIKeyAuth, JWTAuth
 from app.core import configure_logging, get_logger, CorrelationIdMiddleware, validate_all_secrets
 from app.middleware.rate_limiter import limiter, RateLimitExceeded, rate_limit_exceeded_handler
@@ -193,15 +194,25 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Pre-flight checks failed: {e}")
 
-    # Test MongoDB connection
+    # Open the shared MongoDB client pool (routers borrow it via MongoService())
     try:
-        mongo = MongoService()
-        mongo.db.command('ping')
-        logger.info("MongoDB connection successful")
-        mongo.close()
+        init_client_pool()
     except Exception as e:
         logger.error(f"MongoDB connection failed: {e}")
 
+    # Start building the catalog search and lineage indexes in the background
+    # (search and lineage queries fall back to MongoDB until they are ready)
+    try:
+        from app.services.data_catalog import get_catalog_search_index
+        get_catalog_search_index(MongoService())
+    except Exception as e:
+        logger.warning(f"Catalog search index warm-up skipped: {e}")
+    try:
+        from app.services.lineage import get_lineage_index
+        get_lineage_index(MongoService())
+    except Exception as e:
+        logger.warning(f"Lineage index warm-up skipped: {e}")
+
     # Connect PostgreSQL (graceful degradation if unavailable)
     try:
         from app.services.postgres_service import get_pg, close_pg
@@ -225,6 +236,9 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    shutdown_mongo_executor()
+    close_client_pool()
+
 
 # Create FastAPI application
 app = FastAPI(
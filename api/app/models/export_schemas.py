@@ -27,8 +27,8 @@ class ExportRequest(BaseModel):
     )
     format: str = Field(
         "csv",
-        pattern="^(csv|excel|json)$",
-        description="Export format: csv, excel, or json"
+        pattern="^(csv|excel|json|parquet|arrow)$",
+        description="Export format: csv, excel, json, parquet, or arrow (Arrow IPC file)"
     )
     query: Optional[Dict[str, Any]] = Field(
         None,
@@ -57,6 +57,11 @@ class ExportRequest(BaseModel):
         pattern="^(utf-8|utf-8-sig|euc-kr|cp949)$",
         description="Character encoding for CSV export"
     )
+    compression: Optional[str] = Field(
+        None,
+        pattern="^(gzip|zstd)$",
+        description="Compress CSV/JSON job output (gzip, or zstd if zstandard is installed)"
+    )
     date_field: str = Field(
         "created_at",
         description="Field name to use for date filtering"
@@ -19,6 +19,7 @@ from app.services.data_catalog import (
     DatasetStatus,
     SearchFilter,
     SortOption,
+    get_catalog_search_index,
 )
 from app.core import get_logger
 
@@ -95,7 +96,7 @@ async def list_datasets(
     필터와 검색어를 사용하여 데이터셋 목록을 조회합니다.
     """
     try:
-        catalog = DataCatalog(mongo_service=mongo)
+        catalog = DataCatalog(mongo_service=mongo, search_index=get_catalog_search_index())
 
         skip = (page - 1) * page_size
         datasets, total = catalog.list_datasets(
@@ -131,7 +132,7 @@ async def create_dataset(
     데이터셋 메타데이터를 생성합니다.
     """
     try:
-        catalog = DataCatalog(mongo_service=mongo)
+        catalog = DataCatalog(mongo_service=mongo, search_index=get_catalog_search_index())
 
         dataset = catalog.create_dataset(
             name=request.name,
@@ -170,7 +171,7 @@ async def search_datasets(
     전문 검색으로 데이터셋을 찾습니다.
     """
     try:
-        search = CatalogSearch(mongo_service=mongo)
+        search = CatalogSearch(mongo_service=mongo, index=get_catalog_search_index(mongo))
 
         search_filter = SearchFilter(
             dataset_types=dataset_types or [],
@@ -182,13 +183,13 @@ async def search_datasets(
         result = search.search(
             query=query,
             filters=search_filter,
-            limit=limit,
+            page_size=limit,
         )
 
         return {
-            "datasets": result.datasets,
-            "total_results": result.total_results,
-            "facets": result.facets,
+            "datasets": [ds.to_dict() for ds in result.datasets],
+            "total_results": result.total,
+            "facets": [facet.to_dict() for facet in result.facets],
             "query": query,
         }
 
@@ -208,7 +209,7 @@ async def get_statistics(
     데이터셋, 컬럼, 태그 등의 통계를 조회합니다.
     """
     try:
-        catalog = DataCatalog(mongo_service=mongo)
+        catalog = DataCatalog(mongo_service=mongo, search_index=get_catalog_search_index())
         stats = catalog.get_statistics()
         return stats.to_dict()
 
@@ -229,7 +230,7 @@ async def register_existing_collections(
     관리자 권한 필요.
     """
     try:
-        catalog = DataCatalog(mongo_service=mongo)
+        catalog = DataCatalog(mongo_service=mongo, search_index=get_catalog_search_index())
         registered = catalog.register_existing_collections()
 
         logger.info(f"Auto-registered {len(registered)} collections by {auth.user_id}")
@@ -256,7 +257,7 @@ async def get_dataset(
     ID로 데이터셋 메타데이터를 조회합니다.
     """
     try:
-        catalog = DataCatalog(mongo_service=mongo)
+        catalog = DataCatalog(mongo_service=mongo, search_index=get_catalog_search_index())
         dataset = catalog.get_dataset(dataset_id)
 
         if not dataset:
@@ -285,7 +286,7 @@ async def update_dataset(
     데이터셋 메타데이터를 수정합니다.
     """
     try:
-        catalog = DataCatalog(mongo_service=mongo)
+        catalog = DataCatalog(mongo_service=mongo, search_index=get_catalog_search_index())
 
         updates = request.dict(exclude_unset=True)
         if not updates:
@@ -327,7 +328,7 @@ async def delete_dataset(
     데이터셋 메타데이터와 관련 컬럼 정보를 삭제합니다.
     """
     try:
-        catalog = DataCatalog(mongo_service=mongo)
+        catalog = DataCatalog(mongo_service=mongo, search_index=get_catalog_search_index())
 
         success = catalog.delete_dataset(dataset_id)
 
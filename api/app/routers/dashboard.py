@@ -4,12 +4,14 @@ Dashboard Router.
 Endpoints for dashboard data and system overview.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, Query
 
 from app.models.schemas import DashboardResponse
 from app.services.mongo_service import MongoService
+from app.services.async_mongo_service import AsyncMongoService
 from app.services.airflow_trigger import AirflowTrigger
 from app.auth.dependencies import require_auth, AuthContext
 
@@ -25,10 +27,15 @@ def get_mongo():
         mongo.close()
 
 
+def get_async_mongo(mongo: MongoService = Depends(get_mongo)):
+    # DB 호출을 스레드풀로 넘겨 이벤트 루프를 막지 않음 (close는 get_mongo가 처리)
+    return AsyncMongoService(mongo)
+
+
 @router.get("", response_model=DashboardResponse)
 async def get_dashboard(
     optimized: bool = Query(True, description="Use optimized aggregation queries"),
-    mongo: MongoService = Depends(get_mongo),
+    mongo: AsyncMongoService = Depends(get_async_mongo),
     auth: AuthContext = Depends(require_auth),
 ):
     """
@@ -38,11 +45,12 @@ async def get_dashboard(
     여러 count 쿼리를 단일 aggregation으로 병합 처리
     - 기존: 6개 개별 count 쿼리 + 1개 find 쿼리
     - 최적화 후: 3개 aggregation 쿼리 (sources, crawlers, results 각각 $facet)
+      + 미해결 에러 count를 동시에 실행
     """
     if optimized:
-        stats = mongo.get_dashboard_stats_optimized()
+        stats = await mongo.get_dashboard_stats_optimized()
     else:
-        stats = mongo.get_dashboard_stats()
+        stats = await mongo.get_dashboard_stats()
     return stats
 
 
@@ -50,7 +58,7 @@ async def get_dashboard(
 async def get_recent_activity(
     hours: int = 24,
     optimized: bool = Query(True, description="Use optimized aggregation with $lookup"),
-    mongo: MongoService = Depends(get_mongo),
+    mongo: AsyncMongoService = Depends(get_async_mongo),
     auth: AuthContext = Depends(require_auth),
 ):
     """
@@ -61,12 +69,17 @@ async def get_recent_activity(
     aggregation pipeline에서 조인하여 처리
 
     - 기존: 3개 find 쿼리 (소스 이름 없음, 또는 N개 추가 쿼리 필요)
-    - 최적화 후: 3개 aggregation 쿼리 ($lookup으로 소스 이름 포함)
+    - 최적화 후: 3개 aggregation 쿼리 ($lookup으로 소스 이름 포함, 동시 실행)
     """
     if optimized:
-        return mongo.get_recent_activity_optimized(hours=hours)
+        return await mongo.get_recent_activity_optimized(hours=hours)
 
     # 기존 방식 (하위 호환성)
+    return await mongo.run(_get_recent_activity_legacy, mongo.sync, hours)
+
+
+def _get_recent_activity_legacy(mongo: MongoService, hours: int):
+    """소스 이름 없는 기존 find 쿼리 3개 (DB 스레드풀에서 실행)"""
     cutoff = datetime.utcnow() - timedelta(hours=hours)
 
     # Recent crawl results
@@ -104,7 +117,10 @@ async def get_recent_activity(
 
 
 @router.get("/sources-status")
-async def get_sources_status(mongo: MongoService = Depends(get_mongo), auth: AuthContext = Depends(require_auth)):
+async def get_sources_status(
+    mongo: AsyncMongoService = Depends(get_async_mongo),
+    auth: AuthContext = Depends(require_auth),
+):
     """
     Get status overview of all sources.
 
@@ -119,18 +135,7 @@ async def get_sources_status(mongo: MongoService = Depends(get_mongo), auth: Aut
             'count': {'$sum': 1}
         }}
     ]
-    status_results = list(mongo.db.sources.aggregate(status_pipeline))
 
-    status_summary = {
-        "active": 0,
-        "inactive": 0,
-        "error": 0
-    }
-    total_sources = 0
-    for r in status_results:
-        status_key = r['_id'] or 'inactive'
-        status_summary[status_key] = status_summary.get(status_key, 0) + r['count']
-        total_sources += r['count']
 
     # 최적화: 문제 있는 소스만 직접 쿼리 (전체 목록 조회 후 필터링 대신)
     issues_pipeline = [
@@ -145,7 +150,21 @@ async def get_sources_status(mongo: MongoService = Depends(get_mongo), auth: Aut
         {'$sort': {'error_count': -1}},
         {'$limit': 50}  # 문제 소스 수 제한
     ]
-    sources_with_issues_raw = list(mongo.db.sources.aggregate(issues_pipeline))
+    status_results, sources_with_issues_raw = await asyncio.gather(
+        mongo.aggregate('sources', status_pipeline),
+        mongo.aggregate('sources', issues_pipeline)
+    )
+
+    status_summary = {
+        "active": 0,
+        "inactive": 0,
+        "error": 0
+    }
+    total_sources = 0
+    for r in status_results:
+        status_key = r['_id'] or 'inactive'
+        status_summary[status_key] = status_summary.get(status_key, 0) + r['count']
+        total_sources += r['count']
 
     sources_with_issues = [
         {
@@ -168,7 +187,7 @@ async def get_sources_status(mongo: MongoService = Depends(get_mongo), auth: Aut
 @router.get("/execution-trends")
 async def get_execution_trends(
     days: int = 7,
-    mongo: MongoService = Depends(get_mongo),
+    mongo: AsyncMongoService = Depends(get_async_mongo),
     auth: AuthContext = Depends(require_auth),
 ):
     """Get execution trends over time."""
@@ -196,7 +215,7 @@ async def get_execution_trends(
         {"$sort": {"_id": 1}}
     ]
 
-    trends = list(mongo.db.crawl_results.aggregate(pipeline))
+    trends = await mongo.aggregate('crawl_results', pipeline)
 
     return {
         "period_days": days,
@@ -216,25 +235,30 @@ async def get_execution_trends(
 
 
 @router.get("/system-health")
-async def get_system_health(mongo: MongoService = Depends(get_mongo), auth: AuthContext = Depends(require_auth)):
+async def get_system_health(
+    mongo: AsyncMongoService = Depends(get_async_mongo),
+    auth: AuthContext = Depends(require_auth),
+):
     """Get overall system health indicators."""
+    # MongoDB ping, Airflow 조회, 통계 집계는 서로 독립적이라 동시에 실행
+    airflow = AirflowTrigger()
+    ping, dag_runs, stats = await asyncio.gather(
+        mongo.command('ping'),
+        airflow.get_dag_runs("source_manager", limit=1),
+        mongo.get_dashboard_stats(),
+        return_exceptions=True
+    )
+    if isinstance(stats, Exception):
+        raise stats
+
     # MongoDB health
-    try:
-        mongo.db.command('ping')
-        mongo_status = "healthy"
-    except Exception as e:
-        mongo_status = f"error: {e}"
+    mongo_status = f"error: {ping}" if isinstance(ping, Exception) else "healthy"
 
     # Airflow health
-    airflow = AirflowTrigger()
-    try:
-        result = await airflow.get_dag_runs("source_manager", limit=1)
-        airflow_status = "healthy" if "error" not in result else f"error: {result.get('error')}"
-    except Exception as e:
-        airflow_status = f"error: {e}"
-
-    # Calculate system metrics
-    stats = mongo.get_dashboard_stats()
+    if isinstance(dag_runs, Exception):
+        airflow_status = f"error: {dag_runs}"
+    else:
+        airflow_status = "healthy" if "error" not in dag_runs else f"error: {dag_runs.get('error')}"
 
     health_score = 100
     issues = []
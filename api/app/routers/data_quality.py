@@ -390,6 +390,7 @@ async def get_change_detection_stats(
     - 전체 레코드 수
     - 스킵된 레코드 수 (변경 없음)
     - 트래픽 절감률
+    - 해시 캐시 히트/미스 (이 프로세스 기준)
     """
     from app.services.change_detection import ChangeDetectionService
 
@@ -398,7 +399,8 @@ async def get_change_detection_stats(
 
     return {
         "source_id": source_id,
-        **stats
+        **stats,
+        "hash_cache": service.get_cache_stats()
     }
 
 
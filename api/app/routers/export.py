@@ -1,7 +1,8 @@
 """
 Export Router for data export endpoints.
 
-Provides REST API endpoints for exporting data to CSV, Excel, and JSON formats.
+Provides REST API endpoints for exporting data to CSV, Excel, JSON, Parquet
+and Arrow IPC formats.
 Supports both streaming downloads and asynchronous batch exports.
 """
 
@@ -16,6 +17,8 @@ from bson import ObjectId
 
 from ..services.mongo_service import MongoService
 from ..services.export_service import (
+    COMPRESSION_EXTENSIONS,
+    EXCEL_DOWNLOAD_MAX_ROWS,
     ExportService,
     CrawlResultExporter,
     ReviewDataExporter
@@ -181,9 +184,9 @@ async def export_csv(
     - Frozen header row for easy scrolling
 
     **Limitations:**
-    - Maximum 50,000 records (Excel performance)
-    - File generated in memory before download
-    - For larger exports, use CSV format
+    - Maximum 200,000 records (EXCEL_DOWNLOAD_MAX_ROWS)
+    - Rows are streamed, but the finished file is held in memory before download
+    - For larger exports, use an async export job or CSV format
     """,
     response_class=StreamingResponse,
     responses={
@@ -221,7 +224,7 @@ async def export_excel(
     limit: int = Query(
         10000,
         ge=1,
-        le=50000,
+        le=EXCEL_DOWNLOAD_MAX_ROWS,
         description="Maximum records (lower limit for Excel)"
     ),
     sheet_name: str = Query(
@@ -235,8 +238,8 @@ async def export_excel(
     """
     Generate and download Excel file.
 
-    Note: Excel files are generated in memory, so large exports
-    may use significant memory. Use CSV for very large datasets.
+    Note: the finished Excel file is held in memory before download.
+    Use an async export job or CSV for very large datasets.
     """
     # Validate collection
     valid_collections = [
@@ -302,6 +305,11 @@ async def export_excel(
     - Export may take longer than request timeout
     - You need to track export progress
 
+    **Formats:**
+    - csv, json: optional gzip/zstd compression
+    - excel: .xlsx workbook
+    - parquet, arrow: columnar files for analytics (nested fields flattened)
+
     **Workflow:**
     1. POST to this endpoint to create job
     2. Poll GET /export/jobs/{job_id} for status
@@ -358,7 +366,8 @@ async def create_async_export(
         query=query,
         fields=request.fields,
         limit=request.limit,
-        encoding=request.encoding
+        encoding=request.encoding,
+        compression=request.compression
     )
 
     # Get job details
@@ -470,10 +479,21 @@ async def download_export_file(
     elif format == "json":
         media_type = "application/json"
         ext = ".json"
+    elif format == "parquet":
+        media_type = "application/vnd.apache.parquet"
+        ext = ".parquet"
+    elif format == "arrow":
+        media_type = "application/vnd.apache.arrow.file"
+        ext = ".arrow"
     else:
         media_type = "text/csv"
         ext = ".csv"
 
+    compression = job.get("compression") if format in ("csv", "json") else None
+    if compression:
+        media_type = "application/gzip" if compression == "gzip" else "application/zstd"
+        ext += COMPRESSION_EXTENSIONS[compression]
+
     filename = f"{job.get('collection', 'export')}_{job_id}{ext}"
 
     return FileResponse(
@@ -573,7 +593,7 @@ async def export_crawl_results(
     if format == "excel":
         # Excel export
         ext = "xlsx"
-        excel_limit = min(limit, 50000)
+        excel_limit = min(limit, EXCEL_DOWNLOAD_MAX_ROWS)
         excel_bytes = await export_service.generate_excel_async(
             collection="crawl_results",
             query=query,
@@ -716,7 +736,7 @@ async def export_reviews(
     status_suffix = f"_{status}" if status else ""
 
     if format == "excel":
-        excel_limit = min(limit, 50000)
+        excel_limit = min(limit, EXCEL_DOWNLOAD_MAX_ROWS)
         excel_bytes = await export_service.generate_excel_async(
             collection="data_reviews",
             query=query,
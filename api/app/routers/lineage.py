@@ -17,6 +17,7 @@ from app.services.lineage import (
     EdgeType,
     LineageGraph,
     ImpactAnalyzer,
+    get_lineage_index,
 )
 from app.core import get_logger
 from app.auth.dependencies import require_auth, require_scope, require_admin, AuthContext
@@ -37,8 +38,8 @@ def get_mongo():
 
 
 def get_tracker(mongo: MongoService = Depends(get_mongo)) -> LineageTracker:
-    """리니지 추적기 의존성"""
-    return LineageTracker(mongo_service=mongo)
+    """리니지 추적기 의존성 (공유 메모리 인덱스 연결)"""
+    return LineageTracker(mongo_service=mongo, index=get_lineage_index(mongo))
 
 
 def get_analyzer(
@@ -0,0 +1,286 @@
+"""
+Async MongoDB Service for FastAPI.
+
+async 라우터에서 동기 pymongo 호출이 이벤트 루프를 막지 않도록
+MongoService 연산을 전용 스레드풀로 넘기는 비동기 계층입니다.
+
+- MongoService와 같은 메서드 이름 (sources/crawlers/crawl_results/error_logs)
+- 예외 변환/Circuit Breaker는 MongoService(db_operation) 그대로 사용
+- 공유 풀(init_client_pool)의 MongoClient를 스레드 간에 함께 사용
+- 서로 독립적인 aggregation은 asyncio.gather로 동시에 실행
+
+Usage:
+    async def get_async_mongo(mongo: MongoService = Depends(get_mongo)):
+        yield AsyncMongoService(mongo)
+
+    stats = await amongo.get_dashboard_stats_optimized()
+    source = await amongo.get_source(source_id)
+"""
+
+import os
+import asyncio
+import logging
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Optional, Dict, Any, List, Callable, TypeVar
+
+from .mongo_service import (
+    MongoService,
+    UNRESOLVED_ERRORS_FILTER,
+    build_dashboard_stats,
+    dashboard_stats_pipelines,
+    db_operation,
+    recent_activity_pipelines,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# DB 호출 전용 스레드 수 (기본 스레드풀을 쓰는 다른 run_in_executor 작업과 분리)
+MONGODB_ASYNC_WORKERS = int(os.getenv('MONGODB_ASYNC_WORKERS', '32'))
+
+
+# ============================================
+# DB 전용 스레드풀
+# ============================================
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """DB 스레드풀 (처음 사용할 때 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=MONGODB_ASYNC_WORKERS,
+                    thread_name_prefix="mongo-async"
+                )
+    return _executor
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    """DB 스레드풀 종료 (lifespan 종료 시)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
+
+
+def _offloaded(name: str) -> Callable[..., Any]:
+    """MongoService.<name>을 스레드풀에서 실행하는 async 메서드"""
+    method = getattr(MongoService, name)
+
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await self.run(getattr(self.sync, name), *args, **kwargs)
+
+    return wrapper
+
+
+# ============================================
+# 비동기 서비스 클래스
+# ============================================
+
+class AsyncMongoService:
+    """
+    MongoService의 async 버전 (스레드풀 오프로딩)
+
+    pymongo MongoClient는 스레드 안전하므로 같은 MongoService(같은 공유
+    클라이언트)를 여러 스레드가 동시에 사용합니다. 동기 메서드 결과와
+    예외는 MongoService와 동일합니다.
+
+    Usage:
+        amongo = AsyncMongoService(MongoService())
+        try:
+            sources, total = await asyncio.gather(
+                amongo.list_sources(limit=20),
+                amongo.count_sources()
+            )
+        finally:
+            await amongo.close()
+    """
+
+    def __init__(self, mongo: Optional[MongoService] = None, executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Args:
+            mongo: 감쌀 동기 서비스 (없으면 새로 생성하고 close()에서 닫음)
+            executor: DB 호출 스레드풀 (기본: get_executor())
+        """
+        self._owns_sync = mongo is None
+        self.sync = mongo if mongo is not None else MongoService()
+        self._executor = executor
+        self._connected = False
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def uri(self) -> str:
+        return self.sync.uri
+
+    @property
+    def db(self):
+        """동기 Database (run()에 넘길 함수 안에서만 사용)"""
+        return self.sync.db
+
+    async def _connect(self) -> None:
+        """
+        클라이언트 생성(공유 풀 대여 또는 연결 + ping)을 한 번만 스레드에서 실행
+
+        gather로 동시에 시작한 연산들이 각자 MongoClient를 만들지 않도록
+        첫 연산 전에 직렬화합니다.
+        """
+        async with self._connect_lock:
+            if not self._connected:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._executor or get_executor(), lambda: self.sync.client)
+                self._connected = True
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        동기 함수를 DB 스레드풀에서 실행
+
+        contextvars(요청 ID/트레이스 컨텍스트)를 복사해 넘깁니다.
+        """
+        if not self._connected:
+            await self._connect()
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = partial(context.run, func, *args, **kwargs)
+        return await loop.run_in_executor(self._executor or get_executor(), call)
+
+    async def close(self) -> None:
+        """직접 만든 MongoService만 닫음 (주입받은 서비스는 호출 측이 닫음)"""
+        if self._owns_sync and self._connected:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor or get_executor(), self.sync.close)
+        self._connected = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+    # ==================== Raw Collection Operations ====================
+
+    @db_operation("multiple", "read")
+    def _aggregate_sync(self, collection: str, pipeline: List[Dict[str, Any]]) -> List[Dict]:
+        return list(self.db[collection].aggregate(pipeline))
+
+    @db_operation("multiple", "read")
+    def _count_documents_sync(self, collection: str, query: Dict[str, Any]) -> int:
+        return self.db[collection].count_documents(query)
+
+    @db_operation("multiple", "read")
+    def _find_sync(self, collection: str, query: Dict[str, Any], projection: Optional[Dict] = None,
+                   sort: Optional[List] = None, skip: int = 0, limit: int = 0) -> List[Dict]:
+        cursor = self.db[collection].find(query, projection)
+        if sort:
+            cursor = cursor.sort(sort)
+        if skip:
+            cursor = cursor.skip(skip)
+        if limit:
+            cursor = cursor.limit(limit)
+        return list(cursor)
+
+    async def aggregate(self, collection: str, pipeline: List[Dict[str, Any]]) -> List[Dict]:
+        """aggregation 결과 리스트 (커서는 스레드 안에서 끝까지 소비)"""
+        return await self.run(self._aggregate_sync, collection, pipeline)
+
+    async def count_documents(self, collection: str, query: Optional[Dict[str, Any]] = None) -> int:
+        return await self.run(self._count_documents_sync, collection, query or {})
+
+    async def find(self, collection: str, query: Optional[Dict[str, Any]] = None,
+                   projection: Optional[Dict] = None, sort: Optional[List] = None,
+                   skip: int = 0, limit: int = 0) -> List[Dict]:
+        """find 결과 리스트 (sort는 [(field, direction)] 형식)"""
+        return await self.run(self._find_sync, collection, query or {}, projection, sort, skip, limit)
+
+    def _command_sync(self, command: str) -> Dict[str, Any]:
+        return self.db.command(command)
+
+    async def command(self, command: str) -> Dict[str, Any]:
+        """DB 명령 (예: 'ping'), 예외는 변환하지 않음"""
+        return await self.run(self._command_sync, command)
+
+    health_check = _offloaded('health_check')
+
+    # ==================== Batch Lookups ====================
+
+    get_sources_by_ids = _offloaded('get_sources_by_ids')
+    get_crawlers_by_ids = _offloaded('get_crawlers_by_ids')
+    get_crawl_results_by_ids = _offloaded('get_crawl_results_by_ids')
+    get_crawler_version = _offloaded('get_crawler_version')
+    list_sources_with_crawler_info = _offloaded('list_sources_with_crawler_info')
+    list_crawlers_with_source_info = _offloaded('list_crawlers_with_source_info')
+
+    # ==================== Sources Collection ====================
+
+    create_source = _offloaded('create_source')
+    get_source = _offloaded('get_source')
+    get_source_by_name = _offloaded('get_source_by_name')
+    list_sources = _offloaded('list_sources')
+    count_sources = _offloaded('count_sources')
+    update_source = _offloaded('update_source')
+    delete_source = _offloaded('delete_source')
+
+    # ==================== Crawlers Collection ====================
+
+    get_crawler = _offloaded('get_crawler')
+    get_active_crawler = _offloaded('get_active_crawler')
+    list_crawlers = _offloaded('list_crawlers')
+    count_crawlers = _offloaded('count_crawlers')
+    get_crawler_history = _offloaded('get_crawler_history')
+
+    # ==================== Crawl Results / Error Logs ====================
+
+    get_crawl_results = _offloaded('get_crawl_results')
+    list_errors = _offloaded('list_errors')
+    get_error = _offloaded('get_error')
+    count_errors = _offloaded('count_errors')
+    resolve_error = _offloaded('resolve_error')
+
+    # ==================== Dashboard ====================
+
+    get_dashboard_stats = _offloaded('get_dashboard_stats')
+
+    async def get_recent_activity_optimized(self, hours: int = 24) -> Dict[str, Any]:
+        """
+        최근 활동 데이터 (MongoService.get_recent_activity_optimized와 동일)
+
+        결과/에러/변경 이력 aggregation 3개를 동시에 실행합니다.
+        """
+        pipelines = recent_activity_pipelines(hours)
+        results = await asyncio.gather(*(
+            self.aggregate(collection, pipeline) for collection, pipeline in pipelines.values()
+        ))
+
+        activity: Dict[str, Any] = {'period_hours': hours}
+        for key, docs in zip(pipelines, results):
+            activity[key] = [self.sync._serialize_doc(doc) for doc in docs]
+        return activity
+
+    async def get_dashboard_stats_optimized(self) -> Dict[str, Any]:
+        """
+        대시보드 통계 (MongoService.get_dashboard_stats_optimized와 동일)
+
+        $facet aggregation 3개, 미해결 에러 count, health ping을 동시에
+        실행해 응답 시간이 가장 느린 쿼리 하나 수준으로 줄어듭니다.
+        """
+        pipelines = dashboard_stats_pipelines()
+        *facets, unresolved, health = await asyncio.gather(
+            *(self.aggregate(collection, pipeline) for collection, pipeline in pipelines.items()),
+            self.count_documents('error_logs', UNRESOLVED_ERRORS_FILTER),
+            self.health_check()
+        )
+
+        stats = build_dashboard_stats(dict(zip(pipelines, facets)), unresolved)
+        stats['health'] = health
+        return stats
@@ -9,11 +9,15 @@ Change Detection Service - 데이터 변경 감지
 """
 
 import hashlib
+import json
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from .content_hash_cache import ContentHashCache, get_content_hash_cache
+from .fingerprint import RecordFingerprinter, get_fingerprinter
+
 try:
     from app.core import get_logger
     logger = get_logger(__name__)
@@ -65,10 +69,42 @@ class ChangeDetectionService:
 
     # MongoDB 컬렉션명
     HASH_COLLECTION = "content_hashes"
+    HASH_VERSION_COLLECTION = "content_hash_versions"
     CHANGE_LOG_COLLECTION = "change_logs"
 
-    def __init__(self, mongo_service=None):
+    def __init__(
+        self,
+        mongo_service=None,
+        hash_cache: Optional[ContentHashCache] = None,
+        use_cache: bool = True
+    ):
+        """
+        Args:
+            mongo_service: MongoDB 서비스
+            hash_cache: 해시 캐시 (None이면 프로세스 공용 캐시)
+            use_cache: False면 캐시 없이 매번 MongoDB 조회
+        """
         self.mongo = mongo_service
+        self.hash_cache = None
+        if use_cache:
+            self.hash_cache = hash_cache if hash_cache is not None else get_content_hash_cache()
+
+    # 해시 대상 기본 필드 / include_all에서 제외할 메타데이터 필드
+    DEFAULT_HASH_FIELDS = ('title', 'content', 'url', 'body')
+    EXCLUDED_FIELDS = frozenset({'_id', 'created_at', 'updated_at', 'content_hash', 'crawled_at'})
+
+    # 이전(MD5) 해시 길이 - 저장된 해시가 이 길이면 MD5로 비교
+    LEGACY_HASH_LENGTH = 32
+
+    def get_fingerprinter(
+        self,
+        hash_fields: List[str] = None,
+        include_all: bool = False
+    ) -> RecordFingerprinter:
+        """해시 설정에 해당하는 공유 fingerprinter"""
+        if include_all:
+            return get_fingerprinter(None, exclude=self.EXCLUDED_FIELDS)
+        return get_fingerprinter(self.DEFAULT_HASH_FIELDS if hash_fields is None else hash_fields)
 
     def generate_hash(
         self,
@@ -85,24 +121,20 @@ class ChangeDetectionService:
             include_all: 모든 필드 포함 여부
 
         Returns:
-            MD5 해시 문자열
+            SHA-256 기반 해시 문자열 (40자)
         """
-        if include_all:
-            # 메타데이터 제외하고 모든 필드
-            excluded = {'_id', 'created_at', 'updated_at', 'content_hash', 'crawled_at'}
-            hash_fields = [k for k in record.keys() if k not in excluded]
-        elif hash_fields is None:
-            # 기본 필드: title, content, url
-            hash_fields = ['title', 'content', 'url', 'body']
-
-        # 필드 값들을 정렬된 순서로 결합
+        return self.get_fingerprinter(hash_fields, include_all).fingerprint(record)
+
+    def _legacy_hash(self, record: Dict[str, Any], hash_fields: List[str] = None) -> str:
+        """이전 버전 MD5 해시 (기존에 저장된 content_hashes 비교용)"""
+        if hash_fields is None:
+            hash_fields = self.DEFAULT_HASH_FIELDS
+
         values = []
         for field in sorted(hash_fields):
             value = record.get(field)
             if value is not None:
-                # 리스트/딕셔너리는 JSON 문자열로
                 if isinstance(value, (list, dict)):
-                    import json
                     value = json.dumps(value, sort_keys=True, ensure_ascii=False)
                 values.append(f"{field}:{value}")
 
@@ -129,8 +161,8 @@ class ChangeDetectionService:
                 value = str(record[field])
                 return hashlib.md5(value.encode('utf-8')).hexdigest()[:16]
 
-        # 폴백: 전체 레코드 해시
-        return self.generate_hash(record)[:16]
+        # 폴백: 기본 필드 해시 (ID가 바뀌지 않도록 이전 해시 유지)
+        return self._legacy_hash(record)[:16]
 
     async def check_single(
         self,
@@ -234,47 +266,46 @@ class ChangeDetectionService:
             )
 
         # 레코드별 ID와 해시 계산
+        content_hashes = self.get_fingerprinter(hash_fields).fingerprint_many(records)
         record_data = []
-        for record in records:
-            record_id = self.generate_record_id(record, id_fields)
-            content_hash = self.generate_hash(record, hash_fields)
+        for record, content_hash in zip(records, content_hashes):
             record_data.append({
                 "record": record,
-                "record_id": record_id,
+                "record_id": self.generate_record_id(record, id_fields),
                 "content_hash": content_hash
             })
 
-        # 배치로 기존 해시 조회 (단일 쿼리)
+        # 기존 해시 조회 (캐시 → 캐시에 없는 ID만 배치 단일 쿼리)
         record_ids = [r["record_id"] for r in record_data]
-        existing_hashes = {}
-
-        cursor = self.mongo.db[self.HASH_COLLECTION].find({
-            "source_id": source_id,
-            "record_id": {"$in": record_ids}
-        })
-
-        for doc in cursor:
-            existing_hashes[doc["record_id"]] = doc.get("content_hash")
+        existing_hashes = self._lookup_hashes(source_id, record_ids)
 
         # 변경 분류
+        legacy_upgrades = {}
         for data in record_data:
             record_id = data["record_id"]
             content_hash = data["content_hash"]
             record = data["record"]
 
-            # 메타데이터 추가
-            record["_record_id"] = record_id
-            record["_content_hash"] = content_hash
-
             if record_id not in existing_hashes:
                 # 신규
                 new_records.append(record)
-            elif existing_hashes[record_id] != content_hash:
-                # 변경됨
-                modified_records.append(record)
-            else:
+            elif existing_hashes[record_id] == content_hash:
                 # 변경 없음
                 unchanged_ids.append(record_id)
+            elif self._is_legacy_match(existing_hashes[record_id], record, hash_fields):
+                # 변경 없음 (이전 MD5 해시 → 새 해시로 교체)
+                unchanged_ids.append(record_id)
+                legacy_upgrades[record_id] = content_hash
+            else:
+                # 변경됨
+                modified_records.append(record)
+
+            # 메타데이터 추가
+            record["_record_id"] = record_id
+            record["_content_hash"] = content_hash
+
+        if legacy_upgrades:
+            self._write_hashes(source_id, legacy_upgrades)
 
         # 삭제 감지 (선택적)
         deleted_count = 0
@@ -334,42 +365,62 @@ class ChangeDetectionService:
         if not self.mongo or not records:
             return 0
 
-        now = datetime.utcnow()
-        operations = []
+        updates = {}
+        cached_hashes = None
+        if self.hash_cache is not None and source_id in self.hash_cache:
+            cached_hashes, _ = self._get_cached_hashes(source_id)
+        fingerprinter = self.get_fingerprinter(hash_fields)
 
         for record in records:
             # 이미 계산된 해시가 있으면 재사용
             record_id = record.get("_record_id") or self.generate_record_id(record, id_fields)
-            content_hash = record.get("_content_hash") or self.generate_hash(record, hash_fields)
+            content_hash = record.get("_content_hash") or fingerprinter.fingerprint(record)
 
-            operations.append({
-                "filter": {
-                    "source_id": source_id,
-                    "record_id": record_id
-                },
-                "update": {
-                    "$set": {
-                        "content_hash": content_hash,
-                        "updated_at": now
-                    },
-                    "$setOnInsert": {
-                        "created_at": now
-                    }
-                },
-                "upsert": True
-            })
+            # 캐시와 같은 해시는 쓰지 않음 (변경분만 기록)
+            if cached_hashes is not None and cached_hashes.get(record_id) == content_hash:
+                self.hash_cache.stats.writes_skipped += 1
+                continue
+            updates[record_id] = content_hash
+
+        return self._write_hashes(source_id, updates)
+
+    def _write_hashes(self, source_id: str, updates: Dict[str, str]) -> int:
+        """record_id -> content_hash 배치 upsert 후 버전 증가"""
+        if not updates:
+            return 0
 
-        # 배치 upsert
         from pymongo import UpdateOne
+        now = datetime.utcnow()
         bulk_ops = [
-            UpdateOne(op["filter"], op["update"], upsert=op["upsert"])
-            for op in operations
+            UpdateOne(
+                {"source_id": source_id, "record_id": record_id},
+                {
+                    "$set": {"content_hash": content_hash, "updated_at": now},
+                    "$setOnInsert": {"created_at": now}
+                },
+                upsert=True
+            )
+            for record_id, content_hash in updates.items()
         ]
 
         result = self.mongo.db[self.HASH_COLLECTION].bulk_write(bulk_ops)
+        self._bump_version(source_id, updates)
 
         return result.upserted_count + result.modified_count
 
+    def _is_legacy_match(
+        self,
+        stored_hash: Optional[str],
+        record: Dict[str, Any],
+        hash_fields: List[str] = None
+    ) -> bool:
+        """저장된 해시가 이전 MD5 형식이고 레코드 내용이 같은지"""
+        return (
+            stored_hash is not None
+            and len(stored_hash) == self.LEGACY_HASH_LENGTH
+            and stored_hash == self._legacy_hash(record, hash_fields)
+        )
+
     async def log_changes(
         self,
         source_id: str,
@@ -463,6 +514,8 @@ class ChangeDetectionService:
             query["source_id"] = source_id
 
         result = self.mongo.db[self.HASH_COLLECTION].delete_many(query)
+        if result.deleted_count:
+            self._bump_version(source_id)
 
         logger.info(
             "Old hashes cleaned up",
@@ -473,6 +526,100 @@ class ChangeDetectionService:
 
         return result.deleted_count
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """해시 캐시 히트/미스 통계"""
+        if self.hash_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.hash_cache.get_stats()}
+
+    # ==================== 해시 캐시 ====================
+
+    def _get_hash_version(self, source_id: str) -> int:
+        """소스 해시 버전 조회 (쓰기마다 증가)"""
+        self.hash_cache.stats.version_checks += 1
+        doc = self.mongo.db[self.HASH_VERSION_COLLECTION].find_one({"_id": source_id})
+        return int(doc.get("version", 0)) if doc else 0
+
+    def _get_cached_hashes(self, source_id: str) -> Tuple[Optional[Dict[str, Optional[str]]], int]:
+        """
+        캐시된 소스 해시 맵과 현재 해시 버전
+
+        캐시 엔트리의 버전이 content_hash_versions와 다르면 엔트리를 버리고
+        (None, 버전)을 돌려줍니다. is_fresh인 엔트리는 버전 조회를 생략합니다.
+        """
+        cache = self.hash_cache
+        if cache.is_fresh(source_id):
+            hashes, version = cache.get(source_id), cache.cached_version(source_id)
+            if hashes is not None and version is not None:
+                return hashes, version
+        version = self._get_hash_version(source_id)
+        return cache.get(source_id, version), version
+
+    def _lookup_hashes(self, source_id: str, record_ids: List[str]) -> Dict[str, str]:
+        """
+        record_id -> 저장된 해시 (해시가 없는 ID는 제외)
+
+        캐시에 있는 ID는 캐시로 판정하고, 나머지는 $in 조회 한 번으로
+        가져와 캐시에 추가합니다 (해시가 없는 ID는 None으로 기록).
+        """
+        cache = self.hash_cache
+        existing = {}
+        missing = record_ids
+        version = None
+
+        if cache is not None:
+            cached_hashes, version = self._get_cached_hashes(source_id)
+            if cached_hashes is not None:
+                missing = []
+                for record_id in record_ids:
+                    if record_id not in cached_hashes:
+                        missing.append(record_id)
+                        continue
+                    content_hash = cached_hashes[record_id]
+                    if content_hash is not None:
+                        existing[record_id] = content_hash
+                cache.stats.records_served += len(record_ids) - len(missing)
+            if missing:
+                cache.stats.misses += 1
+            else:
+                cache.stats.hits += 1
+
+        if missing:
+            cursor = self.mongo.db[self.HASH_COLLECTION].find(
+                {"source_id": source_id, "record_id": {"$in": missing}},
+                {"_id": 0, "record_id": 1, "content_hash": 1}
+            )
+            found = {doc["record_id"]: doc.get("content_hash") for doc in cursor}
+            existing.update(found)
+            if cache is not None:
+                cache.add(source_id, {record_id: found.get(record_id) for record_id in missing}, version)
+
+        return existing
+
+    def _bump_version(self, source_id: Optional[str], updates: Optional[Dict[str, str]] = None):
+        """해시 쓰기 후 버전 증가 및 캐시 반영 (source_id가 None이면 전체 무효화)"""
+        versions = self.mongo.db[self.HASH_VERSION_COLLECTION]
+
+        if source_id is None:
+            versions.update_many({}, {"$inc": {"version": 1}})
+            if self.hash_cache is not None:
+                self.hash_cache.invalidate()
+            return
+
+        from pymongo import ReturnDocument
+        doc = versions.find_one_and_update(
+            {"_id": source_id},
+            {"$inc": {"version": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        if self.hash_cache is None:
+            return
+
+        version = int(doc["version"])
+        if updates is None or not self.hash_cache.apply(source_id, updates.items(), version - 1, version):
+            self.hash_cache.invalidate(source_id)
+
 
 # 편의 함수
 async def filter_changed_only(
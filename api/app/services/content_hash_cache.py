@@ -0,0 +1,395 @@
+"""
+Content Hash Cache - 소스별 콘텐츠 해시 캐시
+
+ChangeDetectionService가 매 실행마다 content_hashes 컬렉션을 $in 조회하지
+않도록 소스 단위로 record_id -> content_hash 맵을 프로세스 내에 유지합니다.
+맵은 조회했던 record_id만 담고(저장된 해시가 없으면 None), 캐시에 없는
+ID만 $in으로 조회해 채웁니다 (소스 전체 적재 없음).
+
+기본값은 CONTENT_HASH_CACHE_DIR이 있을 때만 사용합니다. 디렉터리가 없으면
+프로세스마다(Airflow 태스크마다) 캐시가 비어 있어 이득이 거의 없습니다.
+CONTENT_HASH_CACHE_ENABLED로 명시적으로 켜거나 끌 수 있습니다.
+
+기능:
+- 소스 간 LRU (전체 해시 개수 기준으로 제한)
+- 버전 기반 무효화 (content_hash_versions의 버전과 다르면 재적재)
+- 소스별 디스크 영속화 (선택, 프로세스 재시작 후 재사용): 압축 스냅샷 +
+  추가 전용 변경 로그, 로그가 커지면 스냅샷으로 병합
+- 히트/미스 카운터
+"""
+
+import gzip
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    from app.core import get_logger
+    logger = get_logger(__name__)
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+CONTENT_HASH_CACHE_DIR = os.getenv('CONTENT_HASH_CACHE_DIR', '')
+CONTENT_HASH_CACHE_ENABLED = os.getenv(
+    'CONTENT_HASH_CACHE_ENABLED', 'true' if CONTENT_HASH_CACHE_DIR else 'false'
+).lower() == 'true'
+CONTENT_HASH_CACHE_MAX_ENTRIES = int(os.getenv('CONTENT_HASH_CACHE_MAX_ENTRIES', '2000000'))
+CONTENT_HASH_CACHE_VERIFY_SECONDS = float(os.getenv('CONTENT_HASH_CACHE_VERIFY_SECONDS', '0'))
+
+
+@dataclass
+class HashCacheStats:
+    """캐시 사용 통계"""
+    hits: int = 0              # 캐시로만 처리한 배치 조회
+    misses: int = 0            # 캐시에 없는 ID를 MongoDB에서 조회한 배치 조회
+    disk_loads: int = 0        # 디스크 파일에서 복원한 횟수
+    records_served: int = 0    # 캐시에서 판정한 레코드 수
+    writes_skipped: int = 0    # 해시가 같아 쓰기를 생략한 레코드 수
+    version_checks: int = 0    # 버전 확인 쿼리 수
+    invalidations: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        data = asdict(self)
+        lookups = self.hits + self.misses
+        data['hit_ratio'] = round(self.hits / lookups, 3) if lookups else 0.0
+        return data
+
+
+class _SourceEntry:
+    __slots__ = ('hashes', 'version', 'verified_at', 'log_lines')
+
+    def __init__(self, hashes: Dict[str, Optional[str]], version: int):
+        self.hashes = hashes
+        self.version = version
+        self.verified_at = time.monotonic()
+        self.log_lines = 0  # 스냅샷 이후 변경 로그 줄 수
+
+
+class ContentHashCache:
+    """
+    소스별 콘텐츠 해시 캐시
+
+    엔트리는 조회했던 record_id의 해시를 담고(저장된 해시가 없으면 None),
+    버전이 일치할 때만 사용됩니다. 엔트리에 없는 record_id는 MongoDB에서
+    조회해 add()로 추가합니다.
+
+    Example:
+        cache = ContentHashCache(max_entries=1_000_000, persist_dir="/var/cache/hashes")
+        hashes = cache.get("source_1", version=3) or {}
+        missing = [rid for rid in record_ids if rid not in hashes]
+        if missing:
+            cache.add("source_1", query_hashes(missing), version=3)
+    """
+
+    FILE_SUFFIX = '.hashes.gz'
+    LOG_SUFFIX = '.hashes.log'
+
+    # 변경 로그가 이 줄 수와 엔트리 크기의 COMPACT_RATIO 중 큰 값을 넘으면 스냅샷으로 병합
+    COMPACT_MIN_LINES = 10000
+    COMPACT_RATIO = 0.5
+
+    def __init__(
+        self,
+        max_entries: int = CONTENT_HASH_CACHE_MAX_ENTRIES,
+        persist_dir: Optional[str] = None,
+        verify_interval_seconds: float = 0.0
+    ):
+        self.max_entries = max_entries
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        self.verify_interval_seconds = verify_interval_seconds
+        self.stats = HashCacheStats()
+        self._sources: 'OrderedDict[str, _SourceEntry]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+
+        if self.persist_dir:
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, source_id: str) -> bool:
+        return source_id in self._sources
+
+    def is_fresh(self, source_id: str) -> bool:
+        """최근 verify_interval_seconds 이내에 버전 확인된 엔트리인지"""
+        if self.verify_interval_seconds <= 0:
+            return False
+        with self._lock:
+            entry = self._sources.get(source_id)
+            return entry is not None and time.monotonic() - entry.verified_at < self.verify_interval_seconds
+
+    def cached_version(self, source_id: str) -> Optional[int]:
+        with self._lock:
+            entry = self._sources.get(source_id)
+            return entry.version if entry else None
+
+    def get(self, source_id: str, version: Optional[int] = None) -> Optional[Dict[str, Optional[str]]]:
+        """
+        소스 해시 맵 조회
+
+        Args:
+            source_id: 소스 ID
+            version: 현재 버전 (None이면 버전 확인 생략, is_fresh일 때 사용)
+
+        Returns:
+            record_id -> content_hash 맵 (해시 없는 ID는 None, 버전이 다르거나 없으면 None)
+        """
+        with self._lock:
+            entry = self._sources.get(source_id)
+            if entry is None and self.persist_dir:
+                entry = self._load_file(source_id)
+                if entry is not None:
+                    self.stats.disk_loads += 1
+                    self._insert(source_id, entry)
+
+            if entry is None:
+                return None
+
+            if version is not None:
+                if entry.version != version:
+                    self._remove(source_id)
+                    self.stats.invalidations += 1
+                    return None
+                entry.verified_at = time.monotonic()
+
+            self._sources.move_to_end(source_id)
+            return entry.hashes
+
+    def put(self, source_id: str, hashes: Dict[str, Optional[str]], version: int) -> bool:
+        """소스 해시 맵 저장 (단일 소스가 max_entries를 넘으면 캐시하지 않음)"""
+        if len(hashes) > self.max_entries:
+            logger.info(f"Hash cache skipped source {source_id}: {len(hashes)} hashes > {self.max_entries}")
+            return False
+
+        with self._lock:
+            self._remove(source_id)
+            self._insert(source_id, _SourceEntry(hashes, version))
+            self._save_file(source_id)
+        return True
+
+    def add(self, source_id: str, hashes: Dict[str, Optional[str]], version: int) -> bool:
+        """
+        조회 결과 추가 (엔트리가 없거나 버전이 다르면 새 엔트리로 시작)
+
+        Returns:
+            캐시 여부 (엔트리가 max_entries를 넘으면 캐시하지 않음)
+        """
+        with self._lock:
+            entry = self._sources.get(source_id)
+            if entry is None or entry.version != version:
+                return self.put(source_id, dict(hashes), version)
+            if len(entry.hashes) + len(hashes) > self.max_entries:
+                self._remove(source_id)
+                return False
+
+            before = len(entry.hashes)
+            entry.hashes.update(hashes)
+            self._size += len(entry.hashes) - before
+            self._sources.move_to_end(source_id)
+            self._evict()
+            if source_id in self._sources:
+                self._append_file(source_id, hashes.items())
+            return True
+
+    def apply(
+        self,
+        source_id: str,
+        updates: Iterable[Tuple[str, str]],
+        previous_version: int,
+        version: int
+    ) -> bool:
+        """
+        쓰기 결과 반영 (write-through)
+
+        캐시 버전이 previous_version과 같을 때만 변경분을 적용하고
+        새 버전으로 올립니다. 그 사이 다른 쓰기가 있었으면 엔트리를 버립니다.
+        """
+        with self._lock:
+            entry = self._sources.get(source_id)
+            if entry is None:
+                return False
+            if entry.version != previous_version:
+                self._remove(source_id)
+                self.stats.invalidations += 1
+                return False
+
+            updates = list(updates)
+            before = len(entry.hashes)
+            entry.hashes.update(updates)
+            entry.version = version
+            entry.verified_at = time.monotonic()
+            self._size += len(entry.hashes) - before
+            self._evict()
+            if source_id in self._sources:
+                self._append_file(source_id, updates, version)
+            return True
+
+    def invalidate(self, source_id: Optional[str] = None) -> None:
+        """소스 또는 전체 엔트리 무효화 (디스크 파일 포함)"""
+        with self._lock:
+            source_ids = [source_id] if source_id else list(self._sources)
+            for sid in source_ids:
+                if sid in self._sources:
+                    self._remove(sid)
+                    self.stats.invalidations += 1
+            if self.persist_dir:
+                if source_id:
+                    self._file_path(source_id).unlink(missing_ok=True)
+                    self._log_path(source_id).unlink(missing_ok=True)
+                else:
+                    for suffix in (self.FILE_SUFFIX, self.LOG_SUFFIX):
+                        for path in self.persist_dir.glob(f'*{suffix}'):
+                            path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            data = self.stats.to_dict()
+            data['sources'] = len(self._sources)
+            data['entries'] = self._size
+            return data
+
+    # ==================== 내부 ====================
+
+    def _insert(self, source_id: str, entry: _SourceEntry) -> None:
+        self._sources[source_id] = entry
+        self._size += len(entry.hashes)
+        self._evict()
+
+    def _remove(self, source_id: str) -> None:
+        entry = self._sources.pop(source_id, None)
+        if entry is not None:
+            self._size -= len(entry.hashes)
+
+    def _evict(self) -> None:
+        while self._size > self.max_entries and self._sources:
+            source_id, entry = self._sources.popitem(last=False)
+            self._size -= len(entry.hashes)
+            self.stats.evictions += 1
+
+    def _file_path(self, source_id: str, suffix: str = FILE_SUFFIX) -> Path:
+        safe_id = re.sub(r'[^A-Za-z0-9_.-]', '_', source_id)
+        return self.persist_dir / f'{safe_id}{suffix}'
+
+    def _log_path(self, source_id: str) -> Path:
+        return self._file_path(source_id, self.LOG_SUFFIX)
+
+    def _save_file(self, source_id: str) -> None:
+        """
+        스냅샷 저장: '#<version>' 헤더 뒤에 'record_id<TAB>hash' 줄을 gzip으로
+        (해시 없음은 빈 값, 원자적 교체). 변경 로그는 먼저 지움 - 중간에
+        실패해도 남는 것은 이전 버전 스냅샷이라 버전 확인에서 버려짐.
+        """
+        if not self.persist_dir:
+            return
+        entry = self._sources[source_id]
+        path = self._file_path(source_id)
+        tmp_path = path.with_suffix(f'.tmp{os.getpid()}')
+        try:
+            self._log_path(source_id).unlink(missing_ok=True)
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=1) as f:
+                f.write(f'#{entry.version}\n')
+                f.writelines(f'{rid}\t{h or ""}\n' for rid, h in entry.hashes.items())
+            os.replace(tmp_path, path)
+            entry.log_lines = 0
+        except OSError as e:
+            logger.warning(f"Failed to persist hash cache for {source_id}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _append_file(
+        self,
+        source_id: str,
+        hashes: Iterable[Tuple[str, Optional[str]]],
+        version: Optional[int] = None
+    ) -> None:
+        """
+        변경분을 로그에 추가 (스냅샷과 같은 줄 형식, 버전 변경은 변경분 뒤에
+        '#<version>' 줄). 로그가 커지면 스냅샷으로 병합합니다.
+        """
+        if not self.persist_dir:
+            return
+        entry = self._sources[source_id]
+        if not self._file_path(source_id).exists():
+            self._save_file(source_id)
+            return
+
+        lines = [f'{rid}\t{h or ""}\n' for rid, h in hashes]
+        if version is not None:
+            lines.append(f'#{version}\n')
+        if not lines:
+            return
+        if entry.log_lines + len(lines) > max(self.COMPACT_MIN_LINES, self.COMPACT_RATIO * len(entry.hashes)):
+            self._save_file(source_id)
+            return
+        try:
+            with open(self._log_path(source_id), 'a', encoding='utf-8') as f:
+                f.write(''.join(lines))
+            entry.log_lines += len(lines)
+        except OSError as e:
+            logger.warning(f"Failed to append hash cache log for {source_id}: {e}")
+            self._save_file(source_id)
+
+    def _load_file(self, source_id: str) -> Optional[_SourceEntry]:
+        path = self._file_path(source_id)
+        if not path.exists():
+            return None
+        log_path = self._log_path(source_id)
+        log_lines = 0
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                version = int(f.readline()[1:])
+                hashes = {}
+                for line in f:
+                    rid, h = line.rstrip('\n').split('\t', 1)
+                    hashes[rid] = h or None
+            if log_path.exists():
+                with open(log_path, encoding='utf-8') as f:
+                    for line in f:
+                        if not line.endswith('\n'):
+                            break  # 기록 중 중단된 마지막 줄
+                        if line.startswith('#'):
+                            version = int(line[1:])
+                        else:
+                            rid, h = line.rstrip('\n').split('\t', 1)
+                            hashes[rid] = h or None
+                        log_lines += 1
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning(f"Discarding unreadable hash cache file {path}: {e}")
+            path.unlink(missing_ok=True)
+            log_path.unlink(missing_ok=True)
+            return None
+
+        if len(hashes) > self.max_entries:
+            return None
+        entry = _SourceEntry(hashes, version)
+        entry.verified_at = 0.0  # 디스크 엔트리는 항상 버전 확인 필요
+        entry.log_lines = log_lines
+        return entry
+
+
+_default_cache: Optional[ContentHashCache] = None
+_default_lock = threading.Lock()
+
+
+def get_content_hash_cache() -> Optional[ContentHashCache]:
+    """프로세스 공용 캐시 (CONTENT_HASH_CACHE_ENABLED가 꺼져 있으면 None)"""
+    global _default_cache
+    if not CONTENT_HASH_CACHE_ENABLED:
+        return None
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = ContentHashCache(
+                    max_entries=CONTENT_HASH_CACHE_MAX_ENTRIES,
+                    persist_dir=CONTENT_HASH_CACHE_DIR or None,
+                    verify_interval_seconds=CONTENT_HASH_CACHE_VERIFY_SECONDS
+                )
+    return _default_cache
@@ -32,7 +32,10 @@ Data Catalog Service - 데이터 카탈로그 및 메타데이터 관리
         tags=["staging", "daily"],
     )
 
-    # 검색
+    # 검색 (역색인 + BM25, 카탈로그 쓰기 증분 반영)
+    index = get_catalog_search_index(mongo)
+    catalog = DataCatalog(mongo, search_index=index)
+    search = CatalogSearch(mongo, index=index)
     results = search.search("news", filters=SearchFilter(
         dataset_types=[DatasetType.FINAL],
         domains=["news"],
@@ -106,6 +109,11 @@ from .search import (
     # Service
     CatalogSearch,
 )
+from .search_index import (
+    CatalogSearchIndex,
+    get_catalog_search_index,
+    reset_catalog_search_index,
+)
 
 __all__ = [
     # === Models ===
@@ -153,6 +161,9 @@ __all__ = [
     "Suggestion",
     # Service
     "CatalogSearch",
+    "CatalogSearchIndex",
+    "get_catalog_search_index",
+    "reset_catalog_search_index",
 ]
 
 
@@ -83,14 +83,16 @@ class DataCatalog:
         },
     }
 
-    def __init__(self, mongo_service=None):
+    def __init__(self, mongo_service=None, search_index=None):
         """
         초기화
 
         Args:
             mongo_service: MongoService 인스턴스
+            search_index: CatalogSearchIndex (있으면 데이터셋 쓰기를 증분 반영)
         """
         self.mongo = mongo_service
+        self.search_index = search_index
         self._tag_cache: Dict[str, Tag] = {}
 
     def _get_catalog_collection(self):
@@ -117,6 +119,19 @@ class DataCatalog:
             doc["_id"] = str(doc["_id"])
         return doc
 
+    def _reindex(self, dataset_id: str):
+        """검색 인덱스에 데이터셋 변경 반영"""
+        if self.search_index is None:
+            return
+        try:
+            doc = self._get_catalog_collection().find_one({"_id": ObjectId(dataset_id)})
+            if doc:
+                self.search_index.upsert(doc)
+            else:
+                self.search_index.remove(dataset_id)
+        except Exception as e:
+            logger.warning(f"Failed to update search index for {dataset_id}: {e}")
+
     # ==================== Dataset CRUD ====================
 
     def create_dataset(
@@ -153,7 +168,7 @@ class DataCatalog:
         collection = self._get_catalog_collection()
 
         # 중복 체크
-        if collection:
+        if collection is not None:
             existing = collection.find_one({"name": name})
             if existing:
                 raise ValueError(f"Dataset with name '{name}' already exists")
@@ -177,13 +192,16 @@ class DataCatalog:
         )
 
         # 저장
-        if collection:
+        if collection is not None:
             doc = dataset.to_dict()
             del doc["_id"]  # 새 ID 생성
             result = collection.insert_one(doc)
             dataset.id = str(result.inserted_id)
             logger.info(f"Created dataset: {dataset.id} ({name})")
 
+            if self.search_index is not None:
+                self.search_index.upsert({**doc, "_id": result.inserted_id})
+
             # 컬럼 정보 저장
             if columns:
                 self._save_columns(dataset.id, columns)
@@ -205,7 +223,7 @@ class DataCatalog:
             Dataset 또는 None
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return None
 
         try:
@@ -228,7 +246,7 @@ class DataCatalog:
             Dataset 또는 None
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return None
 
         doc = collection.find_one({"name": name})
@@ -248,7 +266,7 @@ class DataCatalog:
             Dataset 또는 None
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return None
 
         doc = collection.find_one({"collection_name": collection_name})
@@ -283,7 +301,7 @@ class DataCatalog:
             (데이터셋 목록, 전체 개수)
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return [], 0
 
         query = {}
@@ -332,7 +350,7 @@ class DataCatalog:
             수정 성공 여부
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return False
 
         # 수정 불가 필드 제거
@@ -348,6 +366,7 @@ class DataCatalog:
             )
             if result.modified_count > 0:
                 logger.info(f"Updated dataset: {dataset_id}")
+                self._reindex(dataset_id)
                 return True
         except InvalidId:
             logger.warning(f"Invalid dataset ID: {dataset_id}")
@@ -367,18 +386,20 @@ class DataCatalog:
         collection = self._get_catalog_collection()
         columns_collection = self._get_columns_collection()
 
-        if not collection:
+        if collection is None:
             return False
 
         try:
             # 컬럼 정보 삭제
-            if columns_collection:
+            if columns_collection is not None:
                 columns_collection.delete_many({"dataset_id": dataset_id})
 
             # 데이터셋 삭제
             result = collection.delete_one({"_id": ObjectId(dataset_id)})
             if result.deleted_count > 0:
                 logger.info(f"Deleted dataset: {dataset_id}")
+                if self.search_index is not None:
+                    self.search_index.remove(dataset_id)
                 return True
         except InvalidId:
             logger.warning(f"Invalid dataset ID: {dataset_id}")
@@ -407,7 +428,7 @@ class DataCatalog:
     def _save_columns(self, dataset_id: str, columns: List[Column]):
         """컬럼 정보 저장"""
         collection = self._get_columns_collection()
-        if not collection:
+        if collection is None:
             return
 
         # 기존 컬럼 삭제
@@ -430,7 +451,7 @@ class DataCatalog:
             컬럼 목록
         """
         collection = self._get_columns_collection()
-        if not collection:
+        if collection is None:
             return []
 
         cursor = collection.find({"dataset_id": dataset_id})
@@ -454,7 +475,7 @@ class DataCatalog:
             수정 성공 여부
         """
         collection = self._get_columns_collection()
-        if not collection:
+        if collection is None:
             return False
 
         updates["updated_at"] = datetime.utcnow()
@@ -479,7 +500,7 @@ class DataCatalog:
         collection = self._get_columns_collection()
         catalog_collection = self._get_catalog_collection()
 
-        if not collection or not catalog_collection:
+        if collection is None or catalog_collection is None:
             return False
 
         # 중복 체크
@@ -503,6 +524,7 @@ class DataCatalog:
                 "$set": {"updated_at": datetime.utcnow()}
             }
         )
+        self._reindex(dataset_id)
 
         return True
 
@@ -564,7 +586,7 @@ class DataCatalog:
             usage_count=0,
         )
 
-        if collection:
+        if collection is not None:
             # 중복 체크
             existing = collection.find_one({"name": name})
             if existing:
@@ -593,7 +615,7 @@ class DataCatalog:
             return self._tag_cache[name]
 
         collection = self._get_tags_collection()
-        if not collection:
+        if collection is None:
             return None
 
         doc = collection.find_one({"name": name})
@@ -620,7 +642,7 @@ class DataCatalog:
             태그 목록
         """
         collection = self._get_tags_collection()
-        if not collection:
+        if collection is None:
             return []
 
         query = {}
@@ -637,7 +659,7 @@ class DataCatalog:
     def _increment_tag_usage(self, tag_names: List[str]):
         """태그 사용 카운트 증가"""
         collection = self._get_tags_collection()
-        if collection:
+        if collection is not None:
             collection.update_many(
                 {"name": {"$in": tag_names}},
                 {"$inc": {"usage_count": 1}}
@@ -655,7 +677,7 @@ class DataCatalog:
             수정 성공 여부
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return False
 
         result = collection.update_one(
@@ -668,6 +690,7 @@ class DataCatalog:
 
         if result.modified_count > 0:
             self._increment_tag_usage(tags)
+            self._reindex(dataset_id)
             return True
 
         return False
@@ -684,7 +707,7 @@ class DataCatalog:
             수정 성공 여부
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return False
 
         result = collection.update_one(
@@ -695,7 +718,11 @@ class DataCatalog:
             }
         )
 
-        return result.modified_count > 0
+        if result.modified_count > 0:
+            self._reindex(dataset_id)
+            return True
+
+        return False
 
     # ==================== Quality Metrics ====================
 
@@ -789,7 +816,7 @@ class DataCatalog:
             추가 성공 여부
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return False
 
         result = collection.update_one(
@@ -800,7 +827,11 @@ class DataCatalog:
             }
         )
 
-        return result.modified_count > 0
+        if result.modified_count > 0:
+            self._reindex(dataset_id)
+            return True
+
+        return False
 
     def remove_owner(self, dataset_id: str, user_id: str) -> bool:
         """
@@ -814,7 +845,7 @@ class DataCatalog:
             제거 성공 여부
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return False
 
         result = collection.update_one(
@@ -825,7 +856,11 @@ class DataCatalog:
             }
         )
 
-        return result.modified_count > 0
+        if result.modified_count > 0:
+            self._reindex(dataset_id)
+            return True
+
+        return False
 
     # ==================== Auto Registration ====================
 
@@ -996,7 +1031,7 @@ class DataCatalog:
         collection = self._get_catalog_collection()
         tags_collection = self._get_tags_collection()
 
-        if not collection:
+        if collection is None:
             return CatalogStatistics()
 
         # 데이터셋 통계
@@ -1104,7 +1139,7 @@ class DataCatalog:
             기록 성공 여부
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return False
 
         try:
@@ -1115,6 +1150,8 @@ class DataCatalog:
                     "$set": {"last_accessed_at": datetime.utcnow()}
                 }
             )
+            if result.modified_count > 0 and self.search_index is not None:
+                self.search_index.increment_access(dataset_id)
             return result.modified_count > 0
         except InvalidId:
             return False
@@ -2,7 +2,7 @@
 Data Catalog Search - 메타데이터 검색 및 발견
 
 주요 기능:
-1. 전문 검색 (Full-text search)
+1. 전문 검색 (Full-text search, 역색인 + BM25는 search_index 참고)
 2. 패싯 검색 (Faceted search)
 3. 유사 데이터셋 추천
 4. 인기/최근 데이터셋
@@ -11,7 +11,7 @@ Data Catalog Search - 메타데이터 검색 및 발견
 
 import logging
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
@@ -108,6 +108,68 @@ class SearchFilter:
 
         return query
 
+    def matches(self, doc: Dict[str, Any]) -> bool:
+        """
+        메모리 문서에 대한 필터 평가 (검색 인덱스용, to_mongo_query와 같은 조건)
+
+        Args:
+            doc: data_catalog 문서 형태의 dict (날짜는 datetime)
+
+        Returns:
+            필터 통과 여부
+        """
+        if self.dataset_types and doc.get("dataset_type") not in {t.value for t in self.dataset_types}:
+            return False
+
+        if self.statuses and doc.get("status") not in {s.value for s in self.statuses}:
+            return False
+
+        if self.domains and doc.get("domain") not in self.domains:
+            return False
+
+        if self.tags and not set(self.tags) <= set(doc.get("tags") or []):
+            return False
+
+        if self.owners and not {o.get("user_id") for o in doc.get("owners") or []} & set(self.owners):
+            return False
+
+        if self.sensitivity_levels and doc.get("sensitivity") not in {s.value for s in self.sensitivity_levels}:
+            return False
+
+        score = (doc.get("quality_metrics") or {}).get("overall_score")
+        if self.min_quality_score is not None and (score is None or score < self.min_quality_score):
+            return False
+
+        if self.max_quality_score is not None and (score is None or score > self.max_quality_score):
+            return False
+
+        created_at = _naive_utc(doc.get("created_at"))
+        if self.created_after and (created_at is None or created_at < _naive_utc(self.created_after)):
+            return False
+
+        if self.created_before and (created_at is None or created_at > _naive_utc(self.created_before)):
+            return False
+
+        updated_at = _naive_utc(doc.get("updated_at"))
+        if self.updated_after and (updated_at is None or updated_at < _naive_utc(self.updated_after)):
+            return False
+
+        if self.has_documentation is not None:
+            documented = bool(doc.get("description")) or bool(doc.get("has_column_description"))
+            if documented != self.has_documentation:
+                return False
+
+        return True
+
+
+def _naive_utc(value: Any) -> Optional[datetime]:
+    """비교용 datetime (aware는 UTC naive로 변환, 문자열/기타는 None)"""
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 
 @dataclass
 class SearchFacet:
@@ -193,14 +255,27 @@ class CatalogSearch:
     WEIGHT_TAG = 0.8
     WEIGHT_DOMAIN = 0.5
 
-    def __init__(self, mongo_service=None):
+    # 품질 점수 패싯 구간
+    QUALITY_BOUNDARIES = [0, 50, 70, 85, 95, 101]
+    QUALITY_LABELS = {
+        0: "0-50 (Low)",
+        50: "50-70 (Medium)",
+        70: "70-85 (Good)",
+        85: "85-95 (High)",
+        95: "95-100 (Excellent)",
+        "unknown": "Unknown",
+    }
+
+    def __init__(self, mongo_service=None, index=None):
         """
         초기화
 
         Args:
             mongo_service: MongoService 인스턴스
+            index: CatalogSearchIndex (있으면 검색어 검색을 역색인 + BM25로 처리)
         """
         self.mongo = mongo_service
+        self.index = index
         self._search_history: List[Dict] = []
 
     def _get_catalog_collection(self):
@@ -255,7 +330,7 @@ class CatalogSearch:
         start_time = datetime.utcnow()
         collection = self._get_catalog_collection()
 
-        if not collection:
+        if collection is None:
             return SearchResult(
                 datasets=[],
                 total=0,
@@ -264,6 +339,14 @@ class CatalogSearch:
                 query=query,
             )
 
+        # 역색인 검색 (전체 결과를 BM25로 순위화한 뒤 페이지만 조회)
+        if query and self.index is not None:
+            ranked = self.index.search(query, filters, sort_by)
+            if ranked is not None:
+                return self._search_index_results(
+                    collection, ranked, query, page, page_size, include_facets, start_time
+                )
+
         # MongoDB 쿼리 구성
         mongo_query = {}
 
@@ -339,6 +422,91 @@ class CatalogSearch:
             search_time_ms=search_time,
         )
 
+    def _search_index_results(
+        self,
+        collection,
+        ranked: List[Tuple[str, float]],
+        query: str,
+        page: int,
+        page_size: int,
+        include_facets: bool,
+        start_time: datetime,
+    ) -> SearchResult:
+        """역색인 순위 결과 → SearchResult (현재 페이지 문서만 MongoDB 조회)"""
+        total = len(ranked)
+        skip = (page - 1) * page_size
+        page_ids = [dataset_id for dataset_id, _ in ranked[skip:skip + page_size]]
+
+        docs = {}
+        if page_ids:
+            object_ids = [ObjectId(i) if ObjectId.is_valid(i) else i for i in page_ids]
+            for doc in collection.find({"_id": {"$in": object_ids}}):
+                docs[str(doc["_id"])] = doc
+        datasets = [Dataset.from_dict(self._serialize_id(docs[i])) for i in page_ids if i in docs]
+
+        facets = []
+        if include_facets:
+            facets = self._build_index_facets([dataset_id for dataset_id, _ in ranked])
+
+        suggestions = []
+        if total == 0:
+            suggestions = self._get_suggestions(query)
+
+        self._record_search(query, total)
+
+        return SearchResult(
+            datasets=datasets,
+            total=total,
+            page=page,
+            page_size=page_size,
+            query=query,
+            facets=facets,
+            suggestions=suggestions,
+            search_time_ms=(datetime.utcnow() - start_time).total_seconds() * 1000,
+        )
+
+    def _build_index_facets(self, dataset_ids: List[str]) -> List[SearchFacet]:
+        """검색 결과 전체에 대한 패싯 (검색 인덱스 보관 필드로 계산)"""
+        types, domains, statuses, tags, quality = Counter(), Counter(), Counter(), Counter(), Counter()
+        for dataset_id in dataset_ids:
+            doc = self.index.get_document(dataset_id)
+            if doc is None:
+                continue
+            types[doc.get("dataset_type")] += 1
+            domains[doc.get("domain")] += 1
+            statuses[doc.get("status")] += 1
+            tags.update(doc.get("tags") or [])
+            score = (doc.get("quality_metrics") or {}).get("overall_score")
+            bucket = "unknown"
+            if isinstance(score, (int, float)):
+                for lower, upper in zip(self.QUALITY_BOUNDARIES, self.QUALITY_BOUNDARIES[1:]):
+                    if lower <= score < upper:
+                        bucket = lower
+                        break
+            quality[bucket] += 1
+
+        def values(counter, limit=None, skip_empty=True):
+            return [
+                {"value": value, "count": count}
+                for value, count in counter.most_common(limit)
+                if value or not skip_empty
+            ]
+
+        return [
+            SearchFacet(name="데이터셋 유형", field="dataset_type", values=values(types)),
+            SearchFacet(name="도메인", field="domain", values=values(domains, 10)),
+            SearchFacet(name="상태", field="status", values=values(statuses)),
+            SearchFacet(name="태그", field="tags", values=values(tags, 15)),
+            SearchFacet(
+                name="품질 점수",
+                field="quality_score",
+                values=[
+                    {"value": self.QUALITY_LABELS[bucket], "count": count}
+                    for bucket, count in sorted(quality.items(), key=lambda item: (item[0] == "unknown", item[0] if item[0] != "unknown" else 0))
+                ],
+            ),
+        ]
+
     def _get_sort_spec(self, sort_by: SortOption, query: str = None) -> List[Tuple[str, int]]:
         """정렬 스펙 생성"""
         sort_mapping = {
@@ -405,7 +573,7 @@ class CatalogSearch:
     def _build_facets(self, base_query: Dict) -> List[SearchFacet]:
         """검색 패싯 생성"""
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return []
 
         facets = []
@@ -472,7 +640,7 @@ class CatalogSearch:
             {
                 "$bucket": {
                     "groupBy": "$quality_metrics.overall_score",
-                    "boundaries": [0, 50, 70, 85, 95, 101],
+                    "boundaries": self.QUALITY_BOUNDARIES,
                     "default": "unknown",
                     "output": {"count": {"$sum": 1}},
                 }
@@ -480,19 +648,11 @@ class CatalogSearch:
         ]
         quality_results = list(collection.aggregate(quality_pipeline))
 
-        quality_labels = {
-            0: "0-50 (Low)",
-            50: "50-70 (Medium)",
-            70: "70-85 (Good)",
-            85: "85-95 (High)",
-            95: "95-100 (Excellent)",
-            "unknown": "Unknown",
-        }
         facets.append(SearchFacet(
             name="품질 점수",
             field="quality_score",
             values=[
-                {"value": quality_labels.get(r["_id"], str(r["_id"])), "count": r["count"]}
+                {"value": self.QUALITY_LABELS.get(r["_id"], str(r["_id"])), "count": r["count"]}
                 for r in quality_results
             ],
         ))
@@ -502,7 +662,7 @@ class CatalogSearch:
     def _get_suggestions(self, query: str) -> List[str]:
         """검색어 제안"""
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return []
 
         suggestions = []
@@ -518,7 +678,7 @@ class CatalogSearch:
 
         # 태그에서 찾기
         tags_collection = self._get_tags_collection()
-        if tags_collection:
+        if tags_collection is not None:
             tag_results = tags_collection.find(
                 {"name": {"$regex": f".*{query}.*", "$options": "i"}},
                 {"name": 1}
@@ -564,7 +724,7 @@ class CatalogSearch:
         collection = self._get_columns_collection()
         catalog_collection = self._get_catalog_collection()
 
-        if not collection or not catalog_collection:
+        if collection is None or catalog_collection is None:
             return [], 0
 
         mongo_query: Dict[str, Any] = {}
@@ -671,7 +831,7 @@ class CatalogSearch:
         columns_collection = self._get_columns_collection()
 
         # 데이터셋 이름
-        if catalog_collection:
+        if catalog_collection is not None:
             dataset_cursor = catalog_collection.find(
                 {"name": {"$regex": f"^{prefix}", "$options": "i"}},
                 {"name": 1, "display_name": 1}
@@ -685,7 +845,7 @@ class CatalogSearch:
                 ))
 
         # 태그
-        if tags_collection:
+        if tags_collection is not None:
             tag_cursor = tags_collection.find(
                 {"name": {"$regex": f"^{prefix}", "$options": "i"}},
                 {"name": 1, "category": 1}
@@ -699,7 +859,7 @@ class CatalogSearch:
                 ))
 
         # 컬럼 이름
-        if columns_collection:
+        if columns_collection is not None:
             column_cursor = columns_collection.find(
                 {"name": {"$regex": f"^{prefix}", "$options": "i"}},
                 {"name": 1, "data_type": 1}
@@ -717,7 +877,7 @@ class CatalogSearch:
                     ))
 
         # 도메인
-        if catalog_collection:
+        if catalog_collection is not None:
             domain_pipeline = [
                 {"$match": {"domain": {"$regex": f"^{prefix}", "$options": "i"}}},
                 {"$group": {"_id": "$domain"}},
@@ -769,7 +929,7 @@ class CatalogSearch:
             (데이터셋, 유사도 점수) 튜플 목록
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return []
 
         # 기준 데이터셋 조회
@@ -868,7 +1028,7 @@ class CatalogSearch:
             데이터셋 목록
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return []
 
         since = datetime.utcnow() - timedelta(days=days)
@@ -894,7 +1054,7 @@ class CatalogSearch:
             데이터셋 목록
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return []
 
         cursor = collection.find({}).sort("created_at", -1).limit(limit)
@@ -915,7 +1075,7 @@ class CatalogSearch:
             데이터셋 목록
         """
         collection = self._get_catalog_collection()
-        if not collection:
+        if collection is None:
             return []
 
         cursor = collection.find({
@@ -0,0 +1,486 @@
+"""
+Catalog Search Index - 프로세스 상주 카탈로그 전문 검색 인덱스
+
+data_catalog 문서를 한 번 적재해 역색인(term → {dataset_id: 가중 tf})으로
+보관하고, DataCatalog의 쓰기(생성/수정/삭제/태그/컬럼/소유자)를 증분
+반영합니다. CatalogSearch.search는 검색어가 있으면 이 인덱스로 일치하는
+전체 데이터셋을 BM25로 순위화한 뒤 현재 페이지 문서만 MongoDB에서 가져옵니다.
+
+- 토큰화: 영문/숫자는 단어 단위(camelCase, snake_case 분리), 한글은 음절
+  bigram (조사가 붙은 어절도 부분 일치, 한 글자 어절은 unigram)
+- 필드 가중치: CatalogSearch.WEIGHT_* (이름 > 표시 이름 > 설명 > 컬럼 > 태그 > 도메인)
+- 검색어의 모든 토큰이 일치해야 함(AND), 각 토큰은 접두어 확장 포함
+- 필터/정렬/패싯에 필요한 필드만 보관 (SearchFilter.matches로 필터링)
+
+Usage:
+    index = get_catalog_search_index(mongo)
+    search = CatalogSearch(mongo, index=index)
+    catalog = DataCatalog(mongo, search_index=index)
+"""
+
+import bisect
+import math
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from .search import CatalogSearch, SearchFilter, SortOption
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 재적재 주기 (다른 프로세스의 쓰기 반영, 0이면 재적재 안 함)
+CATALOG_SEARCH_INDEX_TTL_SECONDS = int(os.getenv('CATALOG_SEARCH_INDEX_TTL_SECONDS', '300'))
+
+# 적재 실패 후 재시도까지 대기 (요청마다 전체 스캔 재시도 방지)
+CATALOG_SEARCH_INDEX_RETRY_SECONDS = int(os.getenv('CATALOG_SEARCH_INDEX_RETRY_SECONDS', '60'))
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 접두어 확장 (완전 일치가 아닌 term은 점수 감쇠)
+PREFIX_MIN_LENGTH = 2
+PREFIX_MAX_EXPANSIONS = 50
+PREFIX_WEIGHT = 0.5
+
+# 필터/정렬/패싯용으로 보관하는 필드
+_STORED_FIELDS = [
+    "name", "description", "dataset_type", "status", "domain", "tags", "owners",
+    "sensitivity", "quality_metrics", "created_at", "updated_at", "access_count", "record_count",
+]
+
+_CAMEL_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_WORD_RE = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+
+
+def tokenize(text: Any) -> List[str]:
+    """
+    검색용 토큰 분리
+
+    영문/숫자는 소문자 단어(밑줄, camelCase 경계에서 분리), 한글은 음절
+    bigram으로 나눕니다. 예: "crawlResults 뉴스기사" → crawl, results, 뉴스, 스기, 기사
+
+    Args:
+        text: 원문
+
+    Returns:
+        토큰 목록 (중복 포함)
+    """
+    if not text:
+        return []
+    tokens = []
+    for word in _WORD_RE.findall(_CAMEL_RE.sub(" ", str(text)).lower()):
+        if "가" <= word[0] <= "힣" and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return value
+
+
+class CatalogSearchIndex:
+    """카탈로그 역색인 (BM25 순위)"""
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._doc_length: Dict[str, float] = {}
+        self._total_length = 0.0
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._vocabulary: List[str] = []  # 접두어 검색용 정렬 목록
+        self._lock = threading.RLock()
+        # 적재 중 들어온 쓰기 (교체 후 재적용, 적재 중이 아니면 None)
+        self._pending: Optional[List[Tuple[str, Any]]] = None
+        self.loaded_at: Optional[float] = None
+
+    # ==================== Load & Update ====================
+
+    def load(self, mongo_service) -> "CatalogSearchIndex":
+        """
+        data_catalog 전체 적재 (기존 내용 대체)
+
+        스캔 중에도 기존 내용으로 검색하며, 그동안의 upsert/remove/
+        increment_access는 새 내용으로 교체한 뒤 다시 적용합니다.
+
+        Args:
+            mongo_service: MongoService 인스턴스
+
+        Returns:
+            self
+        """
+        start = time.perf_counter()
+        with self._lock:
+            self._pending = []
+        try:
+            projection = {name: 1 for name in _STORED_FIELDS + ["display_name", "columns"]}
+            fresh = CatalogSearchIndex()
+            for doc in mongo_service.db.data_catalog.find({}, projection):
+                fresh._add(doc)
+            fresh._vocabulary = sorted(fresh._postings)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            pending = self._pending or []
+            self._postings = fresh._postings
+            self._doc_terms = fresh._doc_terms
+            self._doc_length = fresh._doc_length
+            self._total_length = fresh._total_length
+            self._docs = fresh._docs
+            self._vocabulary = fresh._vocabulary
+            self._pending = None
+            for operation, arg in pending:
+                getattr(self, operation)(arg)
+            self.loaded_at = time.time()
+
+        logger.info(
+            f"Catalog search index loaded: {len(self._docs)} datasets, "
+            f"{len(self._postings)} terms in {(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+        return self
+
+    def upsert(self, doc: Dict[str, Any]) -> None:
+        """
+        데이터셋 문서 추가/교체
+
+        Args:
+            doc: data_catalog 문서 (_id 포함)
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(("_upsert", doc))
+            self._upsert(doc)
+
+    def remove(self, dataset_id: str) -> bool:
+        """
+        데이터셋 제거
+
+        Args:
+            dataset_id: 데이터셋 ID
+
+        Returns:
+            제거 여부
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(("_remove", str(dataset_id)))
+            return self._remove(str(dataset_id))
+
+    def increment_access(self, dataset_id: str) -> None:
+        """접근 횟수 증가 (POPULARITY 정렬용, 역색인은 그대로)"""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(("_increment_access", str(dataset_id)))
+            self._increment_access(str(dataset_id))
+
+    def _upsert(self, doc: Dict[str, Any]) -> None:
+        """문서 교체 (lock 보유 상태)"""
+        self._remove(str(doc["_id"]))
+        for term in self._add(doc):
+            index = bisect.bisect_left(self._vocabulary, term)
+            if index == len(self._vocabulary) or self._vocabulary[index] != term:
+                self._vocabulary.insert(index, term)
+
+    def _increment_access(self, dataset_id: str) -> None:
+        doc = self._docs.get(dataset_id)
+        if doc is not None:
+            doc["access_count"] = (doc.get("access_count") or 0) + 1
+
+    def _add(self, doc: Dict[str, Any]) -> List[str]:
+        """문서 색인, 새로 생긴 term 목록 반환 (lock 보유 상태)"""
+        dataset_id = str(doc["_id"])
+        weights: Dict[str, float] = defaultdict(float)
+
+        def index_text(text, weight):
+            for token in tokenize(text):
+                weights[token] += weight
+
+        index_text(doc.get("name"), CatalogSearch.WEIGHT_NAME)
+        index_text(doc.get("display_name"), CatalogSearch.WEIGHT_DISPLAY_NAME)
+        index_text(doc.get("description"), CatalogSearch.WEIGHT_DESCRIPTION)
+        index_text(doc.get("domain"), CatalogSearch.WEIGHT_DOMAIN)
+        for tag in doc.get("tags") or []:
+            index_text(tag, CatalogSearch.WEIGHT_TAG)
+        for column in doc.get("columns") or []:
+            index_text(column.get("name"), CatalogSearch.WEIGHT_COLUMN_NAME)
+            index_text(column.get("business_name"), CatalogSearch.WEIGHT_COLUMN_NAME)
+            index_text(column.get("description"), CatalogSearch.WEIGHT_COLUMN_NAME * 0.5)
+
+        new_terms = []
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                new_terms.append(term)
+            postings[dataset_id] = weight
+
+        stored = {name: doc.get(name) for name in _STORED_FIELDS}
+        stored["created_at"] = _parse_datetime(stored["created_at"])
+        stored["updated_at"] = _parse_datetime(stored["updated_at"])
+        stored["has_column_description"] = any(c.get("description") for c in doc.get("columns") or [])
+
+        length = sum(weights.values())
+        self._doc_terms[dataset_id] = dict(weights)
+        self._doc_length[dataset_id] = length
+        self._total_length += length
+        self._docs[dataset_id] = stored
+        return new_terms
+
+    def _remove(self, dataset_id: str) -> bool:
+        """문서 색인 제거 (lock 보유 상태)"""
+        terms = self._doc_terms.pop(dataset_id, None)
+        if terms is None:
+            return False
+        for term in terms:
+            postings = self._postings[term]
+            del postings[dataset_id]
+            if not postings:
+                del self._postings[term]
+                index = bisect.bisect_left(self._vocabulary, term)
+                if index < len(self._vocabulary) and self._vocabulary[index] == term:
+                    del self._vocabulary[index]
+        self._total_length -= self._doc_length.pop(dataset_id)
+        del self._docs[dataset_id]
+        return True
+
+    # ==================== Search ====================
+
+    def search(
+        self,
+        query: str,
+        filters: SearchFilter = None,
+        sort_by: SortOption = SortOption.RELEVANCE,
+    ) -> Optional[List[Tuple[str, float]]]:
+        """
+        검색어와 필터에 일치하는 전체 데이터셋을 순위대로 반환
+
+        Args:
+            query: 검색어
+            filters: 검색 필터
+            sort_by: 정렬 옵션 (RELEVANCE는 BM25 점수순)
+
+        Returns:
+            (dataset_id, 점수) 목록. 검색어에 색인 가능한 토큰이 없으면 None
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return None
+
+        with self._lock:
+            groups = [self._expand(term) for term in terms]
+            if not all(groups):
+                return []
+
+            # 모든 토큰 그룹에 일치하는 문서 (작은 그룹부터 교집합)
+            sizes = [sum(len(self._postings[t]) for t, _ in group) for group in groups]
+            order = sorted(range(len(groups)), key=sizes.__getitem__)
+            candidates = None
+            for i in order:
+                matched = set()
+                for term, _ in groups[i]:
+                    postings = self._postings[term]
+                    if candidates is None:
+                        matched.update(postings)
+                    else:
+                        matched.update(d for d in candidates if d in postings)
+                candidates = matched
+                if not candidates:
+                    return []
+
+            if filters:
+                candidates = [d for d in candidates if filters.matches(self._docs[d])]
+
+            scores = self._score(candidates, groups)
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], self._docs[item[0]].get("name") or "", item[0]))
+            if sort_by != SortOption.RELEVANCE:
+                ranked.sort(key=self._sort_key(sort_by), reverse=sort_by in _DESCENDING)
+            return ranked
+
+    def _expand(self, term: str) -> List[Tuple[str, float]]:
+        """검색 토큰 → (색인 term, 가중치) 목록 (완전 일치 + 접두어 확장)"""
+        expanded = [(term, 1.0)] if term in self._postings else []
+        if len(term) >= PREFIX_MIN_LENGTH or "가" <= term[0] <= "힣":
+            index = bisect.bisect_right(self._vocabulary, term)
+            while (
+                index < len(self._vocabulary) and len(expanded) < PREFIX_MAX_EXPANSIONS
+                and self._vocabulary[index].startswith(term)
+            ):
+                expanded.append((self._vocabulary[index], PREFIX_WEIGHT))
+                index += 1
+        return expanded
+
+    def _score(self, candidates, groups) -> Dict[str, float]:
+        """BM25 점수 (토큰 그룹별로 가장 높은 term 점수를 합산)"""
+        num_docs = len(self._docs)
+        avg_length = self._total_length / num_docs if num_docs else 1.0
+        scores = dict.fromkeys(candidates, 0.0)
+
+        for group in groups:
+            best: Dict[str, float] = {}
+            for term, weight in group:
+                postings = self._postings[term]
+                df = len(postings)
+                idf = math.log(1 + (num_docs - df + 0.5) / (df + 0.5)) * weight
+                for dataset_id in (scores if len(scores) < df else postings):
+                    tf = postings.get(dataset_id)
+                    if tf is None or dataset_id not in scores:
+                        continue
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_length[dataset_id] / avg_length)
+                    score = idf * tf * (BM25_K1 + 1) / (tf + norm)
+                    if score > best.get(dataset_id, 0.0):
+                        best[dataset_id] = score
+            for dataset_id, score in best.items():
+                scores[dataset_id] += score
+        return scores
+
+    def _sort_key(self, sort_by: SortOption):
+        """MongoDB 정렬과 같은 순서 (null은 오름차순에서 먼저)"""
+        field_name = _SORT_FIELDS[sort_by]
+
+        def key(item):
+            value = self._docs[item[0]].get(field_name)
+            if field_name == "quality_metrics":
+                value = (value or {}).get("overall_score")
+            return (value is not None, value if value is not None else 0)
+
+        return key
+
+    # ==================== Accessors ====================
+
+    def get_document(self, dataset_id: str) -> Optional[Dict[str, Any]]:
+        """보관 중인 필터/정렬 필드"""
+        return self._docs.get(str(dataset_id))
+
+    def __contains__(self, dataset_id: str) -> bool:
+        return str(dataset_id) in self._docs
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """인덱스 통계"""
+        with self._lock:
+            return {
+                "datasets": len(self._docs),
+                "terms": len(self._postings),
+                "postings": sum(len(p) for p in self._postings.values()),
+                "avg_document_length": round(self._total_length / len(self._docs), 2) if self._docs else 0,
+                "loaded_at": self.loaded_at,
+            }
+
+
+_SORT_FIELDS = {
+    SortOption.NAME_ASC: "name",
+    SortOption.NAME_DESC: "name",
+    SortOption.CREATED_ASC: "created_at",
+    SortOption.CREATED_DESC: "created_at",
+    SortOption.UPDATED_DESC: "updated_at",
+    SortOption.QUALITY_DESC: "quality_metrics",
+    SortOption.POPULARITY: "access_count",
+    SortOption.RECORD_COUNT: "record_count",
+}
+_DESCENDING = {
+    SortOption.NAME_DESC, SortOption.CREATED_DESC, SortOption.UPDATED_DESC,
+    SortOption.QUALITY_DESC, SortOption.POPULARITY, SortOption.RECORD_COUNT,
+}
+
+
+# ==================== Shared Index ====================
+
+_catalog_search_index: Optional[CatalogSearchIndex] = None
+_catalog_search_index_lock = threading.Lock()
+_catalog_search_index_refresh: Optional[threading.Thread] = None
+_catalog_search_index_failed_at: Optional[float] = None
+
+
+def _catalog_search_index_stale(ttl_seconds: int) -> bool:
+    index = _catalog_search_index
+    if index is None:
+        return True
+    return (
+        ttl_seconds > 0 and index.loaded_at is not None
+        and time.time() - index.loaded_at > ttl_seconds
+    )
+
+
+def _load_catalog_search_index(mongo_service, index: Optional[CatalogSearchIndex]) -> None:
+    """인덱스 적재 (백그라운드 스레드, 완료 시 공유 인덱스 교체)"""
+    global _catalog_search_index, _catalog_search_index_failed_at
+    try:
+        fresh = (CatalogSearchIndex() if index is None else index).load(mongo_service)
+        with _catalog_search_index_lock:
+            if _catalog_search_index_refresh is threading.current_thread():
+                _catalog_search_index = fresh
+                _catalog_search_index_failed_at = None
+    except Exception as e:
+        logger.error(f"Failed to load catalog search index: {e}")
+        with _catalog_search_index_lock:
+            if _catalog_search_index_refresh is threading.current_thread():
+                _catalog_search_index_failed_at = time.time()
+
+
+def get_catalog_search_index(
+    mongo_service=None,
+    ttl_seconds: int = CATALOG_SEARCH_INDEX_TTL_SECONDS,
+    wait: bool = False,
+) -> Optional[CatalogSearchIndex]:
+    """
+    공유 카탈로그 검색 인덱스
+
+    인덱스가 없거나 TTL이 지났으면 mongo_service로 백그라운드 적재를 시작하고
+    바로 반환합니다 (재적재 중에는 기존 인덱스, 첫 적재 완료 전에는 None -
+    호출 측은 MongoDB 정규식 검색으로 대체). 적재에 실패하면
+    CATALOG_SEARCH_INDEX_RETRY_SECONDS 동안 다시 시도하지 않습니다.
+    mongo_service 없이 호출하면 이미 적재된 인덱스만 반환합니다.
+
+    Args:
+        mongo_service: MongoService 인스턴스
+        ttl_seconds: 재적재 주기 (0이면 재적재 안 함)
+        wait: 시작한(또는 진행 중인) 적재가 끝날 때까지 대기 (시작 시점/스크립트용)
+    """
+    global _catalog_search_index_refresh
+    if mongo_service is not None and _catalog_search_index_stale(ttl_seconds):
+        with _catalog_search_index_lock:
+            refresh = _catalog_search_index_refresh
+            backoff = (
+                _catalog_search_index_failed_at is not None
+                and time.time() - _catalog_search_index_failed_at < CATALOG_SEARCH_INDEX_RETRY_SECONDS
+            )
+            # 락 안에서 다시 확인 (다른 호출이 이미 적재를 마쳤거나 시작했으면 그대로)
+            if (_catalog_search_index_stale(ttl_seconds) and not backoff
+                    and (refresh is None or not refresh.is_alive())):
+                refresh = threading.Thread(
+                    target=_load_catalog_search_index,
+                    args=(mongo_service, _catalog_search_index),
+                    name="catalog-search-index-load",
+                    daemon=True,
+                )
+                _catalog_search_index_refresh = refresh
+                refresh.start()
+        if wait and refresh is not None:
+            refresh.join()
+    return _catalog_search_index
+
+
+def reset_catalog_search_index() -> None:
+    """공유 인덱스 폐기 (테스트/재적재용, 진행 중인 적재 결과는 버림)"""
+    global _catalog_search_index, _catalog_search_index_refresh, _catalog_search_index_failed_at
+    with _catalog_search_index_lock:
+        _catalog_search_index = None
+        _catalog_search_index_refresh = None
+        _catalog_search_index_failed_at = None
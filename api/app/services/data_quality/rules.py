@@ -20,6 +20,12 @@ from typing import Any, Dict, List, Optional, Callable, Set
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from crawlers.utils.parsers import parse_date_formats
+except ImportError:
+    # API 이미지에는 crawlers 패키지가 없을 수 있음 - strptime 순차 시도로 대체
+    parse_date_formats = None
+
 
 class ValidationSeverity(str, Enum):
     """검증 실패 심각도"""
@@ -45,6 +51,9 @@ class ValidationIssue:
 class ValidationRule(ABC):
     """검증 규칙 기본 클래스"""
 
+    # enabled 변경 횟수 (컴파일된 검증 계획 무효화용)
+    generation = 0
+
     def __init__(
         self,
         name: str,
@@ -55,6 +64,16 @@ class ValidationRule(ABC):
         self.severity = severity
         self.enabled = enabled
 
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        if getattr(self, "_enabled", value) != value:
+            ValidationRule.generation += 1
+        self._enabled = value
+
     @abstractmethod
     def validate(self, value: Any, field_name: str, row_index: int = None, context: Dict = None) -> Optional[ValidationIssue]:
         """
@@ -102,6 +121,9 @@ class EncodingRule(ValidationRule):
         r'占쏙옙',              # Common broken Korean
     ]
 
+    # 유니코드 범주가 항상 정상(할당됨)인 범위 밖의 문자 - Latin-1, 한글 음절
+    UNCHECKED_CHARS = re.compile(r'[^\x00-\xff\uac00-\ud7a3]')
+
     def __init__(
         self,
         name: str = "encoding_check",
@@ -117,6 +139,8 @@ class EncodingRule(ValidationRule):
         if self.check_korean:
             patterns.extend(self.SUSPICIOUS_KOREAN)
         self.compiled_patterns = [re.compile(p) for p in patterns]
+        # 한 번의 검색으로 어떤 패턴이든 일치하는지 먼저 확인
+        self._any_pattern = re.compile("|".join(f"(?:{p})" for p in patterns))
 
     def validate(self, value: Any, field_name: str, row_index: int = None, context: Dict = None) -> Optional[ValidationIssue]:
         if value is None:
@@ -125,20 +149,24 @@ class EncodingRule(ValidationRule):
         str_value = str(value)
 
         # Check for broken patterns
-        for pattern in self.compiled_patterns:
-            match = pattern.search(str_value)
-            if match:
-                return ValidationIssue(
-                    rule_name=self.name,
-                    field_name=field_name,
-                    severity=self.severity,
-                    message=f"인코딩 깨짐 감지: '{match.group()}'",
-                    actual_value=str_value[:100],
-                    row_index=row_index,
-                    suggestion="원본 데이터의 인코딩 확인 필요 (EUC-KR, CP949 등)"
-                )
+        if self._any_pattern.search(str_value):
+            for pattern in self.compiled_patterns:
+                match = pattern.search(str_value)
+                if match:
+                    return ValidationIssue(
+                        rule_name=self.name,
+                        field_name=field_name,
+                        severity=self.severity,
+                        message=f"인코딩 깨짐 감지: '{match.group()}'",
+                        actual_value=str_value[:100],
+                        row_index=row_index,
+                        suggestion="원본 데이터의 인코딩 확인 필요 (EUC-KR, CP949 등)"
+                    )
 
         # Check for abnormal Unicode categories
+        if not self.UNCHECKED_CHARS.search(str_value):
+            return None
+
         for char in str_value:
             category = unicodedata.category(char)
             if category in ('Cn', 'Co', 'Cs'):  # Not assigned, Private use, Surrogate
@@ -195,6 +223,7 @@ class DateRule(ValidationRule):
         self.min_date = min_date or datetime(1900, 1, 1)
         self.max_date = max_date
         self.date_format = date_format
+        self._formats = ((date_format,) if date_format else ()) + tuple(self.COMMON_DATE_FORMATS)
 
     def _parse_date(self, value: Any) -> Optional[datetime]:
         """다양한 형식의 날짜 파싱"""
@@ -204,15 +233,12 @@ class DateRule(ValidationRule):
         if not isinstance(value, str):
             return None
 
-        # Try specified format first
-        if self.date_format:
-            try:
-                return datetime.strptime(value, self.date_format)
-            except ValueError:
-                pass
+        # Try specified format first, then common formats
+        formats = self._formats
+        if parse_date_formats is not None:
+            return parse_date_formats(value, formats)
 
-        # Try common formats
-        for fmt in self.COMMON_DATE_FORMATS:
+        for fmt in formats:
             try:
                 return datetime.strptime(value, fmt)
             except ValueError:
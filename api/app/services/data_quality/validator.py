@@ -3,17 +3,18 @@ Data Validator - 데이터 검증 엔진
 
 기능:
 - 다중 규칙 적용
-- 배치 검증
+- 배치 검증 (컴파일된 필드별 실행 계획, 컬럼 단위 평가)
 - 결과 집계
 - 검증 프로필 지원
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import hashlib
 import json
+from operator import itemgetter
 
 from .rules import (
     ValidationRule,
@@ -25,8 +26,31 @@ from .rules import (
     RangeRule,
     FormatRule,
     UniqueRule,
+    ReferenceRule,
 )
 
+NoneType = type(None)
+
+# 규칙 타입별로 validate가 항상 None을 반환하는 값 타입 (호출 생략용 타입 가드)
+# 하위 클래스는 validate를 재정의할 수 있으므로 정확히 일치하는 타입에만 적용
+_SKIP_TYPES: Dict[type, FrozenSet[type]] = {
+    EncodingRule: frozenset({NoneType, bool, int, float, datetime}),
+    DateRule: frozenset({NoneType}),
+    RequiredFieldRule: frozenset({bool, int, float, datetime, list, dict}),
+    RangeRule: frozenset({NoneType}),
+    FormatRule: frozenset({NoneType}),
+    UniqueRule: frozenset({NoneType}),
+    ReferenceRule: frozenset({NoneType}),
+}
+_NO_SKIP: FrozenSet[type] = frozenset()
+
+# 호출 순서와 무관하게 같은 결과를 내는 규칙
+_STATELESS_RULES = (EncodingRule, DateRule, RequiredFieldRule, RangeRule, FormatRule)
+
+UNIQUE_VALUES_LIMIT = 10000
+_STR_COLUMN_TYPES = frozenset({str, NoneType})
+_INT_COLUMN_TYPES = frozenset({int, NoneType})
+
 
 @dataclass
 class ValidationResult:
@@ -147,16 +171,20 @@ class ValidationProfile:
         self.name = name
         self.field_rules: Dict[str, List[ValidationRule]] = {}
         self.global_rules: List[ValidationRule] = []
+        # 규칙 추가 시 증가 (컴파일된 실행 계획 무효화)
+        self.version = 0
 
     def add_field_rule(self, field_name: str, rule: ValidationRule):
         """필드별 규칙 추가"""
         if field_name not in self.field_rules:
             self.field_rules[field_name] = []
         self.field_rules[field_name].append(rule)
+        self.version += 1
 
     def add_global_rule(self, rule: ValidationRule):
         """전역 규칙 추가 (모든 필드에 적용)"""
         self.global_rules.append(rule)
+        self.version += 1
 
     @classmethod
     def create_default(cls, profile_name: str = "strict") -> "ValidationProfile":
@@ -172,19 +200,83 @@ class ValidationProfile:
         return profile
 
 
+class ValidationPlan:
+    """
+    ValidationProfile을 컴파일한 필드별 실행 계획
+
+    - 필드별 규칙을 (전역 + 필드) 순서로 펼치고 비활성 규칙 제외
+    - 규칙마다 호출을 생략할 값 타입 (타입 가드)
+    - 순서에 따라 결과가 달라지는 규칙(UniqueRule, CustomRule 등)이 여러
+      필드에 걸쳐 있으면 컬럼 단위 평가 불가 (columnar=False)
+    """
+
+    def __init__(self, profile: ValidationProfile):
+        self.profile = profile
+        self.key = self.key_for(profile)
+        self.global_rules = self._compile(profile.global_rules)
+        self.field_rules = {
+            field_name: self.global_rules + self._compile(rules)
+            for field_name, rules in profile.field_rules.items()
+        }
+        self.columnar = self._is_columnar()
+
+    @staticmethod
+    def key_for(profile: ValidationProfile) -> Tuple[int, int]:
+        return profile.version, ValidationRule.generation
+
+    @staticmethod
+    def _compile(rules: List[ValidationRule]) -> Tuple[Tuple[ValidationRule, FrozenSet[type]], ...]:
+        return tuple(
+            (rule, _SKIP_TYPES.get(type(rule), _NO_SKIP))
+            for rule in rules if rule.enabled
+        )
+
+    def _is_columnar(self) -> bool:
+        """순서 의존 규칙이 계획 전체에서 한 번씩만 쓰이는지"""
+        stateful = [
+            rule for rule, _ in self.global_rules
+            if not (type(rule) in _STATELESS_RULES or self._is_static_reference(rule))
+        ]
+        if stateful:
+            return False  # 전역 규칙은 모든 필드에 적용
+
+        seen = set()
+        for entries in self.field_rules.values():
+            for rule, _ in entries:
+                if type(rule) in _STATELESS_RULES or self._is_static_reference(rule):
+                    continue
+                if id(rule) in seen:
+                    return False
+                seen.add(id(rule))
+        return True
+
+    @staticmethod
+    def _is_static_reference(rule: ValidationRule) -> bool:
+        return type(rule) is ReferenceRule and rule.lookup_func is None
+
+    def rules_for(self, field_name: str) -> Tuple[Tuple[ValidationRule, FrozenSet[type]], ...]:
+        """필드에 적용할 (규칙, 생략 타입) 목록"""
+        return self.field_rules.get(field_name, self.global_rules)
+
+
 class DataValidator:
     """데이터 검증 엔진"""
 
     def __init__(self, profile: ValidationProfile = None):
         self.profile = profile or ValidationProfile.create_default("strict")
         self._unique_rules: Dict[str, UniqueRule] = {}
+        self._plan: Optional[ValidationPlan] = None
+
+    def compile(self) -> ValidationPlan:
+        """실행 계획 (프로필/규칙 활성화가 바뀌면 다시 컴파일)"""
+        plan = self._plan
+        if plan is None or plan.profile is not self.profile or plan.key != ValidationPlan.key_for(self.profile):
+            plan = self._plan = ValidationPlan(self.profile)
+        return plan
 
     def _get_rules_for_field(self, field_name: str) -> List[ValidationRule]:
         """필드에 적용할 규칙 목록"""
-        rules = list(self.profile.global_rules)
-        if field_name in self.profile.field_rules:
-            rules.extend(self.profile.field_rules[field_name])
-        return [r for r in rules if r.enabled]
+        return [rule for rule, _ in self.compile().rules_for(field_name)]
 
     def validate_record(
         self,
@@ -194,11 +286,13 @@ class DataValidator:
     ) -> List[ValidationIssue]:
         """단일 레코드 검증"""
         issues = []
+        rules_for = self.compile().rules_for
 
         for field_name, value in record.items():
-            rules = self._get_rules_for_field(field_name)
-
-            for rule in rules:
+            value_type = type(value)
+            for rule, skip in rules_for(field_name):
+                if value_type in skip:
+                    continue
                 issue = rule.validate(value, field_name, row_index, context)
                 if issue:
                     issues.append(issue)
@@ -212,10 +306,13 @@ class DataValidator:
         run_id: str,
         context: Dict = None
     ) -> ValidationResult:
-        """배치 데이터 검증"""
-        all_issues = []
-        field_stats = {}
+        """
+        배치 데이터 검증
 
+        레코드를 필드별 컬럼으로 한 번 모은 뒤 필드 통계와 규칙 평가를
+        컬럼 단위로 수행합니다. 이슈 순서는 행 → 레코드 내 필드 → 규칙
+        순서(행 단위 평가와 동일)로 맞춥니다.
+        """
         # Reset unique rules
         for rule in self.profile.global_rules:
             if isinstance(rule, UniqueRule):
@@ -226,43 +323,21 @@ class DataValidator:
                 if isinstance(rule, UniqueRule):
                     rule.reset()
 
-        # Validate each record
-        for idx, record in enumerate(records):
-            # Collect field statistics
-            for field_name, value in record.items():
-                if field_name not in field_stats:
-                    field_stats[field_name] = {
-                        "total": 0,
-                        "null_count": 0,
-                        "empty_count": 0,
-                        "unique_values": set(),
-                    }
+        plan = self.compile()
 
-                stats = field_stats[field_name]
-                stats["total"] += 1
+        columns = self._to_columns(records)
+        field_stats = {
+            field_name: self._column_stats(values)
+            for field_name, (_, values) in columns.items()
+        }
 
-                if value is None:
-                    stats["null_count"] += 1
-                elif isinstance(value, str) and value.strip() == "":
-                    stats["empty_count"] += 1
-                else:
-                    # Track unique values (limit to prevent memory issues)
-                    if len(stats["unique_values"]) < 10000:
-                        try:
-                            stats["unique_values"].add(str(value)[:100])
-                        except:
-                            pass
-
-            # Validate record
-            issues = self.validate_record(record, row_index=idx, context=context)
-            all_issues.extend(issues)
-
-        # Finalize field stats
-        for field_name, stats in field_stats.items():
-            stats["unique_count"] = len(stats["unique_values"])
-            stats["null_rate"] = round(stats["null_count"] / stats["total"] * 100, 2) if stats["total"] > 0 else 0
-            stats["empty_rate"] = round(stats["empty_count"] / stats["total"] * 100, 2) if stats["total"] > 0 else 0
-            del stats["unique_values"]  # Remove set before serialization
+        # validate_record를 재정의한 하위 클래스나 순서 의존 규칙은 행 단위 평가
+        if plan.columnar and type(self).validate_record is DataValidator.validate_record:
+            all_issues = self._validate_columns(plan, records, columns, context)
+        else:
+            all_issues = []
+            for idx, record in enumerate(records):
+                all_issues.extend(self.validate_record(record, row_index=idx, context=context))
 
         return ValidationResult(
             source_id=source_id,
@@ -273,6 +348,105 @@ class DataValidator:
             field_stats=field_stats,
         )
 
+    @staticmethod
+    def _to_columns(records: List[Dict[str, Any]]) -> Dict[str, Tuple[Any, List[Any]]]:
+        """필드별 컬럼 (행 번호, 값) - 필드 순서는 처음 등장한 순서"""
+        if records and len(records[0]) > 1:
+            keys = records[0].keys()
+            if all(record.keys() == keys for record in records):
+                # 모든 레코드의 필드가 같으면 한 번에 전치
+                rows = range(len(records))
+                values = zip(*map(itemgetter(*keys), records))
+                return {field_name: (rows, list(column)) for field_name, column in zip(list(keys), values)}
+
+        columns: Dict[str, Tuple[List[int], List[Any]]] = {}
+        for idx, record in enumerate(records):
+            for field_name, value in record.items():
+                column = columns.get(field_name)
+                if column is None:
+                    column = columns[field_name] = ([], [])
+                column[0].append(idx)
+                column[1].append(value)
+        return columns
+
+    @staticmethod
+    def _validate_columns(
+        plan: ValidationPlan,
+        records: List[Dict[str, Any]],
+        columns: Dict[str, Tuple[List[int], List[Any]]],
+        context: Dict = None
+    ) -> List[ValidationIssue]:
+        """컬럼 단위 규칙 평가 후 행 단위 순서로 정렬"""
+        found = []
+        for field_name, (rows, values) in columns.items():
+            for rule_pos, (rule, skip) in enumerate(plan.rules_for(field_name)):
+                validate = rule.validate
+                for idx, value in zip(rows, values):
+                    if type(value) in skip:
+                        continue
+                    issue = validate(value, field_name, idx, context)
+                    if issue:
+                        found.append((idx, field_name, rule_pos, issue))
+
+        if not found:
+            return []
+
+        positions: Dict[int, Dict[str, int]] = {}
+
+        def order(item):
+            idx, field_name, rule_pos, _ = item
+            pos = positions.get(idx)
+            if pos is None:
+                pos = positions[idx] = {name: i for i, name in enumerate(records[idx])}
+            return idx, pos[field_name], rule_pos
+
+        found.sort(key=order)
+        return [item[3] for item in found]
+
+    @staticmethod
+    def _column_stats(values: List[Any]) -> Dict[str, Any]:
+        """컬럼 통계 (null/빈 문자열/고유값 수, 고유값은 앞 100자 기준 최대 UNIQUE_VALUES_LIMIT개)"""
+        total = len(values)
+        types = set(map(type, values))
+
+        if types <= _STR_COLUMN_TYPES or types <= _INT_COLUMN_TYPES:
+            # str/int만 있는 컬럼은 고유값 단위로 계산 (str 변환 결과가 값과 1:1)
+            null_count = values.count(None)
+            distinct = set(values)
+            distinct.discard(None)
+            empty_count = 0
+            if str in types:
+                empty = [v for v in distinct if not v.strip()]
+                empty_count = sum(values.count(v) for v in empty)
+                distinct = {v[:100] for v in distinct.difference(empty)}
+            unique_count = min(len(distinct), UNIQUE_VALUES_LIMIT)
+        else:
+            null_count = 0
+            empty_count = 0
+            unique_values = set()
+
+            for value in values:
+                if value is None:
+                    null_count += 1
+                elif isinstance(value, str) and not value.strip():
+                    empty_count += 1
+                elif len(unique_values) < UNIQUE_VALUES_LIMIT:
+                    # Track unique values (limit to prevent memory issues)
+                    try:
+                        unique_values.add(str(value)[:100])
+                    except Exception:
+                        pass
+            unique_count = len(unique_values)
+
+        return {
+            "total": total,
+            "null_count": null_count,
+            "empty_count": empty_count,
+            "unique_count": unique_count,
+            "null_rate": round(null_count / total * 100, 2) if total > 0 else 0,
+            "empty_rate": round(empty_count / total * 100, 2) if total > 0 else 0,
+        }
+
     @classmethod
     def create_for_source(cls, source_config: Dict) -> "DataValidator":
         """소스 설정 기반 검증기 생성"""
@@ -1,25 +1,47 @@
 """
 Export Service for data export functionality.
 
-Provides CSV and Excel export capabilities with streaming support
-for large datasets and asynchronous processing for batch exports.
+Provides CSV, Excel, JSON and columnar (Parquet / Arrow IPC) export
+capabilities with streaming support for large datasets and asynchronous
+processing for batch exports.
 """
 
+import asyncio
 import csv
 import io
 import os
+import tempfile
 import uuid
 import logging
 from datetime import datetime, timedelta
-from typing import AsyncIterator, Dict, List, Optional, Any, Generator
+from functools import partial
+from itertools import chain
+from typing import AsyncIterator, BinaryIO, Dict, List, Optional, Any, Generator, Union
 from bson import ObjectId
 
+from .async_mongo_service import get_executor
+
 logger = logging.getLogger(__name__)
 
 # Export file storage path
 EXPORT_STORAGE_PATH = os.getenv('EXPORT_STORAGE_PATH', '/tmp/exports')
 EXPORT_FILE_TTL_HOURS = int(os.getenv('EXPORT_FILE_TTL_HOURS', '24'))
 
+# Excel export limits (worksheet maximum is 1,048,576 rows including header)
+EXCEL_EXPORT_MAX_ROWS = min(int(os.getenv('EXCEL_EXPORT_MAX_ROWS', '1048575')), 1048575)
+EXCEL_WIDTH_SAMPLE_ROWS = 100
+# Direct downloads keep the compressed file in memory; larger exports go through jobs
+EXCEL_DOWNLOAD_MAX_ROWS = int(os.getenv('EXCEL_DOWNLOAD_MAX_ROWS', '200000'))
+
+# Compressed job output (zstd requires the optional zstandard package)
+COMPRESSION_EXTENSIONS = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+# Columnar export (Parquet / Arrow IPC, requires pyarrow)
+COLUMNAR_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+PARQUET_COMPRESSION = os.getenv('PARQUET_COMPRESSION', 'zstd')
+PARQUET_ROW_GROUP_SIZE = int(os.getenv('PARQUET_ROW_GROUP_SIZE', '100000'))
+COLUMNAR_BATCH_SIZE = 10000
+
 
 class ExportService:
     """
@@ -86,56 +108,37 @@ class ExportService:
             Bytes chunks of CSV content
         """
         try:
-            # Get first document to determine headers
-            first_doc = self.mongo.db[collection].find_one(query)
-            if not first_doc:
-                # Empty result - yield empty CSV with minimal header
-                yield "No data found\n".encode(encoding)
-                return
-
-            # Determine fields to export
-            if fields:
-                headers = fields
-            else:
-                headers = self._get_document_headers(first_doc)
-
-            # Create CSV writer with string buffer
             output = io.StringIO()
             writer = csv.writer(output, quoting=csv.QUOTE_MINIMAL)
-
-            # Write header row
-            writer.writerow(headers)
-            yield output.getvalue().encode(encoding)
-            output.seek(0)
-            output.truncate(0)
-
-            # Stream data in batches
-            skip = 0
+            # An empty field list means all fields, as in _build_projection
+            headers = fields or None
             total_exported = 0
 
-            while total_exported < limit:
-                current_batch_size = min(batch_size, limit - total_exported)
-                cursor = self.mongo.db[collection].find(query).skip(skip).limit(current_batch_size)
-                documents = list(cursor)
-
-                if not documents:
-                    break
+            for documents in self._iter_batches(collection, query, fields, batch_size, limit):
+                if headers is None:
+                    # Determine fields from the first document
+                    headers = self._get_document_headers(documents[0])
+                if total_exported == 0:
+                    writer.writerow(headers)
 
                 for doc in documents:
-                    row = self._document_to_row(doc, headers)
-                    writer.writerow(row)
+                    writer.writerow(self._document_to_row(doc, headers))
 
                 yield output.getvalue().encode(encoding)
                 output.seek(0)
                 output.truncate(0)
 
                 total_exported += len(documents)
-                skip += len(documents)
 
                 # Log progress for large exports
                 if total_exported % 10000 == 0:
                     logger.info(f"CSV export progress: {total_exported} records")
 
+            if total_exported == 0:
+                # Empty result - yield empty CSV with minimal header
+                yield "No data found\n".encode(encoding)
+                return
+
             logger.info(f"CSV export completed: {total_exported} records from {collection}")
 
         except Exception as e:
@@ -165,109 +168,147 @@ class ExportService:
         Yields:
             Bytes chunks of CSV content
         """
-        for chunk in self.stream_csv(collection, query, fields, encoding, batch_size, limit):
-            yield chunk
+        # Each batch is fetched and encoded in the shared worker pool so
+        # the event loop stays free between chunks.
+        executor = get_executor()
+        chunks = self.stream_csv(collection, query, fields, encoding, batch_size, limit)
+        pending = None
+        try:
+            while True:
+                pending = executor.submit(next, chunks, None)
+                chunk = await asyncio.wrap_future(pending)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            # Release the cursor when the client disconnects. A batch still
+            # being fetched cannot be interrupted; close once it returns.
+            if pending is None:
+                chunks.close()
+            else:
+                pending.add_done_callback(lambda _: chunks.close())
 
     # ==================== Excel Export ====================
 
-    def generate_excel(
+    def write_excel(
         self,
         collection: str,
         query: Dict,
+        output: Union[str, BinaryIO],
         fields: Optional[List[str]] = None,
         sheet_name: str = "Data",
-        limit: int = 50000
-    ) -> bytes:
+        limit: int = EXCEL_EXPORT_MAX_ROWS,
+        batch_size: int = 1000
+    ) -> int:
         """
-        Generate Excel file in memory.
+        Stream query results into an Excel file.
 
-        Creates an Excel workbook with the query results.
-        Note: Excel generation loads all data into memory, so limit is important.
+        Uses an openpyxl write-only workbook fed batch by batch from the
+        cursor, so memory stays flat regardless of row count. Column
+        widths are computed from the first EXCEL_WIDTH_SAMPLE_ROWS rows
+        before they are written.
 
         Args:
             collection: MongoDB collection name
             query: MongoDB query filter
+            output: File path or binary file object to write to
             fields: List of fields to include
             sheet_name: Name for the Excel worksheet
-            limit: Maximum records (lower than CSV due to memory)
+            limit: Maximum records (capped at the worksheet row limit)
+            batch_size: Number of records to fetch per batch
 
         Returns:
-            Excel file content as bytes
+            Number of data rows written
         """
         try:
             from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Font, PatternFill, Alignment
             from openpyxl.utils import get_column_letter
         except ImportError:
             raise ImportError("openpyxl is required for Excel export. Install with: pip install openpyxl")
 
-        # Fetch data
-        cursor = self.mongo.db[collection].find(query).limit(limit)
-        documents = list(cursor)
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
+
+        batches = self._iter_batches(
+            collection, query, fields, batch_size, min(limit, EXCEL_EXPORT_MAX_ROWS)
+        )
+        first_batch = next(batches, None)
 
-        if not documents:
-            # Return empty workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = sheet_name
+        if not first_batch:
+            # Empty workbook
             ws.append(["No data found"])
-            output = io.BytesIO()
             wb.save(output)
-            output.seek(0)
-            return output.getvalue()
+            return 0
 
         # Determine headers
-        if fields:
-            headers = fields
-        else:
-            headers = self._get_document_headers(documents[0])
+        headers = fields if fields else self._get_document_headers(first_batch[0])
+        sample = [self._document_to_row(doc, headers) for doc in first_batch[:EXCEL_WIDTH_SAMPLE_ROWS]]
+
+        # Column widths must be set before any row is written
+        for col_idx, header in enumerate(headers):
+            max_length = len(str(header))
+            for row in sample:
+                if row[col_idx]:
+                    max_length = max(max_length, min(len(str(row[col_idx])), 50))
+            ws.column_dimensions[get_column_letter(col_idx + 1)].width = max_length + 2
 
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = sheet_name
+        # Freeze header row
+        ws.freeze_panes = "A2"
 
-        # Style for header row
+        # Write styled header row
         header_font = Font(bold=True, color="FFFFFF")
         header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
         header_alignment = Alignment(horizontal="center", vertical="center")
-
-        # Write headers
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
             cell.font = header_font
             cell.fill = header_fill
             cell.alignment = header_alignment
+            header_cells.append(cell)
+        ws.append(header_cells)
 
         # Write data rows
-        for row_idx, doc in enumerate(documents, 2):
-            row = self._document_to_row(doc, headers)
-            for col_idx, value in enumerate(row, 1):
-                ws.cell(row=row_idx, column=col_idx, value=value)
-
-        # Auto-adjust column widths
-        for col_idx, header in enumerate(headers, 1):
-            column_letter = get_column_letter(col_idx)
-            max_length = len(str(header))
+        total_rows = 0
+        for documents in chain([first_batch], batches):
+            for doc in documents:
+                ws.append(self._document_to_row(doc, headers))
+            total_rows += len(documents)
 
-            # Sample first 100 rows for width calculation
-            for row_idx in range(2, min(102, len(documents) + 2)):
-                cell_value = ws.cell(row=row_idx, column=col_idx).value
-                if cell_value:
-                    max_length = max(max_length, min(len(str(cell_value)), 50))
+        wb.save(output)
 
-            adjusted_width = max_length + 2
-            ws.column_dimensions[column_letter].width = adjusted_width
+        logger.info(f"Excel export completed: {total_rows} records from {collection}")
+        return total_rows
 
-        # Freeze header row
-        ws.freeze_panes = "A2"
+    def generate_excel(
+        self,
+        collection: str,
+        query: Dict,
+        fields: Optional[List[str]] = None,
+        sheet_name: str = "Data",
+        limit: int = 50000
+    ) -> bytes:
+        """
+        Generate Excel file in memory.
 
-        # Save to bytes
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
+        Creates an Excel workbook with the query results. Rows are
+        streamed through a write-only workbook; only the compressed file
+        is held in memory.
+
+        Args:
+            collection: MongoDB collection name
+            query: MongoDB query filter
+            fields: List of fields to include
+            sheet_name: Name for the Excel worksheet
+            limit: Maximum records
 
-        logger.info(f"Excel export completed: {len(documents)} records from {collection}")
+        Returns:
+            Excel file content as bytes
+        """
+        output = io.BytesIO()
+        self.write_excel(collection, query, output, fields, sheet_name, limit)
         return output.getvalue()
 
     async def generate_excel_async(
@@ -281,6 +322,8 @@ class ExportService:
         """
         Async wrapper for Excel generation.
 
+        Runs in the shared worker pool so the event loop is not blocked.
+
         Args:
             collection: MongoDB collection name
             query: MongoDB query filter
@@ -291,7 +334,174 @@ class ExportService:
         Returns:
             Excel file content as bytes
         """
-        return self.generate_excel(collection, query, fields, sheet_name, limit)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_executor(),
+            partial(self.generate_excel, collection, query, fields, sheet_name, limit)
+        )
+
+    # ==================== Columnar Export ====================
+
+    def write_columnar(
+        self,
+        collection: str,
+        query: Dict,
+        output: Union[str, BinaryIO],
+        format: str = "parquet",
+        fields: Optional[List[str]] = None,
+        limit: int = 100000,
+        batch_size: int = COLUMNAR_BATCH_SIZE
+    ) -> int:
+        """
+        Stream query results into a Parquet or Arrow IPC file.
+
+        Every cursor batch becomes an Arrow record batch. Parquet row
+        groups are flushed every PARQUET_ROW_GROUP_SIZE rows; Arrow IPC
+        files get one record batch per cursor batch.
+
+        Columns are the given fields, or the flattened (dot notation) keys
+        of all exported documents in first-seen order; _id is exported as
+        "id" (also when requested as "_id"). Column types are inferred per batch and widened as the
+        export goes: integers and floats become float64, any other
+        conflict becomes string, and all-null columns are strings.
+        ObjectIds are written as strings and lists/dicts as JSON strings.
+
+        Parquet and Arrow IPC files have one schema, so batches are first
+        spooled to temporary Arrow IPC streams (a new one whenever the
+        schema widens) and written to the output with the final schema.
+
+        Args:
+            collection: MongoDB collection name
+            query: MongoDB query filter
+            output: File path or binary file object to write to
+            format: parquet or arrow
+            fields: List of fields to include (also the MongoDB projection)
+            limit: Maximum records
+            batch_size: Number of records to fetch per batch
+
+        Returns:
+            Number of rows written
+        """
+        if format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported columnar format: {format}")
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow is required for Parquet/Arrow export. Install with: pip install pyarrow")
+
+        # Records name _id "id" (see _document_to_record); map the requested
+        # field the same way _build_projection does
+        columns = list(dict.fromkeys("id" if field == "_id" else field for field in fields)) if fields else None
+        types: Dict[str, Any] = {column: pa.null() for column in columns or ()}
+        spools = []
+        spool_writer = None
+        schema = None
+        total_rows = 0
+        try:
+            for documents in self._iter_batches(collection, query, fields, batch_size, limit):
+                records = [self._document_to_record(doc, columns) for doc in documents]
+                if not columns:
+                    for record in records:
+                        for key in record:
+                            types.setdefault(key, pa.null())
+
+                arrays = []
+                for column, current in types.items():
+                    array = self._batch_array(pa, [record.get(column) for record in records])
+                    widened = self._widen_column_type(pa, current, array.type)
+                    types[column] = widened
+                    arrays.append(self._cast_column(pa, array, widened))
+
+                batch_schema = pa.schema([pa.field(column, t) for column, t in types.items()])
+                if batch_schema != schema:
+                    if spool_writer is not None:
+                        spool_writer.close()
+                    spools.append(tempfile.TemporaryFile())
+                    spool_writer = pa.ipc.new_stream(spools[-1], batch_schema)
+                    schema = batch_schema
+                spool_writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                total_rows += len(documents)
+
+            if spool_writer is not None:
+                spool_writer.close()
+
+            schema = pa.schema([
+                pa.field(column, pa.string() if pa.types.is_null(t) else t) for column, t in types.items()
+            ] if total_rows else [])
+            if format == "parquet":
+                writer = pq.ParquetWriter(output, schema, compression=PARQUET_COMPRESSION)
+            else:
+                writer = pa.ipc.new_file(output, schema)
+
+            try:
+                pending = []
+                pending_rows = 0
+                for batch in self._read_spools(pa, spools, schema):
+                    if format == "arrow":
+                        writer.write_batch(batch)
+                        continue
+
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+                    if pending_rows >= PARQUET_ROW_GROUP_SIZE:
+                        writer.write_table(pa.Table.from_batches(pending, schema), row_group_size=pending_rows)
+                        pending, pending_rows = [], 0
+
+                if pending:
+                    writer.write_table(pa.Table.from_batches(pending, schema), row_group_size=pending_rows)
+            finally:
+                writer.close()
+        finally:
+            for spool in spools:
+                spool.close()
+
+        if len(spools) > 1:
+            logger.info(f"{format.capitalize()} export schema widened {len(spools) - 1} time(s)")
+        logger.info(f"{format.capitalize()} export completed: {total_rows} records from {collection}")
+        return total_rows
+
+    def _read_spools(self, pa, spools: List[BinaryIO], schema) -> Generator[Any, None, None]:
+        """Read spooled record batches back, cast to the final export schema."""
+        for spool in spools:
+            spool.seek(0)
+            for batch in pa.ipc.open_stream(spool):
+                if batch.schema == schema:
+                    yield batch
+                    continue
+                arrays = []
+                for field in schema:
+                    index = batch.schema.get_field_index(field.name)
+                    if index < 0:
+                        arrays.append(pa.nulls(batch.num_rows, field.type))
+                    else:
+                        arrays.append(self._cast_column(pa, batch.column(index), field.type))
+                yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def generate_columnar(
+        self,
+        collection: str,
+        query: Dict,
+        format: str = "parquet",
+        fields: Optional[List[str]] = None,
+        limit: int = 100000
+    ) -> bytes:
+        """
+        Generate a Parquet or Arrow IPC file in memory.
+
+        Args:
+            collection: MongoDB collection name
+            query: MongoDB query filter
+            format: parquet or arrow
+            fields: List of fields to include
+            limit: Maximum records
+
+        Returns:
+            File content as bytes
+        """
+        output = io.BytesIO()
+        self.write_columnar(collection, query, output, format, fields, limit)
+        return output.getvalue()
 
     # ==================== Async Export Jobs ====================
 
@@ -302,7 +512,8 @@ class ExportService:
         query: Dict,
         fields: Optional[List[str]] = None,
         limit: int = 100000,
-        encoding: str = "utf-8-sig"
+        encoding: str = "utf-8-sig",
+        compression: Optional[str] = None
     ) -> str:
         """
         Create an async export job record.
@@ -311,11 +522,12 @@ class ExportService:
 
         Args:
             collection: Target collection
-            format: Export format (csv, excel, json)
+            format: Export format (csv, excel, json, parquet, arrow)
             query: MongoDB query filter
             fields: Fields to export
             limit: Maximum records
             encoding: Character encoding (for CSV)
+            compression: Output compression for CSV/JSON (gzip, zstd)
 
         Returns:
             Job ID string
@@ -336,6 +548,7 @@ class ExportService:
             "fields": fields,
             "limit": limit,
             "encoding": encoding,
+            "compression": compression,
             "status": "pending",
             "progress": 0.0,
             "records_processed": 0,
@@ -375,7 +588,8 @@ class ExportService:
         Process an export job (runs in background).
 
         Executes the export and saves result to file system.
-        Updates job status throughout processing.
+        Updates job status throughout processing. CSV and JSON jobs are
+        exported in parallel _id-range partitions by ExportWorker.
 
         Args:
             job_id: Job identifier to process
@@ -401,19 +615,30 @@ class ExportService:
             fields = job.get("fields")
             limit = job.get("limit", 100000)
             encoding = job.get("encoding", "utf-8-sig")
+            # Excel, Parquet and Arrow files are compressed internally
+            compression = job.get("compression") if format in ("csv", "json") else None
 
             # Determine file extension
-            ext = ".csv" if format == "csv" else ".xlsx" if format == "excel" else ".json"
+            if format in COLUMNAR_FORMATS:
+                ext = COLUMNAR_FORMATS[format]
+            else:
+                ext = ".csv" if format == "csv" else ".xlsx" if format == "excel" else ".json"
+            ext += COMPRESSION_EXTENSIONS.get(compression, "")
             file_name = f"{job_id}{ext}"
             file_path = os.path.join(EXPORT_STORAGE_PATH, file_name)
 
             # Export based on format
-            if format == "csv":
-                self._process_csv_export(job_id, collection, query, fields, limit, encoding, file_path)
+            if format in ("csv", "json"):
+                from .export_worker import ExportWorker
+                # ExportWorker flushes the final records_processed count itself
+                ExportWorker(self.mongo).run(
+                    job_id, collection, format, query, fields, limit, encoding, file_path,
+                    compression=compression, total_records=job.get("total_records")
+                )
             elif format == "excel":
                 self._process_excel_export(job_id, collection, query, fields, limit, file_path)
-            elif format == "json":
-                self._process_json_export(job_id, collection, query, fields, limit, file_path)
+            elif format in COLUMNAR_FORMATS:
+                self._process_columnar_export(job_id, collection, query, fields, limit, format, file_path)
             else:
                 raise ValueError(f"Unsupported format: {format}")
 
@@ -447,56 +672,6 @@ class ExportService:
                 }}
             )
 
-    def _process_csv_export(
-        self,
-        job_id: str,
-        collection: str,
-        query: Dict,
-        fields: Optional[List[str]],
-        limit: int,
-        encoding: str,
-        file_path: str
-    ) -> None:
-        """Process CSV export to file."""
-        with open(file_path, 'w', newline='', encoding=encoding) as f:
-            writer = None
-            headers = None
-            total_processed = 0
-            batch_size = 1000
-
-            cursor = self.mongo.db[collection].find(query).limit(limit)
-
-            for doc in cursor:
-                if writer is None:
-                    # Initialize writer with headers from first document
-                    headers = fields if fields else self._get_document_headers(doc)
-                    writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
-                    writer.writerow(headers)
-
-                row = self._document_to_row(doc, headers)
-                writer.writerow(row)
-                total_processed += 1
-
-                # Update progress periodically
-                if total_processed % batch_size == 0:
-                    job = self.mongo.db.export_jobs.find_one({"_id": job_id})
-                    total_records = job.get("total_records", limit)
-                    progress = min(total_processed / total_records, 0.99) if total_records > 0 else 0
-
-                    self.mongo.db.export_jobs.update_one(
-                        {"_id": job_id},
-                        {"$set": {
-                            "progress": progress,
-                            "records_processed": total_processed
-                        }}
-                    )
-
-            # Final update
-            self.mongo.db.export_jobs.update_one(
-                {"_id": job_id},
-                {"$set": {"records_processed": total_processed}}
-            )
-
     def _process_excel_export(
         self,
         job_id: str,
@@ -507,70 +682,29 @@ class ExportService:
         file_path: str
     ) -> None:
         """Process Excel export to file."""
-        excel_bytes = self.generate_excel(collection, query, fields, "Data", limit)
-
-        with open(file_path, 'wb') as f:
-            f.write(excel_bytes)
+        count = self.write_excel(collection, query, file_path, fields, "Data", limit)
 
-        # Update records processed
-        cursor = self.mongo.db[collection].find(query).limit(limit)
-        count = len(list(cursor))
         self.mongo.db.export_jobs.update_one(
             {"_id": job_id},
             {"$set": {"records_processed": count}}
         )
 
-    def _process_json_export(
+    def _process_columnar_export(
         self,
         job_id: str,
         collection: str,
         query: Dict,
         fields: Optional[List[str]],
         limit: int,
+        format: str,
         file_path: str
     ) -> None:
-        """Process JSON export to file."""
-        import json
-
-        projection = {field: 1 for field in fields} if fields else None
-        cursor = self.mongo.db[collection].find(query, projection).limit(limit)
-
-        total_processed = 0
-        batch_size = 1000
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write('[\n')
-            first = True
-
-            for doc in cursor:
-                if not first:
-                    f.write(',\n')
-                first = False
-
-                # Serialize document
-                serialized = self._serialize_document(doc)
-                f.write(json.dumps(serialized, ensure_ascii=False, default=str))
-                total_processed += 1
-
-                # Update progress
-                if total_processed % batch_size == 0:
-                    job = self.mongo.db.export_jobs.find_one({"_id": job_id})
-                    total_records = job.get("total_records", limit)
-                    progress = min(total_processed / total_records, 0.99) if total_records > 0 else 0
-
-                    self.mongo.db.export_jobs.update_one(
-                        {"_id": job_id},
-                        {"$set": {
-                            "progress": progress,
-                            "records_processed": total_processed
-                        }}
-                    )
-
-            f.write('\n]')
+        """Process Parquet/Arrow export to file."""
+        count = self.write_columnar(collection, query, file_path, format, fields, limit)
 
         self.mongo.db.export_jobs.update_one(
             {"_id": job_id},
-            {"$set": {"records_processed": total_processed}}
+            {"$set": {"records_processed": count}}
         )
 
     def get_export_file_path(self, job_id: str) -> Optional[str]:
@@ -633,6 +767,152 @@ class ExportService:
 
     # ==================== Helper Methods ====================
 
+    def _build_projection(self, fields: Optional[List[str]]) -> Optional[Dict[str, int]]:
+        """
+        Build a MongoDB projection for the exported fields.
+
+        "id" maps to "_id" and nested headers ("a.b") project only the
+        nested field. Returns None (full documents) when fields is empty.
+
+        Args:
+            fields: Export field names
+
+        Returns:
+            Projection dict or None
+        """
+        if not fields:
+            return None
+        projection = {"_id" if field == "id" else field: 1 for field in fields}
+        # _id is always returned; it is the pagination key
+        projection.setdefault("_id", 1)
+        # Parent and child paths cannot be projected together
+        return {
+            path: 1 for path in projection
+            if not any(path.startswith(parent + ".") for parent in projection)
+        }
+
+    def _iter_batches(
+        self,
+        collection: str,
+        query: Dict,
+        fields: Optional[List[str]],
+        batch_size: int,
+        limit: int
+    ) -> Generator[List[Dict], None, None]:
+        """
+        Fetch matching documents in _id order, one batch per round trip.
+
+        Uses keyset pagination (_id > last seen _id) instead of skip, so
+        every batch is an index range scan regardless of how deep into the
+        result set the export is.
+
+        Args:
+            collection: MongoDB collection name
+            query: MongoDB query filter
+            fields: Fields to project (None for full documents)
+            batch_size: Documents per batch
+            limit: Maximum total documents
+
+        Yields:
+            Lists of documents
+        """
+        coll = self.mongo.db[collection]
+        projection = self._build_projection(fields)
+        last_id = None
+        remaining = limit
+
+        while remaining > 0:
+            batch_query = query
+            if last_id is not None:
+                after = {"_id": {"$gt": last_id}}
+                batch_query = {"$and": [query, after]} if "_id" in query else {**query, **after}
+
+            documents = list(
+                coll.find(batch_query, projection).sort("_id", 1).limit(min(batch_size, remaining))
+            )
+            if not documents:
+                return
+
+            yield documents
+
+            remaining -= len(documents)
+            last_id = documents[-1]["_id"]
+
+    def _document_to_record(self, doc: Dict, columns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Flatten a MongoDB document into columnar values.
+
+        Nested documents are flattened with dot notation, "_id" becomes
+        "id", ObjectIds become strings and lists/dicts JSON strings.
+        Scalars (including datetimes) keep their type.
+
+        Args:
+            doc: MongoDB document
+            columns: Requested fields; parent fields ("data") are
+                exported as one JSON column
+
+        Returns:
+            Flat dictionary of column values
+        """
+        import json
+
+        record = {}
+        for key, value in self._flatten_dict(doc).items():
+            if key == "_id":
+                key = "id"
+            if isinstance(value, ObjectId):
+                value = str(value)
+            elif isinstance(value, (list, dict)):
+                value = json.dumps(value, ensure_ascii=False, default=str)
+            elif value is not None and not isinstance(value, (str, bool, int, float, datetime)):
+                value = str(value)
+            record[key] = value
+
+        for column in columns or ():
+            if column in record:
+                continue
+            value = doc
+            for part in column.split("."):
+                value = value.get(part) if isinstance(value, dict) else None
+            if isinstance(value, dict):
+                record[column] = json.dumps(self._serialize_document(value), ensure_ascii=False, default=str)
+        return record
+
+    def _batch_array(self, pa, values: List[Any]):
+        """
+        Build an Arrow array for one batch of a column.
+
+        Mixed-type values are stored as strings.
+        """
+        try:
+            return pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+    def _widen_column_type(self, pa, current, new):
+        """
+        Smallest export type holding values of both types.
+
+        Nulls take the other type, integers and floats widen to float64
+        and any other combination to string.
+        """
+        if current == new or pa.types.is_null(new):
+            return current
+        if pa.types.is_null(current):
+            return new
+        numeric = (pa.types.is_integer, pa.types.is_floating)
+        if any(check(current) for check in numeric) and any(check(new) for check in numeric):
+            return pa.float64()
+        return pa.string()
+
+    def _cast_column(self, pa, array, arrow_type):
+        """Cast a column to a widened type (values become str() for string columns)."""
+        if array.type == arrow_type:
+            return array
+        if pa.types.is_string(arrow_type) and not pa.types.is_null(array.type):
+            return pa.array([None if v is None else str(v) for v in array.to_pylist()], type=arrow_type)
+        return array.cast(arrow_type)
+
     def _get_document_headers(self, doc: Dict) -> List[str]:
         """
         Extract field names from a document for CSV/Excel headers.
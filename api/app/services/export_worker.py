@@ -0,0 +1,452 @@
+"""
+Export Worker for parallel, partitioned export jobs.
+
+Splits a CSV/JSON export job into _id-range partitions, exports the
+partitions concurrently into part files and concatenates the parts into
+the final file. Optional gzip/zstd compression is applied per part; both
+formats allow concatenated members/frames, so parts are compressed in
+parallel and merged without recompression.
+
+Progress is counted in memory and written to export_jobs at most once
+every EXPORT_PROGRESS_INTERVAL_SECONDS instead of once per batch.
+
+Usage:
+    worker = ExportWorker(mongo_service, max_workers=4)
+    rows = worker.run(job_id, "crawl_results", "csv", query, fields,
+                      limit, "utf-8-sig", "/tmp/exports/job.csv.gz",
+                      compression="gzip", total_records=250000)
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from typing import Any, Callable, BinaryIO, Dict, List, Optional
+
+from .export_service import COMPRESSION_EXTENSIONS, ExportService
+
+logger = logging.getLogger(__name__)
+
+# Worker pool / partitioning
+EXPORT_WORKERS = int(os.getenv('EXPORT_WORKERS', '4'))
+EXPORT_PARTITION_MIN_RECORDS = int(os.getenv('EXPORT_PARTITION_MIN_RECORDS', '50000'))
+EXPORT_PARTITIONS_PER_WORKER = 4
+EXPORT_SAMPLE_PER_PARTITION = 20
+
+# Progress flush interval
+EXPORT_PROGRESS_INTERVAL_SECONDS = float(os.getenv('EXPORT_PROGRESS_INTERVAL_SECONDS', '2'))
+
+
+# ============================================================
+# Progress Tracking
+# ============================================================
+
+class ProgressTracker:
+    """
+    Thread-safe in-memory progress counter for an export job.
+
+    Workers call add() after every batch; the job document is updated
+    only when EXPORT_PROGRESS_INTERVAL_SECONDS have passed since the last
+    write (and once more on flush()).
+    """
+
+    def __init__(
+        self,
+        jobs_collection,
+        job_id: str,
+        total_records: int,
+        interval: float = EXPORT_PROGRESS_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.jobs = jobs_collection
+        self.job_id = job_id
+        self.total_records = total_records
+        self.interval = interval
+        self.clock = clock
+        self.processed = 0
+        self.flushes = 0
+        self._last_flush = clock()
+        self._lock = threading.Lock()
+
+    def add(self, count: int) -> None:
+        """Count processed records and flush if the interval has passed."""
+        with self._lock:
+            self.processed += count
+            now = self.clock()
+            if now - self._last_flush < self.interval:
+                return
+            self._last_flush = now
+            processed = self.processed
+        self._write(processed)
+
+    def flush(self) -> None:
+        """Write the current count unconditionally."""
+        with self._lock:
+            self._last_flush = self.clock()
+            processed = self.processed
+        self._write(processed)
+
+    def _write(self, processed: int) -> None:
+        total = self.total_records
+        progress = min(processed / total, 0.99) if total > 0 else 0
+        self.jobs.update_one(
+            {"_id": self.job_id},
+            {"$set": {"progress": progress, "records_processed": processed}}
+        )
+        self.flushes += 1
+
+
+# ============================================================
+# Compression Helpers
+# ============================================================
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstandard is required for zstd compression. Install with: pip install zstandard")
+    return zstandard
+
+
+def open_compressed(path: str, compression: Optional[str]) -> BinaryIO:
+    """Open a binary file for writing with optional gzip/zstd compression."""
+    if compression is None:
+        return open(path, 'wb')
+    if compression == "gzip":
+        return gzip.open(path, 'wb', compresslevel=6)
+    if compression == "zstd":
+        return _zstd().ZstdCompressor().stream_writer(open(path, 'wb'), closefd=True)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def compress_bytes(data: bytes, compression: Optional[str], empty: bool = False) -> bytes:
+    """Compress a small payload as a standalone gzip member / zstd frame."""
+    if compression is None or not (data or empty):
+        return data
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if compression == "zstd":
+        return _zstd().ZstdCompressor().compress(data)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+# ============================================================
+# Partition Export
+# ============================================================
+
+@dataclass
+class PartitionSpec:
+    """One _id range of an export job, written to its own part file."""
+    collection: str
+    query: Dict[str, Any]
+    fields: Optional[List[str]]
+    headers: Optional[List[str]]
+    format: str
+    encoding: str
+    compression: Optional[str]
+    path: str
+    limit: int
+    batch_size: int = 1000
+
+
+def export_partition(
+    mongo_service,
+    spec: PartitionSpec,
+    on_batch: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    Export one partition to its part file.
+
+    CSV parts contain data rows only (no header); JSON parts contain
+    array items separated by ",\\n" (no brackets).
+
+    Args:
+        mongo_service: MongoService (or compatible) instance
+        spec: Partition to export
+        on_batch: Called with the row count of each written batch
+
+    Returns:
+        Number of records written
+    """
+    service = ExportService(mongo_service)
+    # JSON is always UTF-8; for CSV the BOM belongs to the header only
+    encoding = spec.encoding if spec.format == "csv" else "utf-8"
+    if encoding == "utf-8-sig":
+        encoding = "utf-8"
+    total = 0
+
+    with open_compressed(spec.path, spec.compression) as raw:
+        out = io.TextIOWrapper(raw, encoding=encoding, newline='')
+        writer = csv.writer(out, quoting=csv.QUOTE_MINIMAL) if spec.format == "csv" else None
+
+        for documents in service._iter_batches(spec.collection, spec.query, spec.fields, spec.batch_size, spec.limit):
+            if writer is not None:
+                writer.writerows(service._document_to_row(doc, spec.headers) for doc in documents)
+            else:
+                items = (
+                    json.dumps(service._serialize_document(doc), ensure_ascii=False, default=str)
+                    for doc in documents
+                )
+                out.write((",\n" if total else "") + ",\n".join(items))
+            total += len(documents)
+            if on_batch:
+                on_batch(len(documents))
+
+        out.flush()
+        out.detach()
+
+    return total
+
+
+def _export_partition_in_process(mongo_factory: Callable[[], Any], spec: PartitionSpec) -> int:
+    """Process pool entry point: each process opens its own connection."""
+    mongo = mongo_factory()
+    try:
+        return export_partition(mongo, spec)
+    finally:
+        close = getattr(mongo, "close", None)
+        if close:
+            close()
+
+
+def _and(query: Dict, condition: Dict) -> Dict:
+    return {"$and": [query, condition]} if query else condition
+
+
+# ============================================================
+# Export Worker
+# ============================================================
+
+class ExportWorker:
+    """
+    Runs CSV/JSON export jobs as concurrently exported _id-range partitions.
+
+    Threads share the caller's MongoService (pymongo is thread-safe and
+    releases the GIL on I/O). With use_processes=True each partition runs
+    in a worker process that opens its own connection via mongo_factory,
+    which also parallelizes the CPU-bound row encoding; progress is then
+    reported per finished partition.
+    """
+
+    def __init__(
+        self,
+        mongo_service,
+        max_workers: int = EXPORT_WORKERS,
+        use_processes: bool = False,
+        mongo_factory: Optional[Callable[[], Any]] = None,
+        min_partition_records: int = EXPORT_PARTITION_MIN_RECORDS
+    ):
+        """
+        Initialize ExportWorker.
+
+        Args:
+            mongo_service: MongoService instance for planning, merging and thread workers
+            max_workers: Number of concurrent partition workers
+            use_processes: Use a process pool instead of threads
+            mongo_factory: Picklable callable creating a MongoService in worker processes
+            min_partition_records: Jobs smaller than this run as a single partition
+        """
+        if use_processes and mongo_factory is None:
+            raise ValueError("mongo_factory is required when use_processes=True")
+        self.mongo = mongo_service
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
+        self.mongo_factory = mongo_factory
+        self.min_partition_records = min_partition_records
+
+    def plan_partitions(self, collection: str, query: Dict, num_partitions: int) -> List[Dict]:
+        """
+        Split a query into _id ranges of roughly equal size.
+
+        Boundaries are quantiles of a $sample of matching _ids.
+
+        Args:
+            collection: MongoDB collection name
+            query: MongoDB query filter
+            num_partitions: Desired number of partitions
+
+        Returns:
+            Partition queries, in _id order
+        """
+        if num_partitions <= 1:
+            return [query]
+
+        sample = self.mongo.db[collection].aggregate([
+            {"$match": query},
+            {"$sample": {"size": num_partitions * EXPORT_SAMPLE_PER_PARTITION}},
+            {"$project": {"_id": 1}},
+        ])
+        try:
+            ids = sorted({doc["_id"] for doc in sample})
+        except TypeError:
+            # Mixed _id types have no single range order
+            logger.warning(f"Cannot partition {collection} by _id, exporting as one partition")
+            return [query]
+        step = len(ids) / num_partitions
+        bounds = sorted({ids[int(i * step)] for i in range(1, num_partitions)}) if ids else []
+
+        partitions = []
+        lower = None
+        for bound in bounds + [None]:
+            condition = {}
+            if lower is not None:
+                condition["$gte"] = lower
+            if bound is not None:
+                condition["$lt"] = bound
+            partitions.append(_and(query, {"_id": condition}) if condition else query)
+            lower = bound
+        return partitions
+
+    def run(
+        self,
+        job_id: str,
+        collection: str,
+        format: str,
+        query: Dict,
+        fields: Optional[List[str]],
+        limit: int,
+        encoding: str,
+        file_path: str,
+        compression: Optional[str] = None,
+        total_records: Optional[int] = None
+    ) -> int:
+        """
+        Export a job to file_path.
+
+        Args:
+            job_id: Export job identifier (progress is written to export_jobs)
+            collection: MongoDB collection name
+            format: csv or json
+            query: MongoDB query filter
+            fields: Fields to export (None for all)
+            limit: Maximum records
+            encoding: Character encoding (CSV)
+            file_path: Final output path
+            compression: None, "gzip" or "zstd"
+            total_records: Expected record count (for progress and partitioning)
+
+        Returns:
+            Number of records written
+        """
+        if format not in ("csv", "json"):
+            raise ValueError(f"Unsupported format for partitioned export: {format}")
+        if compression not in COMPRESSION_EXTENSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+
+        service = ExportService(self.mongo)
+        coll = self.mongo.db[collection]
+        projection = service._build_projection(fields)
+        if total_records is None:
+            total_records = min(coll.count_documents(query), limit)
+
+        first = next(iter(coll.find(query, projection).sort("_id", 1).limit(1)), None)
+        headers = None
+        if format == "csv" and first is not None:
+            headers = fields if fields else service._get_document_headers(first)
+
+        # Pin the limit to an _id bound so partitions can run independently.
+        # Always checked: total_records may be a stale estimate from job creation.
+        scoped = query
+        if first is not None:
+            last = next(iter(coll.find(query, {"_id": 1}).sort("_id", 1).skip(limit - 1).limit(1)), None)
+            if last is not None:
+                scoped = _and(query, {"_id": {"$lte": last["_id"]}})
+
+        num_partitions = 1
+        if first is not None and total_records >= self.min_partition_records and self.max_workers > 1:
+            num_partitions = self.max_workers * EXPORT_PARTITIONS_PER_WORKER
+        partition_queries = self.plan_partitions(collection, scoped, num_partitions) if first else []
+
+        progress = ProgressTracker(self.mongo.db.export_jobs, job_id, total_records)
+        part_dir = tempfile.mkdtemp(prefix=f"{job_id}_", dir=os.path.dirname(file_path) or None)
+        try:
+            template = PartitionSpec(
+                collection=collection, query=scoped, fields=fields, headers=headers, format=format,
+                encoding=encoding, compression=compression, path="", limit=limit
+            )
+            specs = [
+                replace(template, query=part_query, path=os.path.join(part_dir, f"part-{i:05d}"))
+                for i, part_query in enumerate(partition_queries)
+            ]
+            counts = self._run_partitions(specs, progress)
+            self._merge(specs, counts, format, headers, encoding, compression, file_path)
+        finally:
+            shutil.rmtree(part_dir, ignore_errors=True)
+
+        total = sum(counts)
+        progress.flush()
+        logger.info(
+            f"Export job {job_id}: {total} records from {collection} "
+            f"in {len(specs)} partition(s), {progress.flushes} progress writes"
+        )
+        return total
+
+    def _run_partitions(self, specs: List[PartitionSpec], progress: ProgressTracker) -> List[int]:
+        """Export all partitions; returns row counts in partition order."""
+        if len(specs) <= 1:
+            return [export_partition(self.mongo, spec, progress.add) for spec in specs]
+
+        counts = [0] * len(specs)
+        workers = min(self.max_workers, len(specs))
+        if self.use_processes:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(_export_partition_in_process, self.mongo_factory, spec): i
+                    for i, spec in enumerate(specs)
+                }
+                for future in as_completed(futures):
+                    counts[futures[future]] = future.result()
+                    progress.add(counts[futures[future]])
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export") as pool:
+                futures = {
+                    pool.submit(export_partition, self.mongo, spec, progress.add): i
+                    for i, spec in enumerate(specs)
+                }
+                for future in as_completed(futures):
+                    counts[futures[future]] = future.result()
+        return counts
+
+    def _merge(
+        self,
+        specs: List[PartitionSpec],
+        counts: List[int],
+        format: str,
+        headers: Optional[List[str]],
+        encoding: str,
+        compression: Optional[str],
+        file_path: str
+    ) -> None:
+        """Concatenate part files (already compressed) into the final file."""
+        if format == "csv":
+            prefix, separator, suffix = b"", b"", b""
+            if headers is not None:
+                header = io.StringIO()
+                csv.writer(header, quoting=csv.QUOTE_MINIMAL).writerow(headers)
+                prefix = header.getvalue().encode(encoding)
+        else:
+            prefix, separator, suffix = b"[\n", b",\n", b"\n]"
+
+        with open(file_path, 'wb') as out:
+            out.write(compress_bytes(prefix, compression))
+            written = False
+            for spec, count in zip(specs, counts):
+                if not count:
+                    continue
+                if written:
+                    out.write(compress_bytes(separator, compression))
+                with open(spec.path, 'rb') as part:
+                    shutil.copyfileobj(part, out, 1024 * 1024)
+                written = True
+            out.write(compress_bytes(suffix, compression))
+            if compression and not prefix and not written:
+                # Empty CSV: still write one (empty) member so the file decodes
+                out.write(compress_bytes(b"", compression, empty=True))
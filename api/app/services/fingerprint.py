@@ -0,0 +1,155 @@
+"""
+Record Fingerprint - 레코드 정규 해시
+
+변경 감지(ChangeDetectionService)와 중복 제거(DataDeduplicator,
+IncrementalDeduplicator)가 같은 방식으로 레코드를 해시하도록 하는
+단일 구현입니다.
+
+정규화 규칙:
+- 필드 순서는 설정마다 한 번 정렬해 재사용 (fields가 없으면 레코드 키 정렬)
+- None/누락 필드는 제외
+- 문자열은 그대로, 리스트/딕셔너리는 정렬된 JSON, 그 외 스칼라는 str()
+  (문자열과 비문자열 값은 구분자로 구별되어 "1"과 1은 다른 해시)
+- SHA-256 앞 20바이트 (40자 hex). 벤치마크 환경(SHA 확장 명령어 지원 CPU)에서
+  blake2b/MD5보다 빨라 선택했습니다.
+"""
+
+import json
+from functools import lru_cache
+from hashlib import sha256
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+# 필드/값 구분자 (일반 텍스트에 나오지 않는 제어 문자)
+_STR_SEP = '\x1f'
+_VALUE_SEP = '\x1d'
+_FIELD_SEP = '\x1e'
+
+DEFAULT_DIGEST_SIZE = 20
+
+
+class RecordFingerprinter:
+    """
+    설정별 레코드 해시 계산기
+
+    필드 순서와 필드 접두어를 생성 시 한 번만 계산합니다.
+    같은 설정은 get_fingerprinter()로 인스턴스를 공유하세요.
+
+    Example:
+        fp = get_fingerprinter(('title', 'url'))
+        fp.fingerprint({"title": "제목", "url": "https://..."})
+        fp.fingerprint_many(records)
+    """
+
+    __slots__ = ('fields', 'exclude', 'case_sensitive', 'digest_size', '_prefixes', '_key_prefixes', '_hex_len')
+
+    # fields가 없을 때 레코드 키 구성별로 보관할 접두어 수
+    MAX_KEY_LAYOUTS = 64
+
+    def __init__(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Iterable[str] = (),
+        case_sensitive: bool = True,
+        digest_size: int = DEFAULT_DIGEST_SIZE
+    ):
+        """
+        Args:
+            fields: 해시 대상 필드 (None이면 레코드의 모든 키)
+            exclude: fields가 None일 때 제외할 키
+            case_sensitive: False면 문자열을 소문자로 정규화
+            digest_size: 해시 바이트 수 (SHA-256 앞부분 사용, 최대 32)
+        """
+        self.fields = tuple(sorted(set(fields))) if fields is not None else None
+        self.exclude = frozenset(exclude)
+        self.case_sensitive = case_sensitive
+        self.digest_size = digest_size
+        self._hex_len = digest_size * 2
+        self._prefixes = self._build_prefixes(self.fields) if self.fields is not None else None
+        self._key_prefixes: Dict[Tuple[str, ...], Tuple[Tuple[str, str, str], ...]] = {}
+
+    @staticmethod
+    def _build_prefixes(fields: Sequence[str]) -> Tuple[Tuple[str, str, str], ...]:
+        return tuple(
+            (f, _FIELD_SEP + f + _STR_SEP, _FIELD_SEP + f + _VALUE_SEP) for f in fields
+        )
+
+    def _layout(self, record: Dict[str, Any]) -> Tuple[Tuple[str, str, str], ...]:
+        """레코드 키 구성에 대한 접두어 (같은 구성은 재사용)"""
+        keys = tuple(record)
+        prefixes = self._key_prefixes.get(keys)
+        if prefixes is None:
+            if len(self._key_prefixes) >= self.MAX_KEY_LAYOUTS:
+                self._key_prefixes.clear()
+            prefixes = self._build_prefixes(sorted(k for k in keys if k not in self.exclude))
+            self._key_prefixes[keys] = prefixes
+        return prefixes
+
+    def _parts(self, record: Dict[str, Any]) -> List[str]:
+        """접두어와 값을 번갈아 담은 목록 (값 문자열은 복사하지 않음)"""
+        prefixes = self._prefixes if self._prefixes is not None else self._layout(record)
+        lower = not self.case_sensitive
+        parts = []
+        append = parts.append
+        for field, str_prefix, value_prefix in prefixes:
+            value = record.get(field)
+            if value is None:
+                continue
+            if value.__class__ is str:
+                append(str_prefix)
+                append(value.lower() if lower else value)
+            elif isinstance(value, (list, dict)):
+                append(value_prefix)
+                append(json.dumps(value, sort_keys=True, ensure_ascii=False, default=str))
+            else:
+                append(value_prefix)
+                append(str(value))
+        return parts
+
+    def fingerprint(self, record: Dict[str, Any]) -> str:
+        """레코드 해시 (hex)"""
+        data = ''.join(self._parts(record)).encode('utf-8')
+        return sha256(data).hexdigest()[:self._hex_len]
+
+    def fingerprint_many(self, records: Iterable[Dict[str, Any]]) -> List[str]:
+        """레코드 목록 해시 (입력 순서 유지)"""
+        parts = self._parts
+        join = ''.join
+        hex_len = self._hex_len
+        return [sha256(join(parts(r)).encode('utf-8')).hexdigest()[:hex_len] for r in records]
+
+    __call__ = fingerprint
+
+
+@lru_cache(maxsize=256)
+def _cached_fingerprinter(
+    fields: Optional[Tuple[str, ...]],
+    exclude: FrozenSet[str],
+    case_sensitive: bool,
+    digest_size: int
+) -> RecordFingerprinter:
+    return RecordFingerprinter(fields, exclude, case_sensitive, digest_size)
+
+
+def get_fingerprinter(
+    fields: Optional[Sequence[str]] = None,
+    exclude: Iterable[str] = (),
+    case_sensitive: bool = True,
+    digest_size: int = DEFAULT_DIGEST_SIZE
+) -> RecordFingerprinter:
+    """설정별 공유 인스턴스 (필드 순서 사전 계산 재사용)"""
+    key = tuple(sorted(set(fields))) if fields is not None else None
+    return _cached_fingerprinter(key, frozenset(exclude), case_sensitive, digest_size)
+
+
+def fingerprint(record: Dict[str, Any], fields: Optional[Sequence[str]] = None, **options) -> str:
+    """단일 레코드 해시"""
+    return get_fingerprinter(fields, **options).fingerprint(record)
+
+
+def fingerprint_many(
+    records: Iterable[Dict[str, Any]],
+    fields: Optional[Sequence[str]] = None,
+    **options
+) -> List[str]:
+    """레코드 목록 해시"""
+    return get_fingerprinter(fields, **options).fingerprint_many(records)
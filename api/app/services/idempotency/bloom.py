@@ -0,0 +1,221 @@
+"""
+Bloom Filter - 확률적 멤버십 필터
+
+IncrementalDeduplicator가 "확실히 처음 보는" 해시에 대해 MongoDB 조회를
+생략하도록 소스별로 사용합니다. 없다는 판정은 항상 정확하고, 있다는
+판정은 error_rate 확률로 틀릴 수 있어 호출 측에서 확인해야 합니다.
+
+- BloomFilter: 고정 용량 (비트 배열 numpy uint8)
+- ScalableBloomFilter: 용량이 차면 더 큰 필터를 추가 (단계마다 오탐률을
+  줄여 전체 오탐률이 error_rate 이하로 유지)
+"""
+
+import math
+from hashlib import blake2b
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+_BIT_MASKS = np.array([1 << i for i in range(8)], dtype=np.uint8)
+_MASK64 = (1 << 64) - 1
+
+
+def _hash_pairs(keys: Sequence[str]) -> np.ndarray:
+    """키별 64비트 해시 두 개 (n, 2) uint64"""
+    digest = b''.join(blake2b(k.encode('utf-8'), digest_size=16).digest() for k in keys)
+    return np.frombuffer(digest, dtype=np.uint64).reshape(-1, 2)
+
+
+def _hash_pair(key: str) -> Tuple[int, int]:
+    """단일 키용 _hash_pairs (numpy 호출 비용 없이)"""
+    digest = blake2b(key.encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+class BloomFilter:
+    """
+    고정 용량 Bloom 필터
+
+    k개 비트 위치는 더블 해싱 (h1 + i * h2) mod m으로 계산합니다.
+    비트 배열은 bytearray이고, 배치 연산은 같은 메모리의 numpy 뷰를 씁니다
+    (단일 키 조회는 numpy 호출 비용이 더 커서 파이썬 정수로 처리).
+    """
+
+    __slots__ = ('capacity', 'error_rate', 'num_bits', 'num_hashes', 'count', '_bits', '_view', '_steps')
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: 오탐률을 보장하는 최대 원소 수
+            error_rate: capacity만큼 채웠을 때 목표 오탐률
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._view = np.frombuffer(self._bits, dtype=np.uint8)
+        self._steps = np.arange(self.num_hashes, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+    def _positions(self, pairs: np.ndarray) -> np.ndarray:
+        """(n, num_hashes) 비트 위치"""
+        with np.errstate(over='ignore'):
+            combined = pairs[:, :1] + self._steps * (pairs[:, 1:] | np.uint64(1))
+        return combined % np.uint64(self.num_bits)
+
+    def _add_pairs(self, pairs: np.ndarray) -> None:
+        positions = self._positions(pairs).ravel()
+        np.bitwise_or.at(self._view, positions >> np.uint64(3), _BIT_MASKS[positions & np.uint64(7)])
+        self.count += len(pairs)
+
+    def _contains_pairs(self, pairs: np.ndarray) -> np.ndarray:
+        positions = self._positions(pairs)
+        hits = self._view[positions >> np.uint64(3)] & _BIT_MASKS[positions & np.uint64(7)]
+        return hits.all(axis=1)
+
+    def _add_pair(self, h1: int, h2: int) -> None:
+        bits, num_bits = self._bits, self.num_bits
+        for i in range(self.num_hashes):
+            position = ((h1 + i * h2) & _MASK64) % num_bits
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def _contains_pair(self, h1: int, h2: int) -> bool:
+        bits, num_bits = self._bits, self.num_bits
+        for i in range(self.num_hashes):
+            position = ((h1 + i * h2) & _MASK64) % num_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add(self, key: str) -> None:
+        self._add_pair(*_hash_pair(key))
+
+    def add_many(self, keys: Sequence[str]) -> None:
+        if len(keys):
+            self._add_pairs(_hash_pairs(keys))
+
+    def __contains__(self, key: str) -> bool:
+        return self._contains_pair(*_hash_pair(key))
+
+    def contains_many(self, keys: Sequence[str]) -> np.ndarray:
+        """키별 포함 가능성 (bool 배열, False는 확실히 없음)"""
+        if not len(keys):
+            return np.zeros(0, dtype=bool)
+        return self._contains_pairs(_hash_pairs(keys))
+
+
+class ScalableBloomFilter:
+    """
+    용량 자동 확장 Bloom 필터
+
+    필터가 차면 growth배 용량, tightening배 오탐률의 필터를 추가합니다.
+    조회는 모든 단계 필터를 확인합니다.
+
+    Example:
+        bloom = ScalableBloomFilter(initial_capacity=100_000)
+        bloom.add_many(hashes)
+        maybe = bloom.contains_many(batch_hashes)
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 100000,
+        error_rate: float = 0.001,
+        growth: int = 2,
+        tightening: float = 0.5
+    ):
+        """
+        Args:
+            initial_capacity: 첫 필터 용량
+            error_rate: 전체 목표 오탐률
+            growth: 단계별 용량 배수
+            tightening: 단계별 오탐률 배수 (0-1)
+        """
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self._filters: List[BloomFilter] = []
+
+    def __len__(self) -> int:
+        return sum(f.count for f in self._filters)
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(f.memory_bytes for f in self._filters)
+
+    @property
+    def stages(self) -> int:
+        return len(self._filters)
+
+    def _add_stage(self) -> BloomFilter:
+        stage = len(self._filters)
+        bloom = BloomFilter(
+            self.initial_capacity * self.growth ** stage,
+            # 첫 단계 오탐률 e(1-t)에서 시작해 기하급수 합이 error_rate를 넘지 않음
+            self.error_rate * (1 - self.tightening) * self.tightening ** stage
+        )
+        self._filters.append(bloom)
+        return bloom
+
+    def add_many(self, keys: Sequence[str]) -> None:
+        if not len(keys):
+            return
+        pairs = _hash_pairs(keys)
+        start = 0
+        while start < len(pairs):
+            bloom = self._filters[-1] if self._filters and not self._filters[-1].is_full else self._add_stage()
+            end = start + (bloom.capacity - bloom.count)
+            bloom._add_pairs(pairs[start:end])
+            start = end
+
+    def add(self, key: str) -> None:
+        bloom = self._filters[-1] if self._filters and not self._filters[-1].is_full else self._add_stage()
+        bloom._add_pair(*_hash_pair(key))
+
+    def contains_many(self, keys: Sequence[str]) -> np.ndarray:
+        """키별 포함 가능성 (bool 배열, False는 확실히 없음)"""
+        result = np.zeros(len(keys), dtype=bool)
+        if not len(keys) or not self._filters:
+            return result
+        pairs = _hash_pairs(keys)
+        for bloom in self._filters:
+            result |= bloom._contains_pairs(pairs)
+        return result
+
+    def __contains__(self, key: str) -> bool:
+        h1, h2 = _hash_pair(key)
+        return any(bloom._contains_pair(h1, h2) for bloom in self._filters)
+
+    def update(self, keys: Iterable[str], chunk_size: int = 50000) -> int:
+        """이터러블을 청크 단위로 추가, 추가한 수 반환"""
+        total = 0
+        chunk: List[str] = []
+        for key in keys:
+            chunk.append(key)
+            if len(chunk) >= chunk_size:
+                self.add_many(chunk)
+                total += len(chunk)
+                chunk = []
+        if chunk:
+            self.add_many(chunk)
+            total += len(chunk)
+        return total
@@ -8,18 +8,43 @@ Data Deduplicator - 데이터 중복 제거
 - 배치 및 스트림 처리
 """
 
-import hashlib
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum
+import hashlib
+import json
 import logging
+import math
+import os
+from collections import OrderedDict
+
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from ..fingerprint import RecordFingerprinter, get_fingerprinter
+from .bloom import ScalableBloomFilter
+from .minhash import MinHashLSH, char_ngrams, jaccard
 
 logger = logging.getLogger(__name__)
 
+# 배치 내 중복 판정용 해시 길이 (8바이트 = 16자 hex)
+DEDUP_DIGEST_SIZE = 8
+
+# dedup_hashes에 이전 형식(공용 fingerprint 도입 전) 해시로 저장된 레코드도
+# 중복으로 판정 (전환 기간용, 이전 해시가 cleanup_old_hashes로 모두 정리되면 끔)
+DEDUP_LEGACY_HASH_LOOKUP = os.getenv('DEDUP_LEGACY_HASH_LOOKUP', 'true').lower() == 'true'
+
 
 class DeduplicationStrategy(str, Enum):
-    """중복 제거 전략"""
+    """
+    중복 제거 전략
+
+    EXACT_MATCH/HASH_MATCH는 공용 fingerprint(services/fingerprint.py)로
+    비교합니다. 값의 타입을 구분하고("1"과 1은 다름), 값이 None인 필드는
+    없는 필드와 같게 취급합니다. 공용 fingerprint 도입 전에는 HASH_MATCH가
+    str()로 비교해 "1"과 1이 같았고, 두 전략 모두 None과 없는 필드를
+    구분했습니다.
+    """
     EXACT_MATCH = "exact_match"         # 완전 일치
     KEY_MATCH = "key_match"             # 특정 필드 기반
     HASH_MATCH = "hash_match"           # 해시 기반
@@ -65,6 +90,11 @@ class DeduplicationConfig:
     timestamp_field: str = "created_at"
     case_sensitive: bool = True
     ignore_null: bool = True
+    # FUZZY_MATCH 엔진: minhash (LSH 후보만 비교) / brute_force (전체 비교)
+    fuzzy_engine: str = "minhash"
+    fuzzy_num_perm: int = 128
+    fuzzy_bands: Optional[int] = None  # None이면 임계값 기준 자동 선택
+    fuzzy_recall_weight: float = 0.7  # 자동 선택 시 미탐 가중치 (높을수록 recall↑, 속도↓)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -77,6 +107,10 @@ class DeduplicationConfig:
             "timestamp_field": self.timestamp_field,
             "case_sensitive": self.case_sensitive,
             "ignore_null": self.ignore_null,
+            "fuzzy_engine": self.fuzzy_engine,
+            "fuzzy_num_perm": self.fuzzy_num_perm,
+            "fuzzy_bands": self.fuzzy_bands,
+            "fuzzy_recall_weight": self.fuzzy_recall_weight,
         }
 
 
@@ -87,11 +121,16 @@ class DataDeduplicator:
         self.config = config or DeduplicationConfig()
         self._seen_hashes: Set[str] = set()
         self._seen_keys: Dict[str, int] = {}  # key -> index
+        self._fuzzy_lsh: Optional[MinHashLSH] = None
+        self._fuzzy_sets: List[Set[str]] = []  # LSH 키 -> 저장된 n-gram 집합
+        self._fuzzy_batch: Optional[Tuple[List[str], List[Set[str]], Any, List[List[int]]]] = None
 
     def reset(self):
         """상태 초기화"""
         self._seen_hashes.clear()
         self._seen_keys.clear()
+        self._fuzzy_lsh = None
+        self._fuzzy_sets.clear()
 
     def deduplicate(
         self,
@@ -118,8 +157,26 @@ class DataDeduplicator:
         duplicates = []
         duplicate_reasons = {}
 
+        uses_hash = cfg.strategy == DeduplicationStrategy.HASH_MATCH or (
+            cfg.strategy == DeduplicationStrategy.COMPOSITE and cfg.hash_fields
+        )
+        # HASH_MATCH 해시는 배치로 한 번 계산
+        fingerprints = self._hash_fingerprinter(cfg).fingerprint_many(records) if uses_hash else None
+
+        uses_fuzzy = cfg.fuzzy_fields and cfg.fuzzy_engine == "minhash" and cfg.strategy in (
+            DeduplicationStrategy.FUZZY_MATCH, DeduplicationStrategy.COMPOSITE
+        )
+        if uses_fuzzy:
+            # 배치 전체 n-gram/서명을 한 번에 계산
+            texts = [self._fuzzy_text(r, cfg) for r in records]
+            shingle_sets = [char_ngrams(t) for t in texts]
+            lsh = self._get_fuzzy_lsh(cfg)
+            signatures = lsh.signatures(shingle_sets)
+            self._fuzzy_batch = (texts, shingle_sets, signatures, lsh.band_keys(signatures))
+
         for idx, record in enumerate(records):
-            is_duplicate, reason = self._is_duplicate(record, idx, cfg)
+            record_hash = fingerprints[idx] if uses_hash else None
+            is_duplicate, reason = self._is_duplicate(record, idx, cfg, record_hash)
 
             if is_duplicate:
                 duplicates.append({
@@ -131,6 +188,7 @@ class DataDeduplicator:
             else:
                 unique_records.append(record)
 
+        self._fuzzy_batch = None
         processing_time = int((time.time() - start_time) * 1000)
 
         result = DeduplicationResult(
@@ -153,7 +211,8 @@ class DataDeduplicator:
         self,
         record: Dict[str, Any],
         index: int,
-        config: DeduplicationConfig
+        config: DeduplicationConfig,
+        record_hash: Optional[str] = None
     ) -> Tuple[bool, str]:
         """
         레코드 중복 여부 확인
@@ -168,10 +227,10 @@ class DataDeduplicator:
             return self._check_key_match(record, index, config)
 
         elif config.strategy == DeduplicationStrategy.HASH_MATCH:
-            return self._check_hash_match(record, config)
+            return self._check_hash_match(record, config, record_hash)
 
         elif config.strategy == DeduplicationStrategy.FUZZY_MATCH:
-            return self._check_fuzzy_match(record, config)
+            return self._check_fuzzy_match(record, config, index)
 
         elif config.strategy == DeduplicationStrategy.COMPOSITE:
             # 복합 전략: 순차적으로 검사
@@ -181,12 +240,12 @@ class DataDeduplicator:
                     return is_dup, reason
 
             if config.hash_fields:
-                is_dup, reason = self._check_hash_match(record, config)
+                is_dup, reason = self._check_hash_match(record, config, record_hash)
                 if is_dup:
                     return is_dup, reason
 
             if config.fuzzy_fields:
-                is_dup, reason = self._check_fuzzy_match(record, config)
+                is_dup, reason = self._check_fuzzy_match(record, config, index)
                 if is_dup:
                     return is_dup, reason
 
@@ -194,11 +253,18 @@ class DataDeduplicator:
 
         return False, ""
 
+    @staticmethod
+    def _hash_fingerprinter(config: DeduplicationConfig) -> RecordFingerprinter:
+        """HASH_MATCH용 fingerprinter (hash_fields가 없으면 모든 필드)"""
+        return get_fingerprinter(
+            config.hash_fields or None,
+            case_sensitive=config.case_sensitive,
+            digest_size=DEDUP_DIGEST_SIZE
+        )
+
     def _check_exact_match(self, record: Dict[str, Any]) -> Tuple[bool, str]:
         """완전 일치 검사"""
-        import json
-        record_str = json.dumps(record, sort_keys=True, default=str)
-        record_hash = hashlib.sha256(record_str.encode()).hexdigest()
+        record_hash = get_fingerprinter(None).fingerprint(record)
 
         if record_hash in self._seen_hashes:
             return True, "exact_match"
@@ -240,22 +306,11 @@ class DataDeduplicator:
     def _check_hash_match(
         self,
         record: Dict[str, Any],
-        config: DeduplicationConfig
+        config: DeduplicationConfig,
+        record_hash: Optional[str] = None
     ) -> Tuple[bool, str]:
         """해시 기반 중복 검사"""
-        fields = config.hash_fields or list(record.keys())
-
-        # 해시 대상 값 수집
-        hash_values = []
-        for field in fields:
-            value = record.get(field, "")
-
-            if isinstance(value, str) and not config.case_sensitive:
-                value = value.lower()
-
-            hash_values.append(str(value))
-
-        content_hash = hashlib.sha256("|".join(hash_values).encode()).hexdigest()[:16]
+        content_hash = record_hash or self._hash_fingerprinter(config).fingerprint(record)
 
         if content_hash in self._seen_hashes:
             return True, "hash_match"
@@ -263,24 +318,91 @@ class DataDeduplicator:
         self._seen_hashes.add(content_hash)
         return False, ""
 
+    @staticmethod
+    def _fuzzy_text(record: Dict[str, Any], config: DeduplicationConfig) -> str:
+        """fuzzy_fields 값을 이어 붙인 비교 텍스트"""
+        values = []
+        for field in config.fuzzy_fields:
+            value = str(record.get(field, ""))
+            if not config.case_sensitive:
+                value = value.lower()
+            values.append(value)
+        return " ".join(values)
+
+    def _get_fuzzy_lsh(self, config: DeduplicationConfig) -> MinHashLSH:
+        if self._fuzzy_lsh is None:
+            self._fuzzy_lsh = MinHashLSH(
+                threshold=config.fuzzy_threshold,
+                num_perm=config.fuzzy_num_perm,
+                bands=config.fuzzy_bands,
+                recall_weight=config.fuzzy_recall_weight
+            )
+        return self._fuzzy_lsh
+
     def _check_fuzzy_match(
         self,
         record: Dict[str, Any],
-        config: DeduplicationConfig
+        config: DeduplicationConfig,
+        index: Optional[int] = None
     ) -> Tuple[bool, str]:
-        """유사도 기반 중복 검사 (간단한 구현)"""
+        """
+        유사도 기반 중복 검사
+
+        MinHash LSH로 같은 버킷에 걸린 이전 레코드만 골라 자카드 유사도를
+        계산합니다. 판정 기준(2-gram 자카드, 저장 텍스트 200자)은
+        brute_force 엔진과 같습니다.
+        """
         if not config.fuzzy_fields:
             return False, ""
 
-        # 현재 레코드의 fuzzy 값
-        current_values = []
-        for field in config.fuzzy_fields:
-            value = str(record.get(field, ""))
-            if not config.case_sensitive:
-                value = value.lower()
-            current_values.append(value)
+        if config.fuzzy_engine == "brute_force":
+            return self._check_fuzzy_brute_force(record, config)
 
-        current_text = " ".join(current_values)
+        lsh = self._get_fuzzy_lsh(config)
+        if self._fuzzy_batch is not None and index is not None:
+            texts, shingle_sets, signatures, batch_keys = self._fuzzy_batch
+            current_text, shingles = texts[index], shingle_sets[index]
+            signature, band_keys = signatures[index], batch_keys[index]
+        else:
+            current_text = self._fuzzy_text(record, config)
+            shingles = char_ngrams(current_text)
+            signature = lsh.signature(shingles)
+            band_keys = None
+
+        if not current_text:
+            return False, ""
+
+        # 서명 일치율이 임계값보다 크게 낮은 후보는 정확 계산 생략
+        # (여유폭 2/sqrt(num_perm) = 추정 표준편차 최댓값의 4배)
+        threshold = config.fuzzy_threshold
+        size = len(shingles)
+        min_estimate = threshold - 2 / math.sqrt(lsh.num_perm)
+        for key in lsh.query(signature, min_estimate, band_keys):
+            seen = self._fuzzy_sets[key]
+            # 자카드 상한 min/max 크기로 먼저 거름
+            if min(size, len(seen)) < threshold * max(size, len(seen)):
+                continue
+            similarity = jaccard(shingles, seen)
+            if similarity >= threshold:
+                return True, f"fuzzy_match:{similarity:.2f}"
+
+        # 새 항목 (기존과 같이 앞 200자만 보관)
+        stored_text = current_text[:200]
+        if stored_text != current_text:
+            shingles = char_ngrams(stored_text)
+            signature = lsh.signature(shingles)
+            band_keys = None
+        lsh.insert(signature, band_keys)
+        self._fuzzy_sets.append(shingles)
+        return False, ""
+
+    def _check_fuzzy_brute_force(
+        self,
+        record: Dict[str, Any],
+        config: DeduplicationConfig
+    ) -> Tuple[bool, str]:
+        """유사도 기반 중복 검사 (이전 레코드 전체와 비교, O(n²))"""
+        current_text = self._fuzzy_text(record, config)
 
         # 기존 해시와 비교 (간단한 ngram 유사도)
         for seen_hash in self._seen_hashes:
@@ -300,19 +422,7 @@ class DataDeduplicator:
             return 0.0
 
         # 2-gram 집합
-        def get_ngrams(text: str, n: int = 2) -> Set[str]:
-            text = text.strip()
-            if len(text) < n:
-                return {text}
-            return {text[i:i+n] for i in range(len(text) - n + 1)}
-
-        set1 = get_ngrams(text1)
-        set2 = get_ngrams(text2)
-
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-
-        return intersection / union if union > 0 else 0.0
+        return jaccard(char_ngrams(text1), char_ngrams(text2))
 
     def find_duplicates_in_batch(
         self,
@@ -328,17 +438,12 @@ class DataDeduplicator:
         cfg = config or self.config
         groups: Dict[str, List[int]] = {}
 
-        for idx, record in enumerate(records):
-            # 키 생성
-            if cfg.key_fields:
-                key_values = [str(record.get(f, "")) for f in cfg.key_fields]
-                key = "|".join(key_values)
-            else:
-                import json
-                key = hashlib.sha256(
-                    json.dumps(record, sort_keys=True, default=str).encode()
-                ).hexdigest()[:16]
+        if cfg.key_fields:
+            keys = ["|".join(str(record.get(f, "")) for f in cfg.key_fields) for record in records]
+        else:
+            keys = get_fingerprinter(None, digest_size=DEDUP_DIGEST_SIZE).fingerprint_many(records)
 
+        for idx, key in enumerate(keys):
             if key not in groups:
                 groups[key] = []
             groups[key].append(idx)
@@ -414,29 +519,123 @@ class DataDeduplicator:
 
 
 class IncrementalDeduplicator:
-    """증분 중복 제거 (스트림 처리용)"""
+    """
+    증분 중복 제거 (스트림 처리용)
+
+    판정 순서:
+    1. 최근 윈도우 (소스+해시, 삽입 순서 유지, O(1) 조회/제거)
+    2. 소스별 Bloom 필터: 확실히 처음 보는 해시는 MongoDB 조회 생략
+       (필터는 소스 첫 사용 시 dedup_hashes에서 한 번 적재)
+    3. MongoDB dedup_hashes 조회 (Bloom이 "있을 수도" 라고 한 해시만)
+
+    Bloom 음성을 믿고 조회를 생략하면 다른 프로세스가 먼저 저장한 해시는
+    (source_id, hash) 유니크 인덱스의 DuplicateKeyError로만 잡힙니다.
+    그래서 첫 사용 시 ensure_indexes()를 한 번 호출하고, 인덱스가 확인되지
+    않으면 Bloom 없이 매번 조회합니다.
+
+    legacy_lookup이면 새 해시로 찾지 못한 레코드를 이전 형식 해시로 한 번 더
+    확인하고, 찾으면 중복으로 판정한 뒤 새 해시를 저장합니다 (다음부터는 새
+    해시로 판정).
+
+    MongoDB가 없으면 윈도우만 사용합니다 (Bloom 양성은 확인할 곳이 없어 사용 안 함).
+    """
+
+    COLLECTION_NAME = "dedup_hashes"
 
     def __init__(
         self,
         mongo_service=None,
         config: DeduplicationConfig = None,
-        window_size: int = 10000
+        window_size: int = 10000,
+        use_bloom: bool = True,
+        bloom_capacity: int = 100000,
+        bloom_error_rate: float = 0.001,
+        legacy_lookup: bool = DEDUP_LEGACY_HASH_LOOKUP
     ):
         """
         Args:
             mongo_service: MongoDB 서비스 (영구 저장용)
             config: 중복 제거 설정
             window_size: 메모리 내 보관할 최대 해시 수
+            use_bloom: 소스별 Bloom 필터로 신규 해시의 DB 조회 생략
+            bloom_capacity: Bloom 필터 초기 용량 (차면 두 배씩 확장)
+            bloom_error_rate: Bloom 필터 오탐률 (오탐은 DB 조회 한 번으로 확인)
+            legacy_lookup: 이전 형식 해시로 저장된 레코드도 확인 (전환 기간용)
         """
         self.mongo = mongo_service
         self.config = config or DeduplicationConfig()
         self.window_size = window_size
-        self._recent_hashes: List[str] = []
+        self.use_bloom = use_bloom
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.legacy_lookup = legacy_lookup
+        self._recent_hashes: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._blooms: Dict[str, ScalableBloomFilter] = {}
+        # None: 아직 확인 전, True/False: ensure_indexes() 결과
+        self._unique_index: Optional[bool] = None
+        self._stats = {
+            "checked": 0,
+            "window_hits": 0,
+            "bloom_negatives": 0,
+            "db_lookups": 0,
+            "db_hits": 0,
+            "db_round_trips": 0,
+            "legacy_hits": 0,
+        }
 
     def _get_collection(self):
-        if self.mongo:
-            return self.mongo.db.dedup_hashes
-        return None
+        if not self.mongo:
+            return None
+        collection = self.mongo.db[self.COLLECTION_NAME]
+        if self._unique_index is None:
+            self._unique_index = self._create_indexes(collection)
+        return collection
+
+    def ensure_indexes(self) -> bool:
+        """
+        (source_id, hash) 유니크 인덱스 생성 (동시 쓰기 시 중복 저장 방지)
+
+        Returns:
+            유니크 인덱스 확인 여부 (실패하면 Bloom 음성도 DB 조회)
+        """
+        if not self.mongo:
+            return False
+        self._unique_index = self._create_indexes(self.mongo.db[self.COLLECTION_NAME])
+        return self._unique_index
+
+    def _create_indexes(self, collection) -> bool:
+        try:
+            collection.create_index([("source_id", 1), ("hash", 1)], unique=True)
+            collection.create_index("created_at")
+        except Exception as e:
+            logger.warning(f"Failed to create dedup_hashes indexes, bloom filter disabled: {e}")
+            return False
+        return True
+
+    def _get_bloom(self, source_id: str, collection) -> Optional[ScalableBloomFilter]:
+        """소스별 Bloom 필터 (첫 사용 시 저장된 해시로 채움, 유니크 인덱스가 있을 때만)"""
+        if not self.use_bloom or collection is None or not self._unique_index:
+            return None
+
+        bloom = self._blooms.get(source_id)
+        if bloom is None:
+            bloom = ScalableBloomFilter(self.bloom_capacity, self.bloom_error_rate)
+            cursor = collection.find({"source_id": source_id}, {"hash": 1, "_id": 0})
+            loaded = bloom.update(doc["hash"] for doc in cursor)
+            self._stats["db_round_trips"] += 1
+            self._blooms[source_id] = bloom
+            if loaded:
+                logger.info(f"Loaded {loaded} dedup hashes into bloom filter for {source_id}")
+        return bloom
+
+    def _remember(self, source_id: str, record_hash: str) -> None:
+        """윈도우에 추가 (가장 오래된 항목부터 제거)"""
+        key = (source_id, record_hash)
+        if key in self._recent_hashes:
+            return
+        self._recent_hashes[key] = None
+        if len(self._recent_hashes) > self.window_size:
+            self._recent_hashes.popitem(last=False)
 
     def is_duplicate(
         self,
@@ -454,52 +653,222 @@ class IncrementalDeduplicator:
             중복 여부
         """
         record_hash = self._compute_hash(record)
+        self._stats["checked"] += 1
 
-        # 메모리 캐시 확인
-        if record_hash in self._recent_hashes:
+        # 메모리 윈도우 확인
+        if (source_id, record_hash) in self._recent_hashes:
+            self._stats["window_hits"] += 1
             return True
 
-        # DB 확인 (있으면)
+        # DB 확인 (있으면, Bloom 음성이면 생략)
         collection = self._get_collection()
-        if collection:
-            existing = collection.find_one({
-                "source_id": source_id,
-                "hash": record_hash
-            })
-            if existing:
+        if collection is not None:
+            bloom = self._get_bloom(source_id, collection)
+            if bloom is not None and record_hash not in bloom:
+                self._stats["bloom_negatives"] += 1
+            else:
+                self._stats["db_lookups"] += 1
+                self._stats["db_round_trips"] += 1
+                existing = collection.find_one({
+                    "source_id": source_id,
+                    "hash": record_hash
+                })
+                if existing:
+                    self._stats["db_hits"] += 1
+                    self._remember(source_id, record_hash)
+                    return True
+
+            legacy_hit = self._is_legacy_duplicate(record, source_id, collection, bloom)
+
+            # 새 해시 저장 (이전 형식 해시로 찾은 레코드도 새 해시로 기록)
+            self._stats["db_round_trips"] += 1
+            try:
+                collection.insert_one({
+                    "source_id": source_id,
+                    "hash": record_hash,
+                    "created_at": datetime.utcnow()
+                })
+            except DuplicateKeyError:
+                # 다른 프로세스가 먼저 저장
+                self._remember(source_id, record_hash)
+                return True
+            if bloom is not None:
+                bloom.add(record_hash)
+            if legacy_hit:
+                self._remember(source_id, record_hash)
                 return True
 
-            # 새 해시 저장
-            collection.insert_one({
-                "source_id": source_id,
-                "hash": record_hash,
-                "created_at": datetime.utcnow()
-            })
+        self._remember(source_id, record_hash)
+        return False
 
-        # 메모리 캐시 추가
-        self._recent_hashes.append(record_hash)
-        if len(self._recent_hashes) > self.window_size:
-            self._recent_hashes.pop(0)
+    def is_duplicate_many(
+        self,
+        records: List[Dict[str, Any]],
+        source_id: str
+    ) -> List[bool]:
+        """
+        배치 중복 체크
 
-        return False
+        배치 전체를 $in 조회 한 번, insert_many 한 번으로 처리합니다.
+        배치 안에서 같은 해시가 반복되면 첫 레코드만 신규입니다.
+
+        Args:
+            records: 레코드 목록
+            source_id: 소스 ID
+
+        Returns:
+            레코드별 중복 여부 (입력 순서)
+        """
+        record_hashes = get_fingerprinter(
+            self.config.key_fields or None,
+            digest_size=DEDUP_DIGEST_SIZE
+        ).fingerprint_many(records)
+        self._stats["checked"] += len(record_hashes)
+
+        results = [False] * len(record_hashes)
+        # 해시 -> 첫 등장 인덱스 (윈도우에 없는 해시만)
+        pending: Dict[str, int] = {}
+        recent = self._recent_hashes
+        for idx, record_hash in enumerate(record_hashes):
+            if record_hash in pending or (source_id, record_hash) in recent:
+                results[idx] = True
+            else:
+                pending[record_hash] = idx
+        self._stats["window_hits"] += len(record_hashes) - len(pending)
+
+        collection = self._get_collection()
+        if collection is not None and pending:
+            candidates = list(pending)
+            bloom = self._get_bloom(source_id, collection)
+            if bloom is not None:
+                maybe = bloom.contains_many(candidates)
+                lookups = [h for h, hit in zip(candidates, maybe) if hit]
+                self._stats["bloom_negatives"] += len(candidates) - len(lookups)
+            else:
+                lookups = candidates
+
+            if lookups:
+                self._stats["db_lookups"] += len(lookups)
+                self._stats["db_round_trips"] += 1
+                cursor = collection.find(
+                    {"source_id": source_id, "hash": {"$in": lookups}},
+                    {"hash": 1, "_id": 0}
+                )
+                for doc in cursor:
+                    idx = pending.pop(doc["hash"], None)
+                    if idx is not None:
+                        results[idx] = True
+                        self._stats["db_hits"] += 1
+                        self._remember(source_id, doc["hash"])
+
+            if pending and self.legacy_lookup:
+                # 이전 형식 해시로 찾은 레코드는 중복이지만 새 해시는 저장
+                self._mark_legacy_duplicates(records, source_id, pending, results, collection, bloom)
+
+            if pending:
+                now = datetime.utcnow()
+                new_hashes = list(pending)
+                self._stats["db_round_trips"] += 1
+                try:
+                    collection.insert_many(
+                        [{"source_id": source_id, "hash": h, "created_at": now} for h in new_hashes],
+                        ordered=False
+                    )
+                except BulkWriteError as e:
+                    # 다른 프로세스가 먼저 저장한 해시는 중복으로 판정
+                    for error in e.details.get("writeErrors", []):
+                        if error.get("code") != 11000:
+                            raise
+                        record_hash = new_hashes[error["index"]]
+                        results[pending.pop(record_hash)] = True
+                        self._remember(source_id, record_hash)
+                if bloom is not None:
+                    bloom.add_many(list(pending))
+
+        for record_hash in pending:
+            self._remember(source_id, record_hash)
+
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """판정 경로별 카운터와 메모리 사용량"""
+        return {
+            **self._stats,
+            "window_size": len(self._recent_hashes),
+            "unique_index": self._unique_index,
+            "bloom_sources": len(self._blooms),
+            "bloom_entries": sum(len(b) for b in self._blooms.values()),
+            "bloom_memory_bytes": sum(b.memory_bytes for b in self._blooms.values()),
+        }
 
     def _compute_hash(self, record: Dict[str, Any]) -> str:
-        """레코드 해시 계산"""
+        """레코드 해시 계산 (key_fields가 없으면 모든 필드)"""
+        return get_fingerprinter(
+            self.config.key_fields or None,
+            digest_size=DEDUP_DIGEST_SIZE
+        ).fingerprint(record)
+
+    def _legacy_hash(self, record: Dict[str, Any]) -> str:
+        """공용 fingerprint 도입 전 해시 (key_fields 값 '|' 연결 또는 정렬된 JSON의 sha256 앞 16자)"""
         if self.config.key_fields:
-            values = [str(record.get(f, "")) for f in self.config.key_fields]
-            content = "|".join(values)
+            content = "|".join(str(record.get(f, "")) for f in self.config.key_fields)
         else:
-            import json
             content = json.dumps(record, sort_keys=True, default=str)
-
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
+    def _is_legacy_duplicate(
+        self,
+        record: Dict[str, Any],
+        source_id: str,
+        collection,
+        bloom: Optional[ScalableBloomFilter]
+    ) -> bool:
+        """이전 형식 해시로 저장된 레코드인지 (Bloom 음성이면 조회 생략)"""
+        if not self.legacy_lookup:
+            return False
+        legacy_hash = self._legacy_hash(record)
+        if bloom is not None and legacy_hash not in bloom:
+            return False
+        self._stats["db_round_trips"] += 1
+        if collection.find_one({"source_id": source_id, "hash": legacy_hash}) is None:
+            return False
+        self._stats["legacy_hits"] += 1
+        return True
+
+    def _mark_legacy_duplicates(
+        self,
+        records: List[Dict[str, Any]],
+        source_id: str,
+        pending: Dict[str, int],
+        results: List[bool],
+        collection,
+        bloom: Optional[ScalableBloomFilter]
+    ) -> None:
+        """pending 중 이전 형식 해시로 저장된 레코드를 중복으로 표시 ($in 조회 한 번)"""
+        legacy = {self._legacy_hash(records[idx]): idx for idx in pending.values()}
+        candidates = list(legacy)
+        if bloom is not None:
+            candidates = [h for h, hit in zip(candidates, bloom.contains_many(candidates)) if hit]
+        if not candidates:
+            return
+
+        self._stats["db_round_trips"] += 1
+        cursor = collection.find(
+            {"source_id": source_id, "hash": {"$in": candidates}},
+            {"hash": 1, "_id": 0}
+        )
+        for doc in cursor:
+            idx = legacy.get(doc["hash"])
+            if idx is not None and not results[idx]:
+                results[idx] = True
+                self._stats["legacy_hits"] += 1
+
     def cleanup_old_hashes(self, source_id: str, days: int = 7) -> int:
         """오래된 해시 정리"""
         from datetime import timedelta
 
         collection = self._get_collection()
-        if not collection:
+        if collection is None:
             return 0
 
         cutoff = datetime.utcnow() - timedelta(days=days)
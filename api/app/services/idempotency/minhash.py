@@ -0,0 +1,213 @@
+"""
+MinHash LSH - 유사 중복 후보 검색 인덱스
+
+DataDeduplicator의 FUZZY_MATCH가 이전 레코드 전체와 자카드 유사도를
+비교하지 않도록 MinHash 서명을 밴드로 나눠 버킷에 저장하고, 같은 버킷에
+걸린 후보만 반환합니다. 최종 판정(정확한 자카드 계산)은 호출 측이 합니다.
+
+- 서명: 32비트 shingle 해시에 multiply-add-shift 해시 ((a*x + b) >> 32,
+  64비트 랩어라운드)를 num_perm개 적용한 최솟값
+- 밴드 수/행 수: 임계값 기준 오탐·미탐 확률 적분이 최소가 되도록 자동 선택
+  (recall_weight로 미탐 비중 조절)
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+_MAX_HASH = 0xFFFFFFFF
+_SHIFT = np.uint64(32)
+
+
+def char_ngrams(text: str, n: int = 2) -> Set[str]:
+    """문자 n-gram 집합 (공백 제거 후 n보다 짧으면 텍스트 자체)"""
+    text = text.strip()
+    if len(text) < n:
+        return {text}
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def jaccard(set1: Set[str], set2: Set[str]) -> float:
+    """자카드 유사도"""
+    intersection = len(set1 & set2)
+    union = len(set1) + len(set2) - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+def _integrate(f, a: float, b: float, steps: int = 100) -> float:
+    step = (b - a) / steps
+    return sum(f(a + (i + 0.5) * step) for i in range(steps)) * step
+
+
+def optimal_bands(threshold: float, num_perm: int, recall_weight: float = 0.5) -> Tuple[int, int]:
+    """
+    임계값에 맞는 (밴드 수, 밴드당 행 수)
+
+    유사도 s인 쌍이 후보가 될 확률은 1 - (1 - s^r)^b 입니다.
+    threshold 아래 구간의 후보 확률(오탐)과 위 구간의 비후보 확률(미탐)을
+    (1 - recall_weight) : recall_weight로 가중한 합이 최소인 조합을 고릅니다.
+    """
+    best, best_error = (num_perm, 1), float('inf')
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        rows = num_perm // bands
+        false_positive = _integrate(lambda s, r=rows, b=bands: 1 - (1 - s ** r) ** b, 0.0, threshold)
+        false_negative = _integrate(lambda s, r=rows, b=bands: (1 - s ** r) ** b, threshold, 1.0)
+        error = (1 - recall_weight) * false_positive + recall_weight * false_negative
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHashLSH:
+    """
+    MinHash 서명 + LSH 밴드 버킷
+
+    Example:
+        lsh = MinHashLSH(threshold=0.9)
+        sigs = lsh.signatures([char_ngrams(t) for t in titles])
+        keys = lsh.band_keys(sigs)
+        for sig, band_keys in zip(sigs, keys):
+            candidates = lsh.query(sig, band_keys=band_keys)
+            ...
+            lsh.insert(sig, band_keys)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        num_perm: int = 128,
+        bands: Optional[int] = None,
+        recall_weight: float = 0.7,
+        seed: int = 1
+    ):
+        """
+        Args:
+            threshold: 목표 자카드 임계값
+            num_perm: 서명 길이 (클수록 정확, 느림)
+            bands: 밴드 수 (None이면 optimal_bands로 자동 선택, num_perm의 약수)
+            recall_weight: 자동 선택 시 미탐 가중치 (0-1, 높을수록 후보 증가)
+            seed: 순열 계수 난수 시드
+        """
+        if bands is None:
+            bands, rows = optimal_bands(threshold, num_perm, recall_weight)
+        else:
+            if num_perm % bands:
+                raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+            rows = num_perm // bands
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = rows
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(0, 2 ** 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.randint(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+        self._band_coeffs = rng.randint(0, 2 ** 63, size=rows, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._buckets: List[Dict[int, Union[int, List[int]]]] = [{} for _ in range(bands)]
+        # 키 -> 서명 (후보 추정 유사도 계산용, 필요 시 두 배로 확장)
+        self._signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        for bucket in self._buckets:
+            bucket.clear()
+        self._signatures = np.empty((0, self.num_perm), dtype=np.uint32)
+        self._size = 0
+
+    def signatures(self, shingle_sets: Sequence[Iterable[str]], chunk_size: int = 2000) -> np.ndarray:
+        """
+        shingle 집합 목록의 MinHash 서명 (n, num_perm) uint32
+
+        여러 레코드를 한 번에 행렬 연산으로 계산합니다.
+        """
+        result = np.empty((len(shingle_sets), self.num_perm), dtype=np.uint32)
+        for start in range(0, len(shingle_sets), chunk_size):
+            chunk = shingle_sets[start:start + chunk_size]
+            # 파이썬 hash()는 프로세스마다 달라지지만 인덱스는 메모리 전용이라 무관
+            hashes = [[hash(s) & _MAX_HASH for s in shingles] or [0] for shingles in chunk]
+            lengths = np.fromiter((len(h) for h in hashes), dtype=np.int64, count=len(hashes))
+            flat = np.fromiter((x for h in hashes for x in h), dtype=np.uint64, count=int(lengths.sum()))
+            # (num_perm, shingle 수) 배치: reduceat이 연속 메모리 축을 따라 동작
+            permuted = np.multiply.outer(self._a, flat)
+            permuted += self._b[:, None]
+            permuted >>= _SHIFT
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            result[start:start + len(chunk)] = np.minimum.reduceat(permuted, offsets, axis=1).T
+        return result
+
+    def signature(self, shingles: Iterable[str]) -> np.ndarray:
+        return self.signatures([shingles])[0]
+
+    def band_keys(self, signatures: np.ndarray) -> List[List[int]]:
+        """
+        서명 (n, num_perm)의 밴드별 버킷 키 (n, bands)
+
+        밴드의 행 값을 홀수 계수 가중합(64비트 랩어라운드)으로 합칩니다. 키 충돌은 후보를
+        늘릴 뿐이고 최종 판정은 정확한 자카드로 하므로 결과에 영향이 없습니다.
+        """
+        bands = signatures.reshape(len(signatures), self.bands, self.rows).astype(np.uint64)
+        with np.errstate(over='ignore'):
+            return (bands * self._band_coeffs).sum(axis=2, dtype=np.uint64).tolist()
+
+    def insert(self, signature: np.ndarray, band_keys: Optional[List[int]] = None) -> int:
+        """서명 등록, 부여된 키(0부터 삽입 순서) 반환"""
+        key = self._size
+        if key == len(self._signatures):
+            grown = np.empty((max(1024, key * 2), self.num_perm), dtype=np.uint32)
+            grown[:key] = self._signatures
+            self._signatures = grown
+        self._signatures[key] = signature
+        self._size = key + 1
+
+        if band_keys is None:
+            band_keys = self.band_keys(signature[None])[0]
+        # 버킷 대부분은 키 하나라 정수로 두고 충돌 시에만 리스트로 바꿉니다
+        # (버킷마다 리스트를 만들면 GC 추적 객체가 밴드 수만큼 늘어남)
+        for bucket, band_key in zip(self._buckets, band_keys):
+            keys = bucket.get(band_key)
+            if keys is None:
+                bucket[band_key] = key
+            elif keys.__class__ is int:
+                bucket[band_key] = [keys, key]
+            else:
+                keys.append(key)
+        return key
+
+    def query(
+        self,
+        signature: np.ndarray,
+        min_estimate: Optional[float] = None,
+        band_keys: Optional[List[int]] = None
+    ) -> List[int]:
+        """
+        한 밴드라도 같은 버킷에 있는 키 (오름차순)
+
+        Args:
+            min_estimate: 지정 시 서명 일치율(추정 자카드)이 이 값 미만인 후보 제외
+            band_keys: band_keys()로 미리 계산한 키 (배치 처리 시)
+        """
+        if band_keys is None:
+            band_keys = self.band_keys(signature[None])[0]
+        candidates: Set[int] = set()
+        for bucket, band_key in zip(self._buckets, band_keys):
+            keys = bucket.get(band_key)
+            if keys is None:
+                continue
+            if keys.__class__ is int:
+                candidates.add(keys)
+            else:
+                candidates.update(keys)
+        if not candidates:
+            return []
+
+        keys = sorted(candidates)
+        if min_estimate is None or len(keys) == 1:
+            return keys
+        estimates = (self._signatures[keys] == signature).mean(axis=1)
+        return [key for key, estimate in zip(keys, estimates) if estimate >= min_estimate]
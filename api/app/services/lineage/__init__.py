@@ -7,6 +7,7 @@ Data Lineage Module - 데이터 리니지 추적
 Components:
 - LineageTracker: 리니지 추적 및 조회 서비스
 - LineageGraph: 리니지 그래프 관리
+- LineageIndex: 프로세스 상주 리니지 그래프 인덱스 (메모리 조회)
 - LineageNode: 데이터 엔티티 (소스, 데이터셋, 필드)
 - LineageEdge: 데이터 흐름 (추출, 변환, 적재)
 - ImpactAnalyzer: 영향 분석
@@ -26,6 +27,7 @@ from .tracker import (
     LineageRun,
 )
 from .graph import LineageGraph
+from .index import LineageIndex, get_lineage_index, reset_lineage_index
 from .impact import ImpactAnalyzer, ImpactResult
 
 __all__ = [
@@ -38,6 +40,10 @@ __all__ = [
     "LineageRun",
     # Graph
     "LineageGraph",
+    # Index
+    "LineageIndex",
+    "get_lineage_index",
+    "reset_lineage_index",
     # Impact Analysis
     "ImpactAnalyzer",
     "ImpactResult",
@@ -4,13 +4,14 @@ Lineage Graph - 리니지 그래프 관리
 기능:
 - 그래프 시각화용 데이터 변환
 - 경로 분석
+- 사이클/강연결 컴포넌트 분석
 - 그래프 통계
 """
 
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
 import logging
 
 from .tracker import LineageNode, LineageEdge, NodeType, EdgeType
@@ -262,19 +263,24 @@ class LineageGraph:
         if start_node_id == end_node_id:
             return [start_node_id]
 
-        visited = {start_node_id}
-        queue = [(start_node_id, [start_node_id])]
+        # 경로 대신 부모만 기록하고 도착 시 복원
+        parents = {start_node_id: None}
+        queue = deque([start_node_id])
 
         while queue:
-            current, path = queue.pop(0)
+            current = queue.popleft()
 
             for neighbor in self._adjacency.get(current, set()):
                 if neighbor == end_node_id:
-                    return path + [neighbor]
+                    path = [neighbor, current]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    path.reverse()
+                    return path
 
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
+                if neighbor not in parents:
+                    parents[neighbor] = current
+                    queue.append(neighbor)
 
         return None
 
@@ -298,19 +304,28 @@ class LineageGraph:
         if start_node_id not in self._nodes or end_node_id not in self._nodes:
             return []
 
+        if start_node_id == end_node_id:
+            return [[start_node_id]] if max_paths > 0 else []
+
         paths = []
-        stack = [(start_node_id, [start_node_id])]
+        path = [start_node_id]
+        on_path = {start_node_id}  # 사이클 방지
+        # 이웃을 역순으로 방문 (스택에 쌓아 꺼내던 이전 구현과 같은 경로 순서)
+        stack = [iter(list(self._adjacency.get(start_node_id, ()))[::-1])]
 
         while stack and len(paths) < max_paths:
-            current, path = stack.pop()
-
-            if current == end_node_id:
-                paths.append(path)
+            neighbor = next(stack[-1], None)
+            if neighbor is None:
+                stack.pop()
+                on_path.discard(path.pop())
                 continue
 
-            for neighbor in self._adjacency.get(current, set()):
-                if neighbor not in path:  # 사이클 방지
-                    stack.append((neighbor, path + [neighbor]))
+            if neighbor == end_node_id:
+                paths.append(path + [neighbor])
+            elif neighbor not in on_path:
+                path.append(neighbor)
+                on_path.add(neighbor)
+                stack.append(iter(list(self._adjacency.get(neighbor, ()))[::-1]))
 
         return paths
 
@@ -324,62 +339,130 @@ class LineageGraph:
         visited = set()
         components = []
 
-        def dfs(node_id: str, component: Set[str]):
+        for node_id in self._nodes:
             if node_id in visited:
-                return
-            visited.add(node_id)
-            component.add(node_id)
-
-            # 양방향 연결 탐색
-            for neighbor in self._adjacency.get(node_id, set()):
-                dfs(neighbor, component)
-            for neighbor in self._reverse_adjacency.get(node_id, set()):
-                dfs(neighbor, component)
+                continue
 
-        for node_id in self._nodes:
-            if node_id not in visited:
-                component = set()
-                dfs(node_id, component)
-                components.append(component)
+            component = {node_id}
+            visited.add(node_id)
+            stack = [node_id]
+            while stack:
+                current = stack.pop()
+                # 양방향 연결 탐색
+                for neighbors in (self._adjacency.get(current, ()), self._reverse_adjacency.get(current, ())):
+                    for neighbor in neighbors:
+                        if neighbor not in visited:
+                            visited.add(neighbor)
+                            component.add(neighbor)
+                            stack.append(neighbor)
+            components.append(component)
 
         return components
 
     def detect_cycles(self) -> List[List[str]]:
         """
-        사이클 감지
+        사이클 감지 (DFS 역방향 엣지마다 사이클 하나)
 
         Returns:
             사이클 목록 (각 사이클은 노드 ID 목록)
         """
         cycles = []
         visited = set()
-        rec_stack = set()
-        path = []
+        path: List[str] = []
+        position: Dict[str, int] = {}  # 현재 경로 위의 노드 -> 경로 인덱스
 
-        def dfs(node_id: str):
-            visited.add(node_id)
-            rec_stack.add(node_id)
-            path.append(node_id)
+        for root in self._nodes:
+            if root in visited:
+                continue
+
+            visited.add(root)
+            position[root] = 0
+            path.append(root)
+            stack = [iter(self._adjacency.get(root, ()))]
+
+            while stack:
+                neighbor = next(stack[-1], None)
+                if neighbor is None:
+                    stack.pop()
+                    del position[path.pop()]
+                    continue
 
-            for neighbor in self._adjacency.get(node_id, set()):
                 if neighbor not in visited:
-                    result = dfs(neighbor)
-                    if result:
-                        return result
-                elif neighbor in rec_stack:
+                    visited.add(neighbor)
+                    position[neighbor] = len(path)
+                    path.append(neighbor)
+                    stack.append(iter(self._adjacency.get(neighbor, ())))
+                elif neighbor in position:
                     # 사이클 발견
-                    cycle_start = path.index(neighbor)
-                    cycles.append(path[cycle_start:] + [neighbor])
+                    cycles.append(path[position[neighbor]:] + [neighbor])
 
-            path.pop()
-            rec_stack.remove(node_id)
-            return None
+        return cycles
 
-        for node_id in self._nodes:
-            if node_id not in visited:
-                dfs(node_id)
+    def get_strongly_connected_components(self) -> List[Set[str]]:
+        """
+        강연결 컴포넌트 (반복형 Tarjan)
 
-        return cycles
+        사이클에 속한 노드들은 크기 2 이상(또는 자기 루프)인 같은
+        컴포넌트로 묶입니다. 역방향 위상 순서로 반환합니다.
+
+        Returns:
+            컴포넌트 목록 (각 컴포넌트는 노드 ID 집합)
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        scc_stack: List[str] = []
+        on_stack: Set[str] = set()
+        components = []
+
+        for root in self._nodes:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = len(index)
+            scc_stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self._adjacency.get(root, ())))]
+
+            while work:
+                node_id, neighbors = work[-1]
+                neighbor = next(neighbors, None)
+
+                if neighbor is not None:
+                    if neighbor not in index:
+                        index[neighbor] = lowlink[neighbor] = len(index)
+                        scc_stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(self._adjacency.get(neighbor, ()))))
+                    elif neighbor in on_stack:
+                        lowlink[node_id] = min(lowlink[node_id], index[neighbor])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node_id])
+
+                if lowlink[node_id] == index[node_id]:
+                    component = set()
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+                        if member == node_id:
+                            break
+                    components.append(component)
+
+        return components
+
+    def has_cycles(self) -> bool:
+        """사이클 존재 여부 (detect_cycles()가 비어 있지 않은지와 동일)"""
+        for component in self.get_strongly_connected_components():
+            if len(component) > 1:
+                return True
+            node_id = next(iter(component))
+            if node_id in self._adjacency.get(node_id, ()):  # 자기 루프
+                return True
+        return False
 
     def get_subgraph(
         self,
@@ -424,11 +507,11 @@ class LineageGraph:
                 if target in in_degree:
                     in_degree[target] += 1
 
-        queue = [n_id for n_id, degree in in_degree.items() if degree == 0]
+        queue = deque(n_id for n_id, degree in in_degree.items() if degree == 0)
         result = []
 
         while queue:
-            node_id = queue.pop(0)
+            node_id = queue.popleft()
             result.append(node_id)
 
             for neighbor in self._adjacency.get(node_id, set()):
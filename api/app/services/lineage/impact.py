@@ -8,7 +8,8 @@ Impact Analyzer - 영향 분석
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
@@ -110,16 +111,8 @@ class ImpactAnalyzer:
             change_type="delete"
         )
 
-        # 다운스트림 노드 조회
-        downstream_nodes, downstream_edges = self.tracker.get_downstream(node_id)
-
-        # 영향 분석
-        impacted = self._analyze_downstream_impact(
-            node_id,
-            downstream_nodes,
-            downstream_edges,
-            change_type="delete"
-        )
+        # 다운스트림 영향 분석
+        impacted = self._downstream_impact(node_id, change_type="delete")
 
         result.impacted_nodes = impacted
         result.total_impacted = len(impacted)
@@ -168,14 +161,8 @@ class ImpactAnalyzer:
         all_impacted: Dict[str, ImpactedNode] = {}
 
         for field_node in field_nodes:
-            downstream_nodes, downstream_edges = self.tracker.get_downstream(
-                field_node.node_id
-            )
-
-            impacted = self._analyze_downstream_impact(
+            impacted = self._downstream_impact(
                 field_node.node_id,
-                downstream_nodes,
-                downstream_edges,
                 change_type=f"field_{change_type}"
             )
 
@@ -343,11 +330,30 @@ class ImpactAnalyzer:
             "total_edges": len(edges),
             "stages": stages,
             "flow_order": flow_order,
-            "cycles_detected": len(graph.detect_cycles()) > 0,
+            "cycles_detected": graph.has_cycles(),
             "graph_statistics": graph.get_statistics(),
             "visualization": graph.to_visualization_format()
         }
 
+    def _downstream_impact(self, node_id: str, change_type: str) -> List[ImpactedNode]:
+        """
+        다운스트림 영향 분석
+
+        추적기에 메모리 인덱스가 있으면 MongoDB 조회 없이 인덱스 BFS 한 번으로
+        거리와 경로를 구하고, 없으면 다운스트림을 조회해 계산합니다.
+        """
+        index = getattr(self.tracker, "index", None)
+        if index is not None and node_id in index:
+            return self._build_impacted(index.impact(node_id, depth=10), change_type)
+
+        downstream_nodes, downstream_edges = self.tracker.get_downstream(node_id)
+        return self._analyze_downstream_impact(
+            node_id,
+            downstream_nodes,
+            downstream_edges,
+            change_type=change_type
+        )
+
     def _analyze_downstream_impact(
         self,
         source_node_id: str,
@@ -356,28 +362,31 @@ class ImpactAnalyzer:
         change_type: str
     ) -> List[ImpactedNode]:
         """다운스트림 영향 분석"""
-        impacted = []
-
-        # 거리 계산
-        distances = self._calculate_distances(source_node_id, downstream_edges)
+        # 거리/경로 계산 (BFS 한 번)
+        distances, parents = self._shortest_path_tree(source_node_id, downstream_edges)
 
-        for node in downstream_nodes:
-            if node.node_id == source_node_id:
-                continue
+        reachable = [
+            (node, distances.get(node.node_id, 99), self._build_path(parents, node.node_id))
+            for node in downstream_nodes
+            if node.node_id != source_node_id
+        ]
+        return self._build_impacted(reachable, change_type)
 
-            distance = distances.get(node.node_id, 99)
+    def _build_impacted(
+        self,
+        reachable: Iterable[Tuple[LineageNode, int, List[str]]],
+        change_type: str
+    ) -> List[ImpactedNode]:
+        """(노드, 거리, 경로)로 영향 노드 목록 생성"""
+        impacted = []
 
+        for node, distance, path in reachable:
             # 영향 수준 결정
             impact_level = self._determine_impact_level(node, distance, change_type)
 
             # 영향 사유
             impact_reason = self._generate_impact_reason(node, distance, change_type)
 
-            # 경로 계산
-            path = self._find_shortest_path(
-                source_node_id, node.node_id, downstream_edges
-            )
-
             impacted.append(ImpactedNode(
                 node=node,
                 impact_level=impact_level,
@@ -461,60 +470,41 @@ class ImpactAnalyzer:
         else:
             return f"Data modification impact (distance: {distance})"
 
-    def _calculate_distances(
+    def _shortest_path_tree(
         self,
         source_id: str,
         edges: List[LineageEdge]
-    ) -> Dict[str, int]:
-        """거리 계산 (BFS)"""
-        adjacency = {}
+    ) -> Tuple[Dict[str, int], Dict[str, str]]:
+        """거리와 BFS 부모 계산 (노드별 최단 경로는 부모를 거슬러 올라가 복원)"""
+        adjacency = defaultdict(list)
         for edge in edges:
-            if edge.source_node_id not in adjacency:
-                adjacency[edge.source_node_id] = []
             adjacency[edge.source_node_id].append(edge.target_node_id)
 
         distances = {source_id: 0}
-        queue = [source_id]
+        parents: Dict[str, str] = {}
+        queue = deque([source_id])
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             current_dist = distances[current]
 
             for neighbor in adjacency.get(current, []):
                 if neighbor not in distances:
                     distances[neighbor] = current_dist + 1
+                    parents[neighbor] = current
                     queue.append(neighbor)
 
-        return distances
-
-    def _find_shortest_path(
-        self,
-        start_id: str,
-        end_id: str,
-        edges: List[LineageEdge]
-    ) -> List[str]:
-        """최단 경로 찾기"""
-        adjacency = {}
-        for edge in edges:
-            if edge.source_node_id not in adjacency:
-                adjacency[edge.source_node_id] = []
-            adjacency[edge.source_node_id].append(edge.target_node_id)
-
-        visited = {start_id}
-        queue = [(start_id, [start_id])]
-
-        while queue:
-            current, path = queue.pop(0)
-
-            if current == end_id:
-                return path
-
-            for neighbor in adjacency.get(current, []):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
-
-        return []
+        return distances, parents
+
+    def _build_path(self, parents: Dict[str, str], end_id: str) -> List[str]:
+        """BFS 부모로 최단 경로 복원 (도달 불가면 빈 목록)"""
+        if end_id not in parents:
+            return []
+        path = [end_id]
+        while path[-1] in parents:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return path
 
     def _find_related_field_nodes(
         self,
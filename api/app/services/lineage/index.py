@@ -0,0 +1,509 @@
+"""
+Lineage Index - 프로세스 상주 리니지 그래프 인덱스
+
+lineage_nodes/lineage_edges를 한 번 적재해 정수 ID 인접 배열(CSR, 정방향/
+역방향)로 보관하고, LineageTracker.register_node/add_edge가 쓸 때마다
+증분 반영합니다. upstream/downstream 폐포, 최단 경로, 영향 분석을
+MongoDB 조회 없이 처리합니다.
+
+- 노드 ID(str) → 정수 인덱스, 노드 메타데이터는 영향 분석에 필요한 것만 보관
+- 인접 배열: offsets(int64) + targets(int32) numpy 배열
+- 증분 엣지는 delta 목록에 쌓았다가 일정 크기가 되면 CSR로 병합
+- 탐색은 레벨 단위 벡터화 BFS (프런티어 전체의 이웃을 한 번에 수집)
+
+Usage:
+    index = get_lineage_index(mongo)
+    tracker = LineageTracker(mongo, index=index)
+    impacted = index.impact(node_id)
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+
+from .tracker import LineageEdge, LineageNode, LineageTracker, NodeType
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 재적재 주기 (다른 프로세스의 쓰기 반영, 0이면 재적재 안 함)
+LINEAGE_INDEX_TTL_SECONDS = int(os.getenv('LINEAGE_INDEX_TTL_SECONDS', '300'))
+
+# 적재 실패 후 재시도까지 대기 (요청마다 전체 스캔 재시도 방지)
+LINEAGE_INDEX_RETRY_SECONDS = int(os.getenv('LINEAGE_INDEX_RETRY_SECONDS', '60'))
+
+_NODE_TYPES = list(NodeType)
+_TYPE_CODES = {t: i for i, t in enumerate(_NODE_TYPES)}
+_UNKNOWN_TYPE = 255  # 엣지로만 알려진 (미등록) 노드
+
+
+class _CSR:
+    """불변 인접 배열 (노드 i의 이웃 = targets[offsets[i]:offsets[i + 1]])"""
+
+    __slots__ = ('offsets', 'targets')
+
+    def __init__(self, offsets: np.ndarray, targets: np.ndarray):
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def build(cls, src: np.ndarray, dst: np.ndarray, num_nodes: int) -> "_CSR":
+        order = np.argsort(src, kind='stable')
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_nodes), out=offsets[1:])
+        return cls(offsets, dst[order].astype(np.int32))
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.nbytes + self.targets.nbytes
+
+    def sources(self) -> np.ndarray:
+        """targets와 같은 순서의 출발 노드 배열"""
+        return np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.offsets))
+
+    def neighbors(self, node: int) -> np.ndarray:
+        if node >= self.num_nodes:
+            return self.targets[:0]
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def expand(self, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """프런티어 전체의 (이웃, 부모) 배열"""
+        base = self.num_nodes
+        starts = self.offsets[np.minimum(frontier, base)]
+        ends = self.offsets[np.minimum(frontier + 1, base)]
+        lengths = ends - starts
+        total = int(lengths.sum())
+        if not total:
+            return self.targets[:0], frontier[:0]
+        # 각 구간 [start, end)를 이어 붙인 인덱스
+        positions = np.arange(total, dtype=np.int64) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return self.targets[positions], np.repeat(frontier, lengths)
+
+
+class LineageIndex:
+    """
+    메모리 리니지 그래프 인덱스
+
+    같은 (출발, 도착) 쌍의 엣지는 타입이 달라도 인접 배열에 한 번만
+    들어갑니다 (폐포/경로 계산에는 연결 여부만 필요).
+    """
+
+    # delta 엣지가 이 수와 기존 엣지의 COMPACT_RATIO 중 큰 값을 넘으면 병합
+    COMPACT_MIN_DELTA = 1024
+    COMPACT_RATIO = 0.1
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: Dict[str, int] = {}
+        self._keys: List[str] = []
+        self._types = bytearray()
+        self._names: List[Optional[str]] = []
+        self._qualified_names: List[Optional[str]] = []
+        self._source_ids: List[Optional[str]] = []
+
+        empty = _CSR(np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32))
+        self._forward = empty
+        self._reverse = empty
+        self._delta_src: List[int] = []
+        self._delta_dst: List[int] = []
+        self._delta_pairs: set = set()
+        self._delta_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._num_edges = 0
+
+        # 적재 중 들어온 쓰기 (교체 후 재적용, 적재 중이 아니면 None)
+        self._pending: Optional[List[Tuple[str, Any]]] = None
+        self.loaded_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._ids
+
+    @property
+    def num_edges(self) -> int:
+        return self._num_edges
+
+    # ==================== 적재/증분 반영 ====================
+
+    def load(self, mongo_service) -> "LineageIndex":
+        """
+        lineage_nodes/lineage_edges 전체를 읽어 인덱스 재구축
+
+        스캔 중에도 기존 내용으로 탐색하며, 그동안의 add_node/add_edge는
+        새 내용으로 교체한 뒤 다시 적용합니다.
+        """
+        start = time.perf_counter()
+        with self._lock:
+            self._pending = []
+        try:
+            fresh = self._scan(mongo_service)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            pending = self._pending or []
+            self.__dict__.update({k: v for k, v in fresh.__dict__.items() if k not in ('_lock', '_pending')})
+            self._pending = None
+            for kind, item in pending:
+                if kind == 'node':
+                    self._add_node(item)
+                else:
+                    self._add_edge(item)
+            self.loaded_at = time.time()
+
+        logger.info(
+            f"Lineage index loaded: {len(self):,} nodes, {self.num_edges:,} edges "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        return self
+
+    @staticmethod
+    def _scan(mongo_service) -> "LineageIndex":
+        """컬렉션 전체로 새 인덱스 구성"""
+        db = mongo_service.db
+        fresh = LineageIndex()
+
+        node_docs = db[LineageTracker.NODES_COLLECTION].find(
+            {}, {"_id": 0, "node_id": 1, "node_type": 1, "name": 1, "qualified_name": 1, "source_id": 1}
+        )
+        for doc in node_docs:
+            fresh._set_node(
+                doc["node_id"], NodeType(doc["node_type"]), doc.get("name"),
+                doc.get("qualified_name"), doc.get("source_id")
+            )
+
+        src, dst = [], []
+        edge_docs = db[LineageTracker.EDGES_COLLECTION].find(
+            {}, {"_id": 0, "source_node_id": 1, "target_node_id": 1}
+        )
+        for doc in edge_docs:
+            src.append(fresh._intern(doc["source_node_id"]))
+            dst.append(fresh._intern(doc["target_node_id"]))
+        fresh._rebuild(np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64))
+        return fresh
+
+    def _intern(self, node_id: str) -> int:
+        idx = self._ids.get(node_id)
+        if idx is None:
+            idx = len(self._keys)
+            self._ids[node_id] = idx
+            self._keys.append(node_id)
+            self._types.append(_UNKNOWN_TYPE)
+            self._names.append(None)
+            self._qualified_names.append(None)
+            self._source_ids.append(None)
+        return idx
+
+    def _set_node(self, node_id: str, node_type: NodeType, name: Optional[str],
+                  qualified_name: Optional[str], source_id: Optional[str]) -> int:
+        idx = self._intern(node_id)
+        self._types[idx] = _TYPE_CODES[node_type]
+        self._names[idx] = name
+        self._qualified_names[idx] = qualified_name
+        self._source_ids[idx] = source_id
+        return idx
+
+    def _rebuild(self, src: np.ndarray, dst: np.ndarray) -> None:
+        """(src, dst) 쌍으로 CSR 재구성 (중복 쌍 제거)"""
+        num_nodes = len(self._keys)
+        if len(src):
+            pairs = np.unique(src * num_nodes + dst)
+            src, dst = pairs // num_nodes, pairs % num_nodes
+        self._forward = _CSR.build(src, dst, num_nodes)
+        self._reverse = _CSR.build(dst, src, num_nodes)
+        self._num_edges = len(src)
+        self._delta_src, self._delta_dst = [], []
+        self._delta_pairs = set()
+        self._delta_arrays = None
+
+    def add_node(self, node: LineageNode) -> int:
+        """노드 등록/갱신 (LineageTracker.register_node에서 호출)"""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(('node', node))
+            return self._add_node(node)
+
+    def add_edge(self, edge: LineageEdge) -> bool:
+        """엣지 추가 (LineageTracker.add_edge에서 호출), 새 연결이면 True"""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(('edge', edge))
+            return self._add_edge(edge)
+
+    def _add_node(self, node: LineageNode) -> int:
+        return self._set_node(node.node_id, node.node_type, node.name, node.qualified_name, node.source_id)
+
+    def _add_edge(self, edge: LineageEdge) -> bool:
+        src = self._intern(edge.source_node_id)
+        dst = self._intern(edge.target_node_id)
+        if (src, dst) in self._delta_pairs or dst in self._forward.neighbors(src):
+            return False
+
+        self._delta_src.append(src)
+        self._delta_dst.append(dst)
+        self._delta_pairs.add((src, dst))
+        self._delta_arrays = None
+        self._num_edges += 1
+
+        if len(self._delta_src) > max(self.COMPACT_MIN_DELTA, self.COMPACT_RATIO * len(self._forward.targets)):
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """delta 엣지를 CSR에 병합 (add_edge가 자동 호출)"""
+        forward = self._forward
+        src = np.concatenate([forward.sources().astype(np.int64), np.array(self._delta_src, dtype=np.int64)])
+        dst = np.concatenate([forward.targets.astype(np.int64), np.array(self._delta_dst, dtype=np.int64)])
+        self._rebuild(src, dst)
+
+    # ==================== 탐색 ====================
+
+    def _snapshot(self, upstream: bool):
+        """탐색에 쓸 (CSR, delta 출발, delta 도착, 노드 수) - 락 안에서 참조만 복사"""
+        with self._lock:
+            if self._delta_arrays is None:
+                self._delta_arrays = (
+                    np.array(self._delta_src, dtype=np.int32),
+                    np.array(self._delta_dst, dtype=np.int32),
+                )
+            delta_src, delta_dst = self._delta_arrays
+            if upstream:
+                return self._reverse, delta_dst, delta_src, len(self._keys)
+            return self._forward, delta_src, delta_dst, len(self._keys)
+
+    def _bfs(
+        self,
+        start: int,
+        depth: Optional[int],
+        upstream: bool,
+        target: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        레벨 동기 BFS
+
+        Returns:
+            (방문 순서(시작 노드 제외), 거리 배열, 부모 배열) - 미방문은 -1
+        """
+        csr, delta_src, delta_dst, num_nodes = self._snapshot(upstream)
+        distance = np.full(num_nodes, -1, dtype=np.int32)
+        parent = np.full(num_nodes, -1, dtype=np.int32)
+        distance[start] = 0
+
+        order = []
+        frontier = np.array([start], dtype=np.int32)
+        level = 0
+        while len(frontier) and (depth is None or level < depth):
+            neighbors, parents = csr.expand(frontier)
+            if len(delta_src):
+                hit = np.isin(delta_src, frontier)
+                if hit.any():
+                    neighbors = np.concatenate([neighbors, delta_dst[hit]])
+                    parents = np.concatenate([parents, delta_src[hit]])
+
+            fresh = distance[neighbors] < 0
+            neighbors, parents = neighbors[fresh], parents[fresh]
+            # 같은 노드가 여러 부모에서 도달하면 첫 번째 부모 사용
+            frontier, first = np.unique(neighbors, return_index=True)
+            level += 1
+            distance[frontier] = level
+            parent[frontier] = parents[first]
+            order.append(frontier)
+
+            if target is not None and distance[target] >= 0:
+                break
+
+        visited = np.concatenate(order) if order else np.zeros(0, dtype=np.int32)
+        return visited, distance, parent
+
+    def _path(self, parent: np.ndarray, end: int) -> List[str]:
+        path = [end]
+        while parent[path[-1]] >= 0:
+            path.append(int(parent[path[-1]]))
+        return [self._keys[i] for i in reversed(path)]
+
+    def _is_known(self, idx: int) -> bool:
+        return self._types[idx] != _UNKNOWN_TYPE
+
+    def closure(self, node_id: str, depth: Optional[int] = None, upstream: bool = False) -> List[str]:
+        """
+        upstream/downstream 폐포 (시작 노드 제외, 가까운 홉부터)
+
+        엣지로만 알려진 미등록 노드는 거쳐 가되 결과에서는 제외합니다
+        (LineageTracker 조회와 동일).
+        """
+        start = self._ids.get(node_id)
+        if start is None:
+            return []
+        visited, _, _ = self._bfs(start, depth, upstream)
+        return [self._keys[i] for i in visited.tolist() if self._is_known(i)]
+
+    def downstream(self, node_id: str, depth: Optional[int] = None) -> List[str]:
+        return self.closure(node_id, depth, upstream=False)
+
+    def upstream(self, node_id: str, depth: Optional[int] = None) -> List[str]:
+        return self.closure(node_id, depth, upstream=True)
+
+    def distances(self, node_id: str, depth: Optional[int] = None, upstream: bool = False) -> Dict[str, int]:
+        """노드별 최단 홉 수 (시작 노드 0 포함)"""
+        start = self._ids.get(node_id)
+        if start is None:
+            return {}
+        visited, distance, _ = self._bfs(start, depth, upstream)
+        result = {node_id: 0}
+        result.update((self._keys[i], int(distance[i])) for i in visited.tolist())
+        return result
+
+    def shortest_path(self, start_node_id: str, end_node_id: str, upstream: bool = False) -> Optional[List[str]]:
+        """최단 경로 (노드 ID 목록) 또는 None"""
+        start = self._ids.get(start_node_id)
+        end = self._ids.get(end_node_id)
+        if start is None or end is None:
+            return None
+        if start == end:
+            return [start_node_id]
+        _, distance, parent = self._bfs(start, None, upstream, target=end)
+        return self._path(parent, end) if distance[end] >= 0 else None
+
+    def get_node(self, node_id: str) -> Optional[LineageNode]:
+        """인덱스에 보관한 필드만 채운 LineageNode (미등록이면 None)"""
+        idx = self._ids.get(node_id)
+        if idx is None or not self._is_known(idx):
+            return None
+        return LineageNode(
+            node_id=node_id,
+            node_type=_NODE_TYPES[self._types[idx]],
+            name=self._names[idx],
+            qualified_name=self._qualified_names[idx],
+            source_id=self._source_ids[idx]
+        )
+
+    def impact(self, node_id: str, depth: Optional[int] = 10) -> List[Tuple[LineageNode, int, List[str]]]:
+        """
+        다운스트림 영향 범위 (BFS 한 번으로 거리와 최단 경로 계산)
+
+        Returns:
+            (노드, 거리, 시작 노드부터의 경로) 목록 - 가까운 홉부터
+        """
+        start = self._ids.get(node_id)
+        if start is None:
+            return []
+        visited, distance, parent = self._bfs(start, depth, upstream=False)
+        parent, distance = parent.tolist(), distance.tolist()
+
+        # BFS 순서라 부모 경로가 먼저 만들어짐
+        paths = {start: [node_id]}
+        impacted = []
+        for i in visited.tolist():
+            key = self._keys[i]
+            path = paths[i] = paths[parent[i]] + [key]
+            if self._is_known(i):
+                impacted.append((self.get_node(key), distance[i], path))
+        return impacted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """노드/엣지 수와 인접 배열 메모리"""
+        return {
+            "nodes": len(self),
+            "edges": self.num_edges,
+            "delta_edges": len(self._delta_src),
+            "adjacency_bytes": self._forward.nbytes + self._reverse.nbytes,
+            "loaded_at": self.loaded_at,
+        }
+
+
+# ============================================
+# 프로세스 공유 인덱스
+# ============================================
+
+_lineage_index: Optional[LineageIndex] = None
+_lineage_index_lock = threading.Lock()
+_lineage_index_refresh: Optional[threading.Thread] = None
+_lineage_index_failed_at: Optional[float] = None
+
+
+def _lineage_index_stale(ttl_seconds: int) -> bool:
+    index = _lineage_index
+    if index is None:
+        return True
+    return (
+        ttl_seconds > 0 and index.loaded_at is not None
+        and time.time() - index.loaded_at > ttl_seconds
+    )
+
+
+def _load_lineage_index(mongo_service, index: Optional[LineageIndex]) -> None:
+    """인덱스 적재 (백그라운드 스레드, 완료 시 공유 인덱스 교체)"""
+    global _lineage_index, _lineage_index_failed_at
+    try:
+        fresh = (LineageIndex() if index is None else index).load(mongo_service)
+        with _lineage_index_lock:
+            if _lineage_index_refresh is threading.current_thread():
+                _lineage_index = fresh
+                _lineage_index_failed_at = None
+    except Exception as e:
+        logger.error(f"Failed to load lineage index: {e}")
+        with _lineage_index_lock:
+            if _lineage_index_refresh is threading.current_thread():
+                _lineage_index_failed_at = time.time()
+
+
+def get_lineage_index(
+    mongo_service=None,
+    ttl_seconds: int = LINEAGE_INDEX_TTL_SECONDS,
+    wait: bool = False,
+) -> Optional[LineageIndex]:
+    """
+    공유 리니지 인덱스
+
+    인덱스가 없거나 TTL이 지났으면 mongo_service로 백그라운드 적재를 시작하고
+    바로 반환합니다 (재적재 중에는 기존 인덱스, 첫 적재 완료 전에는 None -
+    호출 측은 MongoDB 조회로 대체). 적재에 실패하면
+    LINEAGE_INDEX_RETRY_SECONDS 동안 다시 시도하지 않습니다.
+    mongo_service 없이 호출하면 이미 적재된 인덱스만 반환합니다.
+
+    Args:
+        mongo_service: MongoService 인스턴스
+        ttl_seconds: 재적재 주기 (0이면 재적재 안 함)
+        wait: 시작한(또는 진행 중인) 적재가 끝날 때까지 대기 (시작 시점/스크립트용)
+    """
+    global _lineage_index_refresh
+    if mongo_service is not None and _lineage_index_stale(ttl_seconds):
+        with _lineage_index_lock:
+            refresh = _lineage_index_refresh
+            backoff = (
+                _lineage_index_failed_at is not None
+                and time.time() - _lineage_index_failed_at < LINEAGE_INDEX_RETRY_SECONDS
+            )
+            # 락 안에서 다시 확인 (다른 호출이 이미 적재를 마쳤거나 시작했으면 그대로)
+            if (_lineage_index_stale(ttl_seconds) and not backoff
+                    and (refresh is None or not refresh.is_alive())):
+                refresh = threading.Thread(
+                    target=_load_lineage_index,
+                    args=(mongo_service, _lineage_index),
+                    name="lineage-index-load",
+                    daemon=True,
+                )
+                _lineage_index_refresh = refresh
+                refresh.start()
+        if wait and refresh is not None:
+            refresh.join()
+    return _lineage_index
+
+
+def reset_lineage_index() -> None:
+    """공유 인덱스 폐기 (테스트/재적재용, 진행 중인 적재 결과는 버림)"""
+    global _lineage_index, _lineage_index_refresh, _lineage_index_failed_at
+    with _lineage_index_lock:
+        _lineage_index = None
+        _lineage_index_refresh = None
+        _lineage_index_failed_at = None
@@ -160,12 +160,17 @@ class LineageTracker:
     EDGES_COLLECTION = "lineage_edges"
     RUNS_COLLECTION = "lineage_runs"
 
-    def __init__(self, mongo_service=None):
+    # 리니지 조회 시 $in 한 번에 넣는 최대 ID 수
+    QUERY_BATCH_SIZE = 1000
+
+    def __init__(self, mongo_service=None, index=None):
         """
         Args:
             mongo_service: MongoDB 서비스
+            index: 메모리 리니지 인덱스 (LineageIndex, 등록 시 증분 반영)
         """
         self.mongo = mongo_service
+        self.index = index
         self._current_run: Optional[LineageRun] = None
 
     # ==================== Run Management ====================
@@ -250,6 +255,8 @@ class LineageTracker:
                 {"$set": node.to_dict()},
                 upsert=True
             )
+            if self.index is not None:
+                self.index.add_node(node)
 
             if self._current_run and node.node_id not in self._current_run.nodes:
                 self._current_run.nodes.append(node.node_id)
@@ -418,7 +425,7 @@ class LineageTracker:
             return None
 
         try:
-            doc = self.mongo.db[self.NODES_COLLECTION].find_one({"node_id": node_id})
+            doc = self.mongo.db[self.NODES_COLLECTION].find_one({"node_id": node_id}, {"_id": 0})
             return LineageNode.from_dict(doc) if doc else None
         except Exception as e:
             logger.error(f"Failed to get node: {e}")
@@ -471,6 +478,8 @@ class LineageTracker:
                 {"$set": edge.to_dict()},
                 upsert=True
             )
+            if self.index is not None:
+                self.index.add_edge(edge)
 
             if self._current_run and edge.edge_id not in self._current_run.edges:
                 self._current_run.edges.append(edge.edge_id)
@@ -625,6 +634,86 @@ class LineageTracker:
 
     # ==================== Lineage Queries ====================
 
+    def _find_nodes_by_ids(self, node_ids: List[str]) -> Dict[str, LineageNode]:
+        """노드 일괄 조회 (QUERY_BATCH_SIZE개씩 $in)"""
+        found: Dict[str, LineageNode] = {}
+        collection = self.mongo.db[self.NODES_COLLECTION]
+        try:
+            for i in range(0, len(node_ids), self.QUERY_BATCH_SIZE):
+                docs = collection.find(
+                    {"node_id": {"$in": node_ids[i:i + self.QUERY_BATCH_SIZE]}},
+                    {"_id": 0}
+                )
+                for doc in docs:
+                    found[doc["node_id"]] = LineageNode.from_dict(doc)
+        except Exception as e:
+            logger.error(f"Failed to get nodes: {e}")
+        return found
+
+    def _find_edges_by_endpoint(self, endpoint_field: str, node_ids: List[str]) -> List[LineageEdge]:
+        """endpoint_field가 node_ids 중 하나인 엣지 일괄 조회"""
+        edges = []
+        collection = self.mongo.db[self.EDGES_COLLECTION]
+        for i in range(0, len(node_ids), self.QUERY_BATCH_SIZE):
+            docs = collection.find(
+                {endpoint_field: {"$in": node_ids[i:i + self.QUERY_BATCH_SIZE]}},
+                {"_id": 0}
+            )
+            edges.extend(LineageEdge.from_dict(doc) for doc in docs)
+        return edges
+
+    def _traverse(
+        self,
+        node_id: str,
+        depth: int,
+        upstream: bool
+    ) -> Tuple[List[LineageNode], List[LineageEdge]]:
+        """
+        레벨 동기 BFS
+
+        홉마다 프런티어 전체를 노드 $in 한 번, 엣지 $in 한 번으로 확장합니다
+        (노드별 조회 대비 왕복 수가 방문 노드 수 → 깊이 수준으로 줄어듦).
+        depth 레벨의 노드까지 방문하고, 방문한 노드에 연결된 엣지는 모두
+        포함합니다.
+        """
+        match_field, next_field = (
+            ("target_node_id", "source_node_id") if upstream else ("source_node_id", "target_node_id")
+        )
+
+        visited_nodes: Set[str] = {node_id}
+        visited_edges: Set[str] = set()
+        nodes: List[LineageNode] = []
+        edges: List[LineageEdge] = []
+
+        frontier = [node_id]
+        level = 0
+        while frontier:
+            found = self._find_nodes_by_ids(frontier)
+            nodes.extend(found[n] for n in frontier if n in found)
+
+            # 프런티어 순서대로 엣지 정렬 (결과 순서 고정)
+            by_endpoint: Dict[str, List[LineageEdge]] = {}
+            for edge in self._find_edges_by_endpoint(match_field, frontier):
+                by_endpoint.setdefault(getattr(edge, match_field), []).append(edge)
+
+            next_frontier = []
+            for current_id in frontier:
+                for edge in by_endpoint.get(current_id, ()):
+                    if edge.edge_id in visited_edges:
+                        continue
+                    visited_edges.add(edge.edge_id)
+                    edges.append(edge)
+
+                    neighbor = getattr(edge, next_field)
+                    if level < depth and neighbor not in visited_nodes:
+                        visited_nodes.add(neighbor)
+                        next_frontier.append(neighbor)
+
+            frontier = next_frontier
+            level += 1
+
+        return nodes, edges
+
     def get_upstream(
         self,
         node_id: str,
@@ -638,41 +727,12 @@ class LineageTracker:
             depth: 최대 깊이
 
         Returns:
-            (노드 목록, 엣지 목록)
+            (노드 목록, 엣지 목록) - 가까운 홉부터
         """
         if not self.mongo:
             return [], []
 
-        visited_nodes: Set[str] = set()
-        visited_edges: Set[str] = set()
-        nodes = []
-        edges = []
-
-        def traverse(current_id: str, current_depth: int):
-            if current_depth > depth or current_id in visited_nodes:
-                return
-
-            visited_nodes.add(current_id)
-
-            # 현재 노드 조회
-            node = self.get_node(current_id)
-            if node:
-                nodes.append(node)
-
-            # 들어오는 엣지 찾기
-            incoming = list(self.mongo.db[self.EDGES_COLLECTION].find({
-                "target_node_id": current_id
-            }))
-
-            for edge_doc in incoming:
-                edge = LineageEdge.from_dict(edge_doc)
-                if edge.edge_id not in visited_edges:
-                    visited_edges.add(edge.edge_id)
-                    edges.append(edge)
-                    traverse(edge.source_node_id, current_depth + 1)
-
-        traverse(node_id, 0)
-        return nodes, edges
+        return self._traverse(node_id, depth, upstream=True)
 
     def get_downstream(
         self,
@@ -687,41 +747,12 @@ class LineageTracker:
             depth: 최대 깊이
 
         Returns:
-            (노드 목록, 엣지 목록)
+            (노드 목록, 엣지 목록) - 가까운 홉부터
         """
         if not self.mongo:
             return [], []
 
-        visited_nodes: Set[str] = set()
-        visited_edges: Set[str] = set()
-        nodes = []
-        edges = []
-
-        def traverse(current_id: str, current_depth: int):
-            if current_depth > depth or current_id in visited_nodes:
-                return
-
-            visited_nodes.add(current_id)
-
-            # 현재 노드 조회
-            node = self.get_node(current_id)
-            if node:
-                nodes.append(node)
-
-            # 나가는 엣지 찾기
-            outgoing = list(self.mongo.db[self.EDGES_COLLECTION].find({
-                "source_node_id": current_id
-            }))
-
-            for edge_doc in outgoing:
-                edge = LineageEdge.from_dict(edge_doc)
-                if edge.edge_id not in visited_edges:
-                    visited_edges.add(edge.edge_id)
-                    edges.append(edge)
-                    traverse(edge.target_node_id, current_depth + 1)
-
-        traverse(node_id, 0)
-        return nodes, edges
+        return self._traverse(node_id, depth, upstream=False)
 
     def get_full_lineage(
         self,
@@ -7,13 +7,14 @@ connection pooling, and automatic retry mechanisms.
 
 import os
 import logging
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Callable, TypeVar
 from functools import wraps
 from contextlib import contextmanager
 from bson import ObjectId
 from bson.errors import InvalidId
-from pymongo import MongoClient, DESCENDING
+from pymongo import MongoClient, DESCENDING, monitoring
 from pymongo.errors import (
     ConnectionFailure,
     ServerSelectionTimeoutError,
@@ -200,6 +201,408 @@ async def get_db():
     yield _motor_client[db_name]
 
 
+# ============================================
+# 프로세스 공유 MongoClient 풀
+# ============================================
+
+# 연결 Circuit Breaker (MongoService와 공유 풀이 함께 사용)
+_connection_circuit = CircuitBreaker(
+    name="mongo_connection",
+    config=CircuitBreakerConfig(
+        failure_threshold=5,
+        reset_timeout=30,
+        half_open_max_calls=3
+    )
+)
+
+MONGODB_MAX_POOL_SIZE = int(os.getenv('MONGODB_MAX_POOL_SIZE', '100'))
+MONGODB_MIN_POOL_SIZE = int(os.getenv('MONGODB_MIN_POOL_SIZE', '0'))
+MONGODB_MAX_IDLE_TIME_MS = int(os.getenv('MONGODB_MAX_IDLE_TIME_MS', '300000'))
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv('MONGODB_WAIT_QUEUE_TIMEOUT_MS', '5000'))
+MONGODB_HEARTBEAT_FREQUENCY_MS = int(os.getenv('MONGODB_HEARTBEAT_FREQUENCY_MS', '10000'))
+
+
+class _PoolMonitor(monitoring.ServerHeartbeatListener, monitoring.ConnectionPoolListener):
+    """
+    드라이버 이벤트로 풀 상태 추적
+
+    - 서버 heartbeat 성공/실패를 연결 Circuit Breaker에 기록 (요청마다 ping 하지 않음)
+    - 커넥션 생성/체크아웃 수 집계
+    """
+
+    def __init__(self, circuit: CircuitBreaker):
+        self.circuit = circuit
+        self._lock = threading.Lock()
+        self.last_heartbeat_at: Optional[datetime] = None
+        self.last_heartbeat_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.heartbeat_failures = 0
+        self.connections_created = 0
+        self.connections_closed = 0
+        self.checked_out = 0
+        self.checkouts = 0
+        self.checkout_failures = 0
+
+    # ServerHeartbeatListener
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self.last_heartbeat_at = datetime.utcnow()
+        self.last_heartbeat_ms = round(event.duration * 1000, 2)
+        self.last_error = None
+        self.circuit.record_success()
+
+    def failed(self, event):
+        self.last_heartbeat_at = datetime.utcnow()
+        self.last_error = str(event.reply)
+        self.heartbeat_failures += 1
+        self.circuit.record_failure()
+
+    # ConnectionPoolListener
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self._lock:
+            self.connections_created += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.connections_closed += 1
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.checkout_failures += 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checked_out -= 1
+
+
+class MongoClientPool:
+    """
+    프로세스 공유 MongoClient
+
+    FastAPI lifespan에서 한 번 열고 종료 시 닫습니다. 열려 있는 동안
+    MongoService()는 이 클라이언트를 빌려 쓰며 (요청마다 연결/ping/close 없음),
+    서버 상태는 드라이버 heartbeat로 감시해 MongoService의 연결 Circuit
+    Breaker에 반영합니다.
+
+    Example:
+        pool = init_client_pool()
+        ...
+        close_client_pool()
+    """
+
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        max_pool_size: int = MONGODB_MAX_POOL_SIZE,
+        min_pool_size: int = MONGODB_MIN_POOL_SIZE,
+        max_idle_time_ms: int = MONGODB_MAX_IDLE_TIME_MS,
+        wait_queue_timeout_ms: int = MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        heartbeat_frequency_ms: int = MONGODB_HEARTBEAT_FREQUENCY_MS,
+        circuit: Optional[CircuitBreaker] = None
+    ):
+        self.uri = uri or os.getenv('MONGODB_URI', 'mongodb://localhost:27017')
+        self.max_pool_size = max_pool_size
+        self.min_pool_size = min_pool_size
+        self.max_idle_time_ms = max_idle_time_ms
+        self.wait_queue_timeout_ms = wait_queue_timeout_ms
+        self.heartbeat_frequency_ms = heartbeat_frequency_ms
+        self.circuit = circuit or _connection_circuit
+        self.monitor = _PoolMonitor(self.circuit)
+        self._client: Optional[MongoClient] = None
+        self._timeout = int(os.getenv('MONGODB_TIMEOUT', '5000'))
+
+    @property
+    def client(self) -> Optional[MongoClient]:
+        return self._client
+
+    def open(self) -> MongoClient:
+        """
+        클라이언트 생성 후 ping 한 번으로 연결 확인
+
+        ping이 실패해도 클라이언트는 유지합니다 (서버가 돌아오면 드라이버가
+        재연결하고 heartbeat로 Circuit Breaker가 복구됨).
+        """
+        if self._client is not None:
+            return self._client
+
+        self._client = MongoClient(
+            self.uri,
+            maxPoolSize=self.max_pool_size,
+            minPoolSize=self.min_pool_size,
+            maxIdleTimeMS=self.max_idle_time_ms,
+            waitQueueTimeoutMS=self.wait_queue_timeout_ms,
+            heartbeatFrequencyMS=self.heartbeat_frequency_ms,
+            serverSelectionTimeoutMS=self._timeout,
+            connectTimeoutMS=self._timeout,
+            socketTimeoutMS=30000,
+            retryWrites=True,
+            retryReads=True,
+            event_listeners=[self.monitor]
+        )
+        if self.circuit.state == CircuitState.OPEN:
+            # 최근 연결 실패가 누적된 상태면 ping 대기 없이 heartbeat 복구에 맡김
+            logger.warning("MongoDB client pool opened while connection circuit is OPEN")
+            return self._client
+
+        try:
+            self._client.admin.command('ping')
+            logger.info(
+                f"MongoDB client pool opened (maxPoolSize={self.max_pool_size}, "
+                f"minPoolSize={self.min_pool_size})"
+            )
+        except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+            self.circuit.record_failure()
+            logger.error(f"MongoDB client pool opened but ping failed: {e}")
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception as e:
+                logger.warning(f"Error closing MongoDB client pool: {e}")
+            finally:
+                self._client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 설정, 커넥션 수, heartbeat 상태"""
+        monitor = self.monitor
+        return {
+            "open": self._client is not None,
+            "max_pool_size": self.max_pool_size,
+            "min_pool_size": self.min_pool_size,
+            "connections_open": monitor.connections_created - monitor.connections_closed,
+            "connections_created": monitor.connections_created,
+            "checked_out": monitor.checked_out,
+            "checkouts": monitor.checkouts,
+            "checkout_failures": monitor.checkout_failures,
+            "last_heartbeat_at": monitor.last_heartbeat_at.isoformat() if monitor.last_heartbeat_at else None,
+            "last_heartbeat_ms": monitor.last_heartbeat_ms,
+            "heartbeat_failures": monitor.heartbeat_failures,
+            "last_error": monitor.last_error,
+            "circuit_state": self.circuit.state.value,
+        }
+
+
+_client_pool: Optional[MongoClientPool] = None
+
+
+def init_client_pool(**options) -> MongoClientPool:
+    """공유 클라이언트 풀 열기 (이미 열려 있으면 그대로 반환)"""
+    global _client_pool
+    if _client_pool is None:
+        _client_pool = MongoClientPool(**options)
+    _client_pool.open()
+    return _client_pool
+
+
+def get_client_pool() -> Optional[MongoClientPool]:
+    """열린 공유 풀 (lifespan 밖, 예: 스크립트/테스트에서는 None)"""
+    if _client_pool is not None and _client_pool.client is not None:
+        return _client_pool
+    return None
+
+
+def close_client_pool() -> None:
+    global _client_pool
+    if _client_pool is not None:
+        _client_pool.close()
+        _client_pool = None
+
+
+# ============================================
+# 대시보드 aggregation (MongoService/AsyncMongoService 공용)
+# ============================================
+
+# 미해결 에러 수 조건 (dashboard_stats_pipelines와 함께 실행)
+UNRESOLVED_ERRORS_FILTER = {'resolved': False}
+
+
+def _lookup_source_name(local_field: str = 'source_id') -> List[Dict[str, Any]]:
+    """source 이름 조인 스테이지 ($lookup + source_name 필드)"""
+    return [
+        {'$lookup': {
+            'from': 'sources',
+            'localField': local_field,
+            'foreignField': '_id',
+            'pipeline': [{'$project': {'name': 1}}],
+            'as': 'source'
+        }},
+        {'$addFields': {
+            'source_name': {'$arrayElemAt': ['$source.name', 0]}
+        }},
+    ]
+
+
+def recent_activity_pipelines(hours: int = 24) -> Dict[str, Any]:
+    """
+    최근 활동 aggregation 목록
+
+    Returns:
+        응답 키 → (컬렉션, 파이프라인). 세 파이프라인은 서로 독립적이라
+        비동기 계층에서는 동시에 실행합니다.
+    """
+    cutoff = datetime.utcnow() - timedelta(hours=hours)
+
+    # 크롤 결과 + 소스 정보
+    results_pipeline = [
+        {'$match': {'executed_at': {'$gte': cutoff}}},
+        {'$sort': {'executed_at': DESCENDING}},
+        {'$limit': 50},
+        *_lookup_source_name(),
+        {'$project': {
+            'source_id': 1, 'status': 1, 'executed_at': 1,
+            'record_count': 1, 'execution_time_ms': 1, 'source_name': 1
+        }}
+    ]
+
+    # 에러 로그 + 소스 정보
+    errors_pipeline = [
+        {'$match': {'created_at': {'$gte': cutoff}}},
+        {'$sort': {'created_at': DESCENDING}},
+        {'$limit': 20},
+        *_lookup_source_name(),
+        {'$project': {
+            'source_id': 1, 'error_code': 1, 'message': 1,
+            'resolved': 1, 'created_at': 1, 'source_name': 1
+        }}
+    ]
+
+    # 코드 변경 이력 + 크롤러/소스 정보
+    changes_pipeline = [
+        {'$match': {'changed_at': {'$gte': cutoff}}},
+        {'$sort': {'changed_at': DESCENDING}},
+        {'$limit': 20},
+        {'$lookup': {
+            'from': 'crawlers',
+            'localField': 'crawler_id',
+            'foreignField': '_id',
+            'pipeline': [{'$project': {'source_id': 1}}],
+            'as': 'crawler'
+        }},
+        {'$addFields': {
+            'source_id': {'$arrayElemAt': ['$crawler.source_id', 0]}
+        }},
+        *_lookup_source_name(),
+        {'$project': {
+            'crawler_id': 1, 'version': 1, 'change_reason': 1,
+            'changed_at': 1, 'changed_by': 1, 'source_name': 1
+        }}
+    ]
+
+    return {
+        'crawl_results': ('crawl_results', results_pipeline),
+        'errors': ('error_logs', errors_pipeline),
+        'code_changes': ('crawler_history', changes_pipeline),
+    }
+
+
+def dashboard_stats_pipelines() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    대시보드 통계 aggregation 목록 (컬렉션 → 파이프라인)
+
+    $facet으로 컬렉션별 count를 한 쿼리로 병합합니다.
+    """
+    source_pipeline = [
+        {'$facet': {
+            'total': [{'$count': 'count'}],
+            'active': [{'$match': {'status': 'active'}}, {'$count': 'count'}],
+            'error': [{'$match': {'status': 'error'}}, {'$count': 'count'}]
+        }}
+    ]
+
+    crawler_pipeline = [
+        {'$facet': {
+            'total': [{'$count': 'count'}],
+            'active': [{'$match': {'status': 'active'}}, {'$count': 'count'}]
+        }}
+    ]
+
+    # 최근 실행 결과 통계
+    results_pipeline = [
+        {'$sort': {'executed_at': DESCENDING}},
+        {'$limit': 100},
+        {'$group': {
+            '_id': None,
+            'total': {'$sum': 1},
+            'success': {'$sum': {'$cond': [{'$eq': ['$status', 'success']}, 1, 0]}},
+            'failed': {'$sum': {'$cond': [{'$eq': ['$status', 'failed']}, 1, 0]}}
+        }}
+    ]
+
+    return {
+        'sources': source_pipeline,
+        'crawlers': crawler_pipeline,
+        'crawl_results': results_pipeline,
+    }
+
+
+def build_dashboard_stats(facets: Dict[str, List[Dict[str, Any]]], unresolved: int) -> Dict[str, Any]:
+    """
+    dashboard_stats_pipelines 결과 파싱 (health 제외)
+
+    Args:
+        facets: 컬렉션 → aggregation 결과 리스트
+        unresolved: 미해결 에러 수
+    """
+    source_stats = facets.get('sources') or []
+    crawler_stats = facets.get('crawlers') or []
+    results_stats = facets.get('crawl_results') or []
+
+    s = source_stats[0] if source_stats else {'total': [], 'active': [], 'error': []}
+    c = crawler_stats[0] if crawler_stats else {'total': [], 'active': []}
+    r = results_stats[0] if results_stats else {'total': 0, 'success': 0, 'failed': 0}
+
+    sources_total = s['total'][0]['count'] if s['total'] else 0
+    sources_active = s['active'][0]['count'] if s['active'] else 0
+    sources_error = s['error'][0]['count'] if s['error'] else 0
+
+    crawlers_total = c['total'][0]['count'] if c['total'] else 0
+    crawlers_active = c['active'][0]['count'] if c['active'] else 0
+
+    total = r.get('total', 0) if isinstance(r, dict) else 0
+    success = r.get('success', 0) if isinstance(r, dict) else 0
+    failed = r.get('failed', 0) if isinstance(r, dict) else 0
+
+    return {
+        'sources': {'total': sources_total, 'active': sources_active, 'error': sources_error},
+        'crawlers': {'total': crawlers_total, 'active': crawlers_active},
+        'recent_executions': {
+            'total': total,
+            'success': success,
+            'failed': failed,
+            'success_rate': round(success / total * 100, 2) if total > 0 else 0
+        },
+        'unresolved_errors': unresolved,
+        'timestamp': datetime.utcnow()
+    }
+
+
 # ============================================
 # MongoDB 서비스 클래스
 # ============================================
@@ -208,6 +611,10 @@ class MongoService:
     """
     MongoDB service with exception handling, connection pooling, and retry logic.
 
+    공유 풀(init_client_pool)이 열려 있으면 그 클라이언트를 빌려 쓰고
+    close()는 풀을 닫지 않습니다. 풀이 없으면 인스턴스마다 클라이언트를
+    만들고 close()에서 닫습니다.
+
     Usage:
         with MongoService() as mongo:
             source = mongo.get_source(source_id)
@@ -252,21 +659,15 @@ class MongoService:
     db.data_reviews.createIndex({"needs_number_review": 1, "review_status": 1})
     """
 
-    # 연결 Circuit Breaker (클래스 레벨)
-    _connection_circuit = CircuitBreaker(
-        name="mongo_connection",
-        config=CircuitBreakerConfig(
-            failure_threshold=5,
-            reset_timeout=30,
-            half_open_max_calls=3
-        )
-    )
+    # 연결 Circuit Breaker (클래스 레벨, 공유 풀과 같은 인스턴스)
+    _connection_circuit = _connection_circuit
 
     def __init__(self):
         """Initialize MongoDB connection."""
         self.uri = os.getenv('MONGODB_URI', 'mongodb://localhost:27017')
         self.database_name = os.getenv('MONGODB_DATABASE', 'crawler_system')
         self._client: Optional[MongoClient] = None
+        self._shared_client = False
         self._connection_timeout = int(os.getenv('MONGODB_TIMEOUT', '5000'))
 
     def __enter__(self):
@@ -294,6 +695,13 @@ class MongoService:
                     host=self.uri
                 )
 
+            # 공유 풀 사용 (연결 상태는 풀의 heartbeat가 감시)
+            pool = get_client_pool()
+            if pool is not None:
+                self._client = pool.client
+                self._shared_client = True
+                return self._client
+
             try:
                 self._client = MongoClient(
                     self.uri,
@@ -325,6 +733,12 @@ class MongoService:
 
     def close(self):
         """Close the MongoDB connection safely."""
+        if self._shared_client:
+            # 공유 풀은 lifespan 종료 시 닫힘
+            self._client = None
+            self._shared_client = False
+            return
+
         if self._client:
             try:
                 self._client.close()
@@ -345,12 +759,16 @@ class MongoService:
             self.client.admin.command('ping')
             latency = (datetime.utcnow() - start).total_seconds() * 1000
 
-            return {
+            result = {
                 "status": "healthy",
                 "latency_ms": round(latency, 2),
                 "circuit_state": self._connection_circuit.state.value,
                 "database": self.database_name
             }
+            pool = get_client_pool()
+            if pool is not None:
+                result["pool"] = pool.get_stats()
+            return result
         except Exception as e:
             return {
                 "status": "unhealthy",
@@ -587,92 +1005,10 @@ class MongoService:
 
         N+1 문제 해결: 3개의 개별 쿼리 대신 source 정보를 함께 조인
         """
-        from datetime import timedelta
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
-
-        # 크롤 결과 + 소스 정보
-        results_pipeline = [
-            {'$match': {'executed_at': {'$gte': cutoff}}},
-            {'$sort': {'executed_at': DESCENDING}},
-            {'$limit': 50},
-            {'$lookup': {
-                'from': 'sources',
-                'localField': 'source_id',
-                'foreignField': '_id',
-                'pipeline': [{'$project': {'name': 1}}],
-                'as': 'source'
-            }},
-            {'$addFields': {
-                'source_name': {'$arrayElemAt': ['$source.name', 0]}
-            }},
-            {'$project': {
-                'source_id': 1, 'status': 1, 'executed_at': 1,
-                'record_count': 1, 'execution_time_ms': 1, 'source_name': 1
-            }}
-        ]
-
-        # 에러 로그 + 소스 정보
-        errors_pipeline = [
-            {'$match': {'created_at': {'$gte': cutoff}}},
-            {'$sort': {'created_at': DESCENDING}},
-            {'$limit': 20},
-            {'$lookup': {
-                'from': 'sources',
-                'localField': 'source_id',
-                'foreignField': '_id',
-                'pipeline': [{'$project': {'name': 1}}],
-                'as': 'source'
-            }},
-            {'$addFields': {
-                'source_name': {'$arrayElemAt': ['$source.name', 0]}
-            }},
-            {'$project': {
-                'source_id': 1, 'error_code': 1, 'message': 1,
-                'resolved': 1, 'created_at': 1, 'source_name': 1
-            }}
-        ]
-
-        # 코드 변경 이력 + 크롤러/소스 정보
-        changes_pipeline = [
-            {'$match': {'changed_at': {'$gte': cutoff}}},
-            {'$sort': {'changed_at': DESCENDING}},
-            {'$limit': 20},
-            {'$lookup': {
-                'from': 'crawlers',
-                'localField': 'crawler_id',
-                'foreignField': '_id',
-                'pipeline': [{'$project': {'source_id': 1}}],
-                'as': 'crawler'
-            }},
-            {'$addFields': {
-                'source_id': {'$arrayElemAt': ['$crawler.source_id', 0]}
-            }},
-            {'$lookup': {
-                'from': 'sources',
-                'localField': 'source_id',
-                'foreignField': '_id',
-                'pipeline': [{'$project': {'name': 1}}],
-                'as': 'source'
-            }},
-            {'$addFields': {
-                'source_name': {'$arrayElemAt': ['$source.name', 0]}
-            }},
-            {'$project': {
-                'crawler_id': 1, 'version': 1, 'change_reason': 1,
-                'changed_at': 1, 'changed_by': 1, 'source_name': 1
-            }}
-        ]
-
-        recent_results = [self._serialize_doc(doc) for doc in self.db.crawl_results.aggregate(results_pipeline)]
-        recent_errors = [self._serialize_doc(doc) for doc in self.db.error_logs.aggregate(errors_pipeline)]
-        recent_changes = [self._serialize_doc(doc) for doc in self.db.crawler_history.aggregate(changes_pipeline)]
-
-        return {
-            'period_hours': hours,
-            'crawl_results': recent_results,
-            'errors': recent_errors,
-            'code_changes': recent_changes
-        }
+        activity: Dict[str, Any] = {'period_hours': hours}
+        for key, (collection, pipeline) in recent_activity_pipelines(hours).items():
+            activity[key] = [self._serialize_doc(doc) for doc in self.db[collection].aggregate(pipeline)]
+        return activity
 
     @db_operation("multiple", "read")
     def get_dashboard_stats_optimized(self) -> Dict[str, Any]:
@@ -681,68 +1017,15 @@ class MongoService:
 
         N+1 문제 해결: 여러 count 쿼리를 $facet으로 병합
         """
-        # $facet을 사용하여 여러 집계를 단일 쿼리로 실행
-        source_pipeline = [
-            {'$facet': {
-                'total': [{'$count': 'count'}],
-                'active': [{'$match': {'status': 'active'}}, {'$count': 'count'}],
-                'error': [{'$match': {'status': 'error'}}, {'$count': 'count'}]
-            }}
-        ]
-
-        crawler_pipeline = [
-            {'$facet': {
-                'total': [{'$count': 'count'}],
-                'active': [{'$match': {'status': 'active'}}, {'$count': 'count'}]
-            }}
-        ]
-
-        # 최근 실행 결과 통계
-        results_pipeline = [
-            {'$sort': {'executed_at': DESCENDING}},
-            {'$limit': 100},
-            {'$group': {
-                '_id': None,
-                'total': {'$sum': 1},
-                'success': {'$sum': {'$cond': [{'$eq': ['$status', 'success']}, 1, 0]}},
-                'failed': {'$sum': {'$cond': [{'$eq': ['$status', 'failed']}, 1, 0]}}
-            }}
-        ]
-
-        source_stats = list(self.db.sources.aggregate(source_pipeline))
-        crawler_stats = list(self.db.crawlers.aggregate(crawler_pipeline))
-        results_stats = list(self.db.crawl_results.aggregate(results_pipeline))
-        unresolved = self.db.error_logs.count_documents({'resolved': False})
-
-        # 결과 파싱
-        s = source_stats[0] if source_stats else {'total': [], 'active': [], 'error': []}
-        c = crawler_stats[0] if crawler_stats else {'total': [], 'active': []}
-        r = results_stats[0] if results_stats else {'total': 0, 'success': 0, 'failed': 0}
-
-        sources_total = s['total'][0]['count'] if s['total'] else 0
-        sources_active = s['active'][0]['count'] if s['active'] else 0
-        sources_error = s['error'][0]['count'] if s['error'] else 0
-
-        crawlers_total = c['total'][0]['count'] if c['total'] else 0
-        crawlers_active = c['active'][0]['count'] if c['active'] else 0
-
-        total = r.get('total', 0) if isinstance(r, dict) else 0
-        success = r.get('success', 0) if isinstance(r, dict) else 0
-        failed = r.get('failed', 0) if isinstance(r, dict) else 0
-
-        return {
-            'sources': {'total': sources_total, 'active': sources_active, 'error': sources_error},
-            'crawlers': {'total': crawlers_total, 'active': crawlers_active},
-            'recent_executions': {
-                'total': total,
-                'success': success,
-                'failed': failed,
-                'success_rate': round(success / total * 100, 2) if total > 0 else 0
-            },
-            'unresolved_errors': unresolved,
-            'timestamp': datetime.utcnow(),
-            'health': self.health_check()
+        facets = {
+            collection: list(self.db[collection].aggregate(pipeline))
+            for collection, pipeline in dashboard_stats_pipelines().items()
         }
+        unresolved = self.db.error_logs.count_documents(UNRESOLVED_ERRORS_FILTER)
+
+        stats = build_dashboard_stats(facets, unresolved)
+        stats['health'] = self.health_check()
+        return stats
 
     # ==================== Sources Collection ====================
 
@@ -39,12 +39,14 @@ Components:
 
 3. **Event Processor** (`event_processor.py`)
    - Message broker abstraction (InMemory, future Kafka)
-   - Event routing and dispatch
-   - Dead letter queue support
-   - Retry mechanisms
+   - Partitioned consumers per topic with micro-batching
+   - Event routing and dispatch (per-event and batch handlers)
+   - Bounded dead letter store (optionally persisted to MongoDB)
+   - Non-blocking retries via a delay queue with exponential backoff
 
 4. **Real-time Validator** (`realtime_validator.py`)
-   - Stream-based data validation
+   - Stream-based data validation (per-event or batched)
+   - Source config / validator caching with invalidation on source changes
    - Integration with data_quality framework
    - Validation result event emission
 
@@ -196,8 +198,11 @@ from .event_processor import (
     ProcessingStatus,
     ProcessingResult,
     EventEnvelope,
+    RetryScheduler,
+    DeadLetterStore,
 
     # Pre-built handlers
+    BatchEventHandler,
     LoggingEventHandler,
     MetricsEventHandler,
     PersistenceEventHandler,
@@ -260,7 +265,9 @@ class StreamingPipeline:
             "staging_financial",
             "staging_data",
             "data_reviews",
-            "data_lineage"
+            "data_lineage",
+            # Source changes invalidate RealtimeValidator's config cache
+            "sources"
         ]
 
         # Create components
@@ -275,7 +282,7 @@ class StreamingPipeline:
             config=self.config
         )
 
-        self.processor = create_event_processor()
+        self.processor = create_event_processor(mongo_service=mongo_service)
         self.validator = create_realtime_validator(mongo_service)
 
         # Wire up validator to emit events through processor
@@ -411,6 +418,9 @@ __all__ = [
     "ProcessingStatus",
     "ProcessingResult",
     "EventEnvelope",
+    "RetryScheduler",
+    "DeadLetterStore",
+    "BatchEventHandler",
     "LoggingEventHandler",
     "MetricsEventHandler",
     "PersistenceEventHandler",
@@ -6,15 +6,18 @@ using Change Streams. Supports resumable watching and graceful shutdown.
 
 Architecture:
 - Uses MongoDB Change Streams (requires replica set)
-- Transforms changes to domain events
-- Routes events to the event processor
-- Maintains resume tokens for crash recovery
+- A dedicated reader thread pulls changes and feeds an asyncio queue,
+  so the blocking cursor never runs on the event loop
+- Transforms changes to domain events and dispatches them in batches
+- Checkpoints resume tokens on a time/count policy for crash recovery
 """
 
 import asyncio
 import logging
 import os
 import signal
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
@@ -36,6 +39,9 @@ from .event_types import (
 
 logger = logging.getLogger(__name__)
 
+# Reader thread end-of-stream marker
+_READER_DONE = object()
+
 
 class ChangeOperation(str, Enum):
     """MongoDB change stream operation types."""
@@ -72,9 +78,17 @@ class ChangeStreamConfig:
     # Maximum await time for changes (milliseconds)
     max_await_time_ms: int = 1000
 
-    # Batch size for change events
+    # Batch size for change events (cursor batch and dispatch batch)
     batch_size: int = 100
 
+    # Changes buffered between the reader thread and the dispatcher
+    max_pending_changes: int = 1000
+
+    # Resume token checkpoint policy: save after this many changes or this
+    # many seconds, whichever comes first (always flushed on shutdown)
+    checkpoint_every: int = 1000
+    checkpoint_interval_seconds: float = 1.0
+
     # Resume token storage collection
     resume_token_collection: str = "change_stream_resume_tokens"
 
@@ -127,6 +141,7 @@ class ChangeStreamListener:
 
     Provides real-time CDC from MongoDB with:
     - Resumable watching with token persistence
+    - Off-loop reading (dedicated thread) and batched dispatch
     - Graceful shutdown handling
     - Event transformation to domain events
     - Pluggable event handlers
@@ -167,6 +182,8 @@ class ChangeStreamListener:
         self._processed_count = 0
         self._error_count = 0
         self._last_activity: Optional[datetime] = None
+        self._checkpoint_count = 0
+        self._batch_count = 0
 
         # Collection name to event type mapping
         self._collection_event_map = self._build_collection_event_map()
@@ -227,7 +244,8 @@ class ChangeStreamListener:
     async def _load_resume_token(self) -> Optional[Dict[str, Any]]:
         """Load resume token from storage."""
         try:
-            doc = self.db[self.config.resume_token_collection].find_one(
+            doc = await asyncio.to_thread(
+                self.db[self.config.resume_token_collection].find_one,
                 {"stream_id": self.stream_id}
             )
             if doc and doc.get("token"):
@@ -246,7 +264,8 @@ class ChangeStreamListener:
     async def _save_resume_token(self, token: Dict[str, Any], event_id: str = None) -> None:
         """Persist resume token for crash recovery."""
         try:
-            self.db[self.config.resume_token_collection].update_one(
+            await asyncio.to_thread(
+                self.db[self.config.resume_token_collection].update_one,
                 {"stream_id": self.stream_id},
                 {
                     "$set": {
@@ -257,6 +276,7 @@ class ChangeStreamListener:
                 },
                 upsert=True
             )
+            self._checkpoint_count += 1
         except Exception as e:
             logger.error(f"Failed to save resume token: {e}")
 
@@ -395,17 +415,85 @@ class ChangeStreamListener:
     async def _dispatch_event(self, event: DataEvent) -> None:
         """Dispatch event to all registered handlers."""
         for handler in self._handlers:
+            await self._dispatch_to(handler, event)
+
+    async def _dispatch_batch(self, events: List[DataEvent]) -> None:
+        """
+        Dispatch a batch of events to all registered handlers.
+
+        Handlers with a handle_batch method get the whole batch; others get
+        each event in order.
+        """
+        for handler in self._handlers:
+            handle_batch = getattr(handler, "handle_batch", None)
+            if handle_batch is None:
+                for event in events:
+                    await self._dispatch_to(handler, event)
+                continue
+
             try:
-                success = await handler.handle(event)
-                if not success:
-                    logger.warning(f"Handler {type(handler).__name__} returned False for event {event.event_id}")
+                await handle_batch(events)
             except Exception as e:
-                self._error_count += 1
-                logger.error(f"Handler {type(handler).__name__} failed: {e}", exc_info=True)
-                try:
-                    await handler.on_error(event, e)
-                except Exception as handler_error:
-                    logger.error(f"Error handler failed: {handler_error}")
+                self._error_count += len(events)
+                logger.error(f"Handler {type(handler).__name__} failed on batch: {e}", exc_info=True)
+                for event in events:
+                    try:
+                        await handler.on_error(event, e)
+                    except Exception as handler_error:
+                        logger.error(f"Error handler failed: {handler_error}")
+
+    async def _dispatch_to(self, handler: EventHandler, event: DataEvent) -> None:
+        try:
+            success = await handler.handle(event)
+            if not success:
+                logger.warning(f"Handler {type(handler).__name__} returned False for event {event.event_id}")
+        except Exception as e:
+            self._error_count += 1
+            logger.error(f"Handler {type(handler).__name__} failed: {e}", exc_info=True)
+            try:
+                await handler.on_error(event, e)
+            except Exception as handler_error:
+                logger.error(f"Error handler failed: {handler_error}")
+
+    def _read_changes(
+        self,
+        stream,
+        loop: asyncio.AbstractEventLoop,
+        queue: asyncio.Queue,
+        slots: threading.Semaphore,
+        stop: threading.Event
+    ) -> None:
+        """
+        Reader thread: pull changes from the blocking cursor into the queue.
+
+        Items are (change, resume_token); a change of None only advances the
+        token (e.g. postBatchResumeToken while idle). The final item is
+        (_READER_DONE, error).
+        """
+        error = None
+        last_token = None
+        try:
+            while not stop.is_set():
+                # Blocks for at most max_await_time_ms
+                change = stream.try_next()
+                token = stream.resume_token
+                if change is None and token == last_token:
+                    continue
+
+                # Backpressure: wait for the dispatcher to catch up
+                while not slots.acquire(timeout=0.2):
+                    if stop.is_set():
+                        return
+                last_token = token
+                loop.call_soon_threadsafe(queue.put_nowait, (change, token))
+        except Exception as e:
+            error = e
+        finally:
+            try:
+                stream.close()
+            except Exception as e:
+                logger.debug(f"Failed to close change stream: {e}")
+            loop.call_soon_threadsafe(queue.put_nowait, (_READER_DONE, error))
 
     async def _watch_loop(self) -> None:
         """Main watching loop."""
@@ -427,55 +515,99 @@ class ChangeStreamListener:
         logger.info(f"Starting change stream watch on database '{self.database_name}'")
         logger.info(f"Watching collections: {self.config.collections or 'all'}")
 
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        slots = threading.Semaphore(max(1, self.config.max_pending_changes))
+        stop = threading.Event()
+        reader: Optional[threading.Thread] = None
+
+        # Checkpoint state: latest dispatched token not yet saved
+        pending_token = None
+        pending_event_id = None
+        pending_changes = 0
+        last_checkpoint = time.monotonic()
+        poll_timeout = min(0.5, max(0.01, self.config.checkpoint_interval_seconds))
+
+        async def checkpoint() -> None:
+            nonlocal pending_token, pending_changes, last_checkpoint
+            if pending_token is not None:
+                await self._save_resume_token(pending_token, pending_event_id)
+            pending_token = None
+            pending_changes = 0
+            last_checkpoint = time.monotonic()
+
         try:
-            with self.db.watch(pipeline, **watch_options) as stream:
-                while self._running:
-                    # Check for shutdown signal
-                    if self._shutdown_event.is_set():
-                        logger.info("Shutdown signal received, stopping watch")
-                        break
-
-                    # Get next change with timeout
-                    try:
-                        change = stream.try_next()
-
-                        if change is None:
-                            # No changes available, yield control
-                            await asyncio.sleep(0.1)
-                            continue
-
-                        self._last_activity = datetime.utcnow()
-
-                        # Transform and dispatch
-                        event = self._transform_change_to_event(change)
-                        if event:
-                            await self._dispatch_event(event)
-                            self._processed_count += 1
-
-                            # Persist resume token periodically
-                            if self._processed_count % 100 == 0:
-                                await self._save_resume_token(
-                                    stream.resume_token,
-                                    event.event_id
-                                )
-
-                        # Always save token for last processed change
-                        await self._save_resume_token(
-                            stream.resume_token,
-                            event.event_id if event else None
-                        )
-
-                    except StopIteration:
-                        # Stream exhausted (shouldn't happen with watch)
-                        break
+            stream = await asyncio.to_thread(self.db.watch, pipeline, **watch_options)
+            reader = threading.Thread(
+                target=self._read_changes,
+                args=(stream, loop, queue, slots, stop),
+                name=f"change-stream-{self.stream_id}",
+                daemon=True
+            )
+            reader.start()
+
+            reader_error = None
+            while self._running and not self._shutdown_event.is_set():
+                try:
+                    items = [await asyncio.wait_for(queue.get(), timeout=poll_timeout)]
+                except asyncio.TimeoutError:
+                    items = []
+                while items and len(items) < self.config.batch_size and not queue.empty():
+                    items.append(queue.get_nowait())
+
+                done = bool(items) and items[-1][0] is _READER_DONE
+                if done:
+                    reader_error = items.pop()[1]
+                for _ in items:
+                    slots.release()
+
+                events = []
+                for change, token in items:
+                    pending_token = token
+                    if change is None:
+                        continue
+                    pending_changes += 1
+                    event = self._transform_change_to_event(change)
+                    if event:
+                        events.append(event)
+                        pending_event_id = event.event_id
+
+                if events:
+                    self._last_activity = datetime.utcnow()
+                    await self._dispatch_batch(events)
+                    self._processed_count += len(events)
+                    self._batch_count += 1
+
+                # Coalesced resume token checkpoint (count or time policy)
+                if pending_token is not None and (
+                    pending_changes >= self.config.checkpoint_every
+                    or time.monotonic() - last_checkpoint >= self.config.checkpoint_interval_seconds
+                ):
+                    await checkpoint()
+
+                if done:
+                    if reader_error is not None:
+                        raise reader_error
+                    break
+
+            if self._shutdown_event.is_set():
+                logger.info("Shutdown signal received, stopping watch")
 
         except OperationFailure as e:
             if "ChangeStreamHistoryLost" in str(e):
                 logger.warning("Change stream history lost, clearing resume token")
-                self.db[self.config.resume_token_collection].delete_one(
+                pending_token = None
+                await asyncio.to_thread(
+                    self.db[self.config.resume_token_collection].delete_one,
                     {"stream_id": self.stream_id}
                 )
             raise
+        finally:
+            stop.set()
+            if reader is not None:
+                await asyncio.to_thread(reader.join)
+            # Final flush so a restart resumes after the last dispatched change
+            await checkpoint()
 
     async def start(self) -> None:
         """Start the change stream listener."""
@@ -516,6 +648,8 @@ class ChangeStreamListener:
             "running": self._running,
             "processed_count": self._processed_count,
             "error_count": self._error_count,
+            "batch_count": self._batch_count,
+            "checkpoint_count": self._checkpoint_count,
             "last_activity": self._last_activity.isoformat() if self._last_activity else None,
             "handlers_count": len(self._handlers),
             "collections_watched": self.config.collections or "all"
@@ -3,7 +3,8 @@ Event Processor for Streaming Pipeline.
 
 This module provides the core event processing logic with:
 - Message broker abstraction (in-memory, future Kafka)
-- Event routing and dispatch
+- Partitioned topic consumers with micro-batching
+- Event routing and dispatch (per-event and batch handlers)
 - Handler registration and management
 - Dead letter queue support
 - Metrics and monitoring
@@ -16,12 +17,17 @@ Architecture:
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import os
+import random
+import time
+import zlib
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Set, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar
 from dataclasses import dataclass, field
 from enum import Enum
 from uuid import uuid4
@@ -49,6 +55,26 @@ logger = logging.getLogger(__name__)
 
 E = TypeVar('E', bound=BaseEvent)
 
+# Consumers (partitions) per topic. Events with the same partition key always
+# land on the same partition, so per-key ordering is preserved.
+STREAM_CONSUMERS_PER_TOPIC = int(os.getenv('STREAM_CONSUMERS_PER_TOPIC', '1'))
+# Maximum events dequeued and dispatched together by one consumer
+STREAM_MAX_BATCH_SIZE = int(os.getenv('STREAM_MAX_BATCH_SIZE', '100'))
+# How long a consumer waits for a batch to fill (0 = take only what is queued)
+STREAM_MAX_LINGER_MS = float(os.getenv('STREAM_MAX_LINGER_MS', '0'))
+
+# Retry backoff: delay * backoff ** (attempt - 1), capped, minus up to jitter
+STREAM_RETRY_BACKOFF = float(os.getenv('STREAM_RETRY_BACKOFF', '2.0'))
+STREAM_MAX_RETRY_DELAY_SECONDS = float(os.getenv('STREAM_MAX_RETRY_DELAY_SECONDS', '60'))
+STREAM_RETRY_JITTER = float(os.getenv('STREAM_RETRY_JITTER', '0.2'))
+# Dead letters kept (oldest are evicted beyond this)
+STREAM_DEAD_LETTER_MAX_SIZE = int(os.getenv('STREAM_DEAD_LETTER_MAX_SIZE', '10000'))
+
+
+def default_partition_key(event: BaseEvent) -> str:
+    """Partition key for an event: its source_id, falling back to event_id."""
+    return getattr(event, "source_id", None) or event.event_id
+
 
 class ProcessingStatus(str, Enum):
     """Event processing status."""
@@ -110,9 +136,22 @@ class MessageBroker(ABC):
         """Publish event to topic."""
         pass
 
+    async def publish_batch(self, topic: str, events: List[BaseEvent]) -> int:
+        """Publish events to topic. Returns the number published."""
+        published = 0
+        for event in events:
+            if await self.publish(topic, event):
+                published += 1
+        return published
+
     @abstractmethod
-    async def subscribe(self, topic: str, handler: Callable[[BaseEvent], None]) -> None:
-        """Subscribe handler to topic."""
+    async def subscribe(self, topic: str, handler: Callable[[BaseEvent], None], batch: bool = False) -> None:
+        """
+        Subscribe handler to topic.
+
+        With batch=True the handler receives a list of events instead of
+        a single event.
+        """
         pass
 
     @abstractmethod
@@ -136,31 +175,65 @@ class InMemoryBroker(MessageBroker):
     In-memory message broker for development and testing.
 
     Provides topic-based pub/sub with priority queue support.
+
+    Each topic is split into `consumers_per_topic` partitions, each with its
+    own priority queue and consumer task. Events are assigned to a partition
+    by `partition_key` (source_id by default), so a slow handler only stalls
+    its own partition and events sharing a key are handled in order.
+    Consumers dequeue up to `max_batch_size` events at a time, waiting at
+    most `max_linger_ms` for a batch to fill.
     """
 
-    def __init__(self, max_queue_size: int = 10000):
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        consumers_per_topic: int = None,
+        max_batch_size: int = None,
+        max_linger_ms: float = None,
+        partition_key: Callable[[BaseEvent], Any] = None
+    ):
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
-        self._queues: Dict[str, asyncio.PriorityQueue] = {}
+        self._batch_subscribers: Set[Callable] = set()
+        self._queues: Dict[str, List[asyncio.PriorityQueue]] = {}
         self._max_queue_size = max_queue_size
+        self._consumers_per_topic = max(1, consumers_per_topic or STREAM_CONSUMERS_PER_TOPIC)
+        self._max_batch_size = max(1, max_batch_size or STREAM_MAX_BATCH_SIZE)
+        self._max_linger = (STREAM_MAX_LINGER_MS if max_linger_ms is None else max_linger_ms) / 1000
+        self._partition_key = partition_key or default_partition_key
+        self._sequence = itertools.count()
         self._running = False
-        self._processor_tasks: Dict[str, asyncio.Task] = {}
+        self._processor_tasks: Dict[str, List[asyncio.Task]] = {}
         self._processed_count = 0
         self._error_count = 0
+        self._batch_count = 0
 
-    def _get_queue(self, topic: str) -> asyncio.PriorityQueue:
-        """Get or create queue for topic."""
+    def _get_queues(self, topic: str) -> List[asyncio.PriorityQueue]:
+        """Get or create partition queues for topic."""
         if topic not in self._queues:
-            self._queues[topic] = asyncio.PriorityQueue(maxsize=self._max_queue_size)
+            self._queues[topic] = [
+                asyncio.PriorityQueue(maxsize=self._max_queue_size)
+                for _ in range(self._consumers_per_topic)
+            ]
         return self._queues[topic]
 
+    def _get_queue(self, topic: str, event: BaseEvent) -> asyncio.PriorityQueue:
+        """Get the partition queue for an event."""
+        queues = self._get_queues(topic)
+        if len(queues) == 1:
+            return queues[0]
+        key = str(self._partition_key(event)).encode("utf-8")
+        return queues[zlib.crc32(key) % len(queues)]
+
+    def _make_item(self, event: BaseEvent) -> tuple:
+        # Priority queue: (priority, timestamp, sequence, event)
+        # Lower priority value = higher priority; sequence keeps FIFO on ties
+        return (event.priority.value, event.timestamp.timestamp(), next(self._sequence), event)
+
     async def publish(self, topic: str, event: BaseEvent) -> bool:
         """Publish event to topic."""
         try:
-            queue = self._get_queue(topic)
-            # Priority queue: (priority, timestamp, event)
-            # Lower priority value = higher priority
-            item = (event.priority.value, event.timestamp.timestamp(), event)
-            await asyncio.wait_for(queue.put(item), timeout=5.0)
+            queue = self._get_queue(topic, event)
+            await asyncio.wait_for(queue.put(self._make_item(event)), timeout=5.0)
             logger.debug(f"Published event {event.event_id} to topic {topic}")
             return True
         except asyncio.TimeoutError:
@@ -170,79 +243,139 @@ class InMemoryBroker(MessageBroker):
             logger.error(f"Failed to publish event: {e}")
             return False
 
-    async def subscribe(self, topic: str, handler: Callable[[BaseEvent], None]) -> None:
+    async def publish_batch(self, topic: str, events: List[BaseEvent]) -> int:
+        """Publish events to topic, only awaiting when a partition is full."""
+        published = 0
+        for event in events:
+            try:
+                self._get_queue(topic, event).put_nowait(self._make_item(event))
+                published += 1
+            except asyncio.QueueFull:
+                if await self.publish(topic, event):
+                    published += 1
+        logger.debug(f"Published {published}/{len(events)} events to topic {topic}")
+        return published
+
+    async def subscribe(self, topic: str, handler: Callable[[BaseEvent], None], batch: bool = False) -> None:
         """Subscribe handler to topic."""
         self._subscribers[topic].append(handler)
+        if batch:
+            self._batch_subscribers.add(handler)
         logger.info(f"Handler subscribed to topic {topic}")
 
-        # Ensure processor task is running for this topic
+        # Ensure processor tasks are running for this topic
         if self._running and topic not in self._processor_tasks:
-            self._processor_tasks[topic] = asyncio.create_task(
-                self._process_topic(topic)
-            )
+            self._start_topic(topic)
 
     async def unsubscribe(self, topic: str, handler: Callable[[BaseEvent], None]) -> None:
         """Unsubscribe handler from topic."""
         if handler in self._subscribers[topic]:
             self._subscribers[topic].remove(handler)
+            self._batch_subscribers.discard(handler)
 
-    async def _process_topic(self, topic: str) -> None:
-        """Process events for a topic."""
-        queue = self._get_queue(topic)
-        handlers = self._subscribers[topic]
+    def _start_topic(self, topic: str) -> None:
+        self._processor_tasks[topic] = [
+            asyncio.create_task(self._process_partition(topic, queue))
+            for queue in self._get_queues(topic)
+        ]
 
-        while self._running:
-            try:
-                # Get event with timeout
-                priority, timestamp, event = await asyncio.wait_for(
-                    queue.get(),
-                    timeout=1.0
-                )
-
-                # Dispatch to all handlers
-                for handler in handlers:
-                    try:
-                        result = handler(event)
-                        if asyncio.iscoroutine(result):
-                            await result
-                        self._processed_count += 1
-                    except Exception as e:
-                        self._error_count += 1
-                        logger.error(f"Handler error for topic {topic}: {e}")
+    async def _next_batch(self, queue: asyncio.PriorityQueue) -> List[BaseEvent]:
+        """Dequeue up to max_batch_size events, lingering up to max_linger."""
+        # Get first event with timeout
+        batch = [(await asyncio.wait_for(queue.get(), timeout=1.0))[-1]]
+        deadline = asyncio.get_running_loop().time() + self._max_linger
 
-                queue.task_done()
+        while len(batch) < self._max_batch_size:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            batch.append(item[-1])
+        return batch
+
+    async def _dispatch(self, topic: str, events: List[BaseEvent]) -> None:
+        """Dispatch a batch to all handlers, in order within the batch."""
+        for handler in list(self._subscribers[topic]):
+            if handler in self._batch_subscribers:
+                try:
+                    result = handler(events)
+                    if asyncio.iscoroutine(result):
+                        await result
+                    self._processed_count += len(events)
+                except Exception as e:
+                    self._error_count += len(events)
+                    logger.error(f"Batch handler error for topic {topic}: {e}")
+                continue
 
+            for event in events:
+                try:
+                    result = handler(event)
+                    if asyncio.iscoroutine(result):
+                        await result
+                    self._processed_count += 1
+                except Exception as e:
+                    self._error_count += 1
+                    logger.error(f"Handler error for topic {topic}: {e}")
+
+    async def _process_partition(self, topic: str, queue: asyncio.PriorityQueue) -> None:
+        """Process events for one partition of a topic."""
+        while self._running:
+            try:
+                events = await self._next_batch(queue)
             except asyncio.TimeoutError:
                 continue
             except asyncio.CancelledError:
                 break
+
+            try:
+                self._batch_count += 1
+                await self._dispatch(topic, events)
+            except asyncio.CancelledError:
+                break
             except Exception as e:
                 logger.error(f"Topic processor error: {e}")
+            finally:
+                for _ in events:
+                    queue.task_done()
 
     async def start(self) -> None:
         """Start processing events."""
         self._running = True
 
         # Start processor tasks for subscribed topics
-        for topic in self._subscribers.keys():
+        for topic in list(self._subscribers.keys()):
             if topic not in self._processor_tasks:
-                self._processor_tasks[topic] = asyncio.create_task(
-                    self._process_topic(topic)
-                )
+                self._start_topic(topic)
+
+        logger.info(
+            f"InMemoryBroker started (consumers/topic: {self._consumers_per_topic}, "
+            f"max batch: {self._max_batch_size}, linger: {self._max_linger * 1000:.0f}ms)"
+        )
 
-        logger.info("InMemoryBroker started")
+    async def join(self) -> None:
+        """Wait until every published event has been dispatched."""
+        for queues in list(self._queues.values()):
+            for queue in queues:
+                await queue.join()
 
     async def stop(self) -> None:
         """Stop processing events."""
         self._running = False
 
         # Cancel all processor tasks
-        for task in self._processor_tasks.values():
+        tasks = [task for tasks in self._processor_tasks.values() for task in tasks]
+        for task in tasks:
             task.cancel()
 
         # Wait for tasks to complete
-        if self._processor_tasks:
-            await asyncio.gather(*self._processor_tasks.values(), return_exceptions=True)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         self._processor_tasks.clear()
         logger.info(f"InMemoryBroker stopped. Processed: {self._processed_count}, Errors: {self._error_count}")
@@ -250,15 +383,20 @@ class InMemoryBroker(MessageBroker):
     def get_stats(self) -> Dict[str, Any]:
         """Get broker statistics."""
         queue_sizes = {
-            topic: queue.qsize()
-            for topic, queue in self._queues.items()
+            topic: sum(queue.qsize() for queue in queues)
+            for topic, queues in self._queues.items()
         }
         return {
             "running": self._running,
             "topics": list(self._subscribers.keys()),
             "queue_sizes": queue_sizes,
+            "consumers_per_topic": self._consumers_per_topic,
+            "max_batch_size": self._max_batch_size,
+            "max_linger_ms": self._max_linger * 1000,
             "processed_count": self._processed_count,
-            "error_count": self._error_count
+            "error_count": self._error_count,
+            "batch_count": self._batch_count,
+            "avg_batch_size": round(self._processed_count / self._batch_count, 2) if self._batch_count else 0
         }
 
 
@@ -293,9 +431,9 @@ class KafkaBroker(MessageBroker):
     uses real Kafka. Otherwise gracefully falls back to InMemoryBroker.
     """
 
-    def __init__(self, config: KafkaBrokerConfig = None):
+    def __init__(self, config: KafkaBrokerConfig = None, fallback: InMemoryBroker = None):
         self.config = config or KafkaBrokerConfig()
-        self._fallback = InMemoryBroker()
+        self._fallback = fallback or InMemoryBroker()
         self._using_fallback = True
 
         try:
@@ -312,9 +450,13 @@ class KafkaBroker(MessageBroker):
         """Publish event to Kafka or fallback broker."""
         return await self._fallback.publish(topic, event)
 
-    async def subscribe(self, topic: str, handler: Callable[[BaseEvent], None]) -> None:
+    async def publish_batch(self, topic: str, events: List[BaseEvent]) -> int:
+        """Publish events to Kafka or fallback broker."""
+        return await self._fallback.publish_batch(topic, events)
+
+    async def subscribe(self, topic: str, handler: Callable[[BaseEvent], None], batch: bool = False) -> None:
         """Subscribe handler to topic."""
-        await self._fallback.subscribe(topic, handler)
+        await self._fallback.subscribe(topic, handler, batch=batch)
 
     async def unsubscribe(self, topic: str, handler: Callable[[BaseEvent], None]) -> None:
         """Unsubscribe from topic."""
@@ -329,6 +471,201 @@ class KafkaBroker(MessageBroker):
         await self._fallback.stop()
 
 
+# ============================================
+# Retry Scheduling & Dead Letters
+# ============================================
+
+class RetryScheduler:
+    """
+    Delay queue for event retries.
+
+    Events are kept in a heap keyed by due time; a single background task
+    sleeps until the earliest one is due and hands it to `emit`. Topic
+    consumers never wait for a retry delay.
+    """
+
+    def __init__(self, emit: Callable[[BaseEvent], Any], clock: Callable[[], float] = None):
+        self._emit = emit
+        self._clock = clock or (lambda: asyncio.get_running_loop().time())
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._emitted = 0
+
+    def schedule(self, event: BaseEvent, delay: float) -> None:
+        """Re-emit event after delay seconds."""
+        due = self._clock() + max(0.0, delay)
+        heapq.heappush(self._heap, (due, next(self._sequence), event))
+        if self._wakeup is not None and self._heap[0][2] is event:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            wait = self._heap[0][0] - self._clock()
+            if wait > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, event = heapq.heappop(self._heap)
+            try:
+                result = self._emit(event)
+                if asyncio.iscoroutine(result):
+                    await result
+                self._emitted += 1
+            except Exception as e:
+                logger.error(f"Failed to re-emit event {event.event_id}: {e}")
+
+    def start(self) -> None:
+        """Start the scheduler task (pending retries are kept across restarts)."""
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the scheduler task."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._heap:
+            logger.info(f"RetryScheduler stopped with {len(self._heap)} pending retries")
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._heap),
+            "next_due_in_seconds": round(max(0.0, self._heap[0][0] - self._clock()), 3) if self._heap else None,
+            "emitted": self._emitted
+        }
+
+
+class DeadLetterStore:
+    """
+    Bounded dead letter store.
+
+    Keeps at most `max_size` envelopes in memory (oldest evicted first).
+    With a mongo_service, dead letters are also written to
+    `collection_name` and removed again on retry or eviction, so they
+    survive restarts (see load). Those writes run in a worker thread
+    (asyncio.to_thread) to keep the event loop free.
+    """
+
+    def __init__(
+        self,
+        max_size: int = None,
+        mongo_service=None,
+        collection_name: str = "event_dead_letters"
+    ):
+        self.max_size = max(1, max_size or STREAM_DEAD_LETTER_MAX_SIZE)
+        self.mongo = mongo_service
+        self.collection_name = collection_name
+        self._envelopes: "OrderedDict[str, EventEnvelope]" = OrderedDict()
+        self._evicted = 0
+        self._last_sequence = 0
+
+    def _collection(self):
+        if self.mongo is None:
+            return None
+        return self.mongo.db[self.collection_name]
+
+    async def add(self, envelope: EventEnvelope) -> None:
+        """Add a dead letter, evicting the oldest when full."""
+        event_id = envelope.event.event_id
+        self._envelopes.pop(event_id, None)
+        self._envelopes[event_id] = envelope
+
+        evicted = []
+        while len(self._envelopes) > self.max_size:
+            evicted.append(self._envelopes.popitem(last=False)[0])
+        self._evicted += len(evicted)
+
+        collection = self._collection()
+        if collection is None:
+            return
+        # Insertion order survives reload even when timestamps collide
+        self._last_sequence = max(time.time_ns(), self._last_sequence + 1)
+        try:
+            await asyncio.to_thread(
+                collection.replace_one,
+                {"_id": event_id},
+                {
+                    "_id": event_id,
+                    "topic": envelope.topic,
+                    "event": envelope.event.to_dict(),
+                    "error_history": envelope.error_history,
+                    "retry_count": envelope.event.metadata.retry_count,
+                    "dead_lettered_at": datetime.utcnow(),
+                    "sequence": self._last_sequence
+                },
+                upsert=True
+            )
+            if evicted:
+                await asyncio.to_thread(collection.delete_many, {"_id": {"$in": evicted}})
+        except Exception as e:
+            logger.error(f"Failed to persist dead letter {event_id}: {e}")
+
+    async def pop(self, event_id: str) -> Optional[EventEnvelope]:
+        """Remove and return a dead letter."""
+        envelope = self._envelopes.pop(event_id, None)
+        collection = self._collection()
+        if envelope is not None and collection is not None:
+            try:
+                await asyncio.to_thread(collection.delete_one, {"_id": event_id})
+            except Exception as e:
+                logger.error(f"Failed to delete dead letter {event_id}: {e}")
+        return envelope
+
+    def load(self) -> int:
+        """Load persisted dead letters (newest max_size). Returns count restored."""
+        collection = self._collection()
+        if collection is None:
+            return 0
+
+        docs = list(collection.find().sort("sequence", -1).limit(self.max_size))
+        loaded = 0
+        for doc in reversed(docs):
+            try:
+                event = event_from_dict(doc["event"])
+            except Exception as e:
+                logger.warning(f"Skipping unreadable dead letter {doc.get('_id')}: {e}")
+                continue
+            self._envelopes[event.event_id] = EventEnvelope(
+                event=event,
+                status=ProcessingStatus.DEAD_LETTER,
+                error_history=doc.get("error_history", []),
+                retry_count=doc.get("retry_count", 0),
+                topic=doc.get("topic", "")
+            )
+            loaded += 1
+        return loaded
+
+    def list(self) -> List[EventEnvelope]:
+        """Dead letters, oldest first."""
+        return list(self._envelopes.values())
+
+    def __len__(self) -> int:
+        return len(self._envelopes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._envelopes),
+            "max_size": self.max_size,
+            "evicted": self._evicted,
+            "persisted": self.mongo is not None
+        }
+
+
 # ============================================
 # Event Processor
 # ============================================
@@ -340,7 +677,7 @@ class EventProcessor:
     Responsibilities:
     - Route events to appropriate handlers
     - Manage event lifecycle (pending -> processing -> completed/failed)
-    - Handle retries and dead letter queue
+    - Handle retries (delay queue with exponential backoff) and dead letters
     - Provide metrics and monitoring
 
     Example:
@@ -350,8 +687,17 @@ class EventProcessor:
         async def handle_data_created(event: DataEvent):
             await save_to_staging(event.data)
 
+        @processor.on_batch(EventType.DATA_CREATED)
+        async def persist_created(events: List[DataEvent]):
+            await save_many(events)
+
         await processor.start()
         await processor.emit(data_event)
+
+    The processor subscribes one batch handler per topic; the broker decides
+    how events are partitioned and batched (see InMemoryBroker). Failed
+    events are handed to a RetryScheduler and re-emitted when due, so the
+    consumer moves on immediately.
     """
 
     def __init__(
@@ -359,7 +705,11 @@ class EventProcessor:
         broker: MessageBroker = None,
         max_retries: int = 3,
         retry_delay_seconds: float = 1.0,
-        enable_dead_letter: bool = True
+        enable_dead_letter: bool = True,
+        retry_backoff: float = None,
+        max_retry_delay_seconds: float = None,
+        retry_jitter: float = None,
+        dead_letter_store: DeadLetterStore = None
     ):
         """
         Initialize the event processor.
@@ -367,16 +717,28 @@ class EventProcessor:
         Args:
             broker: Message broker to use (defaults to InMemoryBroker)
             max_retries: Maximum retry attempts for failed events
-            retry_delay_seconds: Delay between retries
+            retry_delay_seconds: Delay before the first retry
             enable_dead_letter: Enable dead letter queue for failed events
+            retry_backoff: Multiplier applied to the delay on each further retry
+            max_retry_delay_seconds: Upper bound for the retry delay
+            retry_jitter: Fraction of the delay randomly taken off (0-1)
+            dead_letter_store: Dead letter store (defaults to an in-memory bounded store)
         """
         self.broker = broker or InMemoryBroker()
         self.max_retries = max_retries
         self.retry_delay_seconds = retry_delay_seconds
         self.enable_dead_letter = enable_dead_letter
+        self.retry_backoff = STREAM_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        self.max_retry_delay_seconds = (
+            STREAM_MAX_RETRY_DELAY_SECONDS if max_retry_delay_seconds is None else max_retry_delay_seconds
+        )
+        self.retry_jitter = min(1.0, max(0.0, STREAM_RETRY_JITTER if retry_jitter is None else retry_jitter))
+        self.dead_letters = dead_letter_store or DeadLetterStore()
+        self.retry_scheduler = RetryScheduler(self.emit)
 
         self._handlers: Dict[EventType, List[Callable]] = defaultdict(list)
-        self._dead_letter_queue: List[EventEnvelope] = []
+        self._batch_handlers: Dict[EventType, List[Callable]] = defaultdict(list)
+        self._subscribed_topics: Set[str] = set()
         self._processing_history: List[ProcessingResult] = []
         self._running = False
 
@@ -410,10 +772,42 @@ class EventProcessor:
         self._handlers[event_type].append(handler)
         logger.info(f"Registered handler for {event_type.value}")
 
+    def on_batch(self, event_type: EventType) -> Callable:
+        """
+        Decorator to register a batch event handler.
+
+        The handler receives the events of one dequeued batch that have the
+        given type, in partition order.
+
+        Example:
+            @processor.on_batch(EventType.DATA_CREATED)
+            async def persist(events: List[DataEvent]):
+                collection.insert_many([e.to_dict() for e in events])
+        """
+        def decorator(handler: Callable) -> Callable:
+            self.register_batch_handler(event_type, handler)
+            return handler
+        return decorator
+
+    def register_batch_handler(self, event_type: EventType, handler: Any) -> None:
+        """
+        Register a batch event handler programmatically.
+
+        Accepts a callable taking a list of events, or a BatchEventHandler
+        (its handle_batch method is used).
+        """
+        if isinstance(handler, BatchEventHandler):
+            handler = handler.handle_batch
+        self._batch_handlers[event_type].append(handler)
+        logger.info(f"Registered batch handler for {event_type.value}")
+
     def unregister_handler(self, event_type: EventType, handler: Callable) -> None:
         """Unregister event handler."""
         if handler in self._handlers[event_type]:
             self._handlers[event_type].remove(handler)
+        for registered in list(self._batch_handlers[event_type]):
+            if registered == handler or getattr(registered, "__self__", None) is handler:
+                self._batch_handlers[event_type].remove(registered)
 
     async def emit(self, event: BaseEvent) -> bool:
         """
@@ -434,59 +828,111 @@ class EventProcessor:
         """
         Emit multiple events.
 
+        Events are grouped by topic and handed to the broker's
+        publish_batch, preserving their relative order.
+
         Args:
             events: List of events to emit
 
         Returns:
             Number of successfully queued events
         """
-        success_count = 0
+        by_topic: Dict[str, List[BaseEvent]] = defaultdict(list)
         for event in events:
-            if await self.emit(event):
-                success_count += 1
+            by_topic[get_topic_for_event(event)].append(event)
+        self._metrics["events_emitted"] += len(events)
+
+        success_count = 0
+        for topic, topic_events in by_topic.items():
+            success_count += await self.broker.publish_batch(topic, topic_events)
         return success_count
 
-    async def _create_broker_handler(self, event_type: EventType) -> Callable:
-        """Create a broker handler for an event type."""
-        async def handler(event: BaseEvent):
-            await self._process_event(event)
+    async def _create_broker_handler(self, topic: str) -> Callable:
+        """Create a batch broker handler for a topic."""
+        async def handler(events: List[BaseEvent]):
+            await self._process_batch(events)
         return handler
 
     async def _process_event(self, event: BaseEvent) -> ProcessingResult:
         """Process a single event."""
+        return (await self._process_batch([event]))[0]
+
+    async def _process_batch(self, events: List[BaseEvent]) -> List[ProcessingResult]:
+        """
+        Process a batch of events.
+
+        The batch is split into consecutive runs of the same event type,
+        handled in order, so events for one key (e.g. a CREATED followed
+        by an UPDATED of the same source) keep their publish order. Batch
+        handlers are called once per run; per-event handlers are called
+        for each event of the run in order. A failing batch handler fails
+        every event it was given.
+        """
         start_time = datetime.utcnow()
-        handlers = self._handlers.get(event.event_type, [])
-
-        if not handlers:
-            logger.warning(f"No handlers for event type {event.event_type.value}")
-            return ProcessingResult(
-                event_id=event.event_id,
-                status=ProcessingStatus.COMPLETED,
-                handler_name="none"
-            )
+        errors: Dict[str, List[str]] = defaultdict(list)
 
-        errors = []
-        for handler in handlers:
-            try:
-                result = handler(event)
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception as e:
-                errors.append(f"{handler.__name__}: {str(e)}")
-                logger.error(f"Handler {handler.__name__} failed: {e}", exc_info=True)
+        runs: List[Tuple[EventType, List[BaseEvent]]] = []
+        for event in events:
+            if runs and runs[-1][0] == event.event_type:
+                runs[-1][1].append(event)
+            else:
+                runs.append((event.event_type, [event]))
+
+        for event_type, typed_events in runs:
+            for handler in self._batch_handlers.get(event_type, []):
+                name = getattr(handler, "__name__", type(handler).__name__)
+                try:
+                    result = handler(typed_events)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    for event in typed_events:
+                        errors[event.event_id].append(f"{name}: {str(e)}")
+                    logger.error(f"Batch handler {name} failed: {e}", exc_info=True)
+
+            for handler in self._handlers.get(event_type, []):
+                for event in typed_events:
+                    try:
+                        result = handler(event)
+                        if asyncio.iscoroutine(result):
+                            await result
+                    except Exception as e:
+                        errors[event.event_id].append(f"{handler.__name__}: {str(e)}")
+                        logger.error(f"Handler {handler.__name__} failed: {e}", exc_info=True)
 
         processing_time = (datetime.utcnow() - start_time).total_seconds() * 1000
         self._metrics["processing_time_total_ms"] += processing_time
 
+        results = []
+        for event in events:
+            if not self._handlers.get(event.event_type) and not self._batch_handlers.get(event.event_type):
+                logger.warning(f"No handlers for event type {event.event_type.value}")
+                results.append(ProcessingResult(
+                    event_id=event.event_id,
+                    status=ProcessingStatus.COMPLETED,
+                    handler_name="none"
+                ))
+                continue
+            results.append(await self._complete_event(
+                event, errors.get(event.event_id, []), processing_time / len(events)
+            ))
+        return results
+
+    async def _complete_event(
+        self,
+        event: BaseEvent,
+        errors: List[str],
+        processing_time: float
+    ) -> ProcessingResult:
+        """Record the outcome of an event (retry / dead letter / completed)."""
         if errors:
             # Check for retry
             if event.metadata.retry_count < self.max_retries:
                 event.metadata.retry_count += 1
                 self._metrics["events_retried"] += 1
 
-                # Re-queue with delay
-                await asyncio.sleep(self.retry_delay_seconds)
-                await self.emit(event)
+                # Re-queue from the delay queue; the consumer does not wait
+                self.retry_scheduler.schedule(event, self.get_retry_delay(event.metadata.retry_count))
 
                 return ProcessingResult(
                     event_id=event.event_id,
@@ -502,9 +948,10 @@ class EventProcessor:
                     envelope = EventEnvelope(
                         event=event,
                         status=ProcessingStatus.DEAD_LETTER,
+                        retry_count=event.metadata.retry_count,
                         error_history=errors
                     )
-                    self._dead_letter_queue.append(envelope)
+                    await self.dead_letters.add(envelope)
                     self._metrics["events_dead_lettered"] += 1
 
                 return ProcessingResult(
@@ -530,24 +977,44 @@ class EventProcessor:
 
         self._running = True
 
-        # Subscribe to topics for all registered event types
-        for event_type in self._handlers.keys():
-            topic = get_topic_for_event(BaseEvent(event_type=event_type))
-            handler = await self._create_broker_handler(event_type)
-            await self.broker.subscribe(topic, handler)
+        # Subscribe once per topic (several event types share a topic)
+        await self._subscribe_topics()
 
         await self.broker.start()
+        self.retry_scheduler.start()
         logger.info("EventProcessor started")
 
+    async def _subscribe_topics(self) -> None:
+        event_types = set(self._handlers) | set(self._batch_handlers)
+        for event_type in event_types:
+            topic = get_topic_for_event(BaseEvent(event_type=event_type))
+            if topic not in self._subscribed_topics:
+                self._subscribed_topics.add(topic)
+                handler = await self._create_broker_handler(topic)
+                await self.broker.subscribe(topic, handler, batch=True)
+
     async def stop(self) -> None:
         """Stop the event processor."""
         self._running = False
+        await self.retry_scheduler.stop()
         await self.broker.stop()
         logger.info("EventProcessor stopped")
 
+    def get_retry_delay(self, retry_count: int) -> float:
+        """
+        Delay before retry number retry_count (1-based).
+
+        Exponential backoff capped at max_retry_delay_seconds, with up to
+        retry_jitter of it randomly taken off so failures that happened
+        together are not retried together.
+        """
+        delay = self.retry_delay_seconds * self.retry_backoff ** max(0, retry_count - 1)
+        delay = min(delay, self.max_retry_delay_seconds)
+        return delay * (1 - self.retry_jitter * random.random())
+
     def get_dead_letter_queue(self) -> List[EventEnvelope]:
         """Get events in the dead letter queue."""
-        return self._dead_letter_queue.copy()
+        return self.dead_letters.list()
 
     async def retry_dead_letter(self, event_id: str) -> bool:
         """
@@ -559,21 +1026,22 @@ class EventProcessor:
         Returns:
             True if event was re-queued
         """
-        for i, envelope in enumerate(self._dead_letter_queue):
-            if envelope.event.event_id == event_id:
-                envelope.event.metadata.retry_count = 0
-                await self.emit(envelope.event)
-                self._dead_letter_queue.pop(i)
-                return True
-        return False
+        envelope = await self.dead_letters.pop(event_id)
+        if envelope is None:
+            return False
+        envelope.event.metadata.retry_count = 0
+        await self.emit(envelope.event)
+        return True
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get processor metrics."""
         metrics = self._metrics.copy()
-        metrics["dead_letter_queue_size"] = len(self._dead_letter_queue)
+        metrics["dead_letter_queue_size"] = len(self.dead_letters)
+        metrics["dead_letters"] = self.dead_letters.get_stats()
+        metrics["pending_retries"] = len(self.retry_scheduler)
         metrics["registered_handlers"] = {
-            event_type.value: len(handlers)
-            for event_type, handlers in self._handlers.items()
+            event_type.value: len(self._handlers.get(event_type, [])) + len(self._batch_handlers.get(event_type, []))
+            for event_type in set(self._handlers) | set(self._batch_handlers)
         }
 
         if metrics["events_processed"] > 0:
@@ -590,6 +1058,31 @@ class EventProcessor:
 # Pre-built Event Handlers
 # ============================================
 
+class BatchEventHandler(EventHandler):
+    """
+    Event handler that can process a whole batch at once.
+
+    Register with EventProcessor.register_batch_handler. The default
+    handle_batch falls back to calling handle for each event.
+    """
+
+    async def handle_batch(self, events: List[BaseEvent]) -> int:
+        """
+        Handle a batch of events.
+
+        Returns:
+            Number of events handled successfully
+        """
+        handled = 0
+        for event in events:
+            try:
+                if await self.handle(event):
+                    handled += 1
+            except Exception as e:
+                await self.on_error(event, e)
+        return handled
+
+
 class LoggingEventHandler(EventHandler):
     """Simple logging handler for debugging."""
 
@@ -633,11 +1126,12 @@ class MetricsEventHandler(EventHandler):
         }
 
 
-class PersistenceEventHandler(EventHandler):
+class PersistenceEventHandler(BatchEventHandler):
     """
     Handler that persists events to MongoDB.
 
-    Useful for event sourcing and audit trails.
+    Useful for event sourcing and audit trails. As a batch handler it
+    writes each batch with a single unordered insert_many.
     """
 
     def __init__(self, mongo_service, collection_name: str = "event_log"):
@@ -654,6 +1148,22 @@ class PersistenceEventHandler(EventHandler):
             logger.error(f"Failed to persist event: {e}")
             return False
 
+    async def handle_batch(self, events: List[BaseEvent]) -> int:
+        if not events:
+            return 0
+        persisted_at = datetime.utcnow()
+        docs = []
+        for event in events:
+            doc = event.to_dict()
+            doc["persisted_at"] = persisted_at
+            docs.append(doc)
+        try:
+            result = self.mongo.db[self.collection_name].insert_many(docs, ordered=False)
+            return len(result.inserted_ids)
+        except Exception as e:
+            logger.error(f"Failed to persist {len(events)} events: {e}")
+            return 0
+
     async def on_error(self, event: BaseEvent, error: Exception) -> None:
         # Log error but don't fail other handlers
         logger.error(f"Persistence error for {event.event_id}: {error}")
@@ -730,14 +1240,27 @@ def create_event_processor(
         broker = KafkaBroker(config)
     else:
         broker = InMemoryBroker(
-            max_queue_size=kwargs.get("max_queue_size", 10000)
+            max_queue_size=kwargs.get("max_queue_size", 10000),
+            consumers_per_topic=kwargs.get("consumers_per_topic"),
+            max_batch_size=kwargs.get("max_batch_size"),
+            max_linger_ms=kwargs.get("max_linger_ms")
         )
 
+    dead_letter_store = DeadLetterStore(
+        max_size=kwargs.get("dead_letter_max_size"),
+        mongo_service=kwargs.get("mongo_service")
+    )
+    dead_letter_store.load()
+
     return EventProcessor(
         broker=broker,
         max_retries=kwargs.get("max_retries", 3),
         retry_delay_seconds=kwargs.get("retry_delay_seconds", 1.0),
-        enable_dead_letter=kwargs.get("enable_dead_letter", True)
+        enable_dead_letter=kwargs.get("enable_dead_letter", True),
+        retry_backoff=kwargs.get("retry_backoff"),
+        max_retry_delay_seconds=kwargs.get("max_retry_delay_seconds"),
+        retry_jitter=kwargs.get("retry_jitter"),
+        dead_letter_store=dead_letter_store
     )
 
 
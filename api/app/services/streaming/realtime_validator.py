@@ -5,11 +5,11 @@ This module provides real-time validation of incoming data events,
 integrating with the existing data_quality validation framework.
 
 Features:
-- Stream-based validation (per-event)
+- Stream-based validation (per-event or per-batch)
 - Async validation for high throughput
 - Integration with existing ValidationProfile
 - Validation result events emission
-- Caching for validation rules
+- Caching for source configs and validators (keyed by config fingerprint)
 """
 
 import asyncio
@@ -20,6 +20,7 @@ from dataclasses import dataclass, field
 from functools import lru_cache
 from collections import defaultdict
 import hashlib
+import json
 
 from .event_types import (
     BaseEvent,
@@ -132,16 +133,79 @@ class RealtimeValidationResult:
 
 class ValidatorCache:
     """
-    Cache for validation profiles and rules.
+    Cache for source configs and validators.
 
-    Reduces overhead of creating validators for each event.
+    Source configs are cached per source_id (including sources with no
+    config) so the hot path does not read MongoDB per event. Validators are
+    keyed by a fingerprint of the config's field rules, so sources sharing
+    a config share one validator. Configs with unique fields keep a
+    validator per source because UniqueRule tracks seen values.
     """
 
+    DEFAULT_FINGERPRINT = "default"
+
     def __init__(self, ttl_seconds: int = 300):
         self._validators: Dict[str, Tuple[DataValidator, datetime]] = {}
         self._profiles: Dict[str, Tuple[ValidationProfile, datetime]] = {}
+        self._sources: Dict[str, Tuple[Optional[Dict[str, Any]], str, datetime]] = {}
         self._ttl = timedelta(seconds=ttl_seconds)
         self._lock = asyncio.Lock()
+        self._source_hits = 0
+        self._source_misses = 0
+
+    @classmethod
+    def fingerprint(cls, source_id: str, source_config: Optional[Dict[str, Any]]) -> str:
+        """Key for the validator built from source_config."""
+        if not source_config:
+            return cls.DEFAULT_FINGERPRINT
+
+        fields = source_config.get("fields", [])
+        digest = hashlib.sha1(
+            json.dumps(fields, sort_keys=True, default=str).encode("utf-8"),
+            usedforsecurity=False
+        ).hexdigest()
+        if any(f.get("unique", False) for f in fields):
+            return f"{source_id}:{digest}"
+        return digest
+
+    def get_source(self, source_id: str) -> Optional[Tuple[Optional[Dict[str, Any]], str]]:
+        """Cached (source_config, fingerprint), or None on miss/expiry."""
+        entry = self._sources.get(source_id)
+        if entry and datetime.utcnow() - entry[2] < self._ttl:
+            self._source_hits += 1
+            return entry[0], entry[1]
+        self._source_misses += 1
+        return None
+
+    def put_source(
+        self,
+        source_id: str,
+        source_config: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Cache a source config (None = source has no config)."""
+        fingerprint = self.fingerprint(source_id, source_config)
+        self._sources[source_id] = (source_config, fingerprint, datetime.utcnow())
+        return source_config, fingerprint
+
+    def validator_for(
+        self,
+        fingerprint: str,
+        source_config: Optional[Dict[str, Any]] = None
+    ) -> DataValidator:
+        """Get or create the validator for a config fingerprint."""
+        now = datetime.utcnow()
+
+        entry = self._validators.get(fingerprint)
+        if entry and now - entry[1] < self._ttl:
+            return entry[0]
+
+        if source_config:
+            validator = DataValidator.create_for_source(source_config)
+        else:
+            validator = DataValidator(ValidationProfile.create_default("strict"))
+
+        self._validators[fingerprint] = (validator, now)
+        return validator
 
     async def get_validator(
         self,
@@ -149,53 +213,42 @@ class ValidatorCache:
         source_config: Dict[str, Any] = None
     ) -> DataValidator:
         """Get or create validator for source."""
-        async with self._lock:
-            now = datetime.utcnow()
-
-            # Check cache
-            if source_id in self._validators:
-                validator, cached_at = self._validators[source_id]
-                if now - cached_at < self._ttl:
-                    return validator
-
-            # Create new validator
-            if source_config:
-                validator = DataValidator.create_for_source(source_config)
-            else:
-                validator = DataValidator(ValidationProfile.create_default("strict"))
-
-            self._validators[source_id] = (validator, now)
-            return validator
+        return self.validator_for(self.fingerprint(source_id, source_config), source_config)
 
     async def invalidate(self, source_id: str = None) -> None:
         """Invalidate cache for source or all."""
         async with self._lock:
             if source_id:
-                self._validators.pop(source_id, None)
+                entry = self._sources.pop(source_id, None)
+                if entry and entry[1].startswith(f"{source_id}:"):
+                    self._validators.pop(entry[1], None)
                 self._profiles.pop(source_id, None)
             else:
                 self._validators.clear()
                 self._profiles.clear()
+                self._sources.clear()
 
     async def cleanup_expired(self) -> int:
         """Remove expired cache entries."""
         async with self._lock:
             now = datetime.utcnow()
-            expired_validators = [
-                k for k, (_, cached_at) in self._validators.items()
-                if now - cached_at >= self._ttl
-            ]
-            for k in expired_validators:
-                del self._validators[k]
+            removed = 0
+            for cache in (self._validators, self._profiles, self._sources):
+                expired = [k for k, entry in cache.items() if now - entry[-1] >= self._ttl]
+                for k in expired:
+                    del cache[k]
+                removed += len(expired)
 
-            expired_profiles = [
-                k for k, (_, cached_at) in self._profiles.items()
-                if now - cached_at >= self._ttl
-            ]
-            for k in expired_profiles:
-                del self._profiles[k]
+            return removed
 
-            return len(expired_validators) + len(expired_profiles)
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "sources": len(self._sources),
+            "validators": len(self._validators),
+            "source_hits": self._source_hits,
+            "source_misses": self._source_misses
+        }
 
 
 class RealtimeValidator(EventHandler):
@@ -213,8 +266,13 @@ class RealtimeValidator(EventHandler):
 
         # Or use as EventHandler
         change_stream.add_handler(validator)
+
+    Changes to the sources collection seen by the handler invalidate the
+    cached config for that source.
     """
 
+    SOURCES_COLLECTION = "sources"
+
     def __init__(
         self,
         mongo_service=None,
@@ -277,16 +335,44 @@ class RealtimeValidator(EventHandler):
         return True
 
     async def _get_source_config(self, source_id: str) -> Optional[Dict[str, Any]]:
-        """Get source configuration from MongoDB."""
-        if not self.mongo or not source_id:
-            return None
+        """Get source configuration (cached, MongoDB read off the event loop on miss)."""
+        config, _ = await self._get_cached_source(source_id)
+        return config
 
-        try:
-            source = self.mongo.get_source(source_id)
-            return source
-        except Exception as e:
-            logger.warning(f"Failed to get source config for {source_id}: {e}")
-            return None
+    async def _get_cached_source(self, source_id: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """(source_config, validator fingerprint) for one source."""
+        sources = await self._get_cached_sources([source_id])
+        return sources[source_id]
+
+    async def _get_cached_sources(
+        self,
+        source_ids: List[str]
+    ) -> Dict[str, Tuple[Optional[Dict[str, Any]], str]]:
+        """(source_config, fingerprint) per source, loading all misses in one query."""
+        result = {}
+        missing = []
+        for source_id in source_ids:
+            cached = self._cache.get_source(source_id)
+            if cached is not None:
+                result[source_id] = cached
+            elif self.mongo and source_id:
+                missing.append(source_id)
+            else:
+                result[source_id] = self._cache.put_source(source_id, None)
+
+        if missing:
+            try:
+                sources = await asyncio.to_thread(self.mongo.get_sources_by_ids, missing)
+            except Exception as e:
+                logger.warning(f"Failed to get source configs for {len(missing)} sources: {e}")
+                for source_id in missing:
+                    result[source_id] = (None, ValidatorCache.DEFAULT_FINGERPRINT)
+                return result
+
+            for source_id in missing:
+                result[source_id] = self._cache.put_source(source_id, sources.get(source_id))
+
+        return result
 
     async def validate_event(self, event: DataEvent) -> RealtimeValidationResult:
         """
@@ -301,9 +387,46 @@ class RealtimeValidator(EventHandler):
         start_time = datetime.utcnow()
 
         # Get validator (cached)
-        source_config = await self._get_source_config(event.source_id)
-        validator = await self._cache.get_validator(event.source_id, source_config)
+        source_config, fingerprint = await self._get_cached_source(event.source_id)
+        validator = self._cache.validator_for(fingerprint, source_config)
+
+        return self._validate_with(validator, event, start_time)
+
+    async def validate_events(self, events: List[DataEvent]) -> List[RealtimeValidationResult]:
+        """
+        Validate a batch of data events.
+
+        Source configs for the whole batch are resolved together (one MongoDB
+        query for cache misses) and events are validated grouped by source.
+
+        Args:
+            events: DataEvents to validate
+
+        Returns:
+            RealtimeValidationResults in the same order as events
+        """
+        by_source: Dict[str, List[int]] = defaultdict(list)
+        for i, event in enumerate(events):
+            by_source[event.source_id].append(i)
+
+        sources = await self._get_cached_sources(list(by_source))
+
+        results: List[Optional[RealtimeValidationResult]] = [None] * len(events)
+        for source_id, indexes in by_source.items():
+            source_config, fingerprint = sources[source_id]
+            validator = self._cache.validator_for(fingerprint, source_config)
+            for i in indexes:
+                results[i] = self._validate_with(validator, events[i], datetime.utcnow())
 
+        return results
+
+    def _validate_with(
+        self,
+        validator: DataValidator,
+        event: DataEvent,
+        start_time: datetime
+    ) -> RealtimeValidationResult:
+        """Validate one event with a resolved validator and update stats."""
         # Perform validation
         issues = validator.validate_record(event.data, row_index=0)
 
@@ -402,29 +525,67 @@ class RealtimeValidator(EventHandler):
         if not isinstance(event, DataEvent):
             return True
 
+        if event.collection == self.SOURCES_COLLECTION:
+            await self.invalidate_cache(event.document_id)
+            return True
+
         if not self.should_validate(event):
             return True
 
         try:
             result = await self.validate_event(event)
+            return await self._handle_result(event, result)
 
-            # Emit validation event if configured
-            if self.emit_validation_events and self._event_emitter:
-                validation_event = result.to_event()
-                await self._emit_event(validation_event)
+        except Exception as e:
+            logger.error(f"Validation error for event {event.event_id}: {e}", exc_info=True)
+            return not self.block_on_failure
 
-            # Block on failure if configured
-            if self.block_on_failure and not result.passed:
-                logger.warning(
-                    f"Validation failed for {event.document_id}: {len(result.errors)} errors"
-                )
-                return False
+    async def handle_batch(self, events: List[BaseEvent]) -> int:
+        """
+        Batch interface, called by ChangeStreamListener with a dispatch batch.
 
-            return True
+        Returns:
+            Number of events handled successfully
+        """
+        to_validate = []
+        for event in events:
+            if not isinstance(event, DataEvent):
+                continue
+            if event.collection == self.SOURCES_COLLECTION:
+                await self.invalidate_cache(event.document_id)
+            elif self.should_validate(event):
+                to_validate.append(event)
+
+        handled = len(events) - len(to_validate)
+        if not to_validate:
+            return handled
 
+        try:
+            results = await self.validate_events(to_validate)
         except Exception as e:
-            logger.error(f"Validation error for event {event.event_id}: {e}", exc_info=True)
-            return not self.block_on_failure
+            logger.error(f"Validation error for batch of {len(to_validate)} events: {e}", exc_info=True)
+            return handled if self.block_on_failure else len(events)
+
+        for event, result in zip(to_validate, results):
+            if await self._handle_result(event, result):
+                handled += 1
+        return handled
+
+    async def _handle_result(self, event: DataEvent, result: RealtimeValidationResult) -> bool:
+        """Emit the validation event and apply block_on_failure."""
+        # Emit validation event if configured
+        if self.emit_validation_events and self._event_emitter:
+            validation_event = result.to_event()
+            await self._emit_event(validation_event)
+
+        # Block on failure if configured
+        if self.block_on_failure and not result.passed:
+            logger.warning(
+                f"Validation failed for {event.document_id}: {len(result.errors)} errors"
+            )
+            return False
+
+        return True
 
     async def on_error(self, event: BaseEvent, error: Exception) -> None:
         """Handle validation errors."""
@@ -439,7 +600,9 @@ class RealtimeValidator(EventHandler):
 
     def get_stats(self) -> Dict[str, Any]:
         """Get validation statistics."""
-        return self._stats.to_dict()
+        stats = self._stats.to_dict()
+        stats["cache"] = self._cache.get_stats()
+        return stats
 
     def reset_stats(self) -> None:
         """Reset validation statistics."""
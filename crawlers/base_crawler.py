@@ -15,6 +15,8 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .utils.parsers import parse_date_formats, parse_plain_number
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,6 +57,18 @@ class BaseCrawler(ABC):
         'Cache-Control': 'no-cache'
     }
 
+    DEFAULT_DATE_FORMATS = (
+        '%Y-%m-%d',
+        '%Y/%m/%d',
+        '%Y.%m.%d',
+        '%d-%m-%Y',
+        '%d/%m/%Y',
+        '%Y-%m-%d %H:%M:%S',
+        '%Y/%m/%d %H:%M:%S',
+        '%Y년 %m월 %d일',
+        '%Y년%m월%d일'
+    )
+
     def __init__(
         self,
         url: str,
@@ -296,17 +310,7 @@ class BaseCrawler(ABC):
         Returns:
             Parsed number or None
         """
-        if not value:
-            return None
-
-        import re
-        # Remove currency symbols, commas, spaces
-        cleaned = re.sub(r'[^\d.-]', '', value)
-
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
+        return parse_plain_number(value)
 
     @staticmethod
     def parse_date(value: str, formats: Optional[List[str]] = None) -> Optional[datetime]:
@@ -324,24 +328,6 @@ class BaseCrawler(ABC):
             return None
 
         if formats is None:
-            formats = [
-                '%Y-%m-%d',
-                '%Y/%m/%d',
-                '%Y.%m.%d',
-                '%d-%m-%Y',
-                '%d/%m/%Y',
-                '%Y-%m-%d %H:%M:%S',
-                '%Y/%m/%d %H:%M:%S',
-                '%Y년 %m월 %d일',
-                '%Y년%m월%d일'
-            ]
-
-        value = value.strip()
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
-
-        return None
+            formats = BaseCrawler.DEFAULT_DATE_FORMATS
+
+        return parse_date_formats(value.strip(), formats)
@@ -0,0 +1,271 @@
+"""
+Shared date/number parsers for crawled values.
+
+Precompiled patterns, cheap shape checks before any regex runs, and a
+bounded LRU memo keyed by the raw string (news listings repeat the same
+date strings hundreds of times per page). Results that depend on the
+current time ("30분 전", "14:30") are never memoized.
+
+Used by DataTransformer (ETL), BaseCrawler and the data-quality DateRule.
+"""
+
+import re
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Tuple
+
+PARSE_CACHE_SIZE = 8192
+
+# 상대 시간 패턴 (우선 적용, 현재 시각 기준이므로 캐시하지 않음)
+_RELATIVE_PATTERNS = (
+    (re.compile(r'(\d+)분\s*전'), lambda m: datetime.now() - timedelta(minutes=int(m.group(1)))),
+    (re.compile(r'(\d+)시간\s*전'), lambda m: datetime.now() - timedelta(hours=int(m.group(1)))),
+    (re.compile(r'(\d+)일\s*전'), lambda m: datetime.now() - timedelta(days=int(m.group(1)))),
+    (re.compile(r'방금'), lambda m: datetime.now()),
+    (re.compile(r'오늘'), lambda m: datetime.now().replace(hour=0, minute=0, second=0)),
+    (re.compile(r'어제'), lambda m: (datetime.now() - timedelta(days=1)).replace(hour=0, minute=0, second=0)),
+)
+_RELATIVE_MARKERS = ('전', '방금', '오늘', '어제')
+
+# 한국 날짜 패턴 (DataTransformer.KO_DATE_PATTERNS와 동일한 순서)
+KO_DATE_PATTERNS = (
+    (r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2}):(\d{2})', '%Y-%m-%d %H:%M'),
+    (r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', '%Y-%m-%d'),
+    (r'(\d{4})\.(\d{1,2})\.(\d{1,2})\s*(\d{1,2}):(\d{2})', '%Y-%m-%d %H:%M'),
+    (r'(\d{4})\.(\d{1,2})\.(\d{1,2})', '%Y-%m-%d'),
+    (r'(\d{4})-(\d{1,2})-(\d{1,2})\s*(\d{1,2}):(\d{2}):(\d{2})', '%Y-%m-%d %H:%M:%S'),
+    (r'(\d{4})-(\d{1,2})-(\d{1,2})\s*(\d{1,2}):(\d{2})', '%Y-%m-%d %H:%M'),
+    (r'(\d{4})-(\d{1,2})-(\d{1,2})', '%Y-%m-%d'),
+    (r'(\d{1,2})/(\d{1,2})/(\d{4})', '%m/%d/%Y'),
+    (r'(\d{2}):(\d{2})', '%H:%M'),  # 오늘 시간만
+)
+_KO_DATE_REGEXES = tuple(re.compile(pattern) for pattern, _ in KO_DATE_PATTERNS)
+_HAS_DIGIT = re.compile(r'\d')
+
+# 숫자 정제
+KOREAN_UNITS = (('억', 100000000), ('만', 10000), ('천', 1000))
+_SYMBOL_TABLE = str.maketrans('', '', ',%원$₩')
+_NEGATIVE_PREFIXES = ('-', '▼', '↓')
+_POSITIVE_PREFIXES = ('+', '▲', '↑')
+_NUMBER_TOKEN = re.compile(r'[\d.]+')
+_NON_NUMERIC = re.compile(r'[^\d.-]')
+
+# strptime 지시자 (리터럴 문자 추출용)
+_STRPTIME_DIRECTIVE = re.compile(r'%.')
+
+_TIME_DEPENDENT = object()
+
+
+def parse_korean_date(value: Any) -> Optional[datetime]:
+    """
+    한국어/일반 날짜 문자열 파싱 (상대 시간, 한국어 날짜, ISO 형식)
+
+    Args:
+        value: 날짜 값 (datetime, date, 문자열)
+
+    Returns:
+        datetime 또는 None
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    if not value:
+        return None
+
+    text = str(value).strip()
+    result = _parse_korean_date_cached(text)
+    if result is _TIME_DEPENDENT:
+        return _parse_korean_date_now(text)
+    return result
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_korean_date_cached(text: str):
+    # 상대 시간 표현이 있으면 현재 시각 기준으로 매번 계산
+    if any(marker in text for marker in _RELATIVE_MARKERS):
+        for regex, _ in _RELATIVE_PATTERNS:
+            if regex.search(text):
+                return _TIME_DEPENDENT
+
+    # 숫자가 없으면 절대 날짜 패턴은 매칭될 수 없음
+    if _HAS_DIGIT.search(text):
+        for regex in _KO_DATE_REGEXES:
+            match = regex.search(text)
+            if not match:
+                continue
+            groups = match.groups()
+            if len(groups) == 2:
+                # 시:분만 있으면 오늘 날짜 기준
+                return _TIME_DEPENDENT
+            try:
+                return datetime(*(int(g) for g in groups))
+            except ValueError:
+                continue
+
+    # ISO 형식 시도
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _parse_korean_date_now(text: str) -> Optional[datetime]:
+    """현재 시각에 의존하는 표현 파싱 (캐시 미사용)"""
+    for regex, handler in _RELATIVE_PATTERNS:
+        match = regex.search(text)
+        if match:
+            return handler(match)
+
+    for regex in _KO_DATE_REGEXES:
+        match = regex.search(text)
+        if not match:
+            continue
+        groups = match.groups()
+        try:
+            if len(groups) == 2:
+                return datetime.now().replace(hour=int(groups[0]), minute=int(groups[1]), second=0)
+            return datetime(*(int(g) for g in groups))
+        except ValueError:
+            continue
+
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def parse_korean_number(value: Any) -> Optional[float]:
+    """
+    한국어 금융 숫자 파싱 (부호 화살표, 통화 기호, 억/만/천 단위)
+
+    Args:
+        value: 숫자 값 (int, float, Decimal, 문자열)
+
+    Returns:
+        float 또는 None
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+    return _parse_korean_number_cached(str(value).strip())
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_korean_number_cached(text: str) -> Optional[float]:
+    if not text:
+        return None
+
+    # 부호 처리
+    negative = False
+    if text.startswith(_NEGATIVE_PREFIXES):
+        negative = True
+        text = text[1:]
+    elif text.startswith(_POSITIVE_PREFIXES):
+        text = text[1:]
+
+    # 기호 제거
+    text = text.translate(_SYMBOL_TABLE)
+
+    # 한국어 단위 처리
+    multiplier = 1
+    for unit, mult in KOREAN_UNITS:
+        if unit in text:
+            text = text.replace(unit, '')
+            multiplier = mult
+            break
+
+    # 숫자 추출
+    try:
+        number = float(text.strip()) * multiplier
+        return -number if negative else number
+    except ValueError:
+        # 숫자만 추출 시도
+        match = _NUMBER_TOKEN.search(text)
+        if match:
+            try:
+                number = float(match.group()) * multiplier
+                return -number if negative else number
+            except ValueError:
+                pass
+
+    return None
+
+
+def parse_plain_number(value: Optional[str]) -> Optional[float]:
+    """
+    숫자 이외 문자를 모두 제거한 뒤 float 변환
+
+    Args:
+        value: 문자열 값
+
+    Returns:
+        float 또는 None
+    """
+    if not value:
+        return None
+    return _parse_plain_number_cached(value)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_plain_number_cached(value: str) -> Optional[float]:
+    try:
+        return float(_NON_NUMERIC.sub('', value))
+    except ValueError:
+        return None
+
+
+def parse_date_formats(value: str, formats: Iterable[str]) -> Optional[datetime]:
+    """
+    strptime 형식 목록을 순서대로 시도 (첫 성공 형식 반환)
+
+    입력에 없는 리터럴 문자(구분자 등)를 요구하는 형식은 strptime을
+    호출하지 않고 건너뜁니다.
+
+    Args:
+        value: 날짜 문자열 (앞뒤 공백은 호출자가 처리)
+        formats: strptime 형식 목록
+
+    Returns:
+        datetime 또는 None
+    """
+    if not value:
+        return None
+    return _parse_date_formats_cached(value, tuple(formats))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_date_formats_cached(value: str, formats: Tuple[str, ...]) -> Optional[datetime]:
+    for fmt in formats:
+        if not all(char in value for char in _format_literals(fmt)):
+            continue
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=256)
+def _format_literals(fmt: str) -> frozenset:
+    """
+    strptime 형식이 반드시 요구하는 리터럴 문자 집합
+
+    strptime은 대소문자를 무시하고 공백을 유연하게 매칭하므로
+    대소문자 구분이 없는 비공백 문자(숫자, 구분자, 한글 등)만 포함합니다.
+    """
+    literals = _STRPTIME_DIRECTIVE.sub('', fmt)
+    return frozenset(
+        char for char in literals
+        if not char.isspace() and char.lower() == char.upper()
+    )
+
+
+def clear_parse_caches():
+    """파서 메모 캐시 초기화 (테스트/벤치마크용)"""
+    _parse_korean_date_cached.cache_clear()
+    _parse_korean_number_cached.cache_clear()
+    _parse_plain_number_cached.cache_clear()
+    _parse_date_formats_cached.cache_clear()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Async Dashboard Benchmark - 무거운 대시보드 쿼리 중 가벼운 엔드포인트 지연 시간
+
+async 핸들러에서 동기 MongoService를 직접 호출하는 방식(sync)과
+AsyncMongoService(스레드풀 오프로딩 + asyncio.gather)를 비교합니다.
+대시보드 요청을 --heavy-concurrency개씩 계속 보내는 동안 가벼운
+엔드포인트 두 개를 --cheap-interval-ms 간격으로 보내 p50/p99 지연을
+측정합니다 (예정 시각 기준이라 루프가 막힌 동안의 대기도 포함).
+
+- /ping: DB 없는 async 엔드포인트 (이벤트 루프 블로킹만 측정)
+- /sources/{id}: get_source (find_one 한 번)
+
+--simulate-ms를 주면 MongoDB 없이 연산마다 지정 시간만큼 블로킹하는
+메모리 DB를 사용하고, 없으면 --uri의 MongoDB에 공유 풀로 연결합니다.
+
+Usage:
+    python scripts/benchmarks/bench_async_dashboard.py --simulate-ms 50
+    python scripts/benchmarks/bench_async_dashboard.py --uri mongodb://localhost:27017 --duration 10
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import httpx  # noqa: E402
+from bson import ObjectId  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+
+from api.app.services import mongo_service  # noqa: E402
+from api.app.services.async_mongo_service import AsyncMongoService, shutdown_executor  # noqa: E402
+from api.app.services.mongo_service import MongoService  # noqa: E402
+
+
+class SimulatedCollection:
+    """연산마다 delay초 블로킹하는 컬렉션 (드라이버 I/O 대기 흉내)"""
+
+    def __init__(self, delay, docs=()):
+        self.delay = delay
+        self.docs = list(docs)
+
+    def aggregate(self, pipeline):
+        time.sleep(self.delay)
+        return iter([])
+
+    def count_documents(self, query):
+        time.sleep(self.delay)
+        return 0
+
+    def find_one(self, query):
+        # 인덱스 조회 수준의 짧은 대기
+        time.sleep(self.delay / 50)
+        return self.docs[0] if self.docs else None
+
+
+class SimulatedClient:
+    def __init__(self, delay):
+        source = {'_id': ObjectId(), 'name': 'news'}
+        self._db = {name: SimulatedCollection(delay, [source] if name == 'sources' else ())
+                    for name in ('sources', 'crawlers', 'crawl_results', 'error_logs', 'crawler_history')}
+        self.admin = self
+
+    def __getitem__(self, name):
+        return SimulatedDatabase(self._db)
+
+    def command(self, name):
+        return {'ok': 1}
+
+
+class SimulatedDatabase:
+    def __init__(self, collections):
+        self._collections = collections
+
+    def __getitem__(self, name):
+        return self._collections[name]
+
+    def __getattr__(self, name):
+        return self._collections[name]
+
+
+def build_app(make_mongo) -> FastAPI:
+    app = FastAPI()
+
+    def get_mongo():
+        mongo = make_mongo()
+        try:
+            yield mongo
+        finally:
+            mongo.close()
+
+    def get_async_mongo(mongo: MongoService = Depends(get_mongo)):
+        return AsyncMongoService(mongo)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/sync/dashboard")
+    async def sync_dashboard(mongo: MongoService = Depends(get_mongo)):
+        return mongo.get_dashboard_stats_optimized()['sources']
+
+    @app.get("/sync/sources/{source_id}")
+    async def sync_source(source_id: str, mongo: MongoService = Depends(get_mongo)):
+        doc = mongo.get_source(source_id)
+        return {"name": doc.get("name") if doc else None}
+
+    @app.get("/async/dashboard")
+    async def async_dashboard(mongo: AsyncMongoService = Depends(get_async_mongo)):
+        return (await mongo.get_dashboard_stats_optimized())['sources']
+
+    @app.get("/async/sources/{source_id}")
+    async def async_source(source_id: str, mongo: AsyncMongoService = Depends(get_async_mongo)):
+        doc = await mongo.get_source(source_id)
+        return {"name": doc.get("name") if doc else None}
+
+    return app
+
+
+async def run_mode(app, mode, args):
+    """대시보드 부하를 건 상태에서 가벼운 요청 지연 측정"""
+    transport = httpx.ASGITransport(app=app)
+    latencies = {"ping": [], "source": [], "dashboard": []}
+    stop = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        async def request(kind, path, scheduled=None):
+            start = time.perf_counter()
+            response = await client.get(path)
+            # 가벼운 요청은 예정 시각부터 측정 (루프가 막혀 늦게 보낸 시간 포함)
+            latencies[kind].append(time.perf_counter() - (scheduled or start))
+            response.raise_for_status()
+
+        async def heavy():
+            while not stop.is_set():
+                await request("dashboard", f"/{mode}/dashboard")
+
+        async def cheap(kind, path):
+            interval = args.cheap_interval_ms / 1000
+            scheduled = time.perf_counter()
+            while not stop.is_set():
+                await request(kind, path, scheduled)
+                scheduled += interval
+                # 밀린 요청은 건너뛰지 않고 곧바로 보냄
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+
+        tasks = [asyncio.create_task(heavy()) for _ in range(args.heavy_concurrency)]
+        tasks.append(asyncio.create_task(cheap("ping", "/ping")))
+        tasks.append(asyncio.create_task(cheap("source", f"/{mode}/sources/{ObjectId()}")))
+        await asyncio.sleep(args.duration)
+        stop.set()
+        await asyncio.gather(*tasks)
+    return latencies
+
+
+def pct(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] * 1000 if values else 0.0
+
+
+def report(mode, latencies, duration):
+    for kind in ("ping", "source", "dashboard"):
+        values = latencies[kind]
+        print(f"{mode:<6} {kind:<10} n={len(values):>6}  p50 {pct(values, 0.5):8.2f}ms  "
+              f"p99 {pct(values, 0.99):8.2f}ms  max {pct(values, 1.0):8.2f}ms  {len(values) / duration:8.1f} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--uri', default=os.getenv('MONGODB_URI', 'mongodb://localhost:27017'))
+    parser.add_argument('--simulate-ms', type=float, default=0.0)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--heavy-concurrency', type=int, default=4)
+    parser.add_argument('--cheap-interval-ms', type=float, default=20.0)
+    args = parser.parse_args()
+
+    if args.simulate_ms:
+        client = SimulatedClient(args.simulate_ms / 1000)
+
+        def make_mongo():
+            mongo = MongoService()
+            mongo._client = client
+            mongo._shared_client = True
+            return mongo
+
+        print(f"simulated db: {args.simulate_ms}ms per aggregation/count")
+    else:
+        os.environ['MONGODB_URI'] = args.uri
+        mongo_service.init_client_pool(uri=args.uri)
+        make_mongo = MongoService
+        print(f"uri: {args.uri}")
+
+    print(f"duration: {args.duration}s  heavy concurrency: {args.heavy_concurrency}")
+    print("-" * 100)
+    app = build_app(make_mongo)
+    try:
+        for mode in ("sync", "async"):
+            report(mode, asyncio.run(run_mode(app, mode, args)), args.duration)
+    finally:
+        shutdown_executor()
+        mongo_service.close_client_pool()
+
+
+if __name__ == '__main__':
+    main()
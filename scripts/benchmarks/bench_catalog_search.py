@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Catalog Search Benchmark - 정규식 $or 검색 vs 역색인 BM25 검색
+
+데이터셋 N개(기본 50,000)로 합성 카탈로그를 만들고 CatalogSearch를
+인덱스 없이(정규식 $or + count + skip, 페이지 안 재정렬) 그리고
+CatalogSearchIndex로 실행해 쿼리별 지연 시간(p50/max)을 비교합니다.
+인덱스 적재 시간과 (--memory) 메모리(tracemalloc 최대치)도 출력합니다.
+
+기본은 문서를 리스트로 보관하는 메모리 컬렉션(시뮬레이션)입니다.
+find/count_documents는 매번 전체 문서를 훑으며($or 정규식, $in, 정렬,
+skip/limit) 인덱스 없는 MongoDB의 COLLSCAN 비용을 흉내 냅니다. 집계는
+지원하지 않으므로 패싯은 --uri(실제 MongoDB bench_catalog 데이터베이스)에서만
+비교합니다.
+
+Usage:
+    python scripts/benchmarks/bench_catalog_search.py
+    python scripts/benchmarks/bench_catalog_search.py --datasets 100000 --repeat 5 --memory
+    python scripts/benchmarks/bench_catalog_search.py --uri mongodb://localhost:27017 --facets
+"""
+
+import sys
+import os
+import re
+import time
+import random
+import argparse
+import statistics
+import tracemalloc
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.app.services.data_catalog import CatalogSearch, CatalogSearchIndex, SortOption  # noqa: E402
+from api.app.services.data_catalog.models import (  # noqa: E402
+    Column,
+    ColumnType,
+    Dataset,
+    DatasetStatus,
+    DatasetType,
+    QualityMetrics,
+)
+
+DOMAINS = ["news", "finance", "commerce", "sports", "weather", "government", "health", "realestate"]
+SUBJECTS = ["articles", "prices", "orders", "scores", "forecast", "notices", "reports", "listings",
+            "comments", "users", "events", "rates"]
+KOREAN = ["뉴스기사", "주가정보", "주문내역", "경기결과", "날씨예보", "공지사항", "건강보고서", "부동산매물",
+          "댓글목록", "사용자정보", "이벤트로그", "환율정보"]
+COLUMNS = ["id", "title", "body", "publishedAt", "price", "created_at", "user_id", "category", "url", "score"]
+QUERIES = ["news", "finance prices", "뉴스기사", "주가", "article", "published", "weather forecast", "rep"]
+
+
+def make_dataset(i, rng):
+    domain = rng.choice(DOMAINS)
+    k = rng.randrange(len(SUBJECTS))
+    score = rng.uniform(30, 100)
+    return Dataset(
+        id="",
+        name=f"{domain}_{SUBJECTS[k]}_{i}",
+        display_name=f"{domain} {SUBJECTS[k]} {i}",
+        description=f"{KOREAN[k]} 데이터 - {domain} {SUBJECTS[k]} collected {rng.choice(['daily', 'hourly', 'weekly'])}",
+        dataset_type=rng.choice(list(DatasetType)),
+        status=rng.choice(list(DatasetStatus)),
+        collection_name=f"{domain}_{SUBJECTS[k]}",
+        columns=[Column(name=name, data_type=ColumnType.STRING) for name in rng.sample(COLUMNS, 4)],
+        tags=rng.sample([domain, SUBJECTS[k], "pii", "raw", "gold", "daily"], 2),
+        domain=domain,
+        quality_metrics=QualityMetrics(score, score, score, score, score, score, overall_score=score),
+        access_count=rng.randrange(1000),
+        created_at=datetime(2024, 1, 1) + timedelta(minutes=i),
+    ).to_dict()
+
+
+def _values(doc, path):
+    values = [doc]
+    for key in path.split("."):
+        nested = []
+        for value in values:
+            value = value.get(key) if isinstance(value, dict) else None
+            nested.extend(value if isinstance(value, list) else [value])
+        values = nested
+    return [v for v in values if v is not None]
+
+
+def _matches(doc, query):
+    for key, cond in query.items():
+        if key == "$or":
+            if not any(_matches(doc, sub) for sub in cond):
+                return False
+        elif key == "$and":
+            if not all(_matches(doc, sub) for sub in cond):
+                return False
+        elif isinstance(cond, dict) and "$regex" in cond:
+            pattern = re.compile(cond["$regex"], re.IGNORECASE if "i" in cond.get("$options", "") else 0)
+            if not any(isinstance(v, str) and pattern.search(v) for v in _values(doc, key)):
+                return False
+        elif isinstance(cond, dict) and "$in" in cond:
+            if not set(_values(doc, key)) & set(cond["$in"]):
+                return False
+        elif cond not in _values(doc, key):
+            return False
+    return True
+
+
+class ScanCursor:
+    def __init__(self, docs):
+        self.docs = docs
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, spec):
+        for key, direction in reversed(spec):
+            self.docs.sort(key=lambda d: (_values(d, key) or [""])[0], reverse=direction < 0)
+        return self
+
+    def skip(self, n):
+        self._skip = n
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def __iter__(self):
+        end = self._skip + self._limit if self._limit else None
+        return iter(self.docs[self._skip:end])
+
+
+class ScanCollection:
+    """매 조회마다 전체 문서를 훑는 컬렉션 (인덱스 없는 COLLSCAN 흉내)"""
+
+    def __init__(self):
+        self.docs = []
+        self.by_id = None
+
+    def insert_many(self, docs):
+        from bson import ObjectId
+        for doc in docs:
+            doc.setdefault("_id", ObjectId())
+            self.docs.append(doc)
+        self.by_id = None
+
+    def delete_many(self, query):
+        self.docs = [d for d in self.docs if query and not _matches(d, query)]
+        self.by_id = None
+
+    def count_documents(self, query):
+        return sum(1 for d in self.docs if _matches(d, query))
+
+    def find(self, query=None, projection=None):
+        query = query or {}
+        if list(query) == ["_id"] and "$in" in query["_id"]:
+            # _id는 인덱스가 있으므로 스캔하지 않음
+            by_id = self.by_id or {d["_id"]: d for d in self.docs}
+            self.by_id = by_id
+            docs = [by_id[i] for i in query["_id"]["$in"] if i in by_id]
+        else:
+            docs = [d for d in self.docs if _matches(d, query)]
+        if projection:
+            docs = [{k: v for k, v in d.items() if k in projection or k == "_id"} for d in docs]
+        return ScanCursor(docs)
+
+
+class ScanMongo:
+    def __init__(self):
+        self.db = _Database(data_catalog=ScanCollection())
+
+
+class _Database(dict):
+    def __getattr__(self, name):
+        return self[name]
+
+
+class UriMongo:
+    def __init__(self, uri):
+        from pymongo import MongoClient
+        self.client = MongoClient(uri, serverSelectionTimeoutMS=5000)
+        self.db = self.client["bench_catalog"]
+
+
+def time_queries(search, queries, repeat, facets):
+    rows = []
+    for query in queries:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = search.search(query, sort_by=SortOption.RELEVANCE, page=2, page_size=20,
+                                   include_facets=facets)
+            samples.append((time.perf_counter() - start) * 1000)
+        rows.append((query, result.total, [d.name for d in result.datasets[:1]], samples))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--datasets', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--queries', nargs='+', default=QUERIES)
+    parser.add_argument('--facets', action='store_true', help='패싯 포함 (--uri 필요)')
+    parser.add_argument('--memory', action='store_true', help='tracemalloc으로 적재 메모리 측정 (느림)')
+    parser.add_argument('--skip-regex', action='store_true', help='인덱스 없는 경로 생략')
+    parser.add_argument('--uri', default=None)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    if args.facets and not args.uri:
+        parser.error("--facets requires --uri")
+
+    mongo = UriMongo(args.uri) if args.uri else ScanMongo()
+    collection = mongo.db.data_catalog
+    if collection.count_documents({}) != args.datasets:
+        collection.delete_many({})
+        rng = random.Random(args.seed)
+        for offset in range(0, args.datasets, 5000):
+            batch = [make_dataset(i, rng) for i in range(offset, min(args.datasets, offset + 5000))]
+            for doc in batch:
+                del doc["_id"]
+            collection.insert_many(batch)
+
+    label = f"uri: {args.uri}" if args.uri else "simulated collection (full scan per query)"
+    print(f"{label}  datasets: {args.datasets:,}  page 2 x 20  facets: {args.facets}  repeat: {args.repeat}")
+    print("-" * 100)
+
+    if args.memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    index = CatalogSearchIndex().load(mongo)
+    load_seconds = time.perf_counter() - start
+    memory = ""
+    if args.memory:
+        memory = f"  peak {tracemalloc.get_traced_memory()[1] / 2**20:7.1f} MiB"
+        tracemalloc.stop()
+    stats = index.get_stats()
+    print(f"index load {load_seconds:6.2f}s{memory}  datasets {stats['datasets']:,}  "
+          f"terms {stats['terms']:,}  postings {stats['postings']:,}")
+    print("-" * 100)
+
+    engines = [("index", CatalogSearch(mongo, index=index))]
+    if not args.skip_regex:
+        engines.insert(0, ("regex", CatalogSearch(mongo)))
+
+    results = {name: time_queries(search, args.queries, args.repeat, args.facets) for name, search in engines}
+    for i, query in enumerate(args.queries):
+        line = f"{query!r:<28}"
+        for name, _ in engines:
+            _, total, top, samples = results[name][i]
+            line += f"  {name} p50 {statistics.median(samples):9.1f}ms max {max(samples):9.1f}ms hits {total:>6,}"
+        print(line)
+
+    if len(engines) == 2:
+        regex = sum(statistics.median(r[3]) for r in results["regex"])
+        indexed = sum(statistics.median(r[3]) for r in results["index"])
+        print("-" * 100)
+        print(f"total p50 regex {regex:9.1f}ms  index {indexed:9.1f}ms  x{regex / indexed:6.1f}")
+        missing = [q for q, r, x in zip(args.queries, results["regex"], results["index"]) if r[1] > x[1]]
+        if missing:
+            print(f"queries with fewer index hits (regex substring vs token/prefix match): {missing}")
+
+
+if __name__ == '__main__':
+    main()
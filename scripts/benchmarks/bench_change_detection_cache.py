@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Change Detection Cache Benchmark - 해시 캐시 유무에 따른 check_batch 비용
+
+같은 소스를 여러 번 연속 크롤링하는 상황(매 실행 ~95% 변경 없음)을
+ChangeDetectionService.check_batch + update_hashes로 재현하고, 캐시 없이
+매번 $in 조회하는 경우와 캐시 사용 시의 소요 시간, content_hashes
+조회/쓰기 문서 수, 히트/미스를 비교합니다.
+
+로컬 mongod가 필요합니다.
+
+Usage:
+    python scripts/benchmarks/bench_change_detection_cache.py
+    python scripts/benchmarks/bench_change_detection_cache.py --records 50000 --runs 10 --changed 0.05
+"""
+
+import sys
+import os
+import time
+import random
+import asyncio
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.app.services.change_detection import ChangeDetectionService  # noqa: E402
+from api.app.services.content_hash_cache import ContentHashCache  # noqa: E402
+
+
+class _BenchMongo:
+    """ChangeDetectionService가 사용하는 mongo.db 인터페이스만 제공"""
+
+    def __init__(self, db):
+        self.db = db
+
+
+def _make_db(uri, database):
+    from pymongo import MongoClient
+    client = MongoClient(uri, serverSelectionTimeoutMS=5000)
+    client.admin.command('ping')
+    db = client[database]
+    db.content_hashes.create_index([('source_id', 1), ('record_id', 1)], unique=True)
+    return db
+
+
+def _make_records(count, run, changed_ratio):
+    rng = random.Random(run)
+    changed = set(rng.sample(range(count), int(count * changed_ratio))) if run else set()
+    return [
+        {
+            'url': f'https://news.example.com/{i}',
+            'title': f'기사 제목 {i}' + (f' (수정 {run})' if i in changed else ''),
+            'content': f'본문 {i} ' * 20,
+        }
+        for i in range(count)
+    ]
+
+
+async def run_scenario(db, use_cache, records, runs, changed_ratio):
+    db.content_hashes.delete_many({'source_id': 'bench'})
+    db.content_hash_versions.delete_many({})
+    cache = ContentHashCache() if use_cache else None
+    service = ChangeDetectionService(_BenchMongo(db), hash_cache=cache, use_cache=use_cache)
+
+    timings = []
+    for run in range(runs):
+        batch = _make_records(records, run, changed_ratio)
+        start = time.perf_counter()
+        result = await service.check_batch('bench', batch)
+        await service.update_hashes('bench', result.new_records + result.modified_records)
+        timings.append(time.perf_counter() - start)
+
+    return timings, service.get_cache_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--uri', default=os.getenv('MONGODB_URI', 'mongodb://localhost:27017'))
+    parser.add_argument('--database', default='bench_change_detection')
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--runs', type=int, default=6)
+    parser.add_argument('--changed', type=float, default=0.05, help='실행마다 변경되는 레코드 비율')
+    args = parser.parse_args()
+
+    db = _make_db(args.uri, args.database)
+    print(f"records: {args.records:,}, runs: {args.runs}, changed per run: {args.changed:.0%}")
+    print("-" * 70)
+
+    for use_cache in (False, True):
+        timings, stats = asyncio.run(run_scenario(db, use_cache, args.records, args.runs, args.changed))
+        label = 'cache' if use_cache else 'no cache'
+        steady = timings[1:] or timings
+        print(f"{label:<9} first {timings[0] * 1000:8.1f}ms  "
+              f"steady avg {sum(steady) / len(steady) * 1000:8.1f}ms")
+        if use_cache:
+            print(f"          hits {stats['hits']}  misses {stats['misses']}  "
+                  f"served {stats['records_served']:,}  writes skipped {stats['writes_skipped']:,}  "
+                  f"version checks {stats['version_checks']}")
+
+    db.client.drop_database(args.database)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Change Stream Benchmark - 이벤트 루프 폴링(이전) vs 읽기 스레드 + 배치 디스패치
+
+ChangeStreamListener의 이전 루프(이벤트 루프에서 try_next, 유휴 시
+asyncio.sleep(0.1), 변경마다 resume token update_one)와 현재 구현(전용
+읽기 스레드 → asyncio 큐, 배치 디스패치, 시간/건수 기준 체크포인트)을
+비교합니다. 두 시나리오를 측정합니다.
+
+- steady: --rate 건/초로 꾸준히 쓰기 → 종단 지연(p50/p99/max)
+- burst: --events 건을 한꺼번에 쓰기 → 처리량(events/s)
+
+기본은 시뮬레이션 커서입니다. getMore마다 --rtt-ms 지연 후 최대
+batch_size건을 돌려주고, 쌓인 변경이 없으면 max_await_time_ms까지
+기다립니다. 토큰 저장도 호출마다 --rtt-ms가 걸립니다.
+--uri를 주면 실제 레플리카셋 mongod(bench_change_stream 데이터베이스)에
+쓰고 watch합니다.
+
+Usage:
+    python scripts/benchmarks/bench_change_stream.py
+    python scripts/benchmarks/bench_change_stream.py --events 20000 --rate 2000 --rtt-ms 0.5
+    python scripts/benchmarks/bench_change_stream.py --uri "mongodb://localhost:27017/?replicaSet=rs0"
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+import statistics
+import threading
+from collections import deque
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.app.services.streaming.change_stream import (  # noqa: E402
+    ChangeStreamConfig,
+    ChangeStreamListener,
+    EventHandler,
+)
+
+COLLECTION = "bench_changes"
+
+
+class LegacyListener(ChangeStreamListener):
+    """이전 _watch_loop (이벤트 루프에서 try_next, 변경마다 토큰 저장)"""
+
+    async def _save_resume_token(self, token, event_id=None):
+        self.db[self.config.resume_token_collection].update_one(
+            {"stream_id": self.stream_id},
+            {"$set": {"token": token, "last_event_id": event_id}},
+            upsert=True
+        )
+        self._checkpoint_count += 1
+
+    async def _watch_loop(self):
+        watch_options = {
+            "full_document": self.config.full_document,
+            "max_await_time_ms": self.config.max_await_time_ms,
+            "batch_size": self.config.batch_size
+        }
+        with self.db.watch(self._build_pipeline(), **watch_options) as stream:
+            while self._running:
+                if self._shutdown_event.is_set():
+                    break
+                change = stream.try_next()
+                if change is None:
+                    await asyncio.sleep(0.1)
+                    continue
+                event = self._transform_change_to_event(change)
+                if event:
+                    await self._dispatch_event(event)
+                    self._processed_count += 1
+                    if self._processed_count % 100 == 0:
+                        await self._save_resume_token(stream.resume_token, event.event_id)
+                await self._save_resume_token(stream.resume_token, event.event_id if event else None)
+
+
+# ==================== 시뮬레이션 커서 ====================
+
+class SimStream:
+    """getMore 왕복 지연과 maxAwaitTimeMS 대기를 흉내 내는 change stream"""
+
+    def __init__(self, batch_size, max_await_ms, rtt):
+        self.batch_size = batch_size
+        self.max_await = max_await_ms / 1000
+        self.rtt = rtt
+        self.oplog = deque()
+        self.cond = threading.Condition()
+        self.buffer = deque()
+        self.resume_token = None
+        self.seq = 0
+
+    def write(self, doc):
+        with self.cond:
+            self.seq += 1
+            self.oplog.append({
+                "_id": {"_data": f"{self.seq:012d}"},
+                "operationType": "insert",
+                "ns": {"db": "bench", "coll": COLLECTION},
+                "documentKey": {"_id": self.seq},
+                "fullDocument": doc,
+            })
+            self.cond.notify()
+
+    def _get_more(self):
+        time.sleep(self.rtt)
+        with self.cond:
+            if not self.oplog:
+                self.cond.wait(self.max_await)
+            while self.oplog and len(self.buffer) < self.batch_size:
+                self.buffer.append(self.oplog.popleft())
+
+    def try_next(self):
+        if not self.buffer:
+            self._get_more()
+        if not self.buffer:
+            return None
+        change = self.buffer.popleft()
+        self.resume_token = change["_id"]
+        return change
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SimTokens:
+    def __init__(self, rtt):
+        self.rtt = rtt
+
+    def find_one(self, query):
+        return None
+
+    def update_one(self, *args, **kwargs):
+        time.sleep(self.rtt)
+
+
+class SimDatabase:
+    def __init__(self, stream, rtt):
+        self.stream = stream
+        self.tokens = SimTokens(rtt)
+
+    def watch(self, pipeline, **options):
+        return self.stream
+
+    def __getitem__(self, name):
+        return self.tokens
+
+
+class SimClient:
+    def __init__(self, db):
+        self.db = db
+
+    def __getitem__(self, name):
+        return self.db
+
+    def close(self):
+        pass
+
+
+# ==================== 측정 ====================
+
+class LatencyHandler(EventHandler):
+    def __init__(self, expected, clock):
+        self.expected = expected
+        self.clock = clock
+        self.latencies = []
+        self.done = asyncio.Event()
+
+    async def handle(self, event):
+        self.latencies.append(self.clock() - event.data["sent_at"])
+        if len(self.latencies) >= self.expected:
+            self.done.set()
+        return True
+
+    async def on_error(self, event, error):
+        pass
+
+
+def make_listener(cls, args, config):
+    listener = cls(config=config, stream_id=f"bench_{cls.__name__}")
+    if args.uri:
+        listener.mongo_uri = args.uri
+        listener.database_name = "bench_change_stream"
+        return listener, lambda doc: listener.db[COLLECTION].insert_one(doc), time.time
+    stream = SimStream(config.batch_size, config.max_await_time_ms, args.rtt_ms / 1000)
+    listener._client = SimClient(SimDatabase(stream, args.rtt_ms / 1000))
+    return listener, stream.write, time.perf_counter
+
+
+def writer(write, clock, count, rate):
+    interval = 1 / rate if rate else 0
+    start = time.perf_counter()
+    for i in range(count):
+        if interval:
+            delay = start + i * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        write({"seq": i, "sent_at": clock()})
+
+
+async def run_case(cls, args, count, rate):
+    config = ChangeStreamConfig(collections=[COLLECTION], batch_size=args.batch_size,
+                                max_await_time_ms=args.max_await_ms)
+    listener, write, clock = make_listener(cls, args, config)
+    if args.uri:
+        listener.db[config.resume_token_collection].delete_many({})
+    handler = LatencyHandler(count, clock)
+    listener.add_handler(handler)
+
+    task = asyncio.create_task(listener.start())
+    await asyncio.sleep(0.5)  # watch 시작 대기
+    start = time.perf_counter()
+    thread = threading.Thread(target=writer, args=(write, clock, count, rate), daemon=True)
+    thread.start()
+    await asyncio.wait_for(handler.done.wait(), timeout=args.timeout)
+    elapsed = time.perf_counter() - start
+    await listener.stop()
+    await asyncio.wait_for(task, timeout=args.timeout)
+    thread.join()
+    listener.close()
+    return elapsed, sorted(handler.latencies), listener.get_stats()["checkpoint_count"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=5000)
+    parser.add_argument('--rate', type=float, default=1000, help='steady 시나리오 쓰기 속도 (건/초)')
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--max-await-ms', type=int, default=1000)
+    parser.add_argument('--rtt-ms', type=float, default=0.3, help='시뮬레이션 왕복 지연')
+    parser.add_argument('--timeout', type=float, default=300)
+    parser.add_argument('--uri', default=None)
+    args = parser.parse_args()
+
+    label = f"uri: {args.uri}" if args.uri else f"simulated cursor  rtt: {args.rtt_ms}ms"
+    print(f"{label}  events: {args.events:,}  batch: {args.batch_size}  max_await: {args.max_await_ms}ms")
+    print("-" * 100)
+
+    for scenario, rate in [("steady", args.rate), ("burst", 0)]:
+        steady_events = min(args.events, int(args.rate * 3)) if rate else args.events
+        for cls in (LegacyListener, ChangeStreamListener):
+            elapsed, latencies, checkpoints = asyncio.run(run_case(cls, args, steady_events, rate))
+            ms = [x * 1000 for x in latencies]
+            name = "legacy" if cls is LegacyListener else "current"
+            print(f"{scenario:<7} {name:<8} {steady_events:>6,} events  {elapsed:7.2f}s  "
+                  f"{steady_events / elapsed:>9,.0f} events/s  latency p50 {statistics.median(ms):7.1f}ms  "
+                  f"p99 {ms[int(len(ms) * 0.99) - 1]:7.1f}ms  max {ms[-1]:7.1f}ms  token writes {checkpoints:>6,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Data Validator Benchmark - 행 단위 규칙 조회(이전) vs 컴파일된 컬럼 단위 평가
+
+--records개 레코드 × --fields개 필드(기본 100,000 × 20)를 DataValidator.
+validate_batch로 검증해 이전 엔진(레코드·필드마다 규칙 목록 복사/필터,
+별도 필드 통계 루프)과 현재 엔진(ValidationPlan, 컬럼 단위 평가와 같은
+패스의 필드 통계)의 시간을 비교하고, 이슈 목록과 필드 통계가 같은지
+확인합니다. 두 엔진은 같은 규칙 구현(rules.py)을 쓰므로 비율은 엔진
+차이만 반영합니다.
+
+프로필은 create_for_source와 같은 방식으로 만듭니다. 필드 종류는
+필수 문자열 / 숫자 범위 / 날짜 / 패턴 / 고유값을 순환하며, --dirty 비율의
+값이 규칙을 위반합니다.
+
+Usage:
+    python scripts/benchmarks/bench_data_validator.py
+    python scripts/benchmarks/bench_data_validator.py --records 20000 --fields 40 --repeat 3
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import statistics
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.app.services.data_quality.validator import DataValidator, ValidationResult  # noqa: E402
+from api.app.services.data_quality.rules import UniqueRule  # noqa: E402
+
+KINDS = ["required", "number", "date", "pattern", "unique"]
+
+
+class LegacyValidator(DataValidator):
+    """이전 엔진 (필드마다 규칙 목록 생성, 행 단위 평가, 별도 통계 루프)"""
+
+    def _get_rules_for_field(self, field_name):
+        rules = list(self.profile.global_rules)
+        if field_name in self.profile.field_rules:
+            rules.extend(self.profile.field_rules[field_name])
+        return [r for r in rules if r.enabled]
+
+    def validate_record(self, record, row_index=None, context=None):
+        issues = []
+        for field_name, value in record.items():
+            for rule in self._get_rules_for_field(field_name):
+                issue = rule.validate(value, field_name, row_index, context)
+                if issue:
+                    issues.append(issue)
+        return issues
+
+    def validate_batch(self, records, source_id, run_id, context=None):
+        all_issues = []
+        field_stats = {}
+        for rules in [self.profile.global_rules, *self.profile.field_rules.values()]:
+            for rule in rules:
+                if isinstance(rule, UniqueRule):
+                    rule.reset()
+
+        for idx, record in enumerate(records):
+            for field_name, value in record.items():
+                if field_name not in field_stats:
+                    field_stats[field_name] = {"total": 0, "null_count": 0, "empty_count": 0,
+                                               "unique_values": set()}
+                stats = field_stats[field_name]
+                stats["total"] += 1
+                if value is None:
+                    stats["null_count"] += 1
+                elif isinstance(value, str) and value.strip() == "":
+                    stats["empty_count"] += 1
+                elif len(stats["unique_values"]) < 10000:
+                    try:
+                        stats["unique_values"].add(str(value)[:100])
+                    except Exception:
+                        pass
+            all_issues.extend(self.validate_record(record, row_index=idx, context=context))
+
+        for stats in field_stats.values():
+            stats["unique_count"] = len(stats["unique_values"])
+            stats["null_rate"] = round(stats["null_count"] / stats["total"] * 100, 2) if stats["total"] > 0 else 0
+            stats["empty_rate"] = round(stats["empty_count"] / stats["total"] * 100, 2) if stats["total"] > 0 else 0
+            del stats["unique_values"]
+
+        return ValidationResult(source_id=source_id, run_id=run_id, total_records=len(records),
+                                validated_at=None, issues=all_issues, field_stats=field_stats)
+
+
+def make_config(fields):
+    specs = []
+    for f in range(fields):
+        kind = KINDS[f % len(KINDS)]
+        spec = {"name": f"{kind}_{f}"}
+        if kind == "required":
+            spec["required"] = True
+        elif kind == "number":
+            spec.update(data_type="number", min_value=0, max_value=1000, allow_negative=False)
+        elif kind == "date":
+            spec["data_type"] = "date"
+        elif kind == "pattern":
+            spec["pattern"] = r"^[A-Z]{2}-\d{4}$"
+        else:
+            spec["unique"] = True
+        specs.append(spec)
+    return {"fields": specs}
+
+
+def make_records(args, rng):
+    records = []
+    for i in range(args.records):
+        record = {}
+        for f in range(args.fields):
+            kind = KINDS[f % len(KINDS)]
+            dirty = rng.random() < args.dirty
+            if kind == "required":
+                value = rng.choice([None, "", "  "]) if dirty else f"기사 제목 {i} - {f}"
+            elif kind == "number":
+                value = rng.choice([-5, 5000, "n/a"]) if dirty else rng.randrange(1000)
+            elif kind == "date":
+                value = rng.choice(["2999-01-01", "31/31/2020"]) if dirty else "2024-03-15"
+            elif kind == "pattern":
+                value = "bad code" if dirty else f"KR-{i % 10000:04d}"
+            else:
+                value = f"id-{i - 1 if dirty and i else i}"
+            record[f"{kind}_{f}"] = value
+        records.append(record)
+    return records
+
+
+def issue_key(issue):
+    return (issue.rule_name, issue.field_name, issue.severity, issue.message,
+            repr(issue.actual_value), issue.expected, issue.row_index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--fields', type=int, default=20)
+    parser.add_argument('--dirty', type=float, default=0.01, help='규칙 위반 값 비율')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    config = make_config(args.fields)
+    records = make_records(args, rng)
+    cells = args.records * args.fields
+
+    print(f"records: {args.records:,}  fields: {args.fields}  cells: {cells:,}  dirty: {args.dirty:.1%}")
+    print("-" * 100)
+
+    results = {}
+    timings = {}
+    for name, cls in [("legacy", LegacyValidator), ("compiled", DataValidator)]:
+        validator = cls.create_for_source(config)
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results[name] = validator.validate_batch(records, "bench", "run")
+            samples.append(time.perf_counter() - start)
+        timings[name] = statistics.median(samples)
+        plan = "" if name == "legacy" else f"  columnar {validator.compile().columnar}"
+        print(f"{name:<9} {timings[name]:7.2f}s  {cells / timings[name]:>11,.0f} cells/s  "
+              f"issues {len(results[name].issues):>7,}{plan}")
+
+    legacy, compiled = results["legacy"], results["compiled"]
+    same_issues = [issue_key(i) for i in legacy.issues] == [issue_key(i) for i in compiled.issues]
+    same_stats = legacy.field_stats == compiled.field_stats
+    print("-" * 100)
+    print(f"speedup x{timings['legacy'] / timings['compiled']:.2f}  "
+          f"identical issues: {same_issues}  identical field stats: {same_stats}")
+
+
+if __name__ == '__main__':
+    main()
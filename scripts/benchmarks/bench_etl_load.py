@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+DataLoader Benchmark - per-record vs bulk_write 적재 비교
+
+Staging 적재 경로(DataLoader.load)를 레코드 단위 모드와
+bulk_write(ordered=False) 배치 모드로 각각 실행해 소요 시간을 비교합니다.
+
+mongomock은 pymongo 4.x의 bulk op(UpdateOne sort 인자)를 지원하지 않으므로
+로컬 mongod가 필요합니다.
+
+Usage:
+    python scripts/benchmarks/bench_etl_load.py
+    python scripts/benchmarks/bench_etl_load.py --uri mongodb://localhost:27017
+    python scripts/benchmarks/bench_etl_load.py --records 50000 --batch-sizes 500 1000 5000
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from airflow.dags.utils.etl_pipeline import DataLoader, LoadConfig  # noqa: E402
+
+
+class _BenchMongo:
+    """DataLoader가 사용하는 mongo.db 인터페이스만 제공"""
+
+    def __init__(self, db):
+        self.db = db
+
+
+def _make_db(uri, database):
+    from pymongo import MongoClient
+    client = MongoClient(uri, serverSelectionTimeoutMS=5000)
+    client.admin.command('ping')
+    return client[database]
+
+
+def _make_records(count):
+    return [
+        {
+            'title': f'기사 제목 {i}',
+            'content': '본문 ' * 40,
+            'url': f'https://news.example.com/{i}',
+            'content_hash': f'hash-{i:08d}',
+            '_data_date': '2026-01-01',
+        }
+        for i in range(count)
+    ]
+
+
+def run_load(db, records, bulk, batch_size):
+    db.drop_collection('staging_news')
+    config = LoadConfig(
+        collection_name='news_articles',
+        upsert_key=['content_hash'],
+        bulk_write=bulk,
+        batch_size=batch_size,
+    )
+    loader = DataLoader(_BenchMongo(db), config, use_staging=True)
+
+    start = time.perf_counter()
+    result = asyncio.run(loader.load(records, 'bench_source'))
+    elapsed = time.perf_counter() - start
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--uri', default=os.getenv('MONGODB_URI', 'mongodb://localhost:27017'))
+    parser.add_argument('--database', default='bench_etl_load')
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[100, 1000, 5000])
+    args = parser.parse_args()
+
+    db = _make_db(args.uri, args.database)
+    print(f"URI: {args.uri}, records: {args.records}")
+    print("-" * 60)
+
+    elapsed, result = run_load(db, _make_records(args.records), bulk=False, batch_size=0)
+    baseline = elapsed
+    print(f"per-record           {elapsed:8.2f}s  {args.records / elapsed:10.0f} rec/s  loaded={result['loaded']}")
+
+    for batch_size in args.batch_sizes:
+        elapsed, result = run_load(db, _make_records(args.records), bulk=True, batch_size=batch_size)
+        batch_ms = [b['elapsed_ms'] for b in result['batches']]
+        avg_batch = sum(batch_ms) / len(batch_ms) if batch_ms else 0
+        print(
+            f"bulk batch={batch_size:<6}   {elapsed:8.2f}s  {args.records / elapsed:10.0f} rec/s  "
+            f"loaded={result['loaded']}  avg_batch={avg_batch:.1f}ms  speedup={baseline / elapsed:.1f}x"
+        )
+
+    db.drop_collection('staging_news')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Event Broker Benchmark - 토픽별 소비자 수 / 마이크로 배치별 처리량 (events/s)
+
+EventProcessor + InMemoryBroker로 DATA_CREATED 이벤트를 emit_batch로 넣고
+모두 처리될 때까지의 처리량을 설정별로 비교합니다. 핸들러 구성:
+
+- fast: 모든 이벤트, 대기 없음 (메트릭 집계)
+- slow: --slow-ratio 비율의 이벤트에서 --slow-ms 대기 (웹훅 흉내)
+- persist: 이벤트 저장. 배치가 아니면 이벤트마다 insert_one,
+  배치면 배치마다 insert_many 한 번 (호출당 --rtt-ms 대기)
+
+대기는 asyncio.sleep이므로 실제 MongoDB/HTTP 지연의 시뮬레이션입니다.
+
+Usage:
+    python scripts/benchmarks/bench_event_broker.py
+    python scripts/benchmarks/bench_event_broker.py --events 20000 --sources 500 --consumers 1 4 16
+"""
+
+import sys
+import os
+import time
+import random
+import asyncio
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.app.services.streaming import (  # noqa: E402
+    BatchEventHandler,
+    DataEvent,
+    EventProcessor,
+    EventType,
+    InMemoryBroker,
+)
+
+
+class SlowCollection:
+    """호출마다 왕복 지연을 흉내 내는 컬렉션"""
+
+    def __init__(self, rtt_ms):
+        self.rtt = rtt_ms / 1000
+        self.calls = 0
+        self.docs = 0
+
+    async def insert(self, count):
+        self.calls += 1
+        self.docs += count
+        await asyncio.sleep(self.rtt)
+
+
+class Persist(BatchEventHandler):
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def handle(self, event):
+        await self.collection.insert(1)
+        return True
+
+    async def handle_batch(self, events):
+        await self.collection.insert(len(events))
+        return len(events)
+
+    async def on_error(self, event, error):
+        pass
+
+
+def make_events(args):
+    rng = random.Random(args.seed)
+    return [
+        DataEvent(
+            event_type=EventType.DATA_CREATED,
+            source_id=f"source_{rng.randrange(args.sources)}",
+            collection="staging_data",
+            data={"seq": i, "slow": rng.random() < args.slow_ratio},
+        )
+        for i in range(args.events)
+    ]
+
+
+async def run_case(args, consumers, batch_size, batch_handlers):
+    broker = InMemoryBroker(
+        max_queue_size=args.events,
+        consumers_per_topic=consumers,
+        max_batch_size=batch_size,
+        max_linger_ms=args.linger_ms,
+    )
+    processor = EventProcessor(broker=broker)
+    collection = SlowCollection(args.rtt_ms)
+    persist = Persist(collection)
+    counts = {"fast": 0}
+
+    async def fast(event):
+        counts["fast"] += 1
+
+    async def slow(event):
+        if event.data["slow"]:
+            await asyncio.sleep(args.slow_ms / 1000)
+
+    processor.register_handler(EventType.DATA_CREATED, fast)
+    processor.register_handler(EventType.DATA_CREATED, slow)
+    if batch_handlers:
+        processor.register_batch_handler(EventType.DATA_CREATED, persist)
+    else:
+        processor.register_handler(EventType.DATA_CREATED, persist.handle)
+
+    events = make_events(args)
+    await processor.start()
+    start = time.perf_counter()
+    await processor.emit_batch(events)
+    await broker.join()
+    elapsed = time.perf_counter() - start
+    stats = broker.get_stats()
+    await processor.stop()
+
+    assert counts["fast"] == collection.docs == len(events)
+    return elapsed, collection.calls, stats["avg_batch_size"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=5000)
+    parser.add_argument('--sources', type=int, default=200)
+    parser.add_argument('--consumers', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 100])
+    parser.add_argument('--linger-ms', type=float, default=0)
+    parser.add_argument('--slow-ratio', type=float, default=0.02)
+    parser.add_argument('--slow-ms', type=float, default=20)
+    parser.add_argument('--rtt-ms', type=float, default=0.5, help='저장 호출당 지연')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"simulated handlers  events: {args.events:,}  sources: {args.sources}  "
+          f"slow: {args.slow_ratio:.0%} x {args.slow_ms}ms  persist rtt: {args.rtt_ms}ms  linger: {args.linger_ms}ms")
+    print("-" * 100)
+
+    baseline = None
+    for consumers in args.consumers:
+        for batch_size in args.batch_sizes:
+            for batch_handlers in ([False, True] if batch_size > 1 else [False]):
+                elapsed, calls, avg_batch = asyncio.run(run_case(args, consumers, batch_size, batch_handlers))
+                rate = args.events / elapsed
+                baseline = baseline or rate
+                persist = "insert_many" if batch_handlers else "insert_one "
+                print(f"consumers {consumers:>3}  batch {batch_size:>4}  {persist}  {elapsed:7.2f}s  "
+                      f"{rate:>9,.0f} events/s  x{rate / baseline:6.1f}  persist calls {calls:>6,}  "
+                      f"avg batch {avg_batch:6.1f}")
+
+
+if __name__ == '__main__':
+    main()
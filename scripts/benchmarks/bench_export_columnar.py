@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Columnar Export Benchmark - CSV vs Parquet vs Arrow IPC
+
+같은 데이터를 ExportService로 CSV(선택적으로 gzip), Parquet, Arrow IPC
+파일로 내보내며 쓰기 시간, 파일 크기, 그리고 다운스트림 적재 시간
+(pandas.read_csv / pyarrow 읽기 후 to_pandas)을 비교합니다.
+
+문서는 bench_export_csv의 메모리 컬렉션에서 _id 순서로 생성합니다.
+
+Usage:
+    python scripts/benchmarks/bench_export_columnar.py
+    python scripts/benchmarks/bench_export_columnar.py --docs 500000 --fields id source_id status record_count
+"""
+
+import sys
+import os
+import gzip
+import time
+import shutil
+import argparse
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pandas as pd  # noqa: E402
+import pyarrow as pa  # noqa: E402
+import pyarrow.parquet as pq  # noqa: E402
+
+from api.app.services.export_service import ExportService  # noqa: E402
+
+from scripts.benchmarks.bench_export_csv import COLLECTION, LazyMongo  # noqa: E402
+
+
+def write_csv(service, path, args, compress):
+    with open(path, 'wb') as raw:
+        out = gzip.open(raw, 'wb', compresslevel=6) if compress else raw
+        for chunk in service.stream_csv(COLLECTION, {}, args.fields, "utf-8", batch_size=10000, limit=args.docs):
+            out.write(chunk)
+        if compress:
+            out.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--docs', type=int, default=200000)
+    parser.add_argument('--fields', nargs='*', default=None)
+    args = parser.parse_args()
+
+    service = ExportService(LazyMongo(args.docs))
+    print(f"simulated collection  docs: {args.docs:,}  fields: {args.fields or 'all'}  pyarrow {pa.__version__}")
+    print("-" * 100)
+
+    tmp = tempfile.mkdtemp()
+    try:
+        cases = [
+            ("csv", "out.csv", lambda p: write_csv(service, p, args, False),
+             lambda p: pd.read_csv(p)),
+            ("csv.gz", "out.csv.gz", lambda p: write_csv(service, p, args, True),
+             lambda p: pd.read_csv(p)),
+            ("parquet", "out.parquet", lambda p: service.write_columnar(COLLECTION, {}, p, "parquet", args.fields, args.docs),
+             lambda p: pq.read_table(p).to_pandas()),
+            ("arrow", "out.arrow", lambda p: service.write_columnar(COLLECTION, {}, p, "arrow", args.fields, args.docs),
+             lambda p: pa.ipc.open_file(pa.memory_map(p)).read_all().to_pandas()),
+        ]
+        baseline = None
+        for label, name, write, load in cases:
+            path = os.path.join(tmp, name)
+            start = time.perf_counter()
+            write(path)
+            write_seconds = time.perf_counter() - start
+            size = os.path.getsize(path)
+            start = time.perf_counter()
+            frame = load(path)
+            load_seconds = time.perf_counter() - start
+            baseline = baseline or (size, load_seconds)
+            print(f"{label:<8} write {write_seconds:7.2f}s  size {size / 2**20:8.1f} MiB ({size / baseline[0]:5.2f}x)  "
+                  f"load {load_seconds:6.2f}s ({load_seconds / baseline[1]:5.2f}x)  rows {len(frame):,}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+CSV Export Benchmark - skip/limit 페이지네이션 vs _id 키셋 페이지네이션
+
+ExportService.stream_csv의 이전 구현(find_one으로 헤더 결정 후
+.skip(skip).limit(batch_size) 반복, 전체 문서 조회)과 현재 구현
+(_id > 마지막 _id 키셋 + fields 기반 projection)으로 같은 데이터를
+내보내며 시간과 MongoDB 작업량(훑은 문서 수)을 비교합니다.
+
+기본은 문서를 필요할 때 생성하는 메모리 컬렉션이며, 서버 작업량은
+훑은 문서 수로 집계하고 --scan-ns(문서당 스캔 비용)로 추정 서버
+시간을 계산합니다. --uri를 주면 실제 MongoDB에 bench_export 컬렉션을
+만들어 측정하고 serverStatus의 scannedObjects 증가량을 보고합니다.
+
+Usage:
+    python scripts/benchmarks/bench_export_csv.py
+    python scripts/benchmarks/bench_export_csv.py --docs 1000000 --fields id status record_count
+    python scripts/benchmarks/bench_export_csv.py --uri mongodb://localhost:27017 --docs 200000
+"""
+
+import sys
+import os
+import io
+import csv
+import time
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bson import ObjectId  # noqa: E402
+
+from api.app.services.export_service import ExportService  # noqa: E402
+
+COLLECTION = "bench_export"
+
+
+def make_doc(i):
+    return {
+        "_id": ObjectId(i.to_bytes(12, "big")),
+        "source_id": ObjectId((i % 50).to_bytes(12, "big")),
+        "status": "success" if i % 10 else "failed",
+        "record_count": i % 500,
+        "execution_time_ms": (i * 7) % 3000,
+        "data": {"title": f"기사 제목 {i}", "content": "본문 " * 60, "url": f"https://news.example.com/{i}"},
+    }
+
+
+class LazyCursor:
+    def __init__(self, collection, start, projection):
+        self.collection = collection
+        self.start = start
+        self.projection = projection
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, key, direction=1):
+        return self  # _id 순서로 생성
+
+    def skip(self, n):
+        self._skip = n
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def __iter__(self):
+        first = self.start + self._skip
+        end = min(self.collection.count, first + self._limit) if self._limit else self.collection.count
+        # skip한 문서도 서버가 훑어야 함
+        self.collection.examined += self._skip + max(0, end - first)
+        self.collection.round_trips += 1
+        keys = {path.split(".")[0] for path in self.projection} if self.projection else None
+        for i in range(first, end):
+            doc = make_doc(i)
+            yield {k: v for k, v in doc.items() if k in keys} if keys else doc
+
+
+class LazyCollection:
+    """_id 순서로 문서를 생성하는 컬렉션 ({} 또는 {"_id": {"$gt": ...}} 조회만 지원)"""
+
+    def __init__(self, count):
+        self.count = count
+        self.examined = 0
+        self.round_trips = 0
+
+    def find(self, query, projection=None):
+        start = 0
+        if "_id" in query:
+            # _id 인덱스 범위 스캔
+            start = int.from_bytes(query["_id"]["$gt"].binary, "big") + 1
+        return LazyCursor(self, start, projection)
+
+    def find_one(self, query, projection=None):
+        return next(iter(self.find(query, projection).limit(1)), None)
+
+
+class LazyMongo:
+    def __init__(self, count):
+        self.db = {COLLECTION: LazyCollection(count)}
+
+
+class LegacyExportService(ExportService):
+    """이전 stream_csv (find_one 헤더 + skip/limit, projection 없음)"""
+
+    def stream_csv(self, collection, query, fields=None, encoding="utf-8-sig", batch_size=1000, limit=100000):
+        first_doc = self.mongo.db[collection].find_one(query)
+        if not first_doc:
+            yield "No data found\n".encode(encoding)
+            return
+        headers = fields if fields else self._get_document_headers(first_doc)
+        output = io.StringIO()
+        writer = csv.writer(output, quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(headers)
+        yield output.getvalue().encode(encoding)
+        output.seek(0)
+        output.truncate(0)
+
+        skip = 0
+        total_exported = 0
+        while total_exported < limit:
+            current_batch_size = min(batch_size, limit - total_exported)
+            documents = list(self.mongo.db[collection].find(query).skip(skip).limit(current_batch_size))
+            if not documents:
+                break
+            for doc in documents:
+                writer.writerow(self._document_to_row(doc, headers))
+            yield output.getvalue().encode(encoding)
+            output.seek(0)
+            output.truncate(0)
+            total_exported += len(documents)
+            skip += len(documents)
+
+
+def scanned_objects(db):
+    return db.client.admin.command("serverStatus")["metrics"]["queryExecutor"]["scannedObjects"]
+
+
+def run(service, args, work):
+    start = time.perf_counter()
+    size = 0
+    for chunk in service.stream_csv(COLLECTION, {}, args.fields, batch_size=args.batch_size, limit=args.docs):
+        size += len(chunk)
+    return time.perf_counter() - start, size, work()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--docs', type=int, default=1000000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--fields', nargs='*', default=None)
+    parser.add_argument('--scan-ns', type=float, default=250.0, help='추정 서버 시간용 문서당 스캔 비용')
+    parser.add_argument('--uri', default=None)
+    args = parser.parse_args()
+
+    if args.uri:
+        from pymongo import MongoClient
+        db = MongoClient(args.uri, serverSelectionTimeoutMS=5000)["bench_export"]
+        if db[COLLECTION].estimated_document_count() != args.docs:
+            db.drop_collection(COLLECTION)
+            for offset in range(0, args.docs, 10000):
+                db[COLLECTION].insert_many([make_doc(i) for i in range(offset, min(args.docs, offset + 10000))])
+
+        class Mongo:
+            pass
+
+        mongo = Mongo()
+        mongo.db = db
+        print(f"uri: {args.uri}  docs: {args.docs:,}  batch: {args.batch_size}  fields: {args.fields or 'all'}")
+    else:
+        mongo = LazyMongo(args.docs)
+        print(f"simulated collection  docs: {args.docs:,}  batch: {args.batch_size}  fields: {args.fields or 'all'}  "
+              f"scan cost: {args.scan_ns}ns/doc")
+    print("-" * 100)
+
+    for label, cls in (("skip/limit", LegacyExportService), ("keyset", ExportService)):
+        service = cls(mongo)
+        if args.uri:
+            before = scanned_objects(mongo.db)
+            elapsed, size, examined = run(service, args, lambda: scanned_objects(mongo.db) - before)
+            print(f"{label:<11} {elapsed:8.2f}s  {size / 2**20:8.1f} MiB  scanned objects {examined:>15,}")
+        else:
+            coll = mongo.db[COLLECTION]
+            coll.examined = coll.round_trips = 0
+            elapsed, size, examined = run(service, args, lambda: coll.examined)
+            server = examined * args.scan_ns / 1e9
+            print(f"{label:<11} client {elapsed:8.2f}s  {size / 2**20:8.1f} MiB  "
+                  f"docs examined {examined:>15,}  est. server {server:9.1f}s  total {elapsed + server:9.1f}s")
+
+
+if __name__ == '__main__':
+    main()
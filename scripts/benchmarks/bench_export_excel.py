@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Excel Export Benchmark - 일반 워크북 vs write-only 스트리밍
+
+ExportService.generate_excel의 이전 구현(list(cursor)로 전체 적재 후
+셀 단위로 워크북 구성, 셀을 다시 읽어 열 너비 계산)과 현재 write_excel
+(write-only 워크시트에 배치 단위로 바로 기록)로 같은 행 수를 파일로
+내보내며 시간과 파이썬 메모리 최고치(tracemalloc)를 비교합니다.
+tracemalloc이 실행을 크게 느리게 하므로 시간과 메모리는 따로 실행해 잽니다.
+이전 구현의 작업 건수 계산용 재조회(len(list(cursor)))도 포함합니다.
+
+문서는 bench_export_csv의 메모리 컬렉션에서 필요할 때 생성합니다.
+
+Usage:
+    python scripts/benchmarks/bench_export_excel.py
+    python scripts/benchmarks/bench_export_excel.py --rows 200000 --fields id status record_count data
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.app.services.export_service import ExportService  # noqa: E402
+
+from scripts.benchmarks.bench_export_csv import COLLECTION, LazyMongo  # noqa: E402
+
+
+def legacy_excel_export(service, query, fields, limit, file_path):
+    """이전 _process_excel_export (generate_excel + 건수 재조회)"""
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.utils import get_column_letter
+
+    documents = list(service.mongo.db[COLLECTION].find(query).limit(limit))
+    headers = fields if fields else service._get_document_headers(documents[0])
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for col_idx, header in enumerate(headers, 1):
+        cell = ws.cell(row=1, column=col_idx, value=header)
+        cell.font = Font(bold=True, color="FFFFFF")
+        cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        cell.alignment = Alignment(horizontal="center", vertical="center")
+    for row_idx, doc in enumerate(documents, 2):
+        for col_idx, value in enumerate(service._document_to_row(doc, headers), 1):
+            ws.cell(row=row_idx, column=col_idx, value=value)
+    for col_idx, header in enumerate(headers, 1):
+        max_length = len(str(header))
+        for row_idx in range(2, min(102, len(documents) + 2)):
+            cell_value = ws.cell(row=row_idx, column=col_idx).value
+            if cell_value:
+                max_length = max(max_length, min(len(str(cell_value)), 50))
+        ws.column_dimensions[get_column_letter(col_idx)].width = max_length + 2
+    ws.freeze_panes = "A2"
+    wb.save(file_path)
+    return len(list(service.mongo.db[COLLECTION].find(query).limit(limit)))
+
+
+def measure(func, trace):
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    rows = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if trace else 0
+    tracemalloc.stop()
+    return rows, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--fields', nargs='*', default=None)
+    parser.add_argument('--skip-memory', action='store_true', help='tracemalloc 측정 생략')
+    args = parser.parse_args()
+
+    print(f"rows: {args.rows:,}  fields: {args.fields or 'all'}")
+    print("-" * 100)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in ("workbook", "write-only"):
+            results = []
+            for trace in (False,) if args.skip_memory else (False, True):
+                mongo = LazyMongo(args.rows)
+                service = ExportService(mongo)
+                path = os.path.join(tmp, f"{label}.xlsx")
+                if label == "workbook":
+                    run = lambda: legacy_excel_export(service, {}, args.fields, args.rows, path)  # noqa: E731
+                else:
+                    run = lambda: service.write_excel(COLLECTION, {}, path, args.fields, limit=args.rows)  # noqa: E731
+                results.append(measure(run, trace))
+            rows, elapsed, _ = results[0]
+            peak = results[-1][2]
+            print(f"{label:<11} {elapsed:8.1f}s  {rows / elapsed:9,.0f} rows/s  peak memory {peak / 2**20:9.1f} MiB  "
+                  f"file {os.path.getsize(path) / 2**20:7.1f} MiB  docs examined {mongo.db[COLLECTION].examined:,}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Export Worker Benchmark - 파티션 병렬 내보내기 처리량 (워커 수별)
+
+ExportWorker로 같은 컬렉션을 워커 수(기본 1/2/4/8)와 실행 방식
+(스레드/프로세스)을 바꿔 가며 CSV(선택적으로 gzip)로 내보내고
+처리량(records/s), 1워커 대비 배율, 진행률 기록 횟수를 비교합니다.
+
+기본은 문서를 필요할 때 생성하는 메모리 컬렉션(_id 범위 조회,
+$and, $sample 지원)이며 --rtt-ms로 배치 조회마다 네트워크/서버 지연을
+흉내 냅니다(sleep이므로 GIL을 놓음). --uri를 주면 실제 MongoDB의
+bench_export 컬렉션을 사용합니다.
+
+Usage:
+    python scripts/benchmarks/bench_export_worker.py
+    python scripts/benchmarks/bench_export_worker.py --docs 500000 --rtt-ms 2 --compression gzip
+    python scripts/benchmarks/bench_export_worker.py --uri mongodb://localhost:27017 --workers 1 4 8
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import tempfile
+from functools import partial
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bson import ObjectId  # noqa: E402
+
+from api.app.services.export_worker import ExportWorker  # noqa: E402
+
+from scripts.benchmarks.bench_export_csv import COLLECTION, make_doc  # noqa: E402
+
+
+def _index(oid):
+    return int.from_bytes(oid.binary, "big")
+
+
+class RangeCursor:
+    def __init__(self, collection, start, end, projection):
+        self.collection = collection
+        self.start = start
+        self.end = end
+        self.projection = projection
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, key, direction=1):
+        return self  # _id 순서로 생성
+
+    def skip(self, n):
+        self._skip = n
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def __iter__(self):
+        self.collection.trip()
+        first = self.start + self._skip
+        end = min(self.end, first + self._limit) if self._limit else self.end
+        keys = {path.split(".")[0] for path in self.projection} if self.projection else None
+        for i in range(first, end):
+            doc = make_doc(i)
+            yield {k: v for k, v in doc.items() if k in keys} if keys else doc
+
+
+class RangeCollection:
+    """_id 순서로 문서를 생성하는 컬렉션 (_id 범위 조건과 $and만 지원)"""
+
+    def __init__(self, count, rtt_ms=0.0):
+        self.count = count
+        self.rtt = rtt_ms / 1000
+
+    def trip(self):
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    def _range(self, query):
+        start, end = 0, self.count
+        for key, cond in query.items():
+            if key == "$and":
+                for sub in cond:
+                    lo, hi = self._range(sub)
+                    start, end = max(start, lo), min(end, hi)
+            elif key == "_id":
+                for op, value in cond.items():
+                    i = _index(value)
+                    if op == "$gt":
+                        start = max(start, i + 1)
+                    elif op == "$gte":
+                        start = max(start, i)
+                    elif op == "$lt":
+                        end = min(end, i)
+                    elif op == "$lte":
+                        end = min(end, i + 1)
+            else:
+                raise ValueError(f"unsupported query field: {key}")
+        return start, max(start, end)
+
+    def find(self, query, projection=None):
+        start, end = self._range(query)
+        return RangeCursor(self, start, end, projection)
+
+    def find_one(self, query, projection=None):
+        return next(iter(self.find(query, projection).limit(1)), None)
+
+    def count_documents(self, query):
+        start, end = self._range(query)
+        return end - start
+
+    def aggregate(self, pipeline):
+        self.trip()
+        start, end = self._range(pipeline[0]["$match"])
+        size = min(pipeline[1]["$sample"]["size"], end - start)
+        return [{"_id": ObjectId(i.to_bytes(12, "big"))} for i in random.sample(range(start, end), size)]
+
+
+class CountingJobs:
+    def __init__(self):
+        self.updates = 0
+
+    def update_one(self, query, update):
+        self.updates += 1
+
+
+class BenchMongo:
+    def __init__(self, count, rtt_ms=0.0):
+        self.db = _Database({COLLECTION: RangeCollection(count, rtt_ms), "export_jobs": CountingJobs()})
+
+
+class _Database(dict):
+    def __getattr__(self, name):
+        return self[name]
+
+
+class UriMongo:
+    def __init__(self, uri):
+        from pymongo import MongoClient
+        self.client = MongoClient(uri, serverSelectionTimeoutMS=5000)
+        self.db = self.client["bench_export"]
+
+    def close(self):
+        self.client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--docs', type=int, default=200000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--modes', nargs='+', default=['thread', 'process'], choices=['thread', 'process'])
+    parser.add_argument('--fields', nargs='*', default=None)
+    parser.add_argument('--compression', default=None, choices=['gzip', 'zstd'])
+    parser.add_argument('--rtt-ms', type=float, default=1.0, help='배치 조회당 지연 (메모리 컬렉션)')
+    parser.add_argument('--uri', default=None)
+    args = parser.parse_args()
+
+    if args.uri:
+        factory = partial(UriMongo, args.uri)
+        mongo = factory()
+        mongo.db.export_jobs.delete_many({"_id": "bench"})
+        if mongo.db[COLLECTION].estimated_document_count() != args.docs:
+            mongo.db.drop_collection(COLLECTION)
+            for offset in range(0, args.docs, 10000):
+                mongo.db[COLLECTION].insert_many([make_doc(i) for i in range(offset, min(args.docs, offset + 10000))])
+        print(f"uri: {args.uri}  docs: {args.docs:,}  fields: {args.fields or 'all'}  "
+              f"compression: {args.compression}  cpus: {os.cpu_count()}")
+    else:
+        factory = partial(BenchMongo, args.docs, args.rtt_ms)
+        mongo = factory()
+        print(f"simulated collection  docs: {args.docs:,}  rtt: {args.rtt_ms}ms/batch  "
+              f"fields: {args.fields or 'all'}  compression: {args.compression}  cpus: {os.cpu_count()}")
+    print("-" * 100)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in args.modes:
+            baseline = None
+            for workers in args.workers:
+                worker = ExportWorker(
+                    mongo, max_workers=workers, use_processes=mode == 'process',
+                    mongo_factory=factory, min_partition_records=0
+                )
+                path = os.path.join(tmp, f"{mode}{workers}.csv")
+                updates = getattr(mongo.db.export_jobs, "updates", 0)
+                start = time.perf_counter()
+                count = worker.run("bench", COLLECTION, "csv", {}, args.fields, args.docs, "utf-8-sig",
+                                   path, compression=args.compression, total_records=args.docs)
+                elapsed = time.perf_counter() - start
+                rate = count / elapsed
+                baseline = baseline or rate
+                writes = getattr(mongo.db.export_jobs, "updates", 0) - updates
+                print(f"{mode:<8} workers {workers:>2}  {elapsed:8.2f}s  {rate:>10,.0f} records/s  "
+                      f"x{rate / baseline:5.2f}  {os.path.getsize(path) / 2**20:8.1f} MiB  "
+                      f"progress writes {writes}")
+                os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Incremental Dedup Benchmark - 1M 이벤트 스트림 중복 체크 처리량
+
+이전 구현(리스트 윈도우 + 레코드마다 find_one/insert_one)과 현재
+IncrementalDeduplicator의 is_duplicate(윈도우 + Bloom), is_duplicate_many
+(배치당 $in 한 번 + insert_many 한 번)를 비교합니다.
+
+dedup_hashes는 메모리 가짜 컬렉션이며 --rtt-ms로 왕복당 지연을 더할 수
+있습니다 (기본 0: 순수 CPU 비용, DB 왕복 수는 따로 출력). 이전 구현은
+리스트 윈도우 탐색이 O(window)라 --legacy-events만큼만 실행합니다.
+
+Usage:
+    python scripts/benchmarks/bench_incremental_dedup.py
+    python scripts/benchmarks/bench_incremental_dedup.py --events 1000000 --batch-size 1000 --rtt-ms 0.2
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+from datetime import datetime
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from pymongo.errors import BulkWriteError  # noqa: E402
+
+from api.app.services.fingerprint import get_fingerprinter  # noqa: E402
+from api.app.services.idempotency.deduplicator import (  # noqa: E402
+    DEDUP_DIGEST_SIZE,
+    DeduplicationConfig,
+    IncrementalDeduplicator,
+)
+
+
+class MemoryCollection:
+    """dedup_hashes 가짜 컬렉션 (왕복 수 집계, 선택적 지연)"""
+
+    def __init__(self, rtt_ms=0.0):
+        self.docs = set()
+        self.round_trips = 0
+        self.rtt = rtt_ms / 1000
+
+    def _trip(self):
+        self.round_trips += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    def find(self, query, projection=None):
+        self._trip()
+        source_id = query["source_id"]
+        hashes = query.get("hash", {}).get("$in")
+        if hashes is None:
+            return [{"hash": h} for s, h in self.docs if s == source_id]
+        return [{"hash": h} for h in hashes if (source_id, h) in self.docs]
+
+    def find_one(self, query):
+        self._trip()
+        key = (query["source_id"], query["hash"])
+        return {"hash": key[1]} if key in self.docs else None
+
+    def insert_one(self, doc):
+        self._trip()
+        self.docs.add((doc["source_id"], doc["hash"]))
+
+    def insert_many(self, docs, ordered=True):
+        self._trip()
+        errors = []
+        for i, doc in enumerate(docs):
+            key = (doc["source_id"], doc["hash"])
+            if key in self.docs:
+                errors.append({"index": i, "code": 11000})
+            self.docs.add(key)
+        if errors:
+            raise BulkWriteError({"writeErrors": errors})
+
+    def create_index(self, keys, **kwargs):
+        self._trip()
+
+
+class LegacyIncrementalDeduplicator:
+    """이전 구현 (리스트 윈도우, 레코드마다 DB 왕복)"""
+
+    def __init__(self, collection, window_size):
+        self.collection = collection
+        self.window_size = window_size
+        self._recent_hashes = []
+        self._fingerprinter = get_fingerprinter(("url",), digest_size=DEDUP_DIGEST_SIZE)
+
+    def is_duplicate(self, record, source_id):
+        record_hash = self._fingerprinter(record)
+        if record_hash in self._recent_hashes:
+            return True
+        if self.collection.find_one({"source_id": source_id, "hash": record_hash}):
+            return True
+        self.collection.insert_one({"source_id": source_id, "hash": record_hash, "created_at": datetime.utcnow()})
+        self._recent_hashes.append(record_hash)
+        if len(self._recent_hashes) > self.window_size:
+            self._recent_hashes.pop(0)
+        return False
+
+
+def make_events(count, sources, dup_ratio, seed=0):
+    """(source_id, record) 스트림: dup_ratio 비율로 과거 이벤트 재전송"""
+    rng = random.Random(seed)
+    events = []
+    for i in range(count):
+        if events and rng.random() < dup_ratio:
+            # 절반은 최근(윈도우 안), 절반은 오래된 이벤트
+            back = rng.randint(1, 1000) if rng.random() < 0.5 else rng.randint(1, len(events))
+            events.append(events[max(0, len(events) - back)])
+        else:
+            events.append((f"source_{rng.randrange(sources)}", {"url": f"https://news.example.com/{i}"}))
+    return events
+
+
+def run_legacy(events, args):
+    collection = MemoryCollection(args.rtt_ms)
+    dedup = LegacyIncrementalDeduplicator(collection, args.window)
+    start = time.perf_counter()
+    duplicates = sum(dedup.is_duplicate(record, source_id) for source_id, record in events)
+    return time.perf_counter() - start, duplicates, collection.round_trips
+
+
+def make_dedup(collection, args):
+    mongo = SimpleNamespace(db={IncrementalDeduplicator.COLLECTION_NAME: collection})
+    return IncrementalDeduplicator(mongo, DeduplicationConfig(key_fields=["url"]), window_size=args.window)
+
+
+def run_single(events, args):
+    collection = MemoryCollection(args.rtt_ms)
+    dedup = make_dedup(collection, args)
+    start = time.perf_counter()
+    duplicates = sum(dedup.is_duplicate(record, source_id) for source_id, record in events)
+    return time.perf_counter() - start, duplicates, collection.round_trips
+
+
+def run_batched(events, args):
+    collection = MemoryCollection(args.rtt_ms)
+    dedup = make_dedup(collection, args)
+    start = time.perf_counter()
+    duplicates = 0
+    for offset in range(0, len(events), args.batch_size):
+        # 스트림 배치를 소스별로 나눠 처리
+        by_source = {}
+        for source_id, record in events[offset:offset + args.batch_size]:
+            by_source.setdefault(source_id, []).append(record)
+        for source_id, records in by_source.items():
+            duplicates += sum(dedup.is_duplicate_many(records, source_id))
+    return time.perf_counter() - start, duplicates, collection.round_trips, dedup.get_stats()
+
+
+def report(label, events, elapsed, duplicates, round_trips):
+    print(f"{label:<28} {events:>9,} events  {elapsed:8.2f}s  {events / elapsed:>10,.0f} ev/s"
+          f"  dups {duplicates:>8,}  db round trips {round_trips:>9,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=1000000)
+    parser.add_argument('--legacy-events', type=int, default=100000)
+    parser.add_argument('--sources', type=int, default=10)
+    parser.add_argument('--dup-ratio', type=float, default=0.2)
+    parser.add_argument('--window', type=int, default=10000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--rtt-ms', type=float, default=0.0)
+    args = parser.parse_args()
+
+    events = make_events(args.events, args.sources, args.dup_ratio)
+    print(f"window: {args.window:,}  sources: {args.sources}  dup ratio: {args.dup_ratio}  rtt: {args.rtt_ms}ms")
+    print("-" * 110)
+
+    legacy_events = events[:args.legacy_events]
+    report("legacy (list + per-record)", len(legacy_events), *run_legacy(legacy_events, args))
+    report("is_duplicate", len(events), *run_single(events, args))
+    elapsed, duplicates, round_trips, stats = run_batched(events, args)
+    report(f"is_duplicate_many ({args.batch_size})", len(events), elapsed, duplicates, round_trips)
+    print(f"bloom: {stats['bloom_entries']:,} entries, {stats['bloom_memory_bytes'] / 1024 / 1024:.1f}MiB, "
+          f"negatives {stats['bloom_negatives']:,}, db lookups {stats['db_lookups']:,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Lineage Index Benchmark - 메모리 리니지 인덱스 적재/조회/증분 반영
+
+합성 리니지 그래프(기본 엣지 100k)를 LineageIndex에 적재한 뒤
+메모리 사용량(tracemalloc), 다운스트림 폐포/최단 경로/영향 분석 지연,
+add_edge 증분 반영 처리량을 측정하고, MongoDB를 흉내 낸 메모리 컬렉션
+(--rtt-ms 왕복 지연)을 쓰는 LineageTracker 조회와 비교합니다.
+
+Usage:
+    python scripts/benchmarks/bench_lineage_index.py
+    python scripts/benchmarks/bench_lineage_index.py --edges 100000 --levels 20 --rtt-ms 0.5
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import tracemalloc
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.app.services.lineage.impact import ImpactAnalyzer  # noqa: E402
+from api.app.services.lineage.index import LineageIndex  # noqa: E402
+from api.app.services.lineage.tracker import (  # noqa: E402
+    EdgeType,
+    LineageEdge,
+    LineageNode,
+    LineageTracker,
+    NodeType,
+)
+
+from scripts.benchmarks.bench_lineage_traversal import IndexedCollection  # noqa: E402
+
+
+class ScanCollection(IndexedCollection):
+    """IndexedCollection + 전체 스캔 find({}) (인덱스 적재용)"""
+
+    def __init__(self, docs, fields, rtt_ms=0.0):
+        super().__init__(docs, fields, rtt_ms)
+        self.docs = docs
+
+    def find(self, query, projection=None):
+        if query:
+            return super().find(query, projection)
+        self._trip()
+        return (dict(doc) for doc in self.docs)
+
+
+class BenchMongo:
+    def __init__(self, nodes, edges, rtt_ms):
+        self.db = {
+            LineageTracker.NODES_COLLECTION: ScanCollection(nodes, ["node_id"], rtt_ms),
+            LineageTracker.EDGES_COLLECTION: ScanCollection(edges, ["source_node_id", "target_node_id"], rtt_ms),
+        }
+
+    @property
+    def round_trips(self):
+        return sum(c.round_trips for c in self.db.values())
+
+
+def make_graph(num_edges, levels, fan_out, seed=0):
+    """레벨형 DAG: 각 노드가 다음 레벨의 fan_out개 노드로 연결"""
+    rng = random.Random(seed)
+    width = num_edges // (fan_out * (levels - 1))
+    nodes = [
+        LineageNode(node_id=f"n{i}", node_type=NodeType.DATASET, name=f"ds{i}",
+                    qualified_name=f"dataset://ds{i}").to_dict()
+        for i in range(width * levels)
+    ]
+    edges = []
+    for level in range(levels - 1):
+        for i in range(width):
+            src = level * width + i
+            for dst in rng.sample(range((level + 1) * width, (level + 2) * width), fan_out):
+                edges.append(LineageEdge(
+                    edge_id=f"e{src}-{dst}", source_node_id=f"n{src}", target_node_id=f"n{dst}",
+                    edge_type=EdgeType.TRANSFORM
+                ).to_dict())
+    return nodes, edges, width
+
+
+def timed(func, args_list):
+    """호출당 평균 ms와 결과 목록"""
+    start = time.perf_counter()
+    results = [func(*args) for args in args_list]
+    return (time.perf_counter() - start) / len(args_list) * 1000, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--edges', type=int, default=100000)
+    parser.add_argument('--levels', type=int, default=20)
+    parser.add_argument('--fan-out', type=int, default=3)
+    parser.add_argument('--depth', type=int, default=10)
+    parser.add_argument('--queries', type=int, default=20)
+    parser.add_argument('--rtt-ms', type=float, default=0.0)
+    parser.add_argument('--inserts', type=int, default=10000)
+    args = parser.parse_args()
+
+    nodes, edges, width = make_graph(args.edges, args.levels, args.fan_out)
+    mongo = BenchMongo(nodes, edges, args.rtt_ms)
+    print(f"graph: {len(nodes):,} nodes, {len(edges):,} edges, {args.levels} levels  "
+          f"depth: {args.depth}  queries: {args.queries}  rtt: {args.rtt_ms}ms")
+    print("-" * 100)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    index = LineageIndex().load(mongo)
+    load_seconds = time.perf_counter() - start
+    memory, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = index.get_stats()
+    print(f"load       {load_seconds:8.2f}s  resident {memory / 2**20:7.1f} MiB  peak {peak / 2**20:7.1f} MiB  "
+          f"adjacency arrays {stats['adjacency_bytes'] / 2**20:6.2f} MiB")
+
+    rng = random.Random(1)
+    starts = [(f"n{rng.randrange(width)}", args.depth) for _ in range(args.queries)]
+    tracker = LineageTracker(mongo)
+
+    trips = mongo.round_trips
+    tracker_ms, tracker_results = timed(tracker.get_downstream, starts[:max(1, args.queries // 4)])
+    tracker_trips = (mongo.round_trips - trips) / max(1, args.queries // 4)
+    index_ms, index_results = timed(index.downstream, starts)
+    same = all(
+        sorted(n.node_id for n in nodes_[1:]) == sorted(closure)
+        for (nodes_, _), closure in zip(tracker_results, index_results)
+    )
+    reached = sum(len(r) for r in index_results) / len(index_results)
+    print(f"downstream tracker {tracker_ms:9.2f}ms/query ({tracker_trips:,.0f} round trips)  "
+          f"index {index_ms:8.2f}ms/query  {reached:,.0f} nodes/query  identical: {same}")
+
+    last_level = (args.levels - 1) * width
+    pairs = [(f"n{rng.randrange(width)}", f"n{last_level + rng.randrange(width)}") for _ in range(args.queries)]
+    path_ms, paths = timed(index.shortest_path, pairs)
+    print(f"shortest path      {path_ms:9.2f}ms/query  found {sum(p is not None for p in paths)}/{len(paths)}")
+
+    analyzer = ImpactAnalyzer(LineageTracker(mongo))
+    indexed_analyzer = ImpactAnalyzer(LineageTracker(mongo, index=index))
+    impact_ids = [(node_id,) for node_id, _ in starts[:max(1, args.queries // 4)]]
+    legacy_ms, _ = timed(analyzer.analyze_deletion_impact, impact_ids)
+    indexed_ms, _ = timed(indexed_analyzer.analyze_deletion_impact, impact_ids)
+    print(f"deletion impact    tracker {legacy_ms:9.2f}ms/query  index {indexed_ms:8.2f}ms/query")
+
+    new_edges = [
+        LineageEdge(edge_id=f"x{i}", source_node_id=f"n{rng.randrange(len(nodes))}",
+                    target_node_id=f"new{i}", edge_type=EdgeType.TRANSFORM)
+        for i in range(args.inserts)
+    ]
+    start = time.perf_counter()
+    for edge in new_edges:
+        index.add_edge(edge)
+    insert_seconds = time.perf_counter() - start
+    after_ms, _ = timed(index.downstream, starts)
+    print(f"add_edge           {args.inserts / insert_seconds:9,.0f} edges/s  "
+          f"downstream after inserts {after_ms:8.2f}ms/query  delta edges {index.get_stats()['delta_edges']:,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Lineage Traversal Benchmark - LineageTracker upstream/downstream 조회
+
+합성 리니지 그래프(기본 10k 노드, 레벨 10개)에서 이전 구현(노드마다
+get_node + 엣지 find 재귀)과 현재 레벨 동기 BFS(홉마다 노드 $in + 엣지 $in)의
+DB 왕복 수와 시간을 비교합니다.
+
+lineage_nodes/lineage_edges는 인덱스를 흉내 낸 메모리 가짜 컬렉션이며
+--rtt-ms로 왕복당 지연을 더할 수 있습니다.
+
+Usage:
+    python scripts/benchmarks/bench_lineage_traversal.py
+    python scripts/benchmarks/bench_lineage_traversal.py --nodes 10000 --levels 10 --rtt-ms 0.5
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.app.services.lineage.tracker import (  # noqa: E402
+    EdgeType,
+    LineageEdge,
+    LineageNode,
+    LineageTracker,
+    NodeType,
+)
+
+
+class IndexedCollection:
+    """필드별 해시 인덱스를 가진 메모리 컬렉션 (왕복 수 집계, 선택적 지연)"""
+
+    def __init__(self, docs, fields, rtt_ms=0.0):
+        self.index = {f: {} for f in fields}
+        for doc in docs:
+            for f in fields:
+                self.index[f].setdefault(doc[f], []).append(doc)
+        self.round_trips = 0
+        self.rtt = rtt_ms / 1000
+
+    def _trip(self):
+        self.round_trips += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    def find(self, query, projection=None):
+        self._trip()
+        (key, cond), = query.items()
+        values = cond["$in"] if isinstance(cond, dict) else [cond]
+        return [dict(doc) for v in values for doc in self.index[key].get(v, ())]
+
+    def find_one(self, query, projection=None):
+        docs = self.find(query, projection)
+        return docs[0] if docs else None
+
+
+def make_graph(num_nodes, levels, fan_out, seed=0):
+    """레벨형 DAG: 각 노드가 다음 레벨의 fan_out개 노드로 연결"""
+    rng = random.Random(seed)
+    width = num_nodes // levels
+    nodes = [
+        LineageNode(node_id=f"n{i}", node_type=NodeType.DATASET, name=f"ds{i}",
+                    qualified_name=f"dataset://ds{i}").to_dict()
+        for i in range(width * levels)
+    ]
+    edges = []
+    for level in range(levels - 1):
+        for i in range(width):
+            src = level * width + i
+            for dst in rng.sample(range((level + 1) * width, (level + 2) * width), fan_out):
+                edges.append(LineageEdge(
+                    edge_id=f"e{src}-{dst}", source_node_id=f"n{src}", target_node_id=f"n{dst}",
+                    edge_type=EdgeType.TRANSFORM
+                ).to_dict())
+    return nodes, edges, width
+
+
+class LegacyLineageTracker(LineageTracker):
+    """이전 구현 (노드마다 get_node + 엣지 find, 재귀 DFS)"""
+
+    def get_downstream(self, node_id, depth=10):
+        visited_nodes, visited_edges, nodes, edges = set(), set(), [], []
+
+        def traverse(current_id, current_depth):
+            if current_depth > depth or current_id in visited_nodes:
+                return
+            visited_nodes.add(current_id)
+            node = self.get_node(current_id)
+            if node:
+                nodes.append(node)
+            for edge_doc in self.mongo.db[self.EDGES_COLLECTION].find({"source_node_id": current_id}):
+                edge = LineageEdge.from_dict(edge_doc)
+                if edge.edge_id not in visited_edges:
+                    visited_edges.add(edge.edge_id)
+                    edges.append(edge)
+                    traverse(edge.target_node_id, current_depth + 1)
+
+        traverse(node_id, 0)
+        return nodes, edges
+
+
+class BenchMongo:
+    def __init__(self, nodes, edges, rtt_ms):
+        self.db = {
+            LineageTracker.NODES_COLLECTION: IndexedCollection(nodes, ["node_id"], rtt_ms),
+            LineageTracker.EDGES_COLLECTION: IndexedCollection(edges, ["source_node_id", "target_node_id"], rtt_ms),
+        }
+
+    @property
+    def round_trips(self):
+        return sum(c.round_trips for c in self.db.values())
+
+
+def run(tracker_cls, nodes, edges, start_ids, args):
+    mongo = BenchMongo(nodes, edges, args.rtt_ms)
+    tracker = tracker_cls(mongo)
+    start = time.perf_counter()
+    results = [tracker.get_downstream(node_id, depth=args.depth) for node_id in start_ids]
+    elapsed = time.perf_counter() - start
+    return elapsed, mongo.round_trips, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--nodes', type=int, default=10000)
+    parser.add_argument('--levels', type=int, default=10)
+    parser.add_argument('--fan-out', type=int, default=2)
+    parser.add_argument('--depth', type=int, default=10)
+    parser.add_argument('--queries', type=int, default=5)
+    parser.add_argument('--rtt-ms', type=float, default=0.0)
+    args = parser.parse_args()
+
+    nodes, edges, width = make_graph(args.nodes, args.levels, args.fan_out)
+    rng = random.Random(1)
+    start_ids = [f"n{rng.randrange(width)}" for _ in range(args.queries)]
+    print(f"graph: {len(nodes):,} nodes, {len(edges):,} edges, {args.levels} levels  "
+          f"depth: {args.depth}  queries: {args.queries}  rtt: {args.rtt_ms}ms")
+    print("-" * 100)
+
+    legacy = run(LegacyLineageTracker, nodes, edges, start_ids, args)
+    batched = run(LineageTracker, nodes, edges, start_ids, args)
+
+    for (label, (elapsed, round_trips, results)) in (("recursive", legacy), ("level BFS", batched)):
+        visited = sum(len(n) for n, _ in results)
+        print(f"{label:<10} {elapsed / args.queries * 1000:10.1f}ms/query  "
+              f"{round_trips / args.queries:10,.0f} round trips/query  {visited / args.queries:8,.0f} nodes/query")
+
+    same = all(
+        {n.node_id for n in a[0]} == {n.node_id for n in b[0]} and {e.edge_id for e in a[1]} == {e.edge_id for e in b[1]}
+        for a, b in zip(legacy[2], batched[2])
+    )
+    print(f"identical results: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Mongo Client Pool Benchmark - 요청별 클라이언트 vs 공유 풀 지연 시간
+
+라우터와 같은 형태(제너레이터 의존성에서 MongoService() 생성/close,
+async 핸들러에서 find_one)의 최소 FastAPI 앱에 동시 요청을 보내
+p50/p95/p99 지연과 처리량을 비교합니다.
+
+- per-request: 공유 풀 없음 (요청마다 MongoClient 생성 + ping + close)
+- pooled: init_client_pool() 후 같은 요청 (lifespan과 동일)
+
+MongoDB가 필요합니다 (--uri 또는 MONGODB_URI).
+
+Usage:
+    python scripts/benchmarks/bench_mongo_pool.py --uri mongodb://localhost:27017
+    python scripts/benchmarks/bench_mongo_pool.py --requests 2000 --concurrency 50
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+import statistics
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+
+from api.app.services import mongo_service  # noqa: E402
+from api.app.services.mongo_service import MongoService  # noqa: E402
+
+
+def get_mongo():
+    mongo = MongoService()
+    try:
+        yield mongo
+    finally:
+        mongo.close()
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/sources/latest")
+    async def latest_source(mongo: MongoService = Depends(get_mongo)):
+        doc = mongo.db.sources.find_one({}, {"name": 1})
+        return {"name": doc.get("name") if doc else None}
+
+    return app
+
+
+async def run_load(app, total, concurrency):
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get("/sources/latest")
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def report(label, latencies, elapsed):
+    latencies = sorted(latencies)
+    pct = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000  # noqa: E731
+    print(f"{label:<12} p50 {pct(0.5):7.2f}ms  p95 {pct(0.95):7.2f}ms  p99 {pct(0.99):7.2f}ms  "
+          f"mean {statistics.mean(latencies) * 1000:7.2f}ms  {len(latencies) / elapsed:8.1f} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--uri', default=os.getenv('MONGODB_URI', 'mongodb://localhost:27017'))
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--max-pool-size', type=int, default=mongo_service.MONGODB_MAX_POOL_SIZE)
+    args = parser.parse_args()
+
+    os.environ['MONGODB_URI'] = args.uri
+    app = build_app()
+    print(f"uri: {args.uri}  requests: {args.requests}  concurrency: {args.concurrency}")
+    print("-" * 100)
+
+    report("per-request", *asyncio.run(run_load(app, args.requests, args.concurrency)))
+
+    mongo_service.init_client_pool(uri=args.uri, max_pool_size=args.max_pool_size)
+    try:
+        report("pooled", *asyncio.run(run_load(app, args.requests, args.concurrency)))
+        stats = mongo_service.get_client_pool().get_stats()
+        print(f"pool: {stats['connections_created']} connections created, {stats['checkouts']} checkouts")
+    finally:
+        mongo_service.close_client_pool()
+
+
+if __name__ == '__main__':
+    main()
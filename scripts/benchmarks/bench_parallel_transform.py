@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Parallel Transform Benchmark - 프로세스 풀 병렬 변환 확장성
+
+뉴스 레코드 배치를 ETLPipeline._transform_parallel로 워커 수를 바꿔가며
+변환해 코어 수에 따른 처리량을 비교합니다. 변환 중 이벤트 루프가
+막히지 않는지 확인하기 위해 동시에 도는 heartbeat 코루틴의 최대 지연도
+함께 출력합니다 (workers=0은 기존처럼 루프에서 직접 변환).
+
+Usage:
+    python scripts/benchmarks/bench_parallel_transform.py
+    python scripts/benchmarks/bench_parallel_transform.py --records 200000 --workers 1 2 4 8
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from airflow.dags.utils.etl_pipeline import (  # noqa: E402
+    DataTransformer,
+    ETLPipeline,
+    TransformConfig,
+    DataCategory,
+)
+
+
+def make_records(count):
+    return [
+        {
+            'title': f'  [속보] 코스피 {i % 500}포인트 마감  ',
+            'content': f'본문 {i} ' + '시장 동향 기사 내용입니다. ' * 30,
+            'date': f'2024년 {i % 12 + 1}월 {i % 28 + 1}일 {i % 24}:{i % 60:02d}',
+            'link': f'//news.example.com/article/{i}?utm_source=feed',
+        }
+        for i in range(count)
+    ]
+
+
+async def heartbeat(stop, interval=0.01):
+    """이벤트 루프 응답성 측정 (예상 시각 대비 최대 지연)"""
+    worst = 0.0
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - expected)
+    return worst
+
+
+async def run_once(records, workers, chunk_size):
+    config = TransformConfig(
+        category=DataCategory.NEWS_ARTICLE,
+        parallel_workers=workers,
+        parallel_threshold=0,
+        parallel_chunk_size=chunk_size,
+    )
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(stop))
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    if workers > 0:
+        transformed, _ = await ETLPipeline(None)._transform_parallel(config, records, [])
+    else:
+        transformed = DataTransformer(config).transform(records)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    worst_lag = await beat
+    return elapsed, len(transformed), worst_lag
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    print(f"records: {args.records:,}, cpus: {os.cpu_count()}, chunk: {args.chunk_size}")
+    print("-" * 70)
+
+    baseline, count, lag = asyncio.run(run_once(records, 0, args.chunk_size))
+    print(f"in-process    {baseline:7.2f}s  {count / baseline:10,.0f} rec/s  loop lag {lag * 1000:8.1f}ms")
+
+    for workers in args.workers:
+        elapsed, count, lag = asyncio.run(run_once(records, workers, args.chunk_size))
+        print(
+            f"workers={workers:<4} {elapsed:7.2f}s  {count / elapsed:10,.0f} rec/s  "
+            f"loop lag {lag * 1000:8.1f}ms  speedup {baseline / elapsed:.1f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Parser Benchmark - 한국어 날짜/숫자 파서 비교
+
+기존 DataTransformer 파서 구현(매 호출마다 정규식/람다 재생성)과
+crawlers.utils.parsers(사전 컴파일 + LRU 메모)를 실제 뉴스/금융 페이지에서
+수집한 형식의 코퍼스로 비교합니다. 결과가 동일한지도 함께 검증합니다.
+
+Usage:
+    python scripts/benchmarks/bench_parsers.py
+    python scripts/benchmarks/bench_parsers.py --rounds 200 --repeat 50
+"""
+
+import sys
+import os
+import re
+import random
+import time
+import argparse
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from crawlers.utils.parsers import (  # noqa: E402
+    KO_DATE_PATTERNS,
+    parse_korean_date,
+    parse_korean_number,
+    clear_parse_caches,
+)
+
+DATE_CORPUS = [
+    "2024년 3월 15일 14:30",
+    "2024년 03월 15일",
+    "입력 2024.03.15 09:12",
+    "수정 2024.03.15. 오후 2:05",
+    "2024.03.15",
+    "2024-03-15 10:20:30",
+    "2024-03-15 10:20",
+    "2024-03-15",
+    "기사입력 2024-03-15T10:20:30+09:00",
+    "03/15/2024",
+    "14:30",
+    "5분 전",
+    "3시간 전",
+    "2일 전",
+    "방금",
+    "오늘",
+    "어제",
+    "2024-03-15T10:20:30Z",
+    "날짜 미상",
+]
+
+NUMBER_CORPUS = [
+    "1,234",
+    "2,650.37",
+    "▲12.50",
+    "▼1,250",
+    "↑3.5%",
+    "-0.45%",
+    "+1.2%",
+    "50,000원",
+    "₩3,000",
+    "$1,200.50",
+    "1.5억",
+    "320만",
+    "3천",
+    "약 120 건",
+    "N/A",
+]
+
+
+# ---------------------------------------------------------------------------
+# 기존 구현 (비교 기준)
+# ---------------------------------------------------------------------------
+
+def legacy_parse_date(value):
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    if not value:
+        return None
+
+    text = str(value).strip()
+
+    relative_patterns = {
+        r'(\d+)분\s*전': lambda m: datetime.now() - timedelta(minutes=int(m.group(1))),
+        r'(\d+)시간\s*전': lambda m: datetime.now() - timedelta(hours=int(m.group(1))),
+        r'(\d+)일\s*전': lambda m: datetime.now() - timedelta(days=int(m.group(1))),
+        r'방금': lambda m: datetime.now(),
+        r'오늘': lambda m: datetime.now().replace(hour=0, minute=0, second=0),
+        r'어제': lambda m: (datetime.now() - timedelta(days=1)).replace(hour=0, minute=0, second=0),
+    }
+
+    for pattern, handler in relative_patterns.items():
+        match = re.search(pattern, text)
+        if match:
+            return handler(match)
+
+    for pattern, _ in KO_DATE_PATTERNS:
+        match = re.search(pattern, text)
+        if match:
+            try:
+                groups = match.groups()
+                if len(groups) == 2:
+                    today = datetime.now()
+                    return today.replace(hour=int(groups[0]), minute=int(groups[1]), second=0)
+                elif len(groups) == 3:
+                    return datetime(int(groups[0]), int(groups[1]), int(groups[2]))
+                elif len(groups) == 5:
+                    return datetime(int(groups[0]), int(groups[1]), int(groups[2]),
+                                    int(groups[3]), int(groups[4]))
+                elif len(groups) == 6:
+                    return datetime(int(groups[0]), int(groups[1]), int(groups[2]),
+                                    int(groups[3]), int(groups[4]), int(groups[5]))
+            except Exception:
+                continue
+
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except Exception:
+        pass
+
+    return None
+
+
+LEGACY_NUMBER_PATTERNS = {
+    'korean': {'억': 100000000, '만': 10000, '천': 1000},
+    'symbols': {',': '', '%': '', '원': '', '$': '', '₩': ''},
+}
+
+
+def legacy_parse_number(value):
+    if value is None:
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+
+    text = str(value).strip()
+    if not text:
+        return None
+
+    negative = False
+    if text.startswith('-') or text.startswith('▼') or text.startswith('↓'):
+        negative = True
+        text = text[1:]
+    elif text.startswith('+') or text.startswith('▲') or text.startswith('↑'):
+        text = text[1:]
+
+    for symbol, replacement in LEGACY_NUMBER_PATTERNS['symbols'].items():
+        text = text.replace(symbol, replacement)
+
+    multiplier = 1
+    for unit, mult in LEGACY_NUMBER_PATTERNS['korean'].items():
+        if unit in text:
+            text = text.replace(unit, '')
+            multiplier = mult
+            break
+
+    try:
+        number = float(text.strip())
+        number *= multiplier
+        return -number if negative else number
+    except ValueError:
+        numbers = re.findall(r'[\d.]+', text)
+        if numbers:
+            try:
+                number = float(numbers[0])
+                number *= multiplier
+                return -number if negative else number
+            except ValueError:
+                pass
+
+    return None
+
+
+# ---------------------------------------------------------------------------
+
+
+def _same(a, b):
+    if isinstance(a, datetime) and isinstance(b, datetime):
+        # 상대 시간은 호출 시각 차이만큼 어긋날 수 있음
+        return abs(a - b) < timedelta(seconds=1)
+    return a == b
+
+
+def verify():
+    for text in DATE_CORPUS:
+        assert _same(legacy_parse_date(text), parse_korean_date(text)), text
+    for text in NUMBER_CORPUS:
+        assert _same(legacy_parse_number(text), parse_korean_number(text)), text
+
+
+def bench(label, func, values, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for value in values:
+            func(value)
+    elapsed = time.perf_counter() - start
+    calls = rounds * len(values)
+    print(f"{label:<32} {elapsed * 1000:9.1f}ms  {calls / elapsed:12,.0f} calls/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=100, help='코퍼스 반복 횟수')
+    parser.add_argument('--repeat', type=int, default=20, help='페이지당 동일 문자열 반복 수 (캐시 효과)')
+    args = parser.parse_args()
+
+    verify()
+    print("Results identical to legacy parsers")
+
+    rng = random.Random(42)
+    dates = [rng.choice(DATE_CORPUS) for _ in range(len(DATE_CORPUS) * args.repeat)]
+    numbers = [rng.choice(NUMBER_CORPUS) for _ in range(len(NUMBER_CORPUS) * args.repeat)]
+
+    print("-" * 70)
+    base = bench("legacy _parse_date", legacy_parse_date, dates, args.rounds)
+    clear_parse_caches()
+    new = bench("parse_korean_date", parse_korean_date, dates, args.rounds)
+    print(f"{'speedup':<32} {base / new:9.1f}x")
+
+    print("-" * 70)
+    base = bench("legacy _parse_number", legacy_parse_number, numbers, args.rounds)
+    clear_parse_caches()
+    new = bench("parse_korean_number", parse_korean_number, numbers, args.rounds)
+    print(f"{'speedup':<32} {base / new:9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
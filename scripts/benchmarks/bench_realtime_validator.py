@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Realtime Validator Benchmark - 이벤트마다 소스 조회(이전) vs 설정 캐시 / 배치 검증
+
+RealtimeValidator로 --events개의 DATA_CREATED 이벤트(소스 --sources개,
+레코드당 필드 --fields개)를 검증해 처리량(events/s)을 비교합니다.
+
+- legacy: 이전 validate_event (이벤트마다 이벤트 루프에서 동기 get_source,
+  source_id 단위 검증기 캐시)
+- event: 현재 validate_event (소스 설정 캐시, 미스 시 스레드에서 조회)
+- batch: validate_events (--batch-size 단위, 미스를 한 번에 조회)
+
+기본은 시뮬레이션 MongoDB로, 조회 호출마다 --rtt-ms 동안 블로킹합니다.
+--uri를 주면 실제 MongoDB(bench_realtime_validator 데이터베이스)의
+sources 컬렉션에 소스를 만들고 MongoService로 조회합니다.
+
+Usage:
+    python scripts/benchmarks/bench_realtime_validator.py
+    python scripts/benchmarks/bench_realtime_validator.py --events 50000 --sources 500 --rtt-ms 1
+    python scripts/benchmarks/bench_realtime_validator.py --uri mongodb://localhost:27017
+"""
+
+import sys
+import os
+import time
+import random
+import asyncio
+import argparse
+from datetime import datetime
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.app.services.streaming import DataEvent, EventType, RealtimeValidator  # noqa: E402
+
+TARGET_RATE = 10000
+
+
+class LegacyValidator(RealtimeValidator):
+    """이전 validate_event 경로 (이벤트마다 동기 get_source)"""
+
+    async def validate_event(self, event):
+        start_time = datetime.utcnow()
+        try:
+            source_config = self.mongo.get_source(event.source_id)
+        except Exception:
+            source_config = None
+        validator = await self._cache.get_validator(event.source_id, source_config)
+        return self._validate_with(validator, event, start_time)
+
+
+class SimMongo:
+    """조회 호출마다 왕복 지연만큼 블로킹하는 MongoService 흉내"""
+
+    def __init__(self, sources, rtt_ms):
+        self.sources = sources
+        self.rtt = rtt_ms / 1000
+        self.calls = 0
+
+    def get_source(self, source_id):
+        self.calls += 1
+        time.sleep(self.rtt)
+        return self.sources.get(source_id)
+
+    def get_sources_by_ids(self, source_ids, projection=None):
+        self.calls += 1
+        time.sleep(self.rtt)
+        return {sid: self.sources[sid] for sid in source_ids if sid in self.sources}
+
+
+def make_source(i, fields, rng):
+    specs = []
+    for f in range(fields):
+        kind = f % 4
+        spec = {"name": f"field_{f}", "data_type": ["string", "number", "date", "string"][kind]}
+        if kind == 0:
+            spec["required"] = True
+        elif kind == 1:
+            spec.update(min_value=0, max_value=1000)
+        elif kind == 3 and rng.random() < 0.5:
+            spec["pattern"] = r"^[a-z0-9_]+$"
+        specs.append(spec)
+    return {"name": f"source_{i}", "fields": specs}
+
+
+def make_events(args, source_ids, rng):
+    events = []
+    for i in range(args.events):
+        data = {}
+        for f in range(args.fields):
+            kind = f % 4
+            if kind == 0:
+                data[f"field_{f}"] = "" if rng.random() < 0.02 else f"제목 {i}"
+            elif kind == 1:
+                data[f"field_{f}"] = rng.randrange(-10, 1100)
+            elif kind == 2:
+                data[f"field_{f}"] = "2024-05-01"
+            else:
+                data[f"field_{f}"] = rng.choice(["value_1", "Value 2"])
+        events.append(DataEvent(
+            event_type=EventType.DATA_CREATED,
+            source_id=rng.choice(source_ids),
+            collection="staging_data",
+            document_id=str(i),
+            data=data,
+        ))
+    return events
+
+
+def make_mongo(args, rng):
+    configs = [make_source(i, args.fields, rng) for i in range(args.sources)]
+    if not args.uri:
+        sources = {f"{i:024x}": config for i, config in enumerate(configs)}
+        return SimMongo(sources, args.rtt_ms), list(sources)
+
+    from api.app.services.mongo_service import MongoService
+    os.environ['MONGODB_URI'] = args.uri
+    mongo = MongoService()
+    mongo.database_name = "bench_realtime_validator"
+    mongo.db.sources.delete_many({})
+    ids = mongo.db.sources.insert_many(configs).inserted_ids
+    return mongo, [str(i) for i in ids]
+
+
+async def run_case(name, args, mongo, events):
+    cls = LegacyValidator if name == "legacy" else RealtimeValidator
+    validator = cls(mongo, emit_validation_events=False)
+    calls = getattr(mongo, "calls", 0)
+    start = time.perf_counter()
+    if name == "batch":
+        for offset in range(0, len(events), args.batch_size):
+            await validator.validate_events(events[offset:offset + args.batch_size])
+    else:
+        for event in events:
+            await validator.validate_event(event)
+    elapsed = time.perf_counter() - start
+    stats = validator.get_stats()
+    return elapsed, getattr(mongo, "calls", 0) - calls, stats["failed"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=20000)
+    parser.add_argument('--sources', type=int, default=200)
+    parser.add_argument('--fields', type=int, default=8)
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--rtt-ms', type=float, default=0.5, help='시뮬레이션 조회 호출당 지연')
+    parser.add_argument('--cases', nargs='+', default=["legacy", "event", "batch"])
+    parser.add_argument('--uri', default=None)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mongo, source_ids = make_mongo(args, rng)
+    events = make_events(args, source_ids, rng)
+
+    label = f"uri: {args.uri}" if args.uri else f"simulated mongo  rtt: {args.rtt_ms}ms"
+    print(f"{label}  events: {args.events:,}  sources: {args.sources}  fields: {args.fields}  "
+          f"batch: {args.batch_size}")
+    print("-" * 100)
+
+    for name in args.cases:
+        elapsed, calls, failed = asyncio.run(run_case(name, args, mongo, events))
+        rate = args.events / elapsed
+        mark = "ok" if rate >= TARGET_RATE else "below target"
+        print(f"{name:<7} {elapsed:7.2f}s  {rate:>9,.0f} events/s ({mark})  "
+              f"source lookups {calls:>6,}  failed {failed:>6,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Streaming ETL Benchmark - run() vs run_stream() 최대 메모리
+
+같은 뉴스 레코드를 ETLPipeline.run(전체 리스트)과 ETLPipeline.run_stream
+(제너레이터, 윈도우 단위)으로 처리하고 tracemalloc 기준 최대 메모리와
+소요 시간을 비교합니다. 적재는 MongoDB 호출 없이 빈 컬렉션으로 대체하므로
+변환/중복 제거 단계의 메모리만 측정됩니다.
+
+Usage:
+    python scripts/benchmarks/bench_stream_etl.py
+    python scripts/benchmarks/bench_stream_etl.py --records 200000 --window 2000
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+import tracemalloc
+from types import SimpleNamespace
+from collections import defaultdict
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from airflow.dags.utils.etl_pipeline import ETLPipeline, DataCategory  # noqa: E402
+
+
+def iter_records(count):
+    for i in range(count):
+        yield {
+            'title': f'  [속보] 코스피 {i}포인트 마감  ',
+            'content': f'본문 {i} ' + '시장 동향 기사 내용입니다. ' * 30,
+            'date': f'2024년 {i % 12 + 1}월 {i % 28 + 1}일 {i % 24}:{i % 60:02d}',
+            'link': f'//news.example.com/article/{i}?utm_source=feed',
+        }
+
+
+class NullCollection:
+    """호출 기록을 남기지 않는 적재 대상 (MagicMock은 인자를 모두 보관함)"""
+
+    _result = SimpleNamespace(upserted_id=None, modified_count=1)
+
+    def update_one(self, *args, **kwargs):
+        return self._result
+
+    def create_index(self, *args, **kwargs):
+        return None
+
+
+def make_mongo():
+    collection = NullCollection()
+    return SimpleNamespace(db=defaultdict(lambda: collection))
+
+
+def measure(label, coro_factory):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = asyncio.run(coro_factory())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<24} {elapsed:7.2f}s  peak {peak / 1024 / 1024:8.1f} MiB  "
+          f"loaded {result.loaded_count:,}")
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=50000)
+    parser.add_argument('--window', type=int, nargs='+', default=[1000, 5000])
+    args = parser.parse_args()
+
+    kwargs = dict(source_id='bench', category=DataCategory.NEWS_ARTICLE,
+                  skip_unchanged=False, use_staging=False)
+    print(f"records: {args.records:,}")
+    print("-" * 70)
+
+    baseline = measure(
+        'run (list)',
+        lambda: ETLPipeline(make_mongo()).run(raw_data=list(iter_records(args.records)), **kwargs)
+    )
+    for window in args.window:
+        peak = measure(
+            f'run_stream window={window}',
+            lambda w=window: ETLPipeline(make_mongo()).run_stream(
+                iter_records(args.records), window_size=w, **kwargs
+            )
+        )
+        print(f"{'':<24} {baseline / peak:.1f}x less peak memory")
+
+
+if __name__ == '__main__':
+    main()
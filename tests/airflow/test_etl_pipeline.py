@@ -6,9 +6,11 @@ Covers:
 - DataCategory detection
 - Date parsing (Korean and relative dates)
 - Number parsing (Korean units, symbols)
+- Fallback parsing without the crawlers package
 - Quality validation
 - Deduplication
 - DataLoader operations
+- Columnar (DataFrame) transform parity with the record path
 - ETLPipeline integration
 """
 
@@ -289,6 +291,25 @@ class TestDataTransformerNumberParsing:
         assert result == 123.45
 
 
+class TestParserFallback:
+    """Tests for DataTransformer parsing without the crawlers package."""
+
+    def test_fallback_without_crawlers(self, monkeypatch):
+        """Without crawlers.utils.parsers only ISO dates and plain numbers are parsed."""
+        from airflow.dags.utils import etl_pipeline
+        from airflow.dags.utils.etl_pipeline import DataTransformer, TransformConfig, DataCategory
+
+        monkeypatch.setattr(etl_pipeline, "parse_korean_date", None)
+        monkeypatch.setattr(etl_pipeline, "parse_korean_number", None)
+        transformer = DataTransformer(TransformConfig(category=DataCategory.GENERIC))
+
+        assert transformer._parse_date("2024-01-15T10:30:00Z").day == 15
+        assert transformer._parse_date("2024년 1월 15일") is None
+        assert transformer._parse_date(None) is None
+        assert transformer._parse_number("1,234.5") == 1234.5
+        assert transformer._parse_number(7) == 7.0
+        assert transformer._parse_number("5만") is None
+
 class TestDataTransformerTextCleaning:
     """Tests for DataTransformer text cleaning."""
 
@@ -659,6 +680,254 @@ class TestDataLoaderCollectionMapping:
         assert DataLoader.STAGING_COLLECTION_MAP["announcements"] == "staging_news"
 
 
+@pytest.mark.asyncio
+class TestDataLoaderBulkWrite:
+    """Tests for DataLoader bulk_write load mode."""
+
+    def _loader(self, mock_mongo_service, collection, **config):
+        from airflow.dags.utils.etl_pipeline import DataLoader, LoadConfig
+
+        mock_mongo_service.db.__getitem__.return_value = collection
+        load_config = LoadConfig(collection_name="news_articles", create_index=False, bulk_write=True, **config)
+        return DataLoader(mock_mongo_service, load_config, use_staging=True)
+
+    async def test_bulk_load_batches_operations(self, mock_mongo_service):
+        """Test records are written in unordered batches of batch_size."""
+        collection = MagicMock()
+        collection.bulk_write.return_value = MagicMock(
+            inserted_count=0, upserted_count=2, matched_count=0, modified_count=0,
+            upserted_ids={0: "id-0", 1: "id-1"}
+        )
+        loader = self._loader(mock_mongo_service, collection, upsert_key=["content_hash"], batch_size=2)
+
+        data = [{"content_hash": f"h{i}"} for i in range(5)]
+        result = await loader.load(data, "source_1")
+
+        assert collection.bulk_write.call_count == 3
+        sizes = [len(c.args[0]) for c in collection.bulk_write.call_args_list]
+        assert sizes == [2, 2, 1]
+        assert all(c.kwargs["ordered"] is False for c in collection.bulk_write.call_args_list)
+        assert [b["size"] for b in result["batches"]] == [2, 2, 1]
+        assert all("elapsed_ms" in b for b in result["batches"])
+        collection.update_one.assert_not_called()
+
+    async def test_bulk_load_maps_upsert_results(self, mock_mongo_service):
+        """Test upserted/modified/unchanged map to loaded/duplicates like the per-record path."""
+        collection = MagicMock()
+        collection.bulk_write.return_value = MagicMock(
+            inserted_count=0, upserted_count=1, matched_count=2, modified_count=1,
+            upserted_ids={2: "new-id"}
+        )
+        loader = self._loader(mock_mongo_service, collection, upsert_key=["content_hash"])
+
+        data = [{"content_hash": "a"}, {"content_hash": "b"}, {"content_hash": "c"}]
+        result = await loader.load(data, "source_1", crawl_result_id="crawl_1")
+
+        assert result["loaded"] == 2
+        assert result["duplicates"] == 1
+        assert result["staging_ids"] == ["new-id"]
+        assert result["errors"] == []
+        assert data[0]["_record_index"] == 0
+        assert data[2]["_crawl_result_id"] == "crawl_1"
+
+    async def test_bulk_load_insert_ids_in_record_order(self, mock_mongo_service):
+        """Test InsertOne ids are collected from the documents in record order."""
+        def fake_bulk_write(operations, ordered):
+            for i, op in enumerate(operations):
+                op._doc["_id"] = f"oid-{i}"
+            return MagicMock(
+                inserted_count=len(operations), upserted_count=0, matched_count=0, modified_count=0,
+                upserted_ids={}
+            )
+
+        collection = MagicMock()
+        collection.bulk_write.side_effect = fake_bulk_write
+        loader = self._loader(mock_mongo_service, collection, upsert=False)
+
+        result = await loader.load([{"title": "x"}, {"title": "y"}], "source_1")
+
+        assert result["loaded"] == 2
+        assert result["staging_ids"] == ["oid-0", "oid-1"]
+
+    async def test_bulk_load_partial_failure(self, mock_mongo_service):
+        """Test BulkWriteError details map to duplicates and errors per op."""
+        from pymongo.errors import BulkWriteError
+
+        collection = MagicMock()
+        collection.bulk_write.side_effect = BulkWriteError({
+            "nInserted": 0, "nUpserted": 1, "nMatched": 0, "nModified": 0,
+            "upserted": [{"index": 0, "_id": "ok-id"}],
+            "writeErrors": [
+                {"index": 1, "code": 11000, "errmsg": "E11000 duplicate key error"},
+                {"index": 2, "code": 121, "errmsg": "Document failed validation"},
+            ],
+        })
+        loader = self._loader(mock_mongo_service, collection, upsert_key=["content_hash"])
+
+        data = [{"content_hash": "a"}, {"content_hash": "b"}, {"content_hash": "c"}]
+        result = await loader.load(data, "source_1")
+
+        assert result["loaded"] == 1
+        assert result["duplicates"] == 1
+        assert result["errors"] == ["Document failed validation"]
+        assert result["staging_ids"] == ["ok-id"]
+
+
+@pytest.mark.asyncio
+class TestETLPipelineReviewRecords:
+    """Tests for ETLPipeline._create_review_records chunked inserts."""
+
+    async def test_review_records_inserted_in_chunks(self, mock_mongo_service):
+        """Test review documents are flushed with insert_many per chunk."""
+        from bson import ObjectId
+        from airflow.dags.utils.etl_pipeline import ETLPipeline
+
+        reviews = MagicMock()
+        reviews.insert_many.side_effect = lambda docs, ordered: MagicMock(inserted_ids=[ObjectId() for _ in docs])
+        mock_mongo_service.db.__getitem__.return_value = reviews
+
+        staging_ids = [str(ObjectId()) for _ in range(5)]
+        data = [{"title": f"t{i}", "_quality_score": 1.0} for i in range(5)]
+
+        pipeline = ETLPipeline(mock_mongo_service)
+        created = await pipeline._create_review_records(
+            source_id=str(ObjectId()), staging_ids=staging_ids, transformed_data=data, chunk_size=2
+        )
+
+        assert created == 5
+        assert [len(c.args[0]) for c in reviews.insert_many.call_args_list] == [2, 2, 1]
+        assert all(c.kwargs["ordered"] is False for c in reviews.insert_many.call_args_list)
+        first_doc = reviews.insert_many.call_args_list[0].args[0][0]
+        assert first_doc["original_data"] == {"title": "t0"}
+        assert first_doc["data_record_index"] == 0
+
+    async def test_review_records_skip_invalid_ids(self, mock_mongo_service):
+        """Test records whose staging id cannot be converted are skipped."""
+        from bson import ObjectId
+        from airflow.dags.utils.etl_pipeline import ETLPipeline
+
+        reviews = MagicMock()
+        reviews.insert_many.side_effect = lambda docs, ordered: MagicMock(inserted_ids=[ObjectId() for _ in docs])
+        mock_mongo_service.db.__getitem__.return_value = reviews
+
+        pipeline = ETLPipeline(mock_mongo_service)
+        created = await pipeline._create_review_records(
+            source_id=str(ObjectId()),
+            staging_ids=["not-an-object-id", str(ObjectId())],
+            transformed_data=[{"title": "a"}, {"title": "b"}],
+        )
+
+        assert created == 1
+
+    async def test_review_records_partial_chunk_failure(self, mock_mongo_service):
+        """Test partial chunk failures count only inserted documents."""
+        from bson import ObjectId
+        from pymongo.errors import BulkWriteError
+        from airflow.dags.utils.etl_pipeline import ETLPipeline
+
+        reviews = MagicMock()
+        reviews.insert_many.side_effect = BulkWriteError({
+            "nInserted": 2,
+            "writeErrors": [{"index": 1, "code": 11000, "errmsg": "E11000 duplicate key error"}],
+        })
+        mock_mongo_service.db.__getitem__.return_value = reviews
+
+        pipeline = ETLPipeline(mock_mongo_service)
+        created = await pipeline._create_review_records(
+            source_id=str(ObjectId()),
+            staging_ids=[str(ObjectId()) for _ in range(3)],
+            transformed_data=[{"title": str(i)} for i in range(3)],
+        )
+
+        assert created == 2
+
+
+class TestColumnarTransform:
+    """Tests for DataTransformer.transform_frame() parity with transform()."""
+
+    @staticmethod
+    def _normalize(records):
+        import math
+        normalized = []
+        for record in records:
+            record = dict(record)
+            record.pop('_crawled_at', None)  # 배치 단일 시각 vs 레코드별 시각
+            normalized.append({
+                key: (type(value).__name__, 'NaN' if isinstance(value, float) and math.isnan(value) else value)
+                for key, value in record.items()
+            })
+        return normalized
+
+    @staticmethod
+    def _frames():
+        import numpy as np
+        import pandas as pd
+        from airflow.dags.utils.etl_pipeline import DataCategory
+
+        return {
+            DataCategory.NEWS_ARTICLE: pd.DataFrame({
+                'title': ['  제목  1 ', '', None, 'x' * 10, '제목\u200b2', np.nan, '   '],
+                'content': ['본문 ' * 100, 'short', None, '', 'c', 'd', 'e'],
+                'date': ['2024년 1월 15일', '2024.01.15 09:05', 'bad', None,
+                         '2024-01-15T10:00:00+09:00', '2099-01-01', '2024-01-01'],
+                'link': ['//a.com/1', None, 'http://b', '', 'x', 'y', 'z'],
+            }),
+            DataCategory.STOCK_PRICE: pd.DataFrame({
+                'name': ['삼성', '', None, 'SK', 'a', 'b'],
+                'price': ['1,234', '0', None, '▲5만', 'N/A', 100],
+                'change': ['10', '5', '3', None, '1', '-100'],
+                'code': ['005930', 'A12', None, '', 'x', 7],
+                'date': ['2024-01-15', None, '', '2024.01.02', 'bad', '2024-01-01'],
+            }),
+            DataCategory.MARKET_INDEX: pd.DataFrame({
+                'name': ['코스피 지수', '나스닥', None, 'other', 1.5],
+                'price': [2650.5, 1.0, 2.0, 3.0, 4.0],
+            }),
+            DataCategory.EXCHANGE_RATE: pd.DataFrame({
+                'currency': ['usd', 'jpy100', None, 'eur', 'x'],
+                'base_rate': ['1,300.5', '900', None, 'bad', ''],
+                'price': ['1', '2', '3', '4', '5'],
+            }),
+            DataCategory.ANNOUNCEMENT: pd.DataFrame({
+                'title': ['실적 발표', '배당 공시', '유상증자', '합병', '기타', None],
+                'published_at': ['2024-01-01'] * 6,
+            }),
+        }
+
+    @pytest.mark.parametrize("required_fields", [[], ['name'], ['title', 'price']])
+    @pytest.mark.parametrize("threshold", [0.0, 0.7])
+    def test_matches_record_path(self, required_fields, threshold):
+        """Test every category yields the same records (values and types) as the row path."""
+        pytest.importorskip("pandas")
+        from airflow.dags.utils.etl_pipeline import DataTransformer, TransformConfig
+
+        for category, frame in self._frames().items():
+            transformer = DataTransformer(TransformConfig(
+                category=category,
+                required_fields=required_fields,
+                quality_threshold=threshold,
+            ))
+            expected = transformer.transform(frame.to_dict('records'))
+            actual = transformer.frame_to_records(transformer.transform_frame(frame))
+
+            assert self._normalize(actual) == self._normalize(expected), category
+
+    def test_repeated_values_parsed_once(self):
+        """Test string columns call element parsers once per distinct value."""
+        pd = pytest.importorskip("pandas")
+        from airflow.dags.utils.etl_pipeline import DataTransformer, TransformConfig, DataCategory
+
+        transformer = DataTransformer(TransformConfig(category=DataCategory.STOCK_PRICE))
+        frame = pd.DataFrame({'price': ['1,000', '2,000'] * 50, 'date': ['2024-01-15'] * 100})
+
+        with patch.object(transformer, '_parse_number', wraps=transformer._parse_number) as parse_number:
+            result = transformer.transform_frame(frame)
+
+        assert parse_number.call_count == 2
+        assert len(result) == 100
+        assert result['price'].tolist()[:2] == [1000.0, 2000.0]
+
+
 @pytest.mark.asyncio
 class TestETLPipelineRun:
     """Tests for ETLPipeline.run() method."""
@@ -710,6 +979,232 @@ class TestETLPipelineRun:
         assert result.extracted_count == len(sample_news_articles)
         assert result.category == DataCategory.NEWS_ARTICLE
 
+    @staticmethod
+    def _stock_rows(count):
+        rows = [{'name': f'종목{i}', 'price': f'{i + 1},000', 'code': f'{i:06d}', 'date': '2024-01-15'}
+                for i in range(count)]
+        rows[3]['price'] = None  # 품질 미달
+        rows[5]['name'] = 123    # 변환은 통과 (숫자 이름)
+        return rows
+
+    async def _run_stock(self, mock_mongo_service, rows, **transform_kwargs):
+        from airflow.dags.utils.etl_pipeline import ETLPipeline, DataCategory, TransformConfig
+
+        mock_collection = MagicMock()
+        mock_collection.update_one.return_value = MagicMock(upserted_id="new_id", modified_count=0)
+        mock_mongo_service.db.__getitem__.return_value = mock_collection
+
+        config = TransformConfig(category=DataCategory.STOCK_PRICE, required_fields=['name', 'price'],
+                                 **transform_kwargs)
+        return await ETLPipeline(mock_mongo_service).run(
+            raw_data=rows,
+            source_id="test_source",
+            category=DataCategory.STOCK_PRICE,
+            transform_config=config,
+            skip_unchanged=False,
+            use_staging=False
+        )
+
+    async def test_run_parallel_transform_matches_in_process(self, mock_mongo_service):
+        """Test process-pool transform keeps order and merges per-chunk counts."""
+        rows = self._stock_rows(10)
+
+        serial = await self._run_stock(mock_mongo_service, rows)
+        parallel = await self._run_stock(
+            mock_mongo_service, rows,
+            parallel_workers=2, parallel_threshold=5, parallel_chunk_size=3
+        )
+
+        chunks = parallel.metadata['transform_chunks']
+        assert [c['start'] for c in chunks] == [0, 3, 6, 9]
+        assert sum(c['invalid'] for c in chunks) == parallel.invalid_count == serial.invalid_count == 1
+        assert parallel.metadata['transform_errors'] == 0
+        assert parallel.transformed_count == serial.transformed_count == 9
+        assert [r['_order_index'] for r in parallel.sample_data] == [0, 1, 2]
+
+    async def test_run_below_parallel_threshold_stays_in_process(self, mock_mongo_service):
+        """Test small batches do not start a process pool."""
+        with patch('airflow.dags.utils.etl_pipeline.ProcessPoolExecutor') as pool_cls:
+            result = await self._run_stock(
+                mock_mongo_service, self._stock_rows(10),
+                parallel_workers=2, parallel_threshold=100
+            )
+
+        pool_cls.assert_not_called()
+        assert len(result.metadata['transform_chunks']) == 1
+
+    async def test_run_parallel_failure_falls_back(self, mock_mongo_service):
+        """Test a broken pool falls back to in-process transform with a warning."""
+        with patch('airflow.dags.utils.etl_pipeline.ProcessPoolExecutor', side_effect=OSError("no fork")):
+            result = await self._run_stock(
+                mock_mongo_service, self._stock_rows(10),
+                parallel_workers=2, parallel_threshold=1
+            )
+
+        assert result.transformed_count == 9
+        assert any("Parallel transform failed" in w for w in result.warnings)
+
+    async def test_run_with_dataframe_input(self, mock_mongo_service, sample_news_articles):
+        """Test DataFrame input is transformed column-wise and loaded as records."""
+        pd = pytest.importorskip("pandas")
+        from airflow.dags.utils.etl_pipeline import ETLPipeline
+
+        mock_collection = MagicMock()
+        mock_collection.update_one.return_value = MagicMock(upserted_id="new_id", modified_count=0)
+        mock_collection.insert_one.return_value = MagicMock(inserted_id="inserted_id")
+        mock_mongo_service.db.__getitem__.return_value = mock_collection
+
+        pipeline = ETLPipeline(mock_mongo_service)
+        result = await pipeline.run(
+            raw_data=pd.DataFrame(sample_news_articles),
+            source_id="test_source",
+            skip_unchanged=False,
+            use_staging=False
+        )
+
+        assert result.extracted_count == len(sample_news_articles)
+        assert result.transformed_count > 0
+        loaded = mock_collection.update_one.call_args[0][1]['$set']
+        assert isinstance(loaded, dict)
+        assert 'content_hash' in loaded
+
+
+@pytest.mark.asyncio
+class TestETLPipelineRunStream:
+    """Tests for ETLPipeline.run_stream() method."""
+
+    @staticmethod
+    def _stock_config():
+        from airflow.dags.utils.etl_pipeline import TransformConfig, DataCategory
+
+        return TransformConfig(category=DataCategory.STOCK_PRICE, required_fields=['name', 'price'],
+                               dedup_fields=['code'])
+
+    @staticmethod
+    def _mock_collection(mock_mongo_service):
+        mock_collection = MagicMock()
+        mock_collection.update_one.return_value = MagicMock(upserted_id="new_id", modified_count=0)
+        mock_mongo_service.db.__getitem__.return_value = mock_collection
+        return mock_collection
+
+    async def test_stream_matches_run(self, mock_mongo_service):
+        """Test windowed counters add up to the same totals as run()."""
+        from airflow.dags.utils.etl_pipeline import ETLPipeline, DataCategory
+
+        rows = TestETLPipelineRun._stock_rows(10)
+        rows.append(dict(rows[0]))  # 다른 윈도우에 걸친 중복
+        self._mock_collection(mock_mongo_service)
+        pipeline = ETLPipeline(mock_mongo_service)
+        kwargs = dict(source_id="test_source", category=DataCategory.STOCK_PRICE,
+                      transform_config=self._stock_config(), skip_unchanged=False, use_staging=False)
+
+        batch = await pipeline.run(raw_data=list(rows), **kwargs)
+        stream = await pipeline.run_stream(iter(rows), window_size=4, **kwargs)
+
+        assert [w['start'] for w in stream.metadata['windows']] == [0, 4, 8]
+        for attr in ('extracted_count', 'transformed_count', 'loaded_count',
+                     'duplicate_count', 'invalid_count', 'quality_score'):
+            assert getattr(stream, attr) == getattr(batch, attr), attr
+        assert stream.duplicate_count == 1
+        assert stream.success
+
+    async def test_stream_indices_are_global(self, mock_mongo_service):
+        """Test _order_index / _record_index / review indices continue across windows."""
+        pd = pytest.importorskip("pandas")
+        from airflow.dags.utils.etl_pipeline import ETLPipeline, DataCategory, TransformConfig
+
+        rows = TestETLPipelineRun._stock_rows(10)
+
+        async def indices(run, **config):
+            from bson import ObjectId
+
+            collection = self._mock_collection(mock_mongo_service)
+            collection.update_one.side_effect = lambda *a, **k: MagicMock(upserted_id=ObjectId(), modified_count=0)
+            t_config = TransformConfig(category=DataCategory.STOCK_PRICE, required_fields=['name', 'price'],
+                                       dedup_fields=['code'], **config)
+            await run(source_id=str(ObjectId()), category=DataCategory.STOCK_PRICE, transform_config=t_config,
+                      skip_unchanged=False, use_staging=True)
+            loaded = [c.args[1]['$set'] for c in collection.update_one.call_args_list]
+            reviews = [doc for c in collection.insert_many.call_args_list for doc in c.args[0]]
+            return ([r['_order_index'] for r in loaded], [r['_record_index'] for r in loaded],
+                    [doc['data_record_index'] for doc in reviews])
+
+        pipeline = ETLPipeline(mock_mongo_service)
+        expected = await indices(lambda **kw: pipeline.run(raw_data=[dict(r) for r in rows], **kw))
+        # 품질 미달 1건 제외, 윈도우마다 0부터 다시 시작하지 않음
+        assert expected[0] == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+        assert expected[1] == expected[2] == list(range(9))
+
+        def stream(records, **kw):
+            return pipeline.run_stream(records, window_size=4, **kw)
+
+        assert await indices(lambda **kw: stream(iter([dict(r) for r in rows]), **kw)) == expected
+        assert await indices(lambda **kw: stream(iter([dict(r) for r in rows]), **kw),
+                             parallel_workers=2, parallel_threshold=2, parallel_chunk_size=2) == expected
+        frame = pd.DataFrame(rows)
+        chunks = [frame.iloc[start:start + 4] for start in range(0, 10, 4)]
+        order, record, _ = await indices(lambda **kw: stream(iter(chunks), **kw))
+        assert order == record == list(range(len(order))) and len(order) > 4
+
+    async def test_stream_accepts_async_iterator(self, mock_mongo_service):
+        """Test async generators are consumed window by window."""
+        from airflow.dags.utils.etl_pipeline import ETLPipeline, DataCategory
+
+        mock_collection = self._mock_collection(mock_mongo_service)
+        pulled = []
+
+        async def produce():
+            for row in TestETLPipelineRun._stock_rows(6):
+                pulled.append(row)
+                yield row
+
+        loads = []
+
+        def track(*args, **kwargs):
+            loads.append(len(pulled))
+            return MagicMock(upserted_id="new_id", modified_count=0)
+
+        mock_collection.update_one.side_effect = track
+        result = await ETLPipeline(mock_mongo_service).run_stream(
+            produce(), source_id="test_source", category=DataCategory.STOCK_PRICE,
+            transform_config=self._stock_config(), skip_unchanged=False, use_staging=False,
+            window_size=3
+        )
+
+        assert result.extracted_count == 6
+        assert result.loaded_count == 5
+        # 첫 윈도우는 나머지 레코드를 읽기 전에 적재됨
+        assert loads[0] == 3
+
+    async def test_stream_empty(self, mock_mongo_service):
+        """Test an empty stream returns a successful empty result."""
+        from airflow.dags.utils.etl_pipeline import ETLPipeline
+
+        result = await ETLPipeline(mock_mongo_service).run_stream(
+            iter([]), source_id="test_source", skip_unchanged=False, use_staging=False
+        )
+
+        assert result.extracted_count == 0
+        assert result.success
+        assert result.metadata['windows'] == []
+
+    async def test_stream_dataframe_chunks(self, mock_mongo_service, sample_news_articles):
+        """Test DataFrame chunks are transformed column-wise as one window each."""
+        pd = pytest.importorskip("pandas")
+        from airflow.dags.utils.etl_pipeline import ETLPipeline
+
+        self._mock_collection(mock_mongo_service)
+        frame = pd.DataFrame(sample_news_articles)
+        chunks = [frame.iloc[:1], frame.iloc[1:]]
+
+        result = await ETLPipeline(mock_mongo_service).run_stream(
+            iter(chunks), source_id="test_source", skip_unchanged=False, use_staging=False
+        )
+
+        assert result.extracted_count == len(sample_news_articles)
+        assert len(result.metadata['windows']) == 2
+        assert result.transformed_count > 0
+
 
 class TestURLNormalization:
     """Tests for URL normalization."""
@@ -1,5 +1,7 @@
 """Tests for dashboard endpoints."""
 
+import pytest
+
 
 class TestDashboardStats:
     def test_dashboard_stats_returns_200(self, client, mock_mongo):
@@ -37,3 +39,49 @@ class TestDashboardTrends:
         resp = client.get("/api/dashboard/trends")
         # May return 200 or different status depending on implementation
         assert resp.status_code in (200, 404, 500)
+
+
+@pytest.fixture
+def dashboard_mongo(client, mock_mongo):
+    """dashboard 라우터의 get_mongo를 mock_mongo로 교체"""
+    from app.main import app
+    from app.routers.dashboard import get_mongo
+
+    mock_mongo.db.__getitem__.side_effect = lambda name: getattr(mock_mongo.db, name)
+    app.dependency_overrides[get_mongo] = lambda: mock_mongo
+    yield mock_mongo
+    app.dependency_overrides.pop(get_mongo, None)
+
+
+class TestDashboardAsyncQueries:
+    def test_dashboard_stats_from_concurrent_aggregations(self, client, dashboard_mongo):
+        dashboard_mongo.db.sources.aggregate.return_value = [
+            {'total': [{'count': 4}], 'active': [{'count': 3}], 'error': [{'count': 1}]}
+        ]
+        dashboard_mongo.db.crawlers.aggregate.return_value = [{'total': [{'count': 2}], 'active': []}]
+        dashboard_mongo.db.crawl_results.aggregate.return_value = [{'total': 4, 'success': 3, 'failed': 1}]
+        dashboard_mongo.db.error_logs.count_documents.return_value = 7
+        dashboard_mongo.health_check.return_value = {"status": "healthy"}
+
+        resp = client.get("/api/dashboard")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["sources"] == {"total": 4, "active": 3, "error": 1}
+        assert data["crawlers"] == {"total": 2, "active": 0}
+        assert data["recent_executions"]["success_rate"] == 75.0
+        assert data["unresolved_errors"] == 7
+
+    def test_sources_status(self, client, dashboard_mongo):
+        # 두 aggregation은 동시에 실행되므로 호출 순서가 아닌 파이프라인으로 구분
+        status_counts = [{'_id': 'active', 'count': 5}, {'_id': None, 'count': 1}]
+        issues = [{'_id': 'abc', 'name': 'flaky', 'error_count': 9}]
+        dashboard_mongo.db.sources.aggregate.side_effect = (
+            lambda pipeline: status_counts if '$group' in pipeline[0] else issues
+        )
+
+        resp = client.get("/api/dashboard/sources-status")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total_sources"] == 6
+        assert data["status_summary"]["inactive"] == 1
+        assert data["sources_with_issues"][0]["name"] == "flaky"
@@ -0,0 +1,141 @@
+"""
+Shared fakes for export tests (test_export_service.py, test_export_worker.py).
+"""
+
+import csv
+import io
+import time
+
+from bson import ObjectId
+
+
+class FakeCursor:
+    def __init__(self, collection, docs):
+        self.collection = collection
+        self.docs = docs
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, key, direction=1):
+        self.docs = sorted(self.docs, key=lambda d: d[key], reverse=direction < 0)
+        return self
+
+    def skip(self, n):
+        self._skip = n
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def __iter__(self):
+        end = self._skip + self._limit if self._limit else None
+        docs = self.docs[self._skip:end]
+        # skip한 문서도 서버가 훑어야 함
+        self.collection.examined += self._skip + len(docs)
+        return iter(docs)
+
+
+class FakeCollection:
+    """find/aggregate 최소 구현 (일치, $gt/$gte/$lt/$lte, $and, projection, $sample 지원, 작업량 기록)"""
+
+    OPERATORS = {
+        "$gt": lambda a, b: a > b,
+        "$gte": lambda a, b: a >= b,
+        "$lt": lambda a, b: a < b,
+        "$lte": lambda a, b: a <= b,
+    }
+
+    def __init__(self, docs, delay=0.0):
+        self.docs = docs
+        self.delay = delay
+        self.examined = 0
+        self.queries = []
+        self.projections = []
+        self.aggregations = []
+
+    def _matches(self, doc, query):
+        for key, cond in query.items():
+            if key == "$and":
+                if not all(self._matches(doc, sub) for sub in cond):
+                    return False
+            elif isinstance(cond, dict):
+                if not all(self.OPERATORS[op](doc[key], value) for op, value in cond.items()):
+                    return False
+            elif doc.get(key) != cond:
+                return False
+        return True
+
+    def _project(self, doc, projection):
+        if not projection:
+            return dict(doc)
+        return {head: doc[head] for head in {path.split(".")[0] for path in projection} if head in doc}
+
+    def find(self, query, projection=None):
+        time.sleep(self.delay)
+        self.queries.append(query)
+        self.projections.append(projection)
+        return FakeCursor(self, [self._project(d, projection) for d in self.docs if self._matches(d, query)])
+
+    def find_one(self, query, projection=None):
+        return next(iter(self.find(query, projection).limit(1)), None)
+
+    def count_documents(self, query):
+        return sum(1 for d in self.docs if self._matches(d, query))
+
+    def aggregate(self, pipeline):
+        self.aggregations.append(pipeline)
+        docs = [d for d in self.docs if self._matches(d, pipeline[0]["$match"])]
+        # 결정적인 "샘플": 균등 간격
+        size = pipeline[1]["$sample"]["size"]
+        step = max(1, len(docs) // size)
+        return [{"_id": d["_id"]} for d in docs[::step][:size]]
+
+
+class FakeJobs:
+    def __init__(self):
+        self.jobs = {}
+        self.updates = []
+        self.reads = 0
+
+    def insert_one(self, doc):
+        self.jobs[doc["_id"]] = dict(doc)
+
+    def find_one(self, query):
+        self.reads += 1
+        job = self.jobs.get(query["_id"])
+        return dict(job) if job else None
+
+    def update_one(self, query, update):
+        self.updates.append(update["$set"])
+        if query["_id"] in self.jobs:
+            self.jobs[query["_id"]].update(update["$set"])
+
+
+class FakeDatabase(dict):
+    def __getattr__(self, name):
+        return self[name]
+
+
+class FakeMongo:
+    def __init__(self, docs, delay=0.0):
+        self.db = FakeDatabase(crawl_results=FakeCollection(docs, delay), export_jobs=FakeJobs())
+
+
+def make_docs(count, title="title"):
+    return [
+        {
+            "_id": ObjectId(i.to_bytes(12, "big")),
+            "status": "success" if i % 3 else "failed",
+            "record_count": i,
+            "data": {"title": f"{title} {i}", "body": "x" * 50},
+        }
+        for i in range(count)
+    ]
+
+
+def read_csv(data, encoding="utf-8-sig"):
+    """CSV 바이트 (또는 스트리밍 청크 목록)를 행 목록으로"""
+    if not isinstance(data, bytes):
+        data = b"".join(data)
+    return list(csv.reader(io.StringIO(data.decode(encoding), newline="")))
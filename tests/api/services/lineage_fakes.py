@@ -0,0 +1,69 @@
+"""
+Shared fakes for lineage tests (test_lineage_tracker.py, test_lineage_index.py).
+"""
+
+import random
+
+from api.app.services.lineage.tracker import EdgeType, LineageEdge, LineageNode, LineageTracker, NodeType
+
+
+class FakeLineageCollection:
+    """find/find_one 최소 구현 (필드 일치 또는 $in, 호출 수 기록)"""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = 0
+
+    def _matches(self, doc, query):
+        for key, cond in query.items():
+            if isinstance(cond, dict):
+                if doc.get(key) not in cond["$in"]:
+                    return False
+            elif doc.get(key) != cond:
+                return False
+        return True
+
+    def find(self, query, projection=None):
+        self.calls += 1
+        return [dict(doc) for doc in self.docs if self._matches(doc, query)]
+
+    def find_one(self, query, projection=None):
+        self.calls += 1
+        return next((dict(doc) for doc in self.docs if self._matches(doc, query)), None)
+
+
+class FakeMongo:
+    def __init__(self, nodes, edges):
+        self.db = {
+            LineageTracker.NODES_COLLECTION: FakeLineageCollection(nodes),
+            LineageTracker.EDGES_COLLECTION: FakeLineageCollection(edges),
+        }
+
+    @property
+    def calls(self):
+        return sum(c.calls for c in self.db.values())
+
+
+def make_node(i):
+    return LineageNode(
+        node_id=f"n{i}", node_type=NodeType.DATASET, name=f"ds{i}", qualified_name=f"dataset://ds{i}"
+    ).to_dict()
+
+
+def make_edge(a, b):
+    return LineageEdge(
+        edge_id=f"e{a}-{b}", source_node_id=f"n{a}", target_node_id=f"n{b}", edge_type=EdgeType.TRANSFORM
+    ).to_dict()
+
+
+def layered_graph(levels=6, width=8, fan_out=2, seed=0):
+    """레벨 간 무작위 엣지를 가진 DAG (노드 id = level * width + index)"""
+    rng = random.Random(seed)
+    nodes = [make_node(i) for i in range(levels * width)]
+    edges = []
+    for level in range(levels - 1):
+        for i in range(width):
+            src = level * width + i
+            for dst in rng.sample(range((level + 1) * width, (level + 2) * width), fan_out):
+                edges.append(make_edge(src, dst))
+    return nodes, edges
@@ -0,0 +1,177 @@
+"""
+Tests for AsyncMongoService (thread-pool offloaded MongoService).
+
+Covers:
+- Parity with the synchronous dashboard/activity methods
+- Independent aggregations running concurrently
+- Event loop staying responsive while slow queries run
+- Exception translation through db_operation
+- Offloaded CRUD methods
+"""
+
+import asyncio
+import time
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+
+from api.app.exceptions import DatabaseOperationError
+from api.app.services.async_mongo_service import AsyncMongoService
+from api.app.services.mongo_service import MongoService
+
+
+class FakeCollection:
+    """aggregate/count/find_one 최소 구현 (호출마다 delay초 블로킹)"""
+
+    def __init__(self, results=None, count=0, delay=0.0):
+        self.results = results or []
+        self.count = count
+        self.delay = delay
+        self.error = None
+
+    def _block(self):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+
+    def aggregate(self, pipeline):
+        self._block()
+        return iter([dict(doc) for doc in self.results])
+
+    def count_documents(self, query):
+        self._block()
+        return self.count
+
+    def find_one(self, query):
+        self._block()
+        return next((dict(doc) for doc in self.results if doc['_id'] == query.get('_id')), None)
+
+
+class FakeDatabase(dict):
+    def __getattr__(self, name):
+        return self[name]
+
+
+class FakeClient:
+    def __init__(self, db, delay=0.0):
+        self._db = db
+        self.admin = self
+        self.delay = delay
+
+    def __getitem__(self, name):
+        return self._db
+
+    def command(self, name):
+        time.sleep(self.delay)
+        return {'ok': 1}
+
+
+def make_mongo(delay=0.0):
+    source_id = ObjectId()
+    db = FakeDatabase(
+        sources=FakeCollection(
+            [{'_id': source_id, 'name': 'news', 'total': [{'count': 3}], 'active': [{'count': 2}],
+              'error': [{'count': 1}]}],
+            delay=delay
+        ),
+        crawlers=FakeCollection([{'total': [{'count': 4}], 'active': [{'count': 4}]}], delay=delay),
+        crawl_results=FakeCollection(
+            [{'_id': ObjectId(), 'source_id': source_id, 'total': 10, 'success': 9, 'failed': 1}],
+            delay=delay
+        ),
+        error_logs=FakeCollection(count=5, delay=delay),
+        crawler_history=FakeCollection(delay=delay),
+    )
+    mongo = MongoService()
+    mongo._client = FakeClient(db, delay=delay)
+    return mongo, db, source_id
+
+
+def without_volatile(stats):
+    return {k: v for k, v in stats.items() if k not in ('timestamp', 'health')}
+
+
+class TestAsyncMongoService:
+    @pytest.mark.asyncio
+    async def test_dashboard_stats_match_sync(self):
+        mongo, _, _ = make_mongo()
+        expected = mongo.get_dashboard_stats_optimized()
+
+        stats = await AsyncMongoService(mongo).get_dashboard_stats_optimized()
+
+        assert without_volatile(stats) == without_volatile(expected)
+        assert stats['sources'] == {'total': 3, 'active': 2, 'error': 1}
+        assert stats['recent_executions']['success_rate'] == 90.0
+        assert stats['unresolved_errors'] == 5
+        assert stats['health']['status'] == 'healthy'
+
+    @pytest.mark.asyncio
+    async def test_recent_activity_match_sync(self):
+        mongo, _, source_id = make_mongo()
+        expected = mongo.get_recent_activity_optimized(hours=6)
+
+        activity = await AsyncMongoService(mongo).get_recent_activity_optimized(hours=6)
+
+        assert activity == expected
+        assert activity['period_hours'] == 6
+        assert activity['crawl_results'][0]['source_id'] == str(source_id)
+
+    @pytest.mark.asyncio
+    async def test_dashboard_aggregations_run_concurrently(self):
+        mongo, _, _ = make_mongo(delay=0.2)
+        amongo = AsyncMongoService(mongo)
+        await amongo.health_check()  # 연결 단계 제외
+
+        start = time.perf_counter()
+        await amongo.get_dashboard_stats_optimized()
+        elapsed = time.perf_counter() - start
+
+        # 순차 실행이면 aggregation 3 + count 1 + ping 1 = 1.0초
+        assert elapsed < 0.6
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        mongo, _, _ = make_mongo(delay=0.3)
+        amongo = AsyncMongoService(mongo)
+
+        lags = []
+
+        async def ticker():
+            for _ in range(20):
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lags.append(time.perf_counter() - start)
+
+        await asyncio.gather(amongo.get_dashboard_stats_optimized(), ticker())
+
+        assert max(lags) < 0.15
+
+    @pytest.mark.asyncio
+    async def test_errors_are_translated(self):
+        mongo, db, _ = make_mongo()
+        db['crawlers'].error = OperationFailure("boom")
+
+        with pytest.raises(DatabaseOperationError):
+            await AsyncMongoService(mongo).get_dashboard_stats_optimized()
+
+    @pytest.mark.asyncio
+    async def test_offloaded_crud_methods(self):
+        mongo, _, source_id = make_mongo()
+        amongo = AsyncMongoService(mongo)
+
+        source = await amongo.get_source(str(source_id))
+        unresolved = await amongo.count_documents('error_logs', {'resolved': False})
+
+        assert source['name'] == 'news'
+        assert source['_id'] == str(source_id)
+        assert unresolved == 5
+        assert AsyncMongoService.get_source.__doc__ == MongoService.get_source.__doc__
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_injected_service_open(self):
+        mongo, _, _ = make_mongo()
+        async with AsyncMongoService(mongo) as amongo:
+            await amongo.health_check()
+
+        assert mongo._client is not None
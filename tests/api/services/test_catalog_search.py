@@ -0,0 +1,292 @@
+"""
+Tests for CatalogSearch inverted index search.
+
+Covers:
+- Tokenization (snake_case/camelCase, Korean syllable bigrams)
+- Global BM25 ranking across pages, AND semantics, prefix matching
+- Filters, sort options and facets over the full result set
+- Incremental updates from DataCatalog writes
+- Shared index loading in the background, retry backoff and fallback to regex search
+"""
+
+import threading
+from types import SimpleNamespace
+
+import mongomock
+import pytest
+
+from api.app.services.data_catalog import (
+    CatalogSearch,
+    CatalogSearchIndex,
+    DataCatalog,
+    DatasetType,
+    SearchFilter,
+    SortOption,
+    get_catalog_search_index,
+    reset_catalog_search_index,
+)
+from api.app.services.data_catalog.models import Column, ColumnType, QualityMetrics
+from api.app.services.data_catalog import search_index as search_index_module
+from api.app.services.data_catalog.search_index import tokenize
+
+
+class Mongo:
+    def __init__(self):
+        self.db = mongomock.MongoClient().db
+
+
+@pytest.fixture
+def mongo():
+    return Mongo()
+
+
+@pytest.fixture
+def index(mongo):
+    return CatalogSearchIndex().load(mongo)
+
+
+@pytest.fixture
+def catalog(mongo, index):
+    return DataCatalog(mongo, search_index=index)
+
+
+@pytest.fixture
+def search(mongo, index):
+    return CatalogSearch(mongo, index=index)
+
+
+def names(result):
+    return [d.name for d in result.datasets]
+
+
+class TestTokenize:
+    def test_latin_words(self):
+        assert tokenize("crawl_results crawlResults API-v2") == ["crawl", "results", "crawl", "results", "api", "v2"]
+
+    def test_korean_bigrams(self):
+        assert tokenize("뉴스기사를 수집") == ["뉴스", "스기", "기사", "사를", "수집"]
+        assert tokenize("글 news") == ["글", "news"]
+
+    def test_empty(self):
+        assert tokenize("") == [] and tokenize(None) == [] and tokenize("!!") == []
+
+
+class TestIndexSearch:
+    def test_global_relevance_across_pages(self, catalog, search):
+        # 오래된 데이터셋이 가장 관련도가 높음 (이전 구현은 페이지 안에서만 재정렬)
+        catalog.create_dataset("weather_archive", DatasetType.FINAL, description="weather weather weather")
+        for i in range(30):
+            catalog.create_dataset(f"dataset_{i:02d}", DatasetType.STAGING, description=f"misc table {i} weather")
+
+        first = search.search("weather", page=1, page_size=10)
+        second = search.search("weather", page=2, page_size=10)
+
+        assert first.total == 31
+        assert names(first)[0] == "weather_archive"
+        assert not set(names(first)) & set(names(second))
+        assert len(names(second)) == 10
+
+    def test_field_weights(self, catalog, search):
+        catalog.create_dataset("orders", DatasetType.FINAL, description="customer purchases")
+        catalog.create_dataset("customers", DatasetType.FINAL, description="people")
+        catalog.create_dataset("misc", DatasetType.FINAL, tags=["customers"])
+
+        assert names(search.search("customers"))[:2] == ["customers", "misc"]
+
+    def test_korean_substring_and_particles(self, catalog, search):
+        catalog.create_dataset("news_kr", DatasetType.FINAL, description="서울 지역 뉴스기사를 수집합니다")
+        catalog.create_dataset("finance_kr", DatasetType.FINAL, description="금융 데이터")
+
+        assert names(search.search("뉴스기사")) == ["news_kr"]
+        assert names(search.search("기사")) == ["news_kr"]
+        assert names(search.search("뉴")) == ["news_kr"]
+        assert search.search("기사 금융").total == 0
+
+    def test_and_semantics_and_prefix(self, catalog, search):
+        catalog.create_dataset("news_finance", DatasetType.FINAL, description="finance news")
+        catalog.create_dataset("news_sports", DatasetType.FINAL, description="sports news")
+        catalog.create_dataset("crawler_logs", DatasetType.SOURCE)
+
+        assert names(search.search("news finance")) == ["news_finance"]
+        assert set(names(search.search("news"))) == {"news_finance", "news_sports"}
+        assert names(search.search("craw")) == ["crawler_logs"]
+
+    def test_columns_are_searchable(self, catalog, search):
+        catalog.create_dataset(
+            "articles", DatasetType.FINAL,
+            columns=[Column(name="publishedAt", data_type=ColumnType.DATETIME, description="게시 시각")],
+        )
+
+        assert names(search.search("published")) == ["articles"]
+        assert names(search.search("게시")) == ["articles"]
+
+    def test_filters_and_facets(self, catalog, search):
+        for i in range(6):
+            catalog.create_dataset(
+                f"sales_{i}", DatasetType.FINAL if i % 2 else DatasetType.STAGING,
+                domain="commerce" if i < 4 else "finance", tags=["daily"] if i < 3 else [],
+                description="sales records",
+            )
+        catalog.create_dataset("other", DatasetType.FINAL, domain="commerce")
+
+        result = search.search("sales", filters=SearchFilter(domains=["commerce"], tags=["daily"]))
+        assert sorted(names(result)) == ["sales_0", "sales_1", "sales_2"]
+
+        facets = {f.field: f.values for f in search.search("sales").facets}
+        assert facets["domain"] == [{"value": "commerce", "count": 4}, {"value": "finance", "count": 2}]
+        assert sorted(facets["dataset_type"], key=lambda v: v["value"]) == [
+            {"value": "final", "count": 3}, {"value": "staging", "count": 3}
+        ]
+        assert facets["tags"] == [{"value": "daily", "count": 3}]
+        assert facets["quality_score"] == [{"value": "Unknown", "count": 6}]
+
+    def test_quality_filter_and_sort(self, catalog, search):
+        for i, score in enumerate([40, 90, 75]):
+            dataset = catalog.create_dataset(f"metric_{i}", DatasetType.FINAL, description="metrics")
+            metrics = QualityMetrics(score, score, score, score, score, score)
+            catalog.update_quality_metrics(dataset.id, metrics)
+
+        result = search.search("metrics", filters=SearchFilter(min_quality_score=70), sort_by=SortOption.QUALITY_DESC)
+        assert names(result) == ["metric_1", "metric_2"]
+        assert names(search.search("metrics", sort_by=SortOption.NAME_DESC)) == ["metric_2", "metric_1", "metric_0"]
+
+    def test_popularity_follows_record_access(self, catalog, search):
+        a = catalog.create_dataset("report_a", DatasetType.FINAL)
+        b = catalog.create_dataset("report_b", DatasetType.FINAL)
+        catalog.record_access(b.id)
+
+        assert names(search.search("report", sort_by=SortOption.POPULARITY)) == ["report_b", "report_a"]
+        catalog.record_access(a.id)
+        catalog.record_access(a.id)
+        assert names(search.search("report", sort_by=SortOption.POPULARITY)) == ["report_a", "report_b"]
+
+    def test_no_results_and_suggestions(self, catalog, search):
+        catalog.create_dataset("weather", DatasetType.FINAL)
+
+        result = search.search("weatherproof")
+
+        assert result.total == 0 and result.datasets == []
+        assert result.suggestions == ["weather"]
+
+
+class TestIncrementalUpdates:
+    def test_catalog_writes_update_index(self, catalog, search, index):
+        dataset = catalog.create_dataset("events", DatasetType.STAGING, description="click stream")
+        assert names(search.search("click")) == ["events"]
+
+        catalog.update_dataset(dataset.id, {"description": "page views"})
+        assert search.search("click").total == 0
+        assert names(search.search("views")) == ["events"]
+
+        catalog.add_tags_to_dataset(dataset.id, ["analytics"])
+        assert names(search.search("analytics")) == ["events"]
+        catalog.remove_tags_from_dataset(dataset.id, ["analytics"])
+        assert search.search("analytics").total == 0
+
+        catalog.add_column(dataset.id, Column(name="session_id", data_type=ColumnType.STRING))
+        assert names(search.search("session")) == ["events"]
+
+        catalog.delete_dataset(dataset.id)
+        assert search.search("views").total == 0
+        assert len(index) == 0 and index.get_stats()["terms"] == 0
+
+    def test_load_matches_incremental(self, mongo, catalog, index):
+        for i in range(20):
+            dataset = catalog.create_dataset(f"ds_{i}", DatasetType.FINAL, description=f"topic{i % 4} data")
+            if i % 3 == 0:
+                catalog.update_dataset(dataset.id, {"description": "replaced text"})
+
+        fresh = CatalogSearchIndex().load(mongo)
+
+        for query in ("data", "topic1", "replaced", "ds"):
+            assert fresh.search(query) == index.search(query)
+
+
+class TestSharedIndex:
+    def setup_method(self):
+        reset_catalog_search_index()
+
+    def teardown_method(self):
+        reset_catalog_search_index()
+
+    def test_get_catalog_search_index(self, mongo):
+        DataCatalog(mongo).create_dataset("alpha", DatasetType.FINAL)
+
+        assert get_catalog_search_index() is None
+        index = get_catalog_search_index(mongo, wait=True)
+        assert len(index) == 1
+        assert get_catalog_search_index() is index
+
+    def test_expired_index_served_while_reloading(self, mongo, monkeypatch):
+        DataCatalog(mongo).create_dataset("alpha", DatasetType.FINAL)
+        index = get_catalog_search_index(mongo, wait=True)
+        DataCatalog(mongo).create_dataset("beta", DatasetType.FINAL)
+
+        # 재적재가 끝나지 않아도 호출은 기존 인덱스를 바로 반환
+        started, release = threading.Event(), threading.Event()
+        original_load = CatalogSearchIndex.load
+
+        def slow_load(self, mongo_service):
+            started.set()
+            release.wait(5)
+            return original_load(self, mongo_service)
+
+        monkeypatch.setattr(CatalogSearchIndex, "load", slow_load)
+        index.loaded_at -= 3600
+
+        assert get_catalog_search_index(mongo, ttl_seconds=60) is index
+        assert started.wait(5)
+        assert len(index) == 1
+
+        release.set()
+        assert get_catalog_search_index(mongo, ttl_seconds=60, wait=True) is index
+        assert len(index) == 2
+
+    def test_writes_during_reload_are_replayed(self, mongo):
+        catalog = DataCatalog(mongo)
+        catalog.create_dataset("alpha_kept", DatasetType.FINAL)
+        dropped = catalog.create_dataset("alpha_dropped", DatasetType.FINAL)
+        index = get_catalog_search_index(mongo, wait=True)
+        catalog = DataCatalog(mongo, search_index=index)
+
+        def scan(*args):
+            # 스캔이 끝난 직후(교체 전) 카탈로그 쓰기가 들어옴
+            yield from mongo.db.data_catalog.find(*args)
+            catalog.create_dataset("alpha_new", DatasetType.FINAL)
+            catalog.delete_dataset(dropped.id)
+
+        index.load(SimpleNamespace(db=SimpleNamespace(data_catalog=SimpleNamespace(find=scan))))
+
+        result = CatalogSearch(mongo, index=index).search("alpha", include_facets=False)
+        assert sorted(names(result)) == ["alpha_kept", "alpha_new"]
+
+    def test_failed_load_backs_off(self, mongo, monkeypatch):
+        calls = []
+
+        def failing_load(self, mongo_service):
+            calls.append(1)
+            raise RuntimeError("mongo down")
+
+        monkeypatch.setattr(CatalogSearchIndex, "load", failing_load)
+
+        assert get_catalog_search_index(mongo, wait=True) is None
+        assert get_catalog_search_index(mongo, wait=True) is None
+        assert len(calls) == 1
+
+        monkeypatch.setattr(search_index_module, "CATALOG_SEARCH_INDEX_RETRY_SECONDS", 0)
+        get_catalog_search_index(mongo, wait=True)
+        assert len(calls) == 2
+
+    def test_fallback_without_index(self, mongo):
+        DataCatalog(mongo).create_dataset("alpha_table", DatasetType.FINAL, description="first")
+        search = CatalogSearch(mongo)
+
+        result = search.search("alpha", include_facets=False)
+
+        assert names(result) == ["alpha_table"]
+
+    def test_untokenizable_query_falls_back(self, mongo, index):
+        DataCatalog(mongo, search_index=index).create_dataset("c++", DatasetType.FINAL)
+
+        assert index.search("++") is None
+        assert names(CatalogSearch(mongo, index=index).search("\\+\\+", include_facets=False)) == ["c++"]
@@ -0,0 +1,318 @@
+"""
+Tests for ChangeDetectionService and its content hash cache.
+
+Covers:
+- Batch change classification (new / modified / unchanged)
+- Cache hits skipping the content_hashes lookup
+- Cold misses answered with the batch $in query (no full-source load)
+- Version-based invalidation after writes from another process
+- Delta-only hash writes
+- On-disk persistence (snapshot + append-only delta log) and LRU eviction
+- Upgrading stored MD5 hashes to the shared fingerprint
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.app.services import change_detection
+from api.app.services.change_detection import ChangeDetectionService
+from api.app.services.content_hash_cache import ContentHashCache
+from api.app.services.fingerprint import RecordFingerprinter
+
+
+class FakeHashStore:
+    """content_hashes / content_hash_versions 최소 구현 (호출 수 기록)"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.versions = {}
+        self.hashes_coll = MagicMock()
+        self.versions_coll = MagicMock()
+
+        self.hashes_coll.find.side_effect = self._find
+        self.hashes_coll.bulk_write.side_effect = self._bulk_write
+        self.versions_coll.find_one.side_effect = (
+            lambda q: {"_id": q["_id"], "version": self.versions[q["_id"]]} if q["_id"] in self.versions else None
+        )
+        self.versions_coll.find_one_and_update.side_effect = self._inc
+
+        self.db = {
+            ChangeDetectionService.HASH_COLLECTION: self.hashes_coll,
+            ChangeDetectionService.HASH_VERSION_COLLECTION: self.versions_coll,
+        }
+
+    def _find(self, query, projection=None):
+        source_id = query["source_id"]
+        ids = query.get("record_id", {}).get("$in")
+        return [
+            {"record_id": rid, "content_hash": h}
+            for (sid, rid), h in self.hashes.items()
+            if sid == source_id and (ids is None or rid in ids)
+        ]
+
+    def _bulk_write(self, ops):
+        for op in ops:
+            key = (op._filter["source_id"], op._filter["record_id"])
+            self.hashes[key] = op._doc["$set"]["content_hash"]
+        return SimpleNamespace(upserted_count=len(ops), modified_count=0)
+
+    def _inc(self, query, update, upsert=False, return_document=None):
+        self.versions[query["_id"]] = self.versions.get(query["_id"], 0) + 1
+        return {"_id": query["_id"], "version": self.versions[query["_id"]]}
+
+    def external_write(self, source_id, record_id, content_hash):
+        """다른 프로세스의 쓰기"""
+        self.hashes[(source_id, record_id)] = content_hash
+        self.versions[source_id] = self.versions.get(source_id, 0) + 1
+
+
+@pytest.fixture(autouse=True)
+def plain_logger():
+    with patch.object(change_detection, "logger", MagicMock()):
+        yield
+
+
+@pytest.fixture
+def store():
+    return FakeHashStore()
+
+
+def make_records(count, suffix=""):
+    return [{"url": f"https://example.com/{i}", "title": f"제목 {i}{suffix}"} for i in range(count)]
+
+
+def in_queries(store):
+    return [c for c in store.hashes_coll.find.call_args_list if "$in" in str(c)]
+
+
+@pytest.mark.asyncio
+class TestChangeDetectionCache:
+    async def test_results_match_uncached(self, store):
+        records = make_records(10)
+        uncached = ChangeDetectionService(SimpleNamespace(db=store.db), use_cache=False)
+        await uncached.update_hashes("src", make_records(6))
+
+        cached = ChangeDetectionService(SimpleNamespace(db=store.db), hash_cache=ContentHashCache())
+        changed = make_records(10)
+        changed[0]["title"] = "수정됨"
+
+        expected = await uncached.check_batch("src", [dict(r) for r in changed])
+        actual = await cached.check_batch("src", [dict(r) for r in changed])
+
+        assert (actual.new_count, actual.modified_count, actual.unchanged_count) == (4, 1, 5)
+        assert actual.unchanged_ids == expected.unchanged_ids
+        assert [r["url"] for r in actual.new_records] == [r["url"] for r in expected.new_records]
+        assert len(records) == actual.total_records
+
+    async def test_warm_cache_skips_hash_lookup(self, store):
+        cache = ContentHashCache()
+        service = ChangeDetectionService(SimpleNamespace(db=store.db), hash_cache=cache)
+        await service.update_hashes("src", make_records(100))
+
+        await service.check_batch("src", make_records(100))
+        store.hashes_coll.find.reset_mock()
+        result = await service.check_batch("src", make_records(100))
+
+        assert result.unchanged_count == 100
+        store.hashes_coll.find.assert_not_called()
+        stats = service.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["records_served"] == 100
+
+    async def test_verify_interval_skips_mongo_entirely(self, store):
+        cache = ContentHashCache(verify_interval_seconds=60)
+        service = ChangeDetectionService(SimpleNamespace(db=store.db), hash_cache=cache)
+        await service.check_batch("src", make_records(5))
+
+        store.versions_coll.find_one.reset_mock()
+        store.hashes_coll.find.reset_mock()
+        await service.check_batch("src", make_records(5))
+
+        store.versions_coll.find_one.assert_not_called()
+        store.hashes_coll.find.assert_not_called()
+
+    async def test_external_write_invalidates(self, store):
+        service = ChangeDetectionService(SimpleNamespace(db=store.db), hash_cache=ContentHashCache())
+        await service.update_hashes("src", make_records(3))
+        await service.check_batch("src", make_records(3))
+
+        record_id = service.generate_record_id(make_records(1)[0])
+        store.external_write("src", record_id, "other-hash")
+        result = await service.check_batch("src", make_records(3))
+
+        assert result.modified_count == 1
+        assert service.get_cache_stats()["invalidations"] == 1
+
+    async def test_update_writes_only_deltas(self, store):
+        service = ChangeDetectionService(SimpleNamespace(db=store.db), hash_cache=ContentHashCache())
+        await service.check_batch("src", make_records(10))
+        assert await service.update_hashes("src", make_records(10)) == 10
+
+        records = make_records(10)
+        records[3]["title"] = "수정됨"
+        store.hashes_coll.bulk_write.reset_mock()
+        assert await service.update_hashes("src", records) == 1
+        assert len(store.hashes_coll.bulk_write.call_args[0][0]) == 1
+
+        store.hashes_coll.bulk_write.reset_mock()
+        assert await service.update_hashes("src", records) == 0
+        store.hashes_coll.bulk_write.assert_not_called()
+
+        # 쓰기 후에도 캐시가 DB와 일치
+        store.hashes_coll.find.reset_mock()
+        result = await service.check_batch("src", records)
+        assert result.unchanged_count == 10
+        assert in_queries(store) == []
+
+    async def test_cold_miss_queries_batch_ids_only(self, store):
+        for i in range(1000):
+            store.external_write("src", f"other-{i}", "h")
+        service = ChangeDetectionService(SimpleNamespace(db=store.db), use_cache=False)
+        await service.update_hashes("src", make_records(20))
+
+        cache = ContentHashCache()
+        cached = ChangeDetectionService(SimpleNamespace(db=store.db), hash_cache=cache)
+        store.hashes_coll.find.reset_mock()
+        first = await cached.check_batch("src", make_records(10))
+        second = await cached.check_batch("src", make_records(30))
+
+        assert (first.unchanged_count, second.unchanged_count, second.new_count) == (10, 20, 10)
+        # 소스 전체(1,020건)를 적재하지 않고, 두 번째 배치는 캐시에 없는 20건만 조회
+        queried = [c.args[0]["record_id"]["$in"] for c in store.hashes_coll.find.call_args_list]
+        assert [len(ids) for ids in queried] == [10, 20]
+        assert len(cache) == 30
+
+        store.hashes_coll.find.reset_mock()
+        third = await cached.check_batch("src", make_records(30))
+        assert third.new_count == 10  # 해시 없음(None)도 캐시됨
+        store.hashes_coll.find.assert_not_called()
+
+
+class TestContentHashCache:
+    def test_version_mismatch_returns_none(self):
+        cache = ContentHashCache()
+        cache.put("src", {"a": "1"}, version=1)
+
+        assert cache.get("src", 1) == {"a": "1"}
+        assert cache.get("src", 2) is None
+        assert "src" not in cache
+
+    def test_lru_eviction_by_entry_count(self):
+        cache = ContentHashCache(max_entries=5)
+        cache.put("a", {str(i): "h" for i in range(3)}, 1)
+        cache.put("b", {str(i): "h" for i in range(2)}, 1)
+        cache.get("a", 1)
+        cache.put("c", {"x": "h"}, 1)
+
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert len(cache) == 4
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_oversized_source_not_cached(self):
+        cache = ContentHashCache(max_entries=2)
+        assert cache.put("src", {"a": "1", "b": "2", "c": "3"}, 1) is False
+        assert "src" not in cache
+
+    def test_apply_requires_previous_version(self):
+        cache = ContentHashCache()
+        cache.put("src", {"a": "1"}, 1)
+
+        assert cache.apply("src", [("b", "2")], previous_version=1, version=2)
+        assert cache.get("src", 2) == {"a": "1", "b": "2"}
+        assert not cache.apply("src", [("c", "3")], previous_version=5, version=6)
+        assert "src" not in cache
+
+    def test_add_extends_entry_of_same_version(self):
+        cache = ContentHashCache(max_entries=4)
+        cache.add("src", {"a": "1", "b": None}, 1)
+        cache.add("src", {"c": "3"}, 1)
+        assert cache.get("src", 1) == {"a": "1", "b": None, "c": "3"}
+
+        cache.add("src", {"d": "4"}, 2)
+        assert cache.get("src", 2) == {"d": "4"}
+        assert cache.add("src", {str(i): "h" for i in range(4)}, 2) is False
+        assert "src" not in cache
+
+    def test_persisted_file_survives_restart(self, tmp_path):
+        cache = ContentHashCache(persist_dir=str(tmp_path))
+        cache.put("source/1", {"a": "1", "b": "2", "n": None}, 7)
+        cache.apply("source/1", [("c", "3")], 7, 8)
+
+        restarted = ContentHashCache(persist_dir=str(tmp_path))
+        assert restarted.get("source/1", 8) == {"a": "1", "b": "2", "n": None, "c": "3"}
+        assert restarted.get_stats()["disk_loads"] == 1
+
+        restarted.invalidate("source/1")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_batches_append_deltas_instead_of_rewriting(self, tmp_path):
+        cache = ContentHashCache(persist_dir=str(tmp_path))
+        cache.put("src", {str(i): "h" for i in range(1000)}, 1)
+        snapshot = tmp_path / "src.hashes.gz"
+        mtime = snapshot.stat().st_mtime_ns
+
+        cache.add("src", {"x": None}, 1)
+        cache.apply("src", [("y", "2")], previous_version=1, version=2)
+
+        assert snapshot.stat().st_mtime_ns == mtime
+        assert (tmp_path / "src.hashes.log").read_text() == "x\t\ny\t2\n#2\n"
+        restarted = ContentHashCache(persist_dir=str(tmp_path))
+        assert restarted.get("src", 2) == {**{str(i): "h" for i in range(1000)}, "x": None, "y": "2"}
+
+    def test_log_compacts_into_snapshot(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ContentHashCache, "COMPACT_MIN_LINES", 3)
+        cache = ContentHashCache(persist_dir=str(tmp_path))
+        cache.put("src", {"a": "1"}, 1)
+
+        cache.add("src", {"b": "2"}, 1)
+        assert (tmp_path / "src.hashes.log").exists()
+        cache.add("src", {"c": "3", "d": "4", "e": "5"}, 1)
+
+        assert not (tmp_path / "src.hashes.log").exists()
+        expected = {"a": "1", "b": "2", "c": "3", "d": "4", "e": "5"}
+        assert ContentHashCache(persist_dir=str(tmp_path)).get("src", 1) == expected
+
+    def test_torn_log_line_is_ignored(self, tmp_path):
+        cache = ContentHashCache(persist_dir=str(tmp_path))
+        cache.put("src", {"a": "1"}, 1)
+        cache.apply("src", [("b", "2")], previous_version=1, version=2)
+        with open(tmp_path / "src.hashes.log", "a") as f:
+            f.write("c\t3\n#3")  # 버전 줄 기록 중 중단
+
+        restarted = ContentHashCache(persist_dir=str(tmp_path))
+        assert restarted.get("src", 2) == {"a": "1", "b": "2", "c": "3"}
+
+
+@pytest.mark.asyncio
+class TestLegacyHashes:
+    async def test_legacy_md5_hash_counts_as_unchanged_and_is_upgraded(self, store):
+        service = ChangeDetectionService(SimpleNamespace(db=store.db), hash_cache=ContentHashCache())
+        records = make_records(3)
+        for record in records:
+            record_id = service.generate_record_id(record)
+            store.hashes[("src", record_id)] = service._legacy_hash(record)
+        records[2]["title"] = "수정됨"
+
+        result = await service.check_batch("src", [dict(r) for r in records])
+
+        assert (result.unchanged_count, result.modified_count) == (2, 1)
+        upgraded = sorted(h for (sid, _), h in store.hashes.items() if len(h) == 40)
+        assert len(upgraded) == 2
+
+        again = await service.check_batch("src", make_records(2))
+        assert again.unchanged_count == 2
+
+    async def test_hash_is_reused_by_update(self, store):
+        service = ChangeDetectionService(SimpleNamespace(db=store.db), use_cache=False)
+        result = await service.check_batch("src", make_records(2))
+
+        with patch.object(RecordFingerprinter, "fingerprint", side_effect=AssertionError("rehashed")):
+            assert await service.update_hashes("src", result.new_records) == 2
+
+        record = result.new_records[0]
+        assert len(record["_content_hash"]) == 40
+        assert store.hashes[("src", record["_record_id"])] == record["_content_hash"]
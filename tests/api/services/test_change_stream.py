@@ -0,0 +1,257 @@
+"""
+Tests for ChangeStreamListener.
+
+Covers:
+- Changes read off the event loop (reader thread) and dispatched in batches
+- Coalesced resume token checkpoints (count / time policy, final flush)
+- Resume from a stored token
+- Reader errors (ChangeStreamHistoryLost) surfaced to start()
+"""
+
+import asyncio
+import queue
+import threading
+import time
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from api.app.services.streaming.change_stream import (
+    ChangeStreamConfig,
+    ChangeStreamListener,
+    EventHandler,
+)
+
+
+class FakeStream:
+    """Blocking try_next like pymongo's ChangeStream (waits up to max_await_time_ms)."""
+
+    def __init__(self, max_await_ms):
+        self.changes = queue.Queue()
+        self.max_await = max_await_ms / 1000
+        self.resume_token = None
+        self.closed = threading.Event()
+        self.reader_threads = set()
+
+    def push(self, n, start=0, coll="staging_data"):
+        for i in range(start, start + n):
+            self.changes.put({
+                "_id": {"_data": f"token{i}"},
+                "operationType": "insert",
+                "ns": {"db": "test", "coll": coll},
+                "documentKey": {"_id": i},
+                "fullDocument": {"_id": i, "source_id": f"src_{i % 3}", "seq": i},
+            })
+
+    def try_next(self):
+        self.reader_threads.add(threading.current_thread().name)
+        try:
+            change = self.changes.get(timeout=self.max_await)
+        except queue.Empty:
+            return None
+        if isinstance(change, Exception):
+            raise change
+        self.resume_token = change["_id"]
+        return change
+
+    def close(self):
+        self.closed.set()
+
+
+class FakeTokens:
+    def __init__(self, stored=None):
+        self.stored = stored
+        self.writes = []
+        self.deleted = False
+
+    def find_one(self, query):
+        return {"stream_id": query["stream_id"], "token": self.stored} if self.stored else None
+
+    def update_one(self, query, update, upsert=False):
+        self.writes.append(update["$set"]["token"])
+
+    def delete_one(self, query):
+        self.deleted = True
+
+
+class FakeDatabase:
+    def __init__(self, stream, tokens):
+        self.stream = stream
+        self.tokens = tokens
+        self.watch_options = None
+
+    def watch(self, pipeline, **options):
+        self.watch_options = options
+        return self.stream
+
+    def __getitem__(self, name):
+        return self.tokens
+
+
+class FakeClient:
+    def __init__(self, db):
+        self.db = db
+
+    def __getitem__(self, name):
+        return self.db
+
+
+class Recorder(EventHandler):
+    def __init__(self):
+        self.events = []
+
+    async def handle(self, event):
+        self.events.append(event.data["seq"])
+        return True
+
+    async def on_error(self, event, error):
+        pass
+
+
+class BatchRecorder(Recorder):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def handle_batch(self, events):
+        self.batches.append(len(events))
+        self.events.extend(e.data["seq"] for e in events)
+
+
+def make_listener(stored_token=None, **config):
+    config.setdefault("max_await_time_ms", 50)
+    stream = FakeStream(config["max_await_time_ms"])
+    tokens = FakeTokens(stored_token)
+    listener = ChangeStreamListener(config=ChangeStreamConfig(**config), stream_id="test")
+    listener._client = FakeClient(FakeDatabase(stream, tokens))
+    return listener, stream, tokens
+
+
+async def wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+class TestChangeStreamListener:
+    @pytest.mark.asyncio
+    async def test_reads_off_loop_and_dispatches_batches(self):
+        listener, stream, tokens = make_listener(batch_size=50, checkpoint_interval_seconds=60, max_await_time_ms=500)
+        plain, batched = Recorder(), BatchRecorder()
+        listener.add_handler(plain)
+        listener.add_handler(batched)
+        stream.push(200)
+
+        task = asyncio.create_task(listener.start())
+        await wait_for(lambda: len(plain.events) == 200)
+
+        # 읽기 스레드가 try_next에서 최대 500ms 대기하는 동안에도 이벤트 루프는 응답
+        for _ in range(5):
+            start = time.monotonic()
+            await asyncio.sleep(0.01)
+            assert time.monotonic() - start < 0.1
+
+        await listener.stop()
+        await asyncio.wait_for(task, timeout=2)
+
+        assert plain.events == batched.events == list(range(200))
+        assert max(batched.batches) <= 50 and len(batched.batches) < 200
+        assert stream.reader_threads == {"change-stream-test"}
+        assert stream.closed.is_set()
+        # 변경마다 저장하지 않고 종료 시 마지막 토큰 한 번
+        assert tokens.writes == [{"_data": "token199"}]
+        assert listener.get_stats()["checkpoint_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_every_count(self):
+        listener, stream, tokens = make_listener(batch_size=100, checkpoint_every=100, checkpoint_interval_seconds=60)
+        handler = Recorder()
+        listener.add_handler(handler)
+        stream.push(300)
+
+        task = asyncio.create_task(listener.start())
+        await wait_for(lambda: len(handler.events) == 300)
+        await listener.stop()
+        await asyncio.wait_for(task, timeout=2)
+
+        # 배치 경계에서 100개 이상 쌓일 때마다 저장, 종료 시 마지막 토큰
+        saved = [int(t["_data"][5:]) for t in tokens.writes]
+        assert saved[-1] == 299
+        assert saved[0] >= 99 and all(b - a >= 100 for a, b in zip(saved, saved[1:-1]))
+        assert 2 <= len(saved) <= 4
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_interval_while_idle(self):
+        listener, stream, tokens = make_listener(checkpoint_interval_seconds=0.05)
+        handler = Recorder()
+        listener.add_handler(handler)
+
+        task = asyncio.create_task(listener.start())
+        stream.push(5)
+        await wait_for(lambda: tokens.writes)
+        assert tokens.writes[-1] == {"_data": "token4"}
+
+        stream.push(5, start=5)
+        await wait_for(lambda: tokens.writes[-1] == {"_data": "token9"})
+        writes = len(tokens.writes)
+        await asyncio.sleep(0.15)
+        assert len(tokens.writes) == writes  # 새 변경이 없으면 다시 쓰지 않음
+
+        await listener.stop()
+        await asyncio.wait_for(task, timeout=2)
+        assert handler.events == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_stored_token(self):
+        listener, stream, tokens = make_listener(stored_token={"_data": "token41"})
+        listener.add_handler(Recorder())
+
+        task = asyncio.create_task(listener.start())
+        await wait_for(lambda: listener.db.watch_options is not None)
+        await listener.stop()
+        await asyncio.wait_for(task, timeout=2)
+
+        assert listener.db.watch_options["resume_after"] == {"_data": "token41"}
+        assert tokens.writes == []
+
+    @pytest.mark.asyncio
+    async def test_reader_error_propagates(self):
+        listener, stream, tokens = make_listener(checkpoint_interval_seconds=60)
+        handler = Recorder()
+        listener.add_handler(handler)
+        stream.push(3)
+        stream.changes.put(OperationFailure("Error: ChangeStreamHistoryLost"))
+
+        with pytest.raises(OperationFailure):
+            await asyncio.wait_for(listener.start(), timeout=2)
+
+        assert handler.events == [0, 1, 2]
+        assert tokens.deleted
+        # 이력이 사라졌으므로 토큰을 다시 저장하지 않음
+        assert tokens.writes == []
+
+    @pytest.mark.asyncio
+    async def test_backpressure_bounds_pending_changes(self):
+        listener, stream, tokens = make_listener(batch_size=10, max_pending_changes=20)
+        release = asyncio.Event()
+        seen = []
+
+        class Slow(Recorder):
+            async def handle(self, event):
+                await release.wait()
+                seen.append(event.data["seq"])
+                return True
+
+        listener.add_handler(Slow())
+        stream.push(100)
+
+        task = asyncio.create_task(listener.start())
+        await asyncio.sleep(0.2)
+        # 첫 배치(10)를 처리 중, 나머지는 최대 20개만 읽어 둠
+        assert stream.changes.qsize() >= 100 - 10 - 20 - 1
+        release.set()
+        await wait_for(lambda: len(seen) == 100)
+        await listener.stop()
+        await asyncio.wait_for(task, timeout=2)
+        assert seen == list(range(100))
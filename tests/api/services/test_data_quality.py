@@ -471,3 +471,142 @@ class TestValidationResult:
             validated_at=datetime.utcnow(),
         )
         assert result.quality_score == 100.0
+
+
+# ============================================
+# Compiled Plan Tests
+# ============================================
+
+
+def legacy_validate_batch(profile, records):
+    """컴파일 이전 엔진 (행 단위, 필드마다 규칙 목록 생성)"""
+    for rules in [profile.global_rules, *profile.field_rules.values()]:
+        for rule in rules:
+            if isinstance(rule, UniqueRule):
+                rule.reset()
+
+    issues = []
+    field_stats = {}
+    for idx, record in enumerate(records):
+        for field_name, value in record.items():
+            stats = field_stats.setdefault(field_name, {
+                "total": 0, "null_count": 0, "empty_count": 0, "unique_values": set()
+            })
+            stats["total"] += 1
+            if value is None:
+                stats["null_count"] += 1
+            elif isinstance(value, str) and value.strip() == "":
+                stats["empty_count"] += 1
+            elif len(stats["unique_values"]) < 10000:
+                stats["unique_values"].add(str(value)[:100])
+
+        for field_name, value in record.items():
+            rules = list(profile.global_rules) + profile.field_rules.get(field_name, [])
+            for rule in [r for r in rules if r.enabled]:
+                issue = rule.validate(value, field_name, idx, None)
+                if issue:
+                    issues.append(issue)
+
+    for stats in field_stats.values():
+        stats["unique_count"] = len(stats["unique_values"])
+        stats["null_rate"] = round(stats["null_count"] / stats["total"] * 100, 2)
+        stats["empty_rate"] = round(stats["empty_count"] / stats["total"] * 100, 2)
+        del stats["unique_values"]
+    return issues, field_stats
+
+
+def make_records(n, seed=3):
+    import random
+    rng = random.Random(seed)
+    values = [None, "", "  ", "ok", "Ok", "깨짐�", "사설\ue000영역", "tab\there", "2024-01-05", "2999-01-01", "nope",
+              -3, 0, 7, 7.5, "12", True, datetime(2020, 1, 1), ("\x00",), "abc_1", "ABC"]
+    fields = ["title", "price", "date", "code", "extra"]
+    records = []
+    for _ in range(n):
+        names = rng.sample(fields, rng.randrange(2, len(fields) + 1))  # 필드 순서/누락 섞기
+        records.append({name: rng.choice(values) for name in names})
+    return records
+
+
+def make_profile(global_unique=False, custom=False):
+    profile = ValidationProfile.create_default("strict")
+    profile.add_field_rule("title", RequiredFieldRule(name="required_title"))
+    profile.add_field_rule("title", UniqueRule(name="unique_title", case_sensitive=False))
+    profile.add_field_rule("price", RangeRule(name="range_price", min_value=0, max_value=10))
+    profile.add_field_rule("date", DateRule(name="date_date"))
+    profile.add_field_rule("code", FormatRule(name="format_code", pattern=r"^[a-z]+_\d$"))
+    profile.add_field_rule("code", UniqueRule(name="unique_code"))
+    disabled = RangeRule(name="disabled_range", max_value=0)
+    disabled.enabled = False
+    profile.add_field_rule("price", disabled)
+    if global_unique:
+        profile.add_global_rule(UniqueRule(name="unique_any"))
+    if custom:
+        seen = []
+
+        def first_two(value, field_name, row_index, context):
+            seen.append(value)
+            if len(seen) <= 2:
+                return ValidationIssue("custom", field_name, ValidationSeverity.INFO, "first", value, row_index=row_index)
+            return None
+
+        from api.app.services.data_quality.rules import CustomRule
+        rule = CustomRule("custom", first_two)
+        profile.add_field_rule("title", rule)
+        profile.add_field_rule("extra", rule)
+    return profile
+
+
+def issue_tuples(issues):
+    return [(i.rule_name, i.field_name, i.severity, i.message, repr(i.actual_value), i.expected, i.row_index)
+            for i in issues]
+
+
+class TestCompiledPlan:
+    @pytest.mark.parametrize("global_unique,custom,columnar", [
+        (False, False, True),
+        (True, False, False),
+        (False, True, False),
+    ])
+    def test_batch_identical_to_legacy_engine(self, global_unique, custom, columnar):
+        records = make_records(500)
+        validator = DataValidator(make_profile(global_unique, custom))
+        result = validator.validate_batch(records, "s1", "r1")
+        assert validator.compile().columnar is columnar
+
+        expected_issues, expected_stats = legacy_validate_batch(make_profile(global_unique, custom), records)
+        assert issue_tuples(result.issues) == issue_tuples(expected_issues)
+        assert result.field_stats == expected_stats
+        assert list(result.field_stats) == list(expected_stats)
+        assert len(result.issues) > 50
+
+    def test_validate_record_identical_to_legacy_engine(self):
+        records = make_records(200, seed=11)
+        validator = DataValidator(make_profile())
+        reference = make_profile()
+        for rules in reference.field_rules.values():
+            for rule in rules:
+                if isinstance(rule, UniqueRule):
+                    rule.reset()
+
+        for idx, record in enumerate(records):
+            expected = []
+            for field_name, value in record.items():
+                rules = list(reference.global_rules) + reference.field_rules.get(field_name, [])
+                expected.extend(i for i in (r.validate(value, field_name, idx) for r in rules if r.enabled) if i)
+            assert issue_tuples(validator.validate_record(record, row_index=idx)) == issue_tuples(expected)
+
+    def test_plan_recompiled_on_profile_change(self):
+        profile = ValidationProfile("custom")
+        validator = DataValidator(profile)
+        assert validator.validate_record({"price": -1}) == []
+        plan = validator.compile()
+        assert validator.compile() is plan
+
+        rule = RangeRule(name="range_price", min_value=0)
+        profile.add_field_rule("price", rule)
+        assert len(validator.validate_record({"price": -1})) == 1
+
+        rule.enabled = False
+        assert validator.validate_record({"price": -1}) == []
+        assert validator.compile() is not plan
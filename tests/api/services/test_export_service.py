@@ -0,0 +1,320 @@
+"""
+Tests for ExportService CSV and Excel export.
+
+Covers:
+- Keyset (_id) pagination: one bounded range scan per batch
+- Projection derived from the exported fields
+- Header detection, empty results and limits
+- Async streaming parity and event loop responsiveness
+- Write-only Excel export (styling, widths, row counts without re-query)
+- Parquet/Arrow export (flattened schema, row groups, type inference)
+"""
+
+import asyncio
+import io
+import time
+
+import pytest
+from bson import ObjectId
+from export_fakes import FakeMongo, make_docs, read_csv
+from openpyxl import load_workbook
+
+from api.app.services.export_service import ExportService
+
+
+class TestStreamCsv:
+    def test_keyset_pagination_scans_each_document_once(self):
+        mongo = FakeMongo(make_docs(2500))
+        service = ExportService(mongo)
+
+        rows = read_csv(service.stream_csv("crawl_results", {}, batch_size=1000))
+
+        assert len(rows) == 2501
+        assert rows[0] == ["id", "status", "record_count", "data.title", "data.body"]
+        assert [int(r[2]) for r in rows[1:]] == list(range(2500))
+        # skip 방식이면 0 + 1000 + 2000 만큼 더 훑음
+        assert mongo.db["crawl_results"].examined == 2500
+
+    def test_query_filter_and_limit(self):
+        mongo = FakeMongo(make_docs(100))
+        service = ExportService(mongo)
+
+        rows = read_csv(service.stream_csv("crawl_results", {"status": "failed"}, batch_size=7, limit=20))
+
+        assert len(rows) == 21
+        assert {r[1] for r in rows[1:]} == {"failed"}
+        assert [int(r[2]) for r in rows[1:]] == list(range(0, 60, 3))
+
+    def test_projection_from_fields(self):
+        mongo = FakeMongo(make_docs(10))
+        service = ExportService(mongo)
+
+        rows = read_csv(service.stream_csv("crawl_results", {}, fields=["id", "record_count", "data.title"]))
+
+        assert rows[1] == [str(ObjectId((0).to_bytes(12, "big"))), "0", "title 0"]
+        assert mongo.db["crawl_results"].projections[0] == {"_id": 1, "record_count": 1, "data.title": 1}
+
+    def test_build_projection(self):
+        service = ExportService(FakeMongo([]))
+
+        assert service._build_projection(None) is None
+        assert service._build_projection(["status"]) == {"status": 1, "_id": 1}
+        assert service._build_projection(["data", "data.title"]) == {"data": 1, "_id": 1}
+
+    def test_existing_id_condition_is_combined(self):
+        docs = make_docs(30)
+        mongo = FakeMongo(docs)
+        service = ExportService(mongo)
+
+        query = {"_id": {"$gt": docs[9]["_id"]}}
+        rows = read_csv(service.stream_csv("crawl_results", query, batch_size=4))
+
+        assert [int(r[2]) for r in rows[1:]] == list(range(10, 30))
+
+    def test_empty_field_list_exports_all_fields(self):
+        service = ExportService(FakeMongo(make_docs(3)))
+
+        rows = read_csv(service.stream_csv("crawl_results", {}, fields=[]))
+
+        assert rows == read_csv(service.stream_csv("crawl_results", {}))
+        assert rows[0] == ["id", "status", "record_count", "data.title", "data.body"]
+
+    def test_empty_result(self):
+        service = ExportService(FakeMongo([]))
+
+        assert b"".join(service.stream_csv("crawl_results", {})).decode("utf-8-sig") == "No data found\n"
+
+
+class TestStreamCsvAsync:
+    @pytest.mark.asyncio
+    async def test_matches_sync_stream(self):
+        service = ExportService(FakeMongo(make_docs(250)))
+
+        chunks = [chunk async for chunk in service.stream_csv_async("crawl_results", {}, batch_size=100)]
+
+        assert len(chunks) == 3
+        assert chunks == list(service.stream_csv("crawl_results", {}, batch_size=100))
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        service = ExportService(FakeMongo(make_docs(50), delay=0.2))
+        lags = []
+
+        async def ticker():
+            for _ in range(20):
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lags.append(time.perf_counter() - start)
+
+        async def consume():
+            return [chunk async for chunk in service.stream_csv_async("crawl_results", {}, batch_size=10)]
+
+        chunks, _ = await asyncio.gather(consume(), ticker())
+
+        assert len(chunks) == 5
+        assert max(lags) < 0.12
+
+    @pytest.fixture
+    def spy_stream(self, monkeypatch):
+        service = ExportService(FakeMongo([]))
+        closed = []
+        generators = []  # 참조를 유지해 GC가 대신 닫지 않도록
+
+        def chunks():
+            try:
+                while True:
+                    time.sleep(0.1)
+                    yield b"chunk"
+            finally:
+                closed.append(True)
+
+        def stream_csv(*args):
+            generators.append(chunks())
+            return generators[-1]
+
+        monkeypatch.setattr(service, "stream_csv", stream_csv)
+        return service.stream_csv_async("crawl_results", {}), closed
+
+    @pytest.mark.asyncio
+    async def test_sync_stream_closed_on_disconnect(self, spy_stream):
+        stream, closed = spy_stream
+
+        assert await stream.__anext__() == b"chunk"
+        await stream.aclose()
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_sync_stream_closed_after_cancelled_fetch(self, spy_stream):
+        stream, closed = spy_stream
+        await stream.__anext__()
+
+        # 배치 조회 도중 취소: 조회가 끝나면 동기 제너레이터를 닫음
+        task = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert closed == []
+
+        await asyncio.sleep(0.2)
+        assert closed == [True]
+
+
+class TestExcelExport:
+    def test_write_excel_streams_rows(self, tmp_path):
+        service = ExportService(FakeMongo(make_docs(2500)))
+        path = tmp_path / "out.xlsx"
+
+        count = service.write_excel("crawl_results", {}, str(path), batch_size=1000)
+
+        assert count == 2500
+        ws = load_workbook(path)["Data"]
+        rows = list(ws.values)
+        assert rows[0] == ("id", "status", "record_count", "data.title", "data.body")
+        assert len(rows) == 2501
+        assert rows[-1][2] == 2499
+        assert ws.freeze_panes == "A2"
+        assert ws["A1"].font.bold and ws["A1"].fill.start_color.rgb.endswith("366092")
+        # 너비는 앞쪽 샘플 기준 (최대 50자 + 2)
+        assert ws.column_dimensions["A"].width == 26
+        assert ws.column_dimensions["E"].width == 52
+
+    def test_limit_and_fields(self):
+        service = ExportService(FakeMongo(make_docs(100)))
+
+        content = service.generate_excel("crawl_results", {}, fields=["record_count", "data.title"], limit=30)
+
+        rows = list(load_workbook(io.BytesIO(content))["Data"].values)
+        assert rows[0] == ("record_count", "data.title")
+        assert rows[1:3] == [(0, "title 0"), (1, "title 1")]
+        assert len(rows) == 31
+
+    def test_empty_result(self):
+        service = ExportService(FakeMongo([]))
+
+        content = service.generate_excel("crawl_results", {}, sheet_name="Empty")
+
+        assert list(load_workbook(io.BytesIO(content))["Empty"].values) == [("No data found",)]
+
+    @pytest.mark.asyncio
+    async def test_generate_excel_async(self):
+        service = ExportService(FakeMongo(make_docs(10)))
+
+        content = await service.generate_excel_async("crawl_results", {})
+
+        assert len(list(load_workbook(io.BytesIO(content))["Data"].values)) == 11
+
+    def test_job_counts_rows_without_requery(self, tmp_path):
+        mongo = FakeMongo(make_docs(1500))
+        service = ExportService(mongo)
+
+        service._process_excel_export("job", "crawl_results", {}, None, 100000, str(tmp_path / "job.xlsx"))
+
+        assert mongo.db.export_jobs.updates == [{"records_processed": 1500}]
+        # 키셋 배치 2번 + 빈 배치 확인 1번 (전체 재조회 없음)
+        assert len(mongo.db.crawl_results.projections) == 3
+
+
+class TestColumnarExport:
+    @pytest.fixture(autouse=True)
+    def arrow(self):
+        pytest.importorskip("pyarrow")
+
+    def read(self, content, format):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if format == "parquet":
+            return pq.read_table(io.BytesIO(content))
+        return pa.ipc.open_file(pa.BufferReader(content)).read_all()
+
+    @pytest.mark.parametrize("format", ["parquet", "arrow"])
+    def test_flattened_schema_and_rows(self, format):
+        service = ExportService(FakeMongo(make_docs(2500)))
+
+        table = self.read(service.generate_columnar("crawl_results", {}, format), format)
+
+        assert table.column_names == ["id", "status", "record_count", "data.title", "data.body"]
+        assert str(table.schema.field("record_count").type) == "int64"
+        assert table.num_rows == 2500
+        assert table.column("record_count").to_pylist() == list(range(2500))
+        assert table.column("id")[0].as_py() == str(ObjectId((0).to_bytes(12, "big")))
+
+    def test_parquet_row_groups(self, tmp_path, monkeypatch):
+        import pyarrow.parquet as pq
+
+        from api.app.services import export_service as module
+
+        monkeypatch.setattr(module, "PARQUET_ROW_GROUP_SIZE", 1000)
+        service = ExportService(FakeMongo(make_docs(2500)))
+        path = tmp_path / "out.parquet"
+
+        count = service.write_columnar("crawl_results", {}, str(path), batch_size=400)
+
+        metadata = pq.ParquetFile(path).metadata
+        assert count == 2500
+        # 400행 배치를 1000행 이상 모아 row group 하나로 기록
+        assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [1200, 1200, 100]
+
+    def test_projection_and_parent_fields(self):
+        mongo = FakeMongo(make_docs(20))
+        service = ExportService(mongo)
+
+        table = self.read(
+            service.generate_columnar("crawl_results", {}, "parquet", fields=["record_count", "data"], limit=5),
+            "parquet"
+        )
+
+        assert table.column_names == ["record_count", "data"]
+        assert table.num_rows == 5
+        assert table.column("data")[1].as_py() == '{"title": "title 1", "body": "' + "x" * 50 + '"}'
+        assert mongo.db.crawl_results.projections[0] == {"record_count": 1, "data": 1, "_id": 1}
+
+    @pytest.mark.parametrize("id_field", ["_id", "id"])
+    def test_id_field(self, id_field):
+        service = ExportService(FakeMongo(make_docs(3)))
+
+        table = self.read(service.generate_columnar("crawl_results", {}, "parquet", fields=[id_field, "status"]), "parquet")
+
+        assert table.column_names == ["id", "status"]
+        assert table.column("id").to_pylist() == [str(ObjectId(i.to_bytes(12, "big"))) for i in range(3)]
+
+    def test_mixed_values_become_strings(self):
+        docs = make_docs(30)
+        docs[0]["extra"] = None
+        docs[1]["tags"] = ["a", "b"]
+        docs[25]["status"] = 7
+        service = ExportService(FakeMongo(docs))
+
+        table = self.read(service.generate_columnar("crawl_results", {}, "arrow", limit=30), "arrow")
+
+        # 첫 배치 값이 모두 null인 열과 혼합 타입 열은 문자열
+        assert str(table.schema.field("extra").type) == "string"
+        assert table.column("tags")[1].as_py() == '["a", "b"]'
+        assert table.column("status")[25].as_py() == "7"
+
+    @pytest.mark.parametrize("format", ["parquet", "arrow"])
+    def test_schema_widens_after_first_batch(self, format, tmp_path):
+        docs = make_docs(30)
+        docs[15]["record_count"] = 1.5
+        docs[25]["status"] = 7
+        docs[28]["late"] = "found"
+        service = ExportService(FakeMongo(docs))
+        path = tmp_path / f"out.{format}"
+
+        assert service.write_columnar("crawl_results", {}, str(path), format, batch_size=10) == 30
+        table = self.read(path.read_bytes(), format)
+
+        # 첫 배치 이후 나온 열은 추가되고, 정수 → 실수 / 충돌 타입 → 문자열로 확장
+        assert table.column_names[-1] == "late"
+        assert table.column("late").to_pylist() == [None] * 28 + ["found", None]
+        assert str(table.schema.field("record_count").type) == "double"
+        assert table.column("record_count").to_pylist()[14:16] == [14.0, 1.5]
+        assert str(table.schema.field("status").type) == "string"
+        assert table.column("status")[25].as_py() == "7"
+        assert table.column("status")[0].as_py() == docs[0]["status"]
+
+    def test_empty_result(self):
+        table = self.read(ExportService(FakeMongo([])).generate_columnar("crawl_results", {}), "parquet")
+
+        assert table.num_rows == 0 and table.num_columns == 0
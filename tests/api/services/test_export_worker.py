@@ -0,0 +1,194 @@
+"""
+Tests for ExportWorker partitioned export jobs.
+
+Covers:
+- _id range partitioning and parity with single-partition output
+- Limit bound across partitions
+- gzip output as concatenated members
+- Time-throttled progress flushing
+- process_export_job integration (no per-batch find_one/update_one)
+"""
+
+import gzip
+import json
+
+import pytest
+from export_fakes import FakeJobs, FakeMongo, make_docs, read_csv
+
+from api.app.services import export_service as export_service_module
+from api.app.services.export_service import ExportService
+from api.app.services.export_worker import ExportWorker, ProgressTracker
+
+
+def make_mongo():
+    return FakeMongo(make_docs(600))
+
+
+def run(worker, tmp_path, name="out.csv", format="csv", query=None, fields=None, limit=100000, **kwargs):
+    path = tmp_path / name
+    count = worker.run("job", "crawl_results", format, query or {}, fields, limit, "utf-8-sig", str(path), **kwargs)
+    return count, path.read_bytes()
+
+
+class TestPartitionedExport:
+    def test_partitions_match_single_partition_output(self, tmp_path):
+        mongo = FakeMongo(make_docs(1000, title="제목"))
+        single = ExportWorker(mongo, max_workers=1, min_partition_records=0)
+        parallel = ExportWorker(mongo, max_workers=4, min_partition_records=0)
+
+        count, expected = run(single, tmp_path, "single.csv")
+        parallel_count, actual = run(parallel, tmp_path, "parallel.csv")
+
+        assert count == parallel_count == 1000
+        assert actual == expected
+        assert actual.startswith(b"\xef\xbb\xbf") and actual.count(b"\xef\xbb\xbf") == 1
+        rows = read_csv(actual)
+        assert rows[0] == ["id", "status", "record_count", "data.title", "data.body"]
+        assert [int(r[2]) for r in rows[1:]] == list(range(1000))
+        # 파티션 경계는 $sample 분위수
+        assert len(mongo.db.crawl_results.aggregations) == 1
+        assert mongo.db.crawl_results.aggregations[0][1] == {"$sample": {"size": 4 * 4 * 20}}
+
+    def test_query_limit_and_fields(self, tmp_path):
+        worker = ExportWorker(FakeMongo(make_docs(1000)), max_workers=3, min_partition_records=0)
+
+        count, data = run(worker, tmp_path, query={"status": "failed"}, fields=["record_count", "data.title"], limit=50)
+
+        rows = read_csv(data)
+        assert count == 50
+        assert rows[0] == ["record_count", "data.title"]
+        assert [int(r[0]) for r in rows[1:]] == list(range(0, 150, 3))
+
+    def test_limit_is_global_with_stale_total(self, tmp_path):
+        worker = ExportWorker(FakeMongo(make_docs(1000)), max_workers=4, min_partition_records=0)
+
+        # 작업 생성 시 추정치(100)보다 실행 시점 문서가 많아도 limit은 전체 기준
+        count, data = run(worker, tmp_path, limit=300, total_records=100)
+
+        rows = read_csv(data)
+        assert count == 300
+        assert [int(r[2]) for r in rows[1:]] == list(range(300))
+
+    def test_json_output(self, tmp_path):
+        worker = ExportWorker(FakeMongo(make_docs(300)), max_workers=4, min_partition_records=0)
+
+        count, data = run(worker, tmp_path, "out.json", format="json", fields=["record_count"])
+
+        items = json.loads(data.decode("utf-8"))
+        assert count == 300
+        assert [item["record_count"] for item in items] == list(range(300))
+        assert set(items[0]) == {"id", "record_count"}
+
+    def test_gzip_members_concatenate(self, tmp_path):
+        mongo = FakeMongo(make_docs(800))
+        _, plain = run(ExportWorker(mongo, max_workers=1), tmp_path)
+        _, compressed = run(
+            ExportWorker(mongo, max_workers=4, min_partition_records=0), tmp_path, "out.csv.gz", compression="gzip"
+        )
+
+        assert gzip.decompress(compressed) == plain
+
+    @pytest.mark.parametrize("format,expected", [("csv", b""), ("json", b"[\n\n]")])
+    def test_empty_result(self, tmp_path, format, expected):
+        worker = ExportWorker(FakeMongo([]), max_workers=4, min_partition_records=0)
+
+        count, data = run(worker, tmp_path, format=format)
+        _, compressed = run(worker, tmp_path, "out.gz", format=format, compression="gzip")
+
+        assert count == 0
+        assert data == expected
+        assert gzip.decompress(compressed) == expected
+
+    def test_process_pool(self, tmp_path):
+        worker = ExportWorker(make_mongo(), max_workers=2, use_processes=True, mongo_factory=make_mongo,
+                              min_partition_records=0)
+
+        count, data = run(worker, tmp_path)
+        _, expected = run(ExportWorker(make_mongo(), max_workers=1), tmp_path, "single.csv")
+
+        assert count == 600
+        assert data == expected
+
+    def test_part_files_removed(self, tmp_path):
+        worker = ExportWorker(FakeMongo(make_docs(200)), max_workers=4, min_partition_records=0)
+
+        run(worker, tmp_path)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["out.csv"]
+
+    def test_invalid_options(self, tmp_path):
+        worker = ExportWorker(FakeMongo(make_docs(10)))
+
+        with pytest.raises(ValueError):
+            run(worker, tmp_path, format="excel")
+        with pytest.raises(ValueError):
+            run(worker, tmp_path, compression="brotli")
+        with pytest.raises(ValueError):
+            ExportWorker(FakeMongo([]), use_processes=True)
+
+
+class TestProgressTracker:
+    def test_flushes_at_most_once_per_interval(self):
+        jobs = FakeJobs()
+        now = [0.0]
+        tracker = ProgressTracker(jobs, "job", 10000, interval=2.0, clock=lambda: now[0])
+
+        for _ in range(10):
+            now[0] += 0.5
+            tracker.add(1000)
+
+        # 2초 간격: 2.0, 4.0초 시점에만 기록
+        assert jobs.updates == [
+            {"progress": 0.4, "records_processed": 4000},
+            {"progress": 0.8, "records_processed": 8000},
+        ]
+
+        tracker.flush()
+        assert jobs.updates[-1] == {"progress": 0.99, "records_processed": 10000}
+
+
+class TestExportJob:
+    @pytest.fixture(autouse=True)
+    def storage(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(export_service_module, "EXPORT_STORAGE_PATH", str(tmp_path))
+
+    def test_job_progress_is_throttled(self, tmp_path):
+        mongo = FakeMongo(make_docs(5000))
+        service = ExportService(mongo)
+
+        job_id = service.create_export_job("crawl_results", "csv", {}, compression="gzip")
+        reads = mongo.db.export_jobs.reads
+        service.process_export_job(job_id)
+
+        job = mongo.db.export_jobs.jobs[job_id]
+        assert job["status"] == "completed", job["error"]
+        assert job["file_path"] == str(tmp_path / f"{job_id}.csv.gz")
+        assert job["records_processed"] == 5000
+        assert len(read_csv(gzip.decompress(open(job["file_path"], "rb").read()))) == 5001
+        # 배치마다 find_one/update_one 하지 않음
+        assert mongo.db.export_jobs.reads - reads == 1
+        # processing + 최종 flush + completed (records_processed는 flush 한 번만)
+        assert len(mongo.db.export_jobs.updates) <= 3
+
+    def test_excel_ignores_compression(self, tmp_path):
+        mongo = FakeMongo(make_docs(10))
+        service = ExportService(mongo)
+
+        job_id = service.create_export_job("crawl_results", "excel", {}, compression="gzip")
+        service.process_export_job(job_id)
+
+        assert mongo.db.export_jobs.jobs[job_id]["file_path"].endswith(".xlsx")
+
+    def test_parquet_job(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        mongo = FakeMongo(make_docs(50))
+        service = ExportService(mongo)
+
+        job_id = service.create_export_job("crawl_results", "parquet", {}, fields=["record_count"], compression="gzip")
+        service.process_export_job(job_id)
+
+        job = mongo.db.export_jobs.jobs[job_id]
+        assert job["status"] == "completed", job["error"]
+        assert job["file_path"].endswith(".parquet")
+        assert job["records_processed"] == 50
+        assert pq.read_table(job["file_path"]).column("record_count").to_pylist() == list(range(50))
@@ -0,0 +1,94 @@
+"""
+Tests for the shared record fingerprint.
+
+Covers:
+- Field order / missing-field normalization
+- Type and case handling
+- Batch API parity
+- Use by DataDeduplicator and IncrementalDeduplicator
+"""
+
+import pytest
+
+from api.app.services.fingerprint import RecordFingerprinter, fingerprint, fingerprint_many, get_fingerprinter
+from api.app.services.idempotency.deduplicator import (
+    DataDeduplicator,
+    DeduplicationConfig,
+    DeduplicationStrategy,
+    IncrementalDeduplicator,
+)
+
+
+class TestRecordFingerprint:
+    def test_field_order_does_not_matter(self):
+        record = {"title": "제목", "url": "https://a", "content": "본문"}
+        assert fingerprint(record, ["title", "url"]) == fingerprint(record, ["url", "title"])
+        assert fingerprint(record) == fingerprint(dict(reversed(list(record.items()))))
+
+    def test_none_and_missing_are_equal(self):
+        assert fingerprint({"a": "x", "b": None}) == fingerprint({"a": "x"})
+        assert fingerprint({"a": "x", "b": None}, ["a", "b"]) == fingerprint({"a": "x"}, ["a", "b"])
+
+    def test_string_and_number_differ(self):
+        assert fingerprint({"a": "1"}) != fingerprint({"a": 1})
+
+    def test_field_boundaries(self):
+        assert fingerprint({"a": "bc"}, ["a", "b"]) != fingerprint({"a": "b", "b": "c"}, ["a", "b"])
+
+    def test_nested_values_are_canonical(self):
+        assert fingerprint({"tags": {"x": 1, "y": [1, 2]}}) == fingerprint({"tags": {"y": [1, 2], "x": 1}})
+
+    def test_case_insensitive(self):
+        fp = RecordFingerprinter(["title"], case_sensitive=False)
+        assert fp({"title": "Hello"}) == fp({"title": "hello"})
+
+    def test_digest_size(self):
+        assert len(fingerprint({"a": "x"})) == 40
+        assert len(fingerprint({"a": "x"}, digest_size=8)) == 16
+
+    def test_batch_matches_single(self):
+        records = [{"title": f"제목 {i}", "views": i, "tags": ["a"]} for i in range(50)]
+        assert fingerprint_many(records, ["title", "views", "tags"]) == [
+            fingerprint(r, ["title", "views", "tags"]) for r in records
+        ]
+
+    def test_fingerprinter_is_shared_per_config(self):
+        assert get_fingerprinter(["b", "a"]) is get_fingerprinter(("a", "b"))
+        assert get_fingerprinter(["a"]) is not get_fingerprinter(["a"], case_sensitive=False)
+
+
+class TestDeduplicatorFingerprints:
+    def test_hash_match(self):
+        records = [{"title": "A", "url": "1"}, {"title": "a", "url": "1"}, {"title": "A", "url": "1"}]
+        config = DeduplicationConfig(strategy=DeduplicationStrategy.HASH_MATCH, hash_fields=["title", "url"])
+
+        unique, result = DataDeduplicator().deduplicate(records, config)
+        assert result.duplicates_removed == 1
+
+        config.case_sensitive = False
+        unique, result = DataDeduplicator().deduplicate(records, config)
+        assert len(unique) == 1
+
+    def test_hash_match_types_and_none(self):
+        # 값 타입은 구분하고 None은 없는 필드와 같게 취급
+        records = [{"id": "1"}, {"id": 1}, {"id": None}, {}]
+        config = DeduplicationConfig(strategy=DeduplicationStrategy.HASH_MATCH, hash_fields=["id"])
+
+        unique, _ = DataDeduplicator().deduplicate(records, config)
+        assert unique == [{"id": "1"}, {"id": 1}, {"id": None}]
+
+    def test_exact_match_and_batch_groups(self):
+        records = [{"a": 1, "b": "x"}, {"b": "x", "a": 1}, {"a": 2}]
+        dedup = DataDeduplicator()
+
+        unique, _ = dedup.deduplicate(records, DeduplicationConfig(strategy=DeduplicationStrategy.EXACT_MATCH))
+        assert len(unique) == 2
+        assert list(dedup.find_duplicates_in_batch(records).values()) == [[0, 1]]
+
+    def test_incremental_uses_shared_hash(self):
+        dedup = IncrementalDeduplicator(config=DeduplicationConfig(key_fields=["url"]))
+        record = {"url": "https://a", "title": "x"}
+
+        assert dedup._compute_hash(record) == fingerprint({"url": "https://a"}, digest_size=8)
+        assert dedup.is_duplicate(record, "src") is False
+        assert dedup.is_duplicate({"url": "https://a", "title": "y"}, "src") is True
@@ -0,0 +1,124 @@
+"""
+Tests for MinHash LSH fuzzy deduplication.
+
+Covers:
+- Band/row auto-selection around the threshold
+- Signature estimates tracking exact Jaccard similarity
+- LSH candidate lookup
+- Recall of the minhash engine against the brute-force engine
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from api.app.services.idempotency.deduplicator import (
+    DataDeduplicator,
+    DeduplicationConfig,
+    DeduplicationStrategy,
+)
+from api.app.services.idempotency.minhash import MinHashLSH, char_ngrams, jaccard, optimal_bands
+
+SYLLABLES = list('가나다라마바사아자차카타파하국민경제시장정부기업금리주가수출투자')
+
+
+def make_titles(count, dup_ratio=0.15, seed=7):
+    rng = random.Random(seed)
+
+    def word():
+        return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+    titles = []
+    for _ in range(count):
+        if titles and rng.random() < dup_ratio:
+            base = rng.choice(titles)
+            titles.append(rng.choice([base + '…', '[속보] ' + base, base.replace(' ', '  ', 1)]))
+        else:
+            titles.append(' '.join(word() for _ in range(rng.randint(6, 10))))
+    return [{"title": t} for t in titles]
+
+
+def fuzzy_config(engine, threshold=0.8):
+    return DeduplicationConfig(
+        strategy=DeduplicationStrategy.FUZZY_MATCH,
+        fuzzy_fields=["title"],
+        fuzzy_threshold=threshold,
+        fuzzy_engine=engine,
+    )
+
+
+def duplicate_indexes(records, config):
+    unique, _ = DataDeduplicator().deduplicate(records, config)
+    kept = {id(r) for r in unique}
+    return {i for i, r in enumerate(records) if id(r) not in kept}
+
+
+class TestMinHashLSH:
+    def test_optimal_bands_divide_num_perm(self):
+        for threshold in (0.5, 0.8, 0.9):
+            bands, rows = optimal_bands(threshold, 128)
+            assert bands * rows == 128
+        # 임계값이 높을수록 밴드당 행이 많아짐
+        assert optimal_bands(0.9, 128)[1] >= optimal_bands(0.5, 128)[1]
+
+    def test_invalid_bands(self):
+        with pytest.raises(ValueError):
+            MinHashLSH(num_perm=128, bands=5)
+
+    def test_signature_estimates_jaccard(self):
+        lsh = MinHashLSH(num_perm=256)
+        a = char_ngrams("코스피 외국인 순매수에 상승 마감 반도체 강세")
+        b = char_ngrams("코스피 외국인 순매수에 상승 마감 자동차 약세")
+        sig_a, sig_b = lsh.signatures([a, b])
+        assert abs((sig_a == sig_b).mean() - jaccard(a, b)) < 0.1
+        assert (lsh.signature(a) == sig_a).all()
+
+    def test_query_returns_similar_keys(self):
+        lsh = MinHashLSH(threshold=0.8)
+        texts = ["삼성전자 2분기 실적 발표 영업이익 증가", "정부 부동산 대책 발표 예정", "환율 급등 원화 약세 지속"]
+        sigs = lsh.signatures([char_ngrams(t) for t in texts])
+        for sig in sigs:
+            lsh.insert(sig)
+
+        near = lsh.signature(char_ngrams("[속보] 삼성전자 2분기 실적 발표 영업이익 증가"))
+        assert lsh.query(near) == [0]
+        assert lsh.query(lsh.signature(char_ngrams("완전히 다른 제목입니다"))) == []
+        assert len(lsh) == 3
+
+        lsh.clear()
+        assert len(lsh) == 0 and lsh.query(sigs[0]) == []
+
+    def test_batch_band_keys_match_single(self):
+        lsh = MinHashLSH()
+        sigs = lsh.signatures([char_ngrams(t) for t in ("가나다라마", "바사아자차")])
+        assert lsh.band_keys(sigs)[1] == lsh.band_keys(sigs[1][None])[0]
+        assert np.asarray(lsh.band_keys(sigs)).shape == (2, lsh.bands)
+
+
+class TestFuzzyEngine:
+    def test_recall_against_brute_force(self):
+        records = make_titles(800)
+        expected = duplicate_indexes(records, fuzzy_config("brute_force"))
+        actual = duplicate_indexes(records, fuzzy_config("minhash"))
+
+        assert len(expected) > 50
+        # 최종 판정은 정확한 자카드라 오탐은 없고, 미탐만 LSH 확률만큼 생김
+        assert actual <= expected
+        assert len(actual) / len(expected) >= 0.95
+
+    def test_reason_and_fresh_state_per_call(self):
+        dedup = DataDeduplicator(fuzzy_config("minhash"))
+        records = [{"title": "한국은행 기준금리 동결 결정 발표"}, {"title": "한국은행 기준금리 동결 결정 발표…"}]
+        unique, result = dedup.deduplicate(records)
+
+        assert unique == records[:1]
+        assert result.sample_duplicates[0]["reason"].startswith("fuzzy_match:")
+
+        unique, _ = dedup.deduplicate(records[1:])
+        assert unique == records[1:]
+
+    def test_empty_text_is_never_duplicate(self):
+        records = [{"title": ""}, {"title": ""}, {"other": 1}]
+        unique, _ = DataDeduplicator().deduplicate(records, fuzzy_config("minhash"))
+        assert len(unique) == 3
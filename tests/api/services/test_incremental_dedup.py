@@ -0,0 +1,251 @@
+"""
+Tests for IncrementalDeduplicator and its Bloom filter front.
+
+Covers:
+- Bloom filter false-negative freedom and error rate
+- Scalable filter growth
+- O(1) window eviction order
+- Bloom negatives skipping dedup_hashes lookups
+- Batched is_duplicate_many parity with is_duplicate
+- Writes racing with another process (unique index violations)
+- Unique index created lazily; no Bloom shortcut without it
+- Hashes stored in the pre-fingerprint format still count as duplicates
+"""
+
+import hashlib
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+
+from api.app.services.idempotency.bloom import BloomFilter, ScalableBloomFilter
+from api.app.services.idempotency.deduplicator import DeduplicationConfig, IncrementalDeduplicator
+
+
+class FakeDedupCollection:
+    """dedup_hashes 최소 구현 ((source_id, hash) 유니크, 호출 수 기록)"""
+
+    def __init__(self):
+        self.docs = {}
+        self.calls = {"find": 0, "find_one": 0, "insert_one": 0, "insert_many": 0}
+        self.indexes = []
+
+    def find(self, query, projection=None):
+        self.calls["find"] += 1
+        hashes = query.get("hash", {}).get("$in")
+        return [
+            {"hash": h} for (sid, h) in list(self.docs)
+            if sid == query["source_id"] and (hashes is None or h in hashes)
+        ]
+
+    def find_one(self, query):
+        self.calls["find_one"] += 1
+        return self.docs.get((query["source_id"], query["hash"]))
+
+    def insert_one(self, doc):
+        self.calls["insert_one"] += 1
+        key = (doc["source_id"], doc["hash"])
+        if key in self.docs:
+            raise DuplicateKeyError("duplicate")
+        self.docs[key] = doc
+
+    def insert_many(self, docs, ordered=True):
+        self.calls["insert_many"] += 1
+        errors = []
+        for i, doc in enumerate(docs):
+            key = (doc["source_id"], doc["hash"])
+            if key in self.docs:
+                errors.append({"index": i, "code": 11000})
+            else:
+                self.docs[key] = doc
+        if errors:
+            raise BulkWriteError({"writeErrors": errors})
+
+    def create_index(self, keys, **kwargs):
+        self.indexes.append((keys, kwargs))
+
+
+class NonUniqueCollection(FakeDedupCollection):
+    """유니크 인덱스를 만들 수 없는 컬렉션 (기존 중복 문서 등, 삽입은 항상 성공)"""
+
+    def insert_one(self, doc):
+        self.calls["insert_one"] += 1
+        self.docs[(doc["source_id"], doc["hash"])] = doc
+
+    def insert_many(self, docs, ordered=True):
+        self.calls["insert_many"] += 1
+        for doc in docs:
+            self.docs[(doc["source_id"], doc["hash"])] = doc
+
+    def create_index(self, keys, **kwargs):
+        raise OperationFailure("E11000 duplicate key error collection: dedup_hashes")
+
+
+@pytest.fixture
+def collection():
+    return FakeDedupCollection()
+
+
+def make_dedup(collection, **kwargs):
+    mongo = SimpleNamespace(db={IncrementalDeduplicator.COLLECTION_NAME: collection})
+    return IncrementalDeduplicator(mongo, DeduplicationConfig(key_fields=["url"]), **kwargs)
+
+
+def records(start, stop):
+    return [{"url": f"https://example.com/{i}"} for i in range(start, stop)]
+
+
+class TestBloomFilter:
+    def test_no_false_negatives_and_bounded_error(self):
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        keys = [f"key-{i}" for i in range(5000)]
+        bloom.add_many(keys)
+
+        assert bloom.contains_many(keys).all()
+        assert "key-1" in bloom
+        false_positive = bloom.contains_many([f"other-{i}" for i in range(20000)]).mean()
+        assert false_positive < 0.02
+
+    def test_scalable_filter_adds_stages(self):
+        bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+        keys = [f"key-{i}" for i in range(1000)]
+        bloom.add_many(keys[:500])
+        bloom.update(keys[500:], chunk_size=64)
+
+        assert len(bloom) == 1000
+        assert bloom.stages == 4  # 100 + 200 + 400 + 800
+        assert bloom.contains_many(keys).all()
+        assert bloom.contains_many([f"other-{i}" for i in range(10000)]).mean() < 0.02
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=10, error_rate=1.5)
+
+
+class TestIncrementalDeduplicator:
+    def test_window_evicts_oldest_first(self):
+        dedup = IncrementalDeduplicator(config=DeduplicationConfig(key_fields=["url"]), window_size=3)
+        for record in records(0, 4):
+            assert dedup.is_duplicate(record, "src") is False
+
+        assert dedup.is_duplicate(records(3, 4)[0], "src") is True
+        assert dedup.is_duplicate(records(0, 1)[0], "src") is False  # 밀려난 해시
+        assert dedup.get_stats()["window_size"] == 3
+
+    def test_window_is_per_source(self):
+        dedup = IncrementalDeduplicator(config=DeduplicationConfig(key_fields=["url"]))
+        assert dedup.is_duplicate(records(0, 1)[0], "a") is False
+        assert dedup.is_duplicate(records(0, 1)[0], "b") is False
+
+    def test_bloom_negatives_skip_lookup(self, collection):
+        dedup = make_dedup(collection)
+        for record in records(0, 50):
+            assert dedup.is_duplicate(record, "src") is False
+
+        assert collection.calls["find_one"] < 5
+        assert len(collection.docs) == 50
+        assert dedup.get_stats()["bloom_negatives"] >= 45
+
+    def test_persisted_hashes_survive_restart(self, collection):
+        make_dedup(collection).is_duplicate_many(records(0, 100), "src")
+
+        restarted = make_dedup(collection, window_size=10)
+        results = restarted.is_duplicate_many(records(50, 150), "src")
+
+        assert results == [True] * 50 + [False] * 50
+        assert len(collection.docs) == 150
+        assert restarted.get_stats()["db_hits"] == 50
+
+    def test_batch_matches_single(self, collection):
+        batch = records(0, 30) + records(10, 20) + records(25, 40)
+        single = make_dedup(FakeDedupCollection())
+        expected = [single.is_duplicate(r, "src") for r in batch]
+
+        dedup = make_dedup(collection)
+        assert dedup.is_duplicate_many(batch, "src") == expected
+        # 소스 적재 1 + $in 조회 최대 1 + insert_many 1
+        assert collection.calls["find"] <= 2
+        assert collection.calls["insert_many"] == 1
+        assert collection.calls["find_one"] == collection.calls["insert_one"] == 0
+
+    def test_concurrent_writer_counts_as_duplicate(self, collection):
+        dedup = make_dedup(collection)
+        dedup.is_duplicate_many(records(0, 1), "src")
+
+        other = make_dedup(collection)
+        other.is_duplicate_many(records(1, 3), "src")
+
+        # dedup의 Bloom에는 없지만 DB 유니크 위반으로 중복 판정
+        assert dedup.is_duplicate_many(records(1, 4), "src") == [True, True, False]
+        assert dedup.is_duplicate(records(4, 5)[0], "src") is False
+        other.is_duplicate(records(5, 6)[0], "src")
+        assert dedup.is_duplicate(records(5, 6)[0], "src") is True
+
+    def test_unique_index_created_once_on_first_use(self, collection):
+        dedup = make_dedup(collection)
+        assert collection.indexes == []
+
+        dedup.is_duplicate_many(records(0, 10), "src")
+        dedup.is_duplicate(records(10, 11)[0], "src")
+
+        assert collection.indexes[0] == ([("source_id", 1), ("hash", 1)], {"unique": True})
+        assert len(collection.indexes) == 2
+        assert dedup.get_stats()["unique_index"] is True
+
+    def test_without_unique_index_bloom_negatives_are_looked_up(self):
+        collection = NonUniqueCollection()
+        dedup = make_dedup(collection)
+        assert dedup.is_duplicate_many(records(0, 1), "src") == [False]
+
+        # 다른 프로세스가 저장한 해시는 삽입 오류로 잡히지 않으므로 조회로 판정
+        other = make_dedup(collection)
+        other.is_duplicate_many(records(1, 3), "src")
+        other.is_duplicate(records(3, 4)[0], "src")
+
+        assert dedup.is_duplicate_many(records(1, 3), "src") == [True, True]
+        assert dedup.is_duplicate(records(3, 4)[0], "src") is True
+        assert dedup.is_duplicate(records(4, 5)[0], "src") is False
+        stats = dedup.get_stats()
+        assert stats["unique_index"] is False
+        assert stats["bloom_sources"] == 0 and stats["bloom_negatives"] == 0
+
+
+class TestLegacyHashes:
+    def store_legacy(self, collection, source_id, urls):
+        """공용 fingerprint 도입 전 형식 (key_fields 값 '|' 연결의 sha256 앞 16자)"""
+        for url in urls:
+            legacy_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
+            collection.docs[(source_id, legacy_hash)] = {
+                "source_id": source_id, "hash": legacy_hash, "created_at": datetime.utcnow()
+            }
+
+    def test_legacy_hash_counts_as_duplicate_and_is_upgraded(self, collection):
+        self.store_legacy(collection, "src", [r["url"] for r in records(0, 3)])
+        dedup = make_dedup(collection)
+
+        assert dedup.is_duplicate_many(records(0, 5), "src") == [True, True, True, False, False]
+        assert dedup.is_duplicate(records(2, 3)[0], "src") is True
+        assert dedup.get_stats()["legacy_hits"] == 3
+
+        # 새 해시로 기록되어 재시작 후에는 이전 해시 없이도 중복
+        for key in list(collection.docs)[:3]:
+            del collection.docs[key]
+        restarted = make_dedup(collection, legacy_lookup=False)
+        assert restarted.is_duplicate_many(records(0, 5), "src") == [True] * 5
+
+    def test_single_check_finds_legacy_hash(self, collection):
+        self.store_legacy(collection, "src", [records(0, 1)[0]["url"]])
+        dedup = make_dedup(collection)
+
+        assert dedup.is_duplicate(records(0, 1)[0], "src") is True
+        assert dedup.is_duplicate(records(1, 2)[0], "src") is False
+        assert len(collection.docs) == 3  # 이전 해시 1 + 새 해시 2
+
+    def test_legacy_lookup_disabled(self, collection):
+        self.store_legacy(collection, "src", [records(0, 1)[0]["url"]])
+        dedup = make_dedup(collection, legacy_lookup=False)
+
+        assert dedup.is_duplicate_many(records(0, 1), "src") == [False]
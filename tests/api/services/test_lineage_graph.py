@@ -0,0 +1,234 @@
+"""
+Tests for LineageGraph path, component, cycle and ordering algorithms.
+
+Covers:
+- Parity with the previous list-queue/recursive implementations
+- Strongly connected components and has_cycles
+- 100k-node chains: no recursion errors, linear running time
+"""
+
+import gc
+import random
+import time
+
+import pytest
+
+from api.app.services.lineage.graph import LineageGraph
+from api.app.services.lineage.tracker import EdgeType, LineageEdge, LineageNode, NodeType
+
+
+def make_graph(num_nodes, edges):
+    graph = LineageGraph()
+    for i in range(num_nodes):
+        graph.add_node(LineageNode(
+            node_id=f"n{i}", node_type=NodeType.DATASET, name=f"ds{i}", qualified_name=f"dataset://ds{i}"
+        ))
+    for a, b in edges:
+        graph.add_edge(LineageEdge(
+            edge_id=f"e{a}-{b}", source_node_id=f"n{a}", target_node_id=f"n{b}", edge_type=EdgeType.TRANSFORM
+        ))
+    return graph
+
+
+def random_graph(seed, num_nodes=30, num_edges=60, dangling=True):
+    rng = random.Random(seed)
+    upper = num_nodes + 3 if dangling else num_nodes  # 미등록 노드로 가는 엣지 포함
+    edges = {(rng.randrange(num_nodes), rng.randrange(upper)) for _ in range(num_edges)}
+    return make_graph(num_nodes, sorted(edges))
+
+
+# ============================================
+# 이전 구현 (비교 기준)
+# ============================================
+
+def legacy_find_path(graph, start, end):
+    if start not in graph._nodes or end not in graph._nodes:
+        return None
+    if start == end:
+        return [start]
+    visited = {start}
+    queue = [(start, [start])]
+    while queue:
+        current, path = queue.pop(0)
+        for neighbor in graph._adjacency.get(current, set()):
+            if neighbor == end:
+                return path + [neighbor]
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, path + [neighbor]))
+    return None
+
+
+def legacy_find_all_paths(graph, start, end, max_paths=10):
+    if start not in graph._nodes or end not in graph._nodes:
+        return []
+    paths = []
+    stack = [(start, [start])]
+    while stack and len(paths) < max_paths:
+        current, path = stack.pop()
+        if current == end:
+            paths.append(path)
+            continue
+        for neighbor in graph._adjacency.get(current, set()):
+            if neighbor not in path:
+                stack.append((neighbor, path + [neighbor]))
+    return paths
+
+
+def legacy_connected_components(graph):
+    visited, components = set(), []
+
+    def dfs(node_id, component):
+        if node_id in visited:
+            return
+        visited.add(node_id)
+        component.add(node_id)
+        for neighbor in graph._adjacency.get(node_id, set()):
+            dfs(neighbor, component)
+        for neighbor in graph._reverse_adjacency.get(node_id, set()):
+            dfs(neighbor, component)
+
+    for node_id in graph._nodes:
+        if node_id not in visited:
+            component = set()
+            dfs(node_id, component)
+            components.append(component)
+    return components
+
+
+def legacy_detect_cycles(graph):
+    cycles, visited, rec_stack, path = [], set(), set(), []
+
+    def dfs(node_id):
+        visited.add(node_id)
+        rec_stack.add(node_id)
+        path.append(node_id)
+        for neighbor in graph._adjacency.get(node_id, set()):
+            if neighbor not in visited:
+                dfs(neighbor)
+            elif neighbor in rec_stack:
+                cycles.append(path[path.index(neighbor):] + [neighbor])
+        path.pop()
+        rec_stack.remove(node_id)
+
+    for node_id in graph._nodes:
+        if node_id not in visited:
+            dfs(node_id)
+    return cycles
+
+
+def legacy_topological_sort(graph):
+    in_degree = {n_id: 0 for n_id in graph._nodes}
+    for targets in graph._adjacency.values():
+        for target in targets:
+            if target in in_degree:
+                in_degree[target] += 1
+    queue = [n_id for n_id, degree in in_degree.items() if degree == 0]
+    result = []
+    while queue:
+        node_id = queue.pop(0)
+        result.append(node_id)
+        for neighbor in graph._adjacency.get(node_id, set()):
+            if neighbor in in_degree:
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+    return result if len(result) == len(graph._nodes) else None
+
+
+class TestLineageGraphParity:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_previous_implementation(self, seed):
+        graph = random_graph(seed)
+        dag = make_graph(30, [(i, j) for i in range(30) for j in range(i + 1, 30) if (i * j + seed) % 7 == 0])
+
+        for g in (graph, dag):
+            for a, b in [("n0", "n5"), ("n3", "n29"), ("n7", "n7"), ("n1", "n30")]:
+                assert g.find_path(a, b) == legacy_find_path(g, a, b)
+                for max_paths in (0, 1, 10, 50):
+                    assert g.find_all_paths(a, b, max_paths) == legacy_find_all_paths(g, a, b, max_paths)
+            assert g.get_connected_components() == legacy_connected_components(g)
+            assert g.detect_cycles() == legacy_detect_cycles(g)
+            assert g.has_cycles() == bool(legacy_detect_cycles(g))
+            assert g.topological_sort() == legacy_topological_sort(g)
+
+    def test_strongly_connected_components(self):
+        # n0 ⇄ n1 → n2 → n3 → n2, n4 자기 루프, n5 단독
+        graph = make_graph(6, [(0, 1), (1, 0), (1, 2), (2, 3), (3, 2), (4, 4)])
+
+        components = graph.get_strongly_connected_components()
+
+        assert sorted(map(sorted, components)) == [["n0", "n1"], ["n2", "n3"], ["n4"], ["n5"]]
+        # 역방향 위상 순서: n2/n3 컴포넌트가 n0/n1보다 먼저
+        assert components.index({"n2", "n3"}) < components.index({"n0", "n1"})
+        assert graph.has_cycles()
+        assert not make_graph(3, [(0, 1), (1, 2)]).has_cycles()
+
+
+class TestLineageGraphScaling:
+    N = 100_000
+
+    @pytest.fixture(scope="class")
+    def chain(self):
+        return make_graph(self.N, [(i, i + 1) for i in range(self.N - 1)])
+
+    @pytest.fixture(scope="class")
+    def ring(self):
+        return make_graph(self.N, [(i, (i + 1) % self.N) for i in range(self.N)])
+
+    def timed(self, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        return result, time.perf_counter() - start
+
+    def test_deep_chain(self, chain):
+        last = f"n{self.N - 1}"
+
+        path, elapsed = self.timed(chain.find_path, "n0", last)
+        assert len(path) == self.N and elapsed < 2.0
+
+        paths, elapsed = self.timed(chain.find_all_paths, "n0", last)
+        assert len(paths) == 1 and elapsed < 2.0
+
+        components, elapsed = self.timed(chain.get_connected_components)
+        assert len(components) == 1 and elapsed < 2.0
+
+        cycles, elapsed = self.timed(chain.detect_cycles)
+        assert cycles == [] and elapsed < 2.0
+
+        order, elapsed = self.timed(chain.topological_sort)
+        assert order[0] == "n0" and order[-1] == last and elapsed < 2.0
+
+        assert not chain.has_cycles()
+
+    def test_deep_ring(self, ring):
+        cycles = ring.detect_cycles()
+        components = ring.get_strongly_connected_components()
+
+        assert len(cycles) == 1 and len(cycles[0]) == self.N + 1
+        assert len(components) == 1 and len(components[0]) == self.N
+        assert ring.topological_sort() is None
+        assert ring.has_cycles()
+
+    def test_linear_growth(self, chain):
+        """노드 수 2배일 때 시간이 4배(이차)보다 확실히 적게 증가"""
+        def run(graph, n):
+            best = float("inf")
+            for _ in range(3):
+                gc.disable()
+                try:
+                    start = time.perf_counter()
+                    graph.find_path("n0", f"n{n - 1}")
+                    graph.topological_sort()
+                    graph.detect_cycles()
+                    graph.get_connected_components()
+                    best = min(best, time.perf_counter() - start)
+                finally:
+                    gc.enable()
+            return best
+
+        half = self.N // 2
+        small = run(make_graph(half, [(i, i + 1) for i in range(half - 1)]), half)
+        large = run(chain, self.N)
+
+        assert large / small < 3.5, (small, large)
@@ -0,0 +1,264 @@
+"""
+Tests for LineageIndex (in-memory lineage graph index).
+
+Covers:
+- Parity with LineageTracker traversal after loading from MongoDB
+- Incremental updates through LineageTracker.register_node/add_edge
+- Compaction of delta edges
+- Shortest paths and impact analysis without MongoDB
+- Shared index lifecycle (background reload, replayed writes, failure backoff)
+"""
+
+import threading
+
+import pytest
+from lineage_fakes import FakeMongo, layered_graph, make_edge, make_node
+
+from api.app.services.lineage import index as index_module
+from api.app.services.lineage.impact import ImpactAnalyzer
+from api.app.services.lineage.index import LineageIndex, get_lineage_index, reset_lineage_index
+from api.app.services.lineage.tracker import (
+    LineageEdge,
+    LineageNode,
+    LineageTracker,
+    NodeType,
+)
+
+
+class UpsertCollection:
+    """update_one(upsert) 최소 구현"""
+
+    def __init__(self, key):
+        self.key = key
+        self.docs = {}
+
+    def update_one(self, query, update, upsert=False):
+        self.docs[query[self.key]] = dict(update["$set"])
+
+    def find(self, query=None, projection=None):
+        return [dict(doc) for doc in self.docs.values()]
+
+
+class UpsertMongo:
+    def __init__(self):
+        self.db = {
+            LineageTracker.NODES_COLLECTION: UpsertCollection("node_id"),
+            LineageTracker.EDGES_COLLECTION: UpsertCollection("edge_id"),
+        }
+
+
+def edge(a, b):
+    return LineageEdge.from_dict(make_edge(a, b))
+
+
+def node(i, node_type=NodeType.DATASET):
+    data = make_node(i)
+    data["node_type"] = node_type.value
+    return LineageNode.from_dict(data)
+
+
+@pytest.fixture(autouse=True)
+def shared_index():
+    reset_lineage_index()
+    yield
+    reset_lineage_index()
+
+
+class TestLineageIndex:
+    @pytest.mark.parametrize("upstream,start", [(False, "n0"), (False, "n3"), (True, "n47"), (True, "n44")])
+    @pytest.mark.parametrize("depth", [1, 3, 10])
+    def test_closure_matches_tracker(self, upstream, start, depth):
+        mongo = FakeMongo(*layered_graph())
+        tracker = LineageTracker(mongo)
+        index = LineageIndex().load(mongo)
+
+        traverse = tracker.get_upstream if upstream else tracker.get_downstream
+        nodes, _ = traverse(start, depth=depth)
+
+        closure = index.closure(start, depth, upstream)
+        distances = index.distances(start, depth, upstream)
+
+        # 같은 홉 안의 순서만 다를 수 있음
+        assert sorted(closure) == sorted(n.node_id for n in nodes[1:])
+        assert [distances[n] for n in closure] == sorted(distances[n] for n in closure)
+
+    def test_dangling_nodes_excluded(self):
+        mongo = FakeMongo([make_node(0), make_node(1)], [make_edge(0, 9), make_edge(9, 1)])
+        index = LineageIndex().load(mongo)
+
+        assert index.downstream("n0") == ["n1"]
+        assert index.shortest_path("n0", "n1") == ["n0", "n9", "n1"]
+        assert index.get_node("n9") is None
+        assert index.upstream("unknown") == []
+
+    def test_incremental_updates_through_tracker(self):
+        index = LineageIndex()
+        tracker = LineageTracker(UpsertMongo(), index=index)
+
+        for i in range(4):
+            tracker.register_node(node(i))
+        for a, b in [(0, 1), (1, 2), (2, 3), (0, 1)]:
+            tracker.add_edge(edge(a, b))
+
+        assert len(index) == 4
+        assert index.num_edges == 3
+        assert index.downstream("n0") == ["n1", "n2", "n3"]
+        assert index.upstream("n3", depth=2) == ["n2", "n1"]
+        # 재적재해도 결과 동일
+        assert LineageIndex().load(tracker.mongo).downstream("n0") == ["n1", "n2", "n3"]
+
+    def test_tracker_without_mongo_leaves_index_untouched(self):
+        index = LineageIndex()
+        LineageTracker(index=index).add_edge(edge(0, 1))
+
+        assert len(index) == 0
+
+    def test_compaction_preserves_graph(self, monkeypatch):
+        monkeypatch.setattr(LineageIndex, "COMPACT_MIN_DELTA", 4)
+        index = LineageIndex()
+        for i in range(50):
+            index.add_node(node(i))
+        for i in range(49):
+            assert index.add_edge(edge(i, i + 1))
+        assert not index.add_edge(edge(10, 11))  # CSR에 병합된 엣지
+
+        stats = index.get_stats()
+        assert stats["edges"] == 49
+        assert stats["delta_edges"] <= 4
+        assert index.downstream("n0") == [f"n{i}" for i in range(1, 50)]
+        assert index.upstream("n49", depth=3) == ["n48", "n47", "n46"]
+
+    def test_shortest_path_and_distances(self):
+        nodes = [make_node(i) for i in range(5)]
+        edges = [make_edge(0, 1), make_edge(1, 2), make_edge(2, 3), make_edge(0, 3), make_edge(3, 4)]
+        index = LineageIndex().load(FakeMongo(nodes, edges))
+
+        assert index.shortest_path("n0", "n4") == ["n0", "n3", "n4"]
+        assert index.shortest_path("n4", "n0") is None
+        assert index.shortest_path("n4", "n0", upstream=True) == ["n4", "n3", "n0"]
+        assert index.distances("n0") == {"n0": 0, "n1": 1, "n3": 1, "n2": 2, "n4": 2}
+
+    def test_impact_analysis_uses_index(self, monkeypatch):
+        mongo = FakeMongo(*layered_graph())
+        index = LineageIndex().load(mongo)
+        expected = ImpactAnalyzer(LineageTracker(mongo)).analyze_deletion_impact("n0")
+
+        tracker = LineageTracker(mongo, index=index)
+        monkeypatch.setattr(tracker, "get_downstream", pytest.fail)
+        result = ImpactAnalyzer(tracker).analyze_deletion_impact("n0")
+
+        def summary(res):
+            return {n.node.node_id: (n.distance_from_source, n.impact_level, len(n.path)) for n in res.impacted_nodes}
+
+        assert summary(result) == summary(expected)
+        assert result.by_level == expected.by_level
+        for impacted in result.impacted_nodes:
+            assert impacted.path[0] == "n0" and impacted.path[-1] == impacted.node.node_id
+
+    def test_shared_index_loads_once(self):
+        mongo = FakeMongo(*layered_graph())
+
+        assert get_lineage_index() is None
+        index = get_lineage_index(mongo, wait=True)
+        calls = mongo.calls
+
+        assert get_lineage_index(mongo) is index
+        assert mongo.calls == calls
+        assert len(index) == 48
+
+    def test_empty_index_is_not_reloaded(self):
+        mongo = FakeMongo([], [])
+        index = get_lineage_index(mongo, wait=True)
+        calls = mongo.calls
+
+        assert index is not None and len(index) == 0
+        assert get_lineage_index(mongo, wait=True) is index
+        assert mongo.calls == calls
+
+    def test_concurrent_callers_after_expiry_scan_once(self):
+        mongo = FakeMongo(*layered_graph())
+        index = get_lineage_index(mongo, wait=True)
+        index.loaded_at -= 3600
+        calls = mongo.calls
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_lineage_index(mongo, ttl_seconds=60, wait=True)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [index] * 8
+        assert mongo.calls - calls == 2  # 노드 + 엣지 한 번씩
+
+    def test_writes_during_reload_are_replayed(self, monkeypatch):
+        mongo = FakeMongo(*layered_graph())
+        index = get_lineage_index(mongo, wait=True)
+
+        # 스캔 도중 LineageTracker의 쓰기가 들어옴 (스캔 결과에는 없음)
+        scan = LineageIndex._scan
+
+        def scan_with_write(mongo_service):
+            fresh = scan(mongo_service)
+            index.add_node(node(100))
+            index.add_edge(edge(47, 100))
+            return fresh
+
+        monkeypatch.setattr(LineageIndex, "_scan", staticmethod(scan_with_write))
+        index.loaded_at -= 3600
+
+        assert get_lineage_index(mongo, ttl_seconds=60, wait=True) is index
+        assert "n100" in index.downstream("n47")
+        assert index.get_node("n100").name == "ds100"
+
+    def test_reload_does_not_block_callers(self, monkeypatch):
+        mongo = FakeMongo(*layered_graph())
+        index = get_lineage_index(mongo, wait=True)
+        started, release = threading.Event(), threading.Event()
+        scan = LineageIndex._scan
+
+        def slow_scan(mongo_service):
+            started.set()
+            release.wait(5)
+            return scan(mongo_service)
+
+        monkeypatch.setattr(LineageIndex, "_scan", staticmethod(slow_scan))
+        index.loaded_at -= 3600
+
+        assert get_lineage_index(mongo, ttl_seconds=60) is index
+        assert started.wait(5)
+        assert len(index) == 48
+        release.set()
+        get_lineage_index(mongo, ttl_seconds=60, wait=True)
+
+    def test_shared_index_load_failure_backs_off(self, monkeypatch):
+        attempts = []
+
+        class BrokenMongo:
+            @property
+            def db(self):
+                attempts.append(1)
+                raise RuntimeError("down")
+
+        mongo = BrokenMongo()
+        assert get_lineage_index(mongo, wait=True) is None
+        assert get_lineage_index(mongo, wait=True) is None
+        assert len(attempts) == 1
+
+        monkeypatch.setattr(index_module, "LINEAGE_INDEX_RETRY_SECONDS", 0)
+        get_lineage_index(mongo, wait=True)
+        assert len(attempts) == 2
+
+
+def test_impact_module_builds_paths_from_single_bfs():
+    analyzer = ImpactAnalyzer(LineageTracker())
+    edges = [edge(0, 1), edge(1, 2), edge(0, 2), edge(2, 3)]
+
+    distances, parents = analyzer._shortest_path_tree("n0", edges)
+
+    assert distances == {"n0": 0, "n1": 1, "n2": 1, "n3": 2}
+    assert analyzer._build_path(parents, "n3") == ["n0", "n2", "n3"]
+    assert analyzer._build_path(parents, "n9") == []
@@ -0,0 +1,102 @@
+"""
+Tests for LineageTracker upstream/downstream traversal.
+
+Covers:
+- Parity with the previous node-by-node recursive traversal
+- Round trips bounded by depth, not by visited node count
+- Depth limit semantics
+- Dangling edges (edge to an unregistered node)
+"""
+
+import pytest
+from lineage_fakes import FakeMongo, layered_graph, make_edge, make_node
+
+from api.app.services.lineage.tracker import LineageEdge, LineageTracker
+
+
+def recursive_traversal(tracker, node_id, depth, upstream):
+    """이전 구현 (노드마다 get_node + 엣지 find, 재귀 DFS)"""
+    match_field, next_field = (
+        ("target_node_id", "source_node_id") if upstream else ("source_node_id", "target_node_id")
+    )
+    visited_nodes, visited_edges, nodes, edges = set(), set(), [], []
+
+    def traverse(current_id, current_depth):
+        if current_depth > depth or current_id in visited_nodes:
+            return
+        visited_nodes.add(current_id)
+        node = tracker.get_node(current_id)
+        if node:
+            nodes.append(node)
+        for edge_doc in tracker.mongo.db[tracker.EDGES_COLLECTION].find({match_field: current_id}):
+            edge = LineageEdge.from_dict(edge_doc)
+            if edge.edge_id not in visited_edges:
+                visited_edges.add(edge.edge_id)
+                edges.append(edge)
+                traverse(getattr(edge, next_field), current_depth + 1)
+
+    traverse(node_id, 0)
+    return nodes, edges
+
+
+def ids(nodes, edges):
+    return {n.node_id for n in nodes}, {e.edge_id for e in edges}
+
+
+class TestLineageTraversal:
+    @pytest.mark.parametrize("upstream,start", [(False, "n0"), (False, "n3"), (True, "n47"), (True, "n44")])
+    def test_matches_recursive_traversal(self, upstream, start):
+        tracker = LineageTracker(FakeMongo(*layered_graph()))
+        expected = recursive_traversal(tracker, start, 10, upstream)
+
+        traverse = tracker.get_upstream if upstream else tracker.get_downstream
+        nodes, edges = traverse(start, depth=10)
+
+        assert ids(nodes, edges) == ids(*expected)
+        assert len(edges) == len({e.edge_id for e in edges})
+        assert nodes[0].node_id == start
+
+    def test_round_trips_bounded_by_depth(self):
+        mongo = FakeMongo(*layered_graph(levels=6, width=40, fan_out=4))
+        tracker = LineageTracker(mongo)
+
+        nodes, _ = tracker.get_downstream("n0", depth=10)
+
+        assert len(nodes) > 50
+        # 레벨 6개 x (노드 $in + 엣지 $in)
+        assert mongo.calls <= 12
+
+    def test_depth_limit(self):
+        chain_nodes = [make_node(i) for i in range(6)]
+        chain_edges = [make_edge(i, i + 1) for i in range(5)]
+        tracker = LineageTracker(FakeMongo(chain_nodes, chain_edges))
+
+        nodes, edges = tracker.get_downstream("n0", depth=2)
+
+        assert [n.node_id for n in nodes] == ["n0", "n1", "n2"]
+        # depth 레벨 노드의 나가는 엣지까지 포함 (이전 구현과 동일)
+        assert [e.edge_id for e in edges] == ["e0-1", "e1-2", "e2-3"]
+
+    def test_shortcut_reaches_nodes_within_depth(self):
+        # n0 → n1 → n2 → n3, n0 → n3 → n4: n4는 1홉 지름길로 depth 2 안
+        nodes = [make_node(i) for i in range(5)]
+        edges = [make_edge(0, 1), make_edge(1, 2), make_edge(2, 3), make_edge(0, 3), make_edge(3, 4)]
+        tracker = LineageTracker(FakeMongo(nodes, edges))
+
+        found, _ = tracker.get_downstream("n0", depth=2)
+
+        assert {n.node_id for n in found} == {"n0", "n1", "n2", "n3", "n4"}
+
+    def test_dangling_edges_and_full_lineage(self):
+        nodes = [make_node(i) for i in range(3)]
+        edges = [make_edge(0, 1), make_edge(1, 2), make_edge(2, 9)]  # n9는 미등록
+        tracker = LineageTracker(FakeMongo(nodes, edges))
+
+        lineage = tracker.get_full_lineage("n1")
+
+        assert lineage["upstream_count"] == 2
+        assert lineage["downstream_count"] == 2
+        assert {e["edge_id"] for e in lineage["edges"]} == {"e0-1", "e1-2", "e2-9"}
+
+    def test_without_mongo(self):
+        assert LineageTracker().get_upstream("n0") == ([], [])
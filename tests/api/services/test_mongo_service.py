@@ -12,6 +12,7 @@ Covers:
 
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, PropertyMock
 from bson import ObjectId
 from bson.errors import InvalidId
@@ -153,6 +154,89 @@ class TestMongoServiceConnection:
             assert "error" in result
 
 
+class TestMongoClientPool:
+    """Tests for the process-wide shared client pool."""
+
+    @pytest.fixture
+    def pool_env(self):
+        from api.app.services import mongo_service
+        from api.app.utils.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+
+        circuit = CircuitBreaker("test_mongo_pool", CircuitBreakerConfig(failure_threshold=3, min_calls_in_window=3))
+        with patch.object(mongo_service, 'MongoClient') as client_cls, \
+                patch.object(mongo_service.MongoService, '_connection_circuit', circuit):
+            client_cls.return_value.admin.command.return_value = {"ok": 1}
+            with patch.object(mongo_service, '_connection_circuit', circuit):
+                yield mongo_service, client_cls, circuit
+            mongo_service.close_client_pool()
+
+    def test_services_share_one_client(self, pool_env):
+        """MongoService instances borrow the pooled client without ping/close."""
+        mongo_service, client_cls, _ = pool_env
+        pool = mongo_service.init_client_pool(max_pool_size=20)
+        client = client_cls.return_value
+        client.admin.command.reset_mock()
+
+        for _ in range(3):
+            with mongo_service.MongoService() as mongo:
+                assert mongo.client is client
+
+        client_cls.assert_called_once()
+        assert client_cls.call_args.kwargs["maxPoolSize"] == 20
+        assert pool.monitor in client_cls.call_args.kwargs["event_listeners"]
+        client.admin.command.assert_not_called()
+        client.close.assert_not_called()
+
+        mongo_service.close_client_pool()
+        client.close.assert_called_once()
+        assert mongo_service.get_client_pool() is None
+
+    def test_without_pool_each_service_owns_client(self, pool_env):
+        """Outside the lifespan, MongoService keeps its per-instance client."""
+        mongo_service, client_cls, _ = pool_env
+
+        with mongo_service.MongoService() as mongo:
+            mongo.client
+
+        client_cls.return_value.admin.command.assert_called_once_with('ping')
+        client_cls.return_value.close.assert_called_once()
+
+    def test_heartbeat_failures_open_circuit(self, pool_env):
+        """Failed driver heartbeats trip the breaker, rejecting requests fast."""
+        from api.app.exceptions import DatabaseConnectionError
+        from api.app.utils.circuit_breaker import CircuitState
+
+        mongo_service, _, circuit = pool_env
+        pool = mongo_service.init_client_pool()
+        for _ in range(3):
+            pool.monitor.failed(SimpleNamespace(reply=Exception("no server"), duration=0.01))
+
+        assert circuit.state == CircuitState.OPEN
+        with pytest.raises(DatabaseConnectionError):
+            mongo_service.MongoService().client
+        stats = pool.get_stats()
+        assert stats["heartbeat_failures"] == 3
+        assert stats["circuit_state"] == "open"
+
+    def test_pool_stats_track_checkouts(self, pool_env):
+        """Connection pool events update checkout counters."""
+        mongo_service, _, _ = pool_env
+        pool = mongo_service.init_client_pool()
+        monitor = pool.monitor
+
+        monitor.connection_created(None)
+        monitor.connection_checked_out(None)
+        monitor.connection_checked_out(None)
+        monitor.connection_checked_in(None)
+        monitor.succeeded(SimpleNamespace(duration=0.002))
+
+        stats = pool.get_stats()
+        assert stats["connections_open"] == 1
+        assert stats["checked_out"] == 1
+        assert stats["checkouts"] == 2
+        assert stats["last_heartbeat_ms"] == 2.0
+
+
 class TestMongoServiceSources:
     """Tests for source-related operations."""
 
@@ -0,0 +1,128 @@
+"""
+Tests for RealtimeValidator source-config caching and batch validation.
+
+Covers:
+- Source configs cached per source (one MongoDB query per batch of misses)
+- Validators shared by config fingerprint (per source when unique fields exist)
+- validate_events matches validate_event, in event order
+- Invalidation on sources collection changes
+"""
+
+import pytest
+
+from api.app.services.streaming.event_types import DataEvent, EventType
+from api.app.services.streaming.realtime_validator import RealtimeValidator, ValidatorCache
+
+REQUIRED_TITLE = {"fields": [{"name": "title", "required": True}]}
+
+
+class FakeMongo:
+    def __init__(self, sources, fail=0):
+        self.sources = sources
+        self.fail = fail
+        self.calls = []
+
+    def get_sources_by_ids(self, source_ids, projection=None):
+        self.calls.append(list(source_ids))
+        if self.fail:
+            self.fail -= 1
+            raise ConnectionError("mongo down")
+        return {sid: self.sources[sid] for sid in source_ids if sid in self.sources}
+
+
+def make_event(source_id, seq, title="제목", collection="staging_data"):
+    return DataEvent(
+        event_type=EventType.DATA_CREATED,
+        source_id=source_id,
+        collection=collection,
+        document_id=f"doc_{seq}",
+        data={"title": title, "seq": seq},
+    )
+
+
+def summary(result):
+    return (result.event_id, result.passed, result.quality_score,
+            [e["rule_name"] for e in result.errors], sorted(result.rules_applied))
+
+
+class TestValidatorCache:
+    @pytest.mark.asyncio
+    async def test_source_configs_cached_per_batch(self):
+        mongo = FakeMongo({"src_a": REQUIRED_TITLE, "src_b": REQUIRED_TITLE})
+        validator = RealtimeValidator(mongo)
+        events = [make_event(f"src_{'abc'[i % 3]}", i) for i in range(30)]
+
+        results = await validator.validate_events(events)
+        for event in events:
+            await validator.validate_event(event)
+
+        assert len(results) == 30
+        # 미스 3개를 한 번에 조회하고, 설정이 없는 src_c도 캐시됨
+        assert mongo.calls == [["src_a", "src_b", "src_c"]]
+        assert validator.get_stats()["cache"]["sources"] == 3
+
+    @pytest.mark.asyncio
+    async def test_validators_keyed_by_fingerprint(self):
+        unique = {"fields": [{"name": "title", "unique": True}]}
+        mongo = FakeMongo({"a": REQUIRED_TITLE, "b": dict(REQUIRED_TITLE, name="other"),
+                           "u1": unique, "u2": unique})
+        validator = RealtimeValidator(mongo)
+        await validator.validate_events([make_event(sid, 0) for sid in ["a", "b", "u1", "u2", "x", "y"]])
+
+        cache = validator._cache
+        shared = cache.fingerprint("a", REQUIRED_TITLE)
+        assert shared == cache.fingerprint("b", mongo.sources["b"])
+        assert cache.fingerprint("x", None) == ValidatorCache.DEFAULT_FINGERPRINT
+        # UniqueRule은 본 값을 기억하므로 소스별 검증기
+        assert cache.fingerprint("u1", unique) != cache.fingerprint("u2", unique)
+        assert cache.get_stats()["validators"] == 4
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_event_path(self):
+        mongo = FakeMongo({"src_a": REQUIRED_TITLE})
+        events = [make_event("src_a" if i % 2 else "src_z", i, title="" if i % 3 == 0 else "t")
+                  for i in range(12)]
+
+        single = RealtimeValidator(mongo)
+        expected = [summary(await single.validate_event(e)) for e in events]
+        batched = RealtimeValidator(mongo)
+        results = await batched.validate_events(events)
+
+        assert [summary(r) for r in results] == expected
+        assert any(not passed for _, passed, *_ in expected)
+        assert batched.get_stats()["failed"] == single.get_stats()["failed"]
+
+    @pytest.mark.asyncio
+    async def test_source_change_invalidates_config(self):
+        mongo = FakeMongo({"src_a": {"fields": []}})
+        validator = RealtimeValidator(mongo)
+        assert (await validator.validate_event(make_event("src_a", 0, title=""))).passed
+
+        mongo.sources["src_a"] = REQUIRED_TITLE
+        assert (await validator.validate_event(make_event("src_a", 1, title=""))).passed  # 캐시된 설정
+
+        change = DataEvent(event_type=EventType.DATA_UPDATED, collection="sources", document_id="src_a")
+        assert await validator.handle_batch([change]) == 1
+        assert not (await validator.validate_event(make_event("src_a", 2, title=""))).passed
+        assert len(mongo.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_lookup_failure_not_cached(self):
+        mongo = FakeMongo({"src_a": REQUIRED_TITLE}, fail=1)
+        validator = RealtimeValidator(mongo)
+
+        assert (await validator.validate_event(make_event("src_a", 0, title=""))).passed  # 기본 프로필
+        assert not (await validator.validate_event(make_event("src_a", 1, title=""))).passed
+        assert len(mongo.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_handle_batch_blocks_failures(self):
+        mongo = FakeMongo({"src_a": REQUIRED_TITLE})
+        validator = RealtimeValidator(mongo, block_on_failure=True)
+        emitted = []
+        validator.set_event_emitter(emitted.append)
+        events = [make_event("src_a", i, title="" if i < 2 else "t") for i in range(5)]
+        events.append(make_event("src_a", 5, collection="data_reviews"))
+
+        assert await validator.handle_batch(events) == 4
+        assert [e.validation_passed for e in emitted] == [False, False, True, True, True]
@@ -5,19 +5,26 @@ Tests cover:
 - InMemoryBroker publish/subscribe
 - KafkaBroker graceful fallback to InMemory
 - EventProcessor event routing
+- Partitioned consumers, per-key ordering and micro-batching
+- Batch handlers (PersistenceEventHandler insert_many)
+- Delay-queue retries with backoff and the bounded dead letter store
 - Event type creation and serialization
 """
 
 import asyncio
+import threading
 from datetime import datetime
 from unittest.mock import AsyncMock
 
 import pytest
 
 from api.app.services.streaming.event_processor import (
+    DeadLetterStore,
+    EventEnvelope,
     EventProcessor,
     InMemoryBroker,
     KafkaBroker,
+    RetryScheduler,
 )
 from api.app.services.streaming.event_types import (
     BaseEvent,
@@ -342,3 +349,383 @@ class TestEventProcessor:
 
         assert len(created_events) == 1
         assert len(crawl_events) == 1
+
+
+# ============================================
+# Partitioned consumers / micro-batching Tests
+# ============================================
+
+
+def make_event(source_id="src_1", seq=0, event_type=EventType.DATA_CREATED):
+    return DataEvent(
+        event_type=event_type,
+        source_id=source_id,
+        collection="test",
+        data={"seq": seq},
+    )
+
+
+class TestPartitionedBroker:
+    @pytest.mark.asyncio
+    async def test_slow_key_does_not_stall_other_partitions(self):
+        broker = InMemoryBroker(consumers_per_topic=4, max_batch_size=1)
+        received = []
+
+        async def handler(event):
+            if event.source_id == "slow":
+                await asyncio.sleep(0.5)
+            received.append(event.source_id)
+
+        await broker.subscribe("test.topic", handler)
+        await broker.start()
+        await broker.publish("test.topic", make_event("slow"))
+        for i in range(20):
+            await broker.publish("test.topic", make_event(f"fast_{i}"))
+
+        await asyncio.sleep(0.2)
+        # 느린 키와 같은 파티션에 걸린 이벤트만 기다림
+        assert len(received) >= 10
+        assert "slow" not in received
+        await broker.join()
+        await broker.stop()
+        assert len(received) == 21
+
+    @pytest.mark.asyncio
+    async def test_order_preserved_per_partition_key(self):
+        broker = InMemoryBroker(consumers_per_topic=4, max_batch_size=8)
+        received = {}
+
+        async def handler(event):
+            await asyncio.sleep(0.001 * (hash(event.source_id) % 3))
+            received.setdefault(event.source_id, []).append(event.data["seq"])
+
+        await broker.subscribe("test.topic", handler)
+        await broker.start()
+        events = [make_event(f"src_{i % 7}", i) for i in range(140)]
+        assert await broker.publish_batch("test.topic", events) == 140
+        await broker.join()
+        await broker.stop()
+
+        assert set(received) == {f"src_{k}" for k in range(7)}
+        for key, seqs in received.items():
+            assert seqs == sorted(seqs) and len(seqs) == 20
+
+    @pytest.mark.asyncio
+    async def test_batch_subscriber_receives_bounded_batches(self):
+        broker = InMemoryBroker(max_batch_size=10)
+        batches = []
+
+        async def handler(events):
+            batches.append([e.data["seq"] for e in events])
+
+        await broker.subscribe("test.topic", handler, batch=True)
+        await broker.publish_batch("test.topic", [make_event(seq=i) for i in range(25)])
+        await broker.start()
+        await broker.join()
+        await broker.stop()
+
+        assert batches == [list(range(10)), list(range(10, 20)), list(range(20, 25))]
+        stats = broker.get_stats()
+        assert stats["batch_count"] == 3 and stats["processed_count"] == 25
+
+    @pytest.mark.asyncio
+    async def test_linger_collects_late_events(self):
+        broker = InMemoryBroker(max_batch_size=10, max_linger_ms=200)
+        batches = []
+
+        async def handler(events):
+            batches.append(len(events))
+
+        await broker.subscribe("test.topic", handler, batch=True)
+        await broker.start()
+        for i in range(5):
+            await broker.publish("test.topic", make_event(seq=i))
+            await asyncio.sleep(0.01)
+        await broker.join()
+        await broker.stop()
+
+        assert batches == [5]
+
+    @pytest.mark.asyncio
+    async def test_priority_ties_do_not_compare_events(self):
+        broker = InMemoryBroker()
+        event = make_event()
+        twin = make_event()
+        twin.metadata.timestamp = event.metadata.timestamp
+
+        assert await broker.publish("test.topic", event)
+        assert await broker.publish("test.topic", twin)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = []
+        self.calls = 0
+
+    def insert_many(self, docs, ordered=True):
+        self.calls += 1
+        self.docs.extend(docs)
+
+        class Result:
+            inserted_ids = list(range(len(docs)))
+        return Result()
+
+
+class FakeMongo:
+    def __init__(self):
+        self.db = {"event_log": FakeCollection()}
+
+
+class TestEventProcessorBatching:
+    @pytest.mark.asyncio
+    async def test_shared_topic_dispatches_once(self):
+        processor = EventProcessor(broker=InMemoryBroker())
+        created, updated = [], []
+        processor.register_handler(EventType.DATA_CREATED, created.append)
+        processor.register_handler(EventType.DATA_UPDATED, updated.append)
+
+        await processor.start()
+        await processor.emit_batch([make_event(), make_event(event_type=EventType.DATA_UPDATED), make_event()])
+        await processor.broker.join()
+        await processor.stop()
+
+        # 같은 토픽(crawler.data.events)을 이벤트 유형마다 구독하지 않음
+        assert len(created) == 2 and len(updated) == 1
+        assert processor.get_metrics()["events_processed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_mixed_types_keep_per_key_order(self):
+        processor = EventProcessor(broker=InMemoryBroker(max_batch_size=50))
+        order = []
+
+        @processor.on_batch(EventType.DATA_CREATED)
+        async def on_created(events):
+            order.extend(("created", e.source_id, e.data["seq"]) for e in events)
+
+        @processor.on(EventType.DATA_UPDATED)
+        async def on_updated(event):
+            order.append(("updated", event.source_id, event.data["seq"]))
+
+        events = [
+            make_event("a", 0, EventType.DATA_UPDATED),
+            make_event("b", 1, EventType.DATA_CREATED),
+            make_event("b", 2, EventType.DATA_UPDATED),
+            make_event("b", 3, EventType.DATA_CREATED),
+        ]
+        await processor.emit_batch(events)
+        await processor.start()
+        await processor.broker.join()
+        await processor.stop()
+
+        # 한 배치 안에서도 같은 소스의 CREATED → UPDATED 순서 유지
+        by_source = {}
+        for kind, source_id, seq in order:
+            by_source.setdefault(source_id, []).append((kind, seq))
+        assert by_source["b"] == [("created", 1), ("updated", 2), ("created", 3)]
+        assert by_source["a"] == [("updated", 0)]
+
+    @pytest.mark.asyncio
+    async def test_persistence_handler_inserts_batch(self):
+        from api.app.services.streaming import PersistenceEventHandler
+
+        mongo = FakeMongo()
+        processor = EventProcessor(broker=InMemoryBroker(max_batch_size=50))
+        processor.register_batch_handler(EventType.DATA_CREATED, PersistenceEventHandler(mongo))
+
+        events = [make_event(seq=i) for i in range(120)]
+        assert await processor.emit_batch(events) == 120
+        await processor.start()
+        await processor.broker.join()
+        await processor.stop()
+
+        collection = mongo.db["event_log"]
+        assert collection.calls == 3
+        assert [d["data"]["seq"] for d in collection.docs] == list(range(120))
+
+    @pytest.mark.asyncio
+    async def test_failing_batch_handler_dead_letters_each_event(self):
+        processor = EventProcessor(broker=InMemoryBroker(), max_retries=0)
+        seen = []
+
+        @processor.on_batch(EventType.DATA_CREATED)
+        async def explode(events):
+            raise RuntimeError("boom")
+
+        @processor.on(EventType.DATA_CREATED)
+        async def record(event):
+            seen.append(event.event_id)
+
+        events = [make_event(seq=i) for i in range(3)]
+        await processor.emit_batch(events)
+        await processor.start()
+        await processor.broker.join()
+        await processor.stop()
+
+        dead = processor.get_dead_letter_queue()
+        assert [e.event.event_id for e in dead] == [e.event_id for e in events]
+        assert "explode: boom" in dead[0].error_history
+        assert seen == [e.event_id for e in events]
+
+
+# ============================================
+# Retry scheduling / dead letter Tests
+# ============================================
+
+
+class TestRetryScheduling:
+    def test_backoff_is_exponential_capped_and_jittered(self):
+        processor = EventProcessor(retry_delay_seconds=1.0, retry_backoff=2.0,
+                                   max_retry_delay_seconds=5.0, retry_jitter=0.0)
+        assert [processor.get_retry_delay(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+        processor.retry_jitter = 0.5
+        delays = [processor.get_retry_delay(3) for _ in range(200)]
+        assert all(2.0 <= d <= 4.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    @pytest.mark.asyncio
+    async def test_scheduler_emits_in_due_order(self):
+        emitted = []
+        scheduler = RetryScheduler(lambda event: emitted.append(event.data["seq"]))
+        scheduler.start()
+        for seq, delay in [(0, 0.15), (1, 0.05), (2, 0.1)]:
+            scheduler.schedule(make_event(seq=seq), delay)
+
+        await asyncio.sleep(0.05)
+        scheduler.schedule(make_event(seq=3), 0)
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+
+        assert emitted == [1, 3, 2, 0]
+        assert len(scheduler) == 0
+
+    @pytest.mark.asyncio
+    async def test_failing_events_do_not_block_consumer(self):
+        processor = EventProcessor(broker=InMemoryBroker(max_batch_size=10), max_retries=3,
+                                   retry_delay_seconds=1.0, retry_jitter=0.0)
+        done = []
+        attempts = {}
+
+        @processor.on(EventType.DATA_CREATED)
+        async def handler(event):
+            await asyncio.sleep(0.001)
+            if event.data["seq"] % 5 == 0:
+                attempts[event.event_id] = attempts.get(event.event_id, 0) + 1
+                raise RuntimeError("downstream unavailable")
+            done.append(event.data["seq"])
+
+        await processor.start()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await processor.emit_batch([make_event(f"src_{i % 3}", i) for i in range(200)])
+        while len(done) < 160 and loop.time() - start < 5:
+            await asyncio.sleep(0.01)
+        elapsed = loop.time() - start
+
+        # 실패 이벤트 40개가 1초씩 소비자를 막았다면 40초 이상 걸림
+        assert len(done) == 160
+        assert elapsed < 1.0
+        assert len(processor.retry_scheduler) == 40
+        assert processor.get_metrics()["pending_retries"] == 40
+        await processor.stop()
+
+    @pytest.mark.asyncio
+    async def test_retries_then_dead_letter(self):
+        processor = EventProcessor(broker=InMemoryBroker(), max_retries=2, retry_delay_seconds=0.01)
+        attempts = []
+
+        @processor.on(EventType.DATA_CREATED)
+        async def handler(event):
+            attempts.append(event.metadata.retry_count)
+            raise RuntimeError("boom")
+
+        await processor.start()
+        event = make_event()
+        await processor.emit(event)
+        for _ in range(100):
+            if processor.get_dead_letter_queue():
+                break
+            await asyncio.sleep(0.01)
+        await processor.stop()
+
+        assert attempts == [0, 1, 2]
+        dead = processor.get_dead_letter_queue()
+        assert [e.event.event_id for e in dead] == [event.event_id]
+        assert dead[0].retry_count == 2
+        metrics = processor.get_metrics()
+        assert metrics["events_retried"] == 2 and metrics["events_dead_lettered"] == 1
+
+
+class TestDeadLetterStore:
+    def make_envelope(self, seq):
+        return EventEnvelope(event=make_event(seq=seq), error_history=[f"error {seq}"])
+
+    @pytest.mark.asyncio
+    async def test_bounded_oldest_evicted(self):
+        store = DeadLetterStore(max_size=3)
+        for seq in range(5):
+            await store.add(self.make_envelope(seq))
+
+        assert [e.event.data["seq"] for e in store.list()] == [2, 3, 4]
+        assert store.get_stats()["evicted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_persisted_and_reloaded(self):
+        import mongomock
+
+        class Mongo:
+            db = mongomock.MongoClient().db
+
+        store = DeadLetterStore(max_size=3, mongo_service=Mongo)
+        envelopes = [self.make_envelope(seq) for seq in range(4)]
+        for envelope in envelopes:
+            await store.add(envelope)
+        assert await store.pop(envelopes[2].event.event_id) is envelopes[2]
+
+        collection = Mongo.db.event_dead_letters
+        assert sorted(d["event"]["data"]["seq"] for d in collection.find()) == [1, 3]
+
+        # 읽을 수 없는 문서는 건너뛰고 복원 개수에서 제외
+        collection.insert_one({"_id": "broken", "event": {}, "sequence": 0})
+        restored = DeadLetterStore(max_size=3, mongo_service=Mongo)
+        assert restored.load() == 2
+        assert [(e.event.event_id, e.error_history) for e in restored.list()] == [
+            (envelopes[1].event.event_id, ["error 1"]),
+            (envelopes[3].event.event_id, ["error 3"]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_writes_run_off_the_event_loop(self):
+        loop_thread = threading.current_thread()
+        threads = []
+
+        class Collection:
+            def replace_one(self, *args, **kwargs):
+                threads.append(threading.current_thread())
+
+            delete_many = delete_one = replace_one
+
+        class Mongo:
+            db = {"event_dead_letters": Collection()}
+
+        store = DeadLetterStore(max_size=1, mongo_service=Mongo)
+        envelopes = [self.make_envelope(seq) for seq in range(2)]
+        for envelope in envelopes:
+            await store.add(envelope)
+        await store.pop(envelopes[1].event.event_id)
+
+        # replace, replace + delete_many(evicted), delete_one
+        assert len(threads) == 4
+        assert loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_retry_dead_letter_requeues(self):
+        processor = EventProcessor(broker=InMemoryBroker(), dead_letter_store=DeadLetterStore(max_size=10))
+        envelope = self.make_envelope(1)
+        envelope.event.metadata.retry_count = 3
+        await processor.dead_letters.add(envelope)
+
+        assert await processor.retry_dead_letter(envelope.event.event_id) is True
+        assert await processor.retry_dead_letter(envelope.event.event_id) is False
+        assert envelope.event.metadata.retry_count == 0
+        assert processor.broker.get_stats()["queue_sizes"] == {"crawler.data.events": 1}
@@ -0,0 +1,143 @@
+"""
+Tests for the shared crawler value parsers (crawlers.utils.parsers).
+
+Covers:
+- Korean/relative/ISO date parsing and memoization rules
+- Korean financial number parsing
+- strptime format-list parsing with literal pre-checks
+"""
+
+import pytest
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+
+from crawlers.utils.parsers import (
+    parse_korean_date,
+    parse_korean_number,
+    parse_plain_number,
+    parse_date_formats,
+    clear_parse_caches,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    clear_parse_caches()
+    yield
+    clear_parse_caches()
+
+
+class TestParseKoreanDate:
+    """Tests for parse_korean_date."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("2024년 1월 15일 14:30", datetime(2024, 1, 15, 14, 30)),
+        ("2024년 1월 15일", datetime(2024, 1, 15)),
+        ("2024.01.15 09:05", datetime(2024, 1, 15, 9, 5)),
+        ("입력 2024.01.15", datetime(2024, 1, 15)),
+        ("2024-01-15 10:20:30", datetime(2024, 1, 15, 10, 20, 30)),
+        ("2024-01-15", datetime(2024, 1, 15)),
+        ("20240115T103000", datetime(2024, 1, 15, 10, 30)),
+        ("Mon, 15 Jan", None),
+    ])
+    def test_absolute_formats(self, text, expected):
+        """Test absolute Korean and ISO formats."""
+        assert parse_korean_date(text) == expected
+
+    def test_invalid_calendar_date_falls_through(self):
+        """Test an impossible date tries the next pattern instead of raising."""
+        assert parse_korean_date("2024.13.45") is None
+
+    def test_non_string_inputs(self):
+        """Test datetime/date/empty inputs."""
+        now = datetime(2024, 1, 1, 12)
+        assert parse_korean_date(now) is now
+        assert parse_korean_date(date(2024, 1, 2)) == datetime(2024, 1, 2)
+        assert parse_korean_date(None) is None
+        assert parse_korean_date("") is None
+        assert parse_korean_date("날짜 없음") is None
+
+    def test_relative_dates_are_not_memoized(self):
+        """Test relative expressions are evaluated against the current time on every call."""
+        first = parse_korean_date("5분 전")
+        assert datetime.now() - first < timedelta(minutes=6)
+
+        with pytest.MonkeyPatch.context() as mp:
+            import crawlers.utils.parsers as parsers
+
+            class _Later(datetime):
+                @classmethod
+                def now(cls, tz=None):
+                    return datetime(2030, 1, 1, 12, 0)
+
+            mp.setattr(parsers, "datetime", _Later)
+            assert parse_korean_date("5분 전") == datetime(2030, 1, 1, 11, 55)
+            assert parse_korean_date("09:30") == datetime(2030, 1, 1, 9, 30)
+
+    def test_relative_takes_priority_over_absolute(self):
+        """Test relative markers win over an embedded absolute date."""
+        result = parse_korean_date("2020.01.01 (3일 전)")
+        assert result.year != 2020
+
+
+class TestParseKoreanNumber:
+    """Tests for parse_korean_number."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("1,234", 1234.0),
+        ("15.5%", 15.5),
+        ("50,000원", 50000.0),
+        ("$1,200.50", 1200.5),
+        ("₩3,000", 3000.0),
+        ("5만", 50000.0),
+        ("1.5억", 150000000.0),
+        ("3천", 3000.0),
+        ("-100", -100.0),
+        ("▼1,250", -1250.0),
+        ("↓3.5", -3.5),
+        ("▲25", 25.0),
+        ("+1.2%", 1.2),
+        ("약 120 건", 120.0),
+        ("N/A", None),
+        ("", None),
+    ])
+    def test_string_values(self, text, expected):
+        """Test symbols, signs and Korean units."""
+        assert parse_korean_number(text) == expected
+
+    def test_numeric_values(self):
+        """Test numeric inputs are converted directly."""
+        assert parse_korean_number(None) is None
+        assert parse_korean_number(3) == 3.0
+        assert parse_korean_number(Decimal("2.5")) == 2.5
+
+
+class TestParsePlainNumber:
+    """Tests for parse_plain_number."""
+
+    def test_strips_non_numeric(self):
+        assert parse_plain_number("₩1,234.5원") == 1234.5
+        assert parse_plain_number("-42 pts") == -42.0
+        assert parse_plain_number("abc") is None
+        assert parse_plain_number("") is None
+
+
+class TestParseDateFormats:
+    """Tests for parse_date_formats."""
+
+    def test_first_matching_format_wins(self):
+        """Test format order is respected for ambiguous inputs."""
+        assert parse_date_formats("05/01/2024", ["%d/%m/%Y", "%m/%d/%Y"]) == datetime(2024, 1, 5)
+        assert parse_date_formats("05/13/2024", ["%d/%m/%Y", "%m/%d/%Y"]) == datetime(2024, 5, 13)
+
+    def test_korean_literal_formats(self):
+        assert parse_date_formats("2024년 01월 15일", ["%Y-%m-%d", "%Y년 %m월 %d일"]) == datetime(2024, 1, 15)
+
+    def test_case_insensitive_literals(self):
+        """Test cased literals are not used to skip formats (strptime ignores case)."""
+        assert parse_date_formats("2024-01-15t10:30:00", ["%Y-%m-%dT%H:%M:%S"]) == datetime(2024, 1, 15, 10, 30)
+
+    def test_no_match(self):
+        assert parse_date_formats("not a date", ["%Y-%m-%d"]) is None
+        assert parse_date_formats("", ["%Y-%m-%d"]) is None
+        assert parse_date_formats("2024-01-15", []) is None